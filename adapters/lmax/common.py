@@ -1,4 +1,7 @@
+import time
+from array import array
 from collections import OrderedDict
+from collections import deque
 
 
 class EvictingDict(OrderedDict):
@@ -10,3 +13,186 @@ class EvictingDict(OrderedDict):
         if len(self) >= self.max_size:
             self.popitem(last=False)  # Remove the oldest item
         super().__setitem__(key, value)
+
+
+class RateLimiter:
+    """
+    Provides a token bucket limiting the number of messages sent per second.
+
+    Up to `burst` messages may be sent at once, after which tokens are refilled at
+    `rate` per second.
+
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, was {rate}")
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self._burst)
+        self._last = time.monotonic()
+
+    def acquire(self, count: int) -> int:
+        """
+        Take up to `count` tokens and return the number taken.
+        """
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        taken = min(count, int(self._tokens))
+        self._tokens -= taken
+        return taken
+
+    def delay(self) -> float:
+        """
+        Return the number of seconds until the next token is available.
+        """
+        return max(0.0, (1.0 - self._tokens) / self._rate)
+
+
+class LatencyHistogram:
+    """
+    Holds a rolling window of the most recent latency samples.
+
+    Samples are kept in a ring buffer of `size` entries. Percentiles and the bucket
+    counts, in power of two microseconds, are computed over the window on demand.
+
+    """
+
+    def __init__(self, size: int = 1024):
+        self._samples: deque[int] = deque(maxlen=size)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def last_ns(self) -> int | None:
+        return self._samples[-1] if self._samples else None
+
+    def add(self, latency_ns: int) -> None:
+        self._samples.append(latency_ns)
+        self.count += 1
+
+    def percentile(self, q: float) -> int | None:
+        """
+        Return the latency at the percentile `q` (0 to 100) of the window.
+        """
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        index = min(len(samples) - 1, int(len(samples) * q / 100))
+        return samples[index]
+
+    def buckets(self) -> dict[int, int]:
+        """
+        Return the sample counts of the window keyed by bucket upper bound in
+        microseconds.
+        """
+        counts: dict[int, int] = {}
+        for latency_ns in self._samples:
+            bound = 1 << max(0, (latency_ns // 1_000) - 1).bit_length()
+            counts[bound] = counts.get(bound, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def __repr__(self) -> str:
+        if not self._samples:
+            return f"{type(self).__name__}(count=0)"
+        return (
+            f"{type(self).__name__}(count={self.count}, "
+            f"p50_us={self.percentile(50) / 1_000:.1f}, "
+            f"p99_us={self.percentile(99) / 1_000:.1f}, "
+            f"max_us={max(self._samples) / 1_000:.1f})"
+        )
+
+
+class StageSummary:
+    """
+    Represents the percentiles of the recent durations of a pipeline stage.
+    """
+
+    __slots__ = ("count", "p50_ns", "p90_ns", "p99_ns", "max_ns")
+
+    def __init__(self, count: int, p50_ns: int, p90_ns: int, p99_ns: int, max_ns: int):
+        self.count = count
+        self.p50_ns = p50_ns
+        self.p90_ns = p90_ns
+        self.p99_ns = p99_ns
+        self.max_ns = max_ns
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(count={self.count}, "
+            f"p50_us={self.p50_ns / 1_000:.1f}, "
+            f"p90_us={self.p90_ns / 1_000:.1f}, "
+            f"p99_us={self.p99_ns / 1_000:.1f}, "
+            f"max_us={self.max_ns / 1_000:.1f})"
+        )
+
+
+class StageTimings:
+    """
+    Records the durations of the stages of a message pipeline in preallocated ring
+    buffers.
+
+    Each stage is added once and then recorded by its index. Its last `size`
+    samples are kept in an int64 array allocated when the stage is added, so
+    recording a sample is an index write. Callers check `enabled` before reading the
+    clock, so the timings only cost an attribute read while disabled, and can be
+    switched on and off at runtime.
+
+    `origin_ns` is the `time.perf_counter_ns` of the socket read being processed, so
+    later stages can record the time since the bytes were read.
+
+    """
+
+    def __init__(self, size: int = 4096, enabled: bool = False):
+        self.enabled = enabled
+        self.origin_ns = 0
+        self._size = size
+        self._stages: dict[str, int] = {}
+        self._samples: list[array] = []
+        self._counts: list[int] = []
+
+    def add_stage(self, name: str) -> int:
+        """
+        Return the index of the stage, adding it if new.
+        """
+        index = self._stages.get(name)
+        if index is None:
+            index = self._stages[name] = len(self._samples)
+            self._samples.append(array("q", bytes(8 * self._size)))
+            self._counts.append(0)
+        return index
+
+    def record(self, stage: int, elapsed_ns: int) -> None:
+        count = self._counts[stage]
+        self._samples[stage][count % self._size] = elapsed_ns
+        self._counts[stage] = count + 1
+
+    def record_since(self, stage: int, start_ns: int) -> None:
+        self.record(stage, time.perf_counter_ns() - start_ns)
+
+    def summary(self) -> dict[str, StageSummary]:
+        """
+        Return the percentiles of the recorded window of every stage with samples.
+        """
+        summaries = {}
+        for name, index in self._stages.items():
+            count = self._counts[index]
+            if count == 0:
+                continue
+            samples = sorted(self._samples[index][: min(count, self._size)])
+            last = len(samples) - 1
+            summaries[name] = StageSummary(
+                count=count,
+                p50_ns=samples[min(last, len(samples) * 50 // 100)],
+                p90_ns=samples[min(last, len(samples) * 90 // 100)],
+                p99_ns=samples[min(last, len(samples) * 99 // 100)],
+                max_ns=samples[last],
+            )
+        return summaries
+
+    def reset(self) -> None:
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
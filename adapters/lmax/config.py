@@ -8,6 +8,12 @@ class LmaxXmlClientConfig(NautilusConfig, frozen=True, kw_only=True):
     hostname: str
     username: str
     password: str
+    heartbeat_interval_seconds: float | None = 300.0
+    max_concurrent_requests: int = 6
+    query_concurrency: int = 2
+    historic_concurrency: int = 1
+    download_concurrency: int = 2
+    historic_timeout_seconds: float = 60.0
 
 
 class LmaxFixClientConfig(NautilusConfig, frozen=True, kw_only=True):
@@ -17,6 +23,18 @@ class LmaxFixClientConfig(NautilusConfig, frozen=True, kw_only=True):
     target_comp_id: str
     heartbeat_frequency_seconds: int = 30
     logon_timeout_seconds: int = 10
+    read_buffer_size: int = 65536
+    max_messages_per_second: float | None = None
+    write_high_water: int = 65536
+    session_store_path: str | None = None
+    reconnect: bool = True
+    reconnect_initial_delay_seconds: float = 0.5
+    reconnect_max_delay_seconds: float = 30.0
+    test_request_interval_seconds: float | None = 30.0
+    io_thread: bool = False
+    journal_path: str | None = None
+    log_messages: bool = False
+    stage_timings: bool = False
 
 
 class LmaxExecClientConfig(LiveExecClientConfig, frozen=True, kw_only=True):
@@ -30,3 +48,11 @@ class LmaxDataClientConfig(LiveDataClientConfig, frozen=True, kw_only=True):
     xml_client: LmaxXmlClientConfig
     fix_client: LmaxFixClientConfig
     instrument_provider: InstrumentProviderConfig = None
+    ingest_process: bool = False
+    ingest_capacity: int = 65536
+    subscription_window_seconds: float = 0.005
+    subscription_batch_size: int = 100
+    drop_duplicate_quotes: bool = True
+    conflate_quotes: bool = False
+    stale_quote_threshold_seconds: float = 10.0
+    feed_summary_interval_seconds: float = 60.0
@@ -3,10 +3,10 @@ The DataClient class is responsible for subscribing and unsubscribing to data.
 """
 
 import asyncio
+import time
 from functools import partial
 
 import pandas as pd
-from simplefix import FixMessage
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
@@ -15,25 +15,34 @@ from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.model.data import BarAggregation
 from nautilus_trader.model.data import BarType
-from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.enums import bar_aggregation_to_str
 from nautilus_trader.model.enums import price_type_to_str
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
-from nautilus_trader.model.objects import Price
-from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from pytower.adapters.lmax import LMAX_VENUE
+from pytower.adapters.lmax.common import StageTimings
 from pytower.adapters.lmax.fix.client import LmaxFixClient
-from pytower.adapters.lmax.fix.messages import MarketDataRequest
+from pytower.adapters.lmax.fix.book import DEPTH10_LEN
+from pytower.adapters.lmax.fix.book import LmaxOrderBook
+from pytower.adapters.lmax.fix.decoder import MarketDataSnapshotFullRefreshView
+from pytower.adapters.lmax.fix.ingest import MarketDataIngestProcess
+from pytower.adapters.lmax.fix.ingest import MarketDataRingReader
 from pytower.adapters.lmax.fix.messages import MarketDataRequestReject
 from pytower.adapters.lmax.fix.messages import MarketDataSnapshotFullRefresh
-from pytower.adapters.lmax.fix.parsing import parse_lmax_timestamp_ns
+from pytower.adapters.lmax.fix.messages import create_market_data_request
+from pytower.adapters.lmax.fix.quotes import QuoteConflationStats
+from pytower.adapters.lmax.fix.quotes import QuoteConflator
+from pytower.adapters.lmax.fix.quotes import QuoteContext
+from pytower.adapters.lmax.fix.subscriptions import MarketDataSubscriptionBatcher
+from pytower.adapters.lmax.monitor import FeedMonitor
 from pytower.adapters.lmax.providers import LmaxInstrumentProvider
 from pytower.adapters.lmax.xml.client import LmaxXmlClient
 from pytower.adapters.lmax.xml.enums import LmaxAggregateOption
@@ -53,6 +62,14 @@ class LmaxLiveDataClient(LiveMarketDataClient):
         clock: LiveClock,
         logger: Logger,
         loop: asyncio.AbstractEventLoop,
+        ingest: MarketDataIngestProcess | None = None,
+        ingest_poll_interval_seconds: float = 0.001,
+        subscription_window_seconds: float = 0.005,
+        subscription_batch_size: int = 100,
+        drop_duplicate_quotes: bool = True,
+        conflate_quotes: bool = False,
+        stale_quote_threshold_seconds: float = 10.0,
+        feed_summary_interval_seconds: float = 60.0,
     ):
         super().__init__(
             loop=loop,
@@ -66,11 +83,63 @@ class LmaxLiveDataClient(LiveMarketDataClient):
         )
 
         self._fix_client = fix_client
+        self._timings = fix_client.stage_timings
+        self._publish_stage = self._timings.add_stage("publish")
+        self._read_to_publish_stage = self._timings.add_stage("read_to_publish")
         self._xml_client = xml_client
-        self._fix_client.register_handler(self.handle_message)
+        self._fix_client.register_handler(
+            self._handle_market_data_update,
+            message_types=[MarketDataSnapshotFullRefresh],
+        )
+        self._fix_client.register_handler(
+            self._handle_market_data_reject,
+            message_types=[MarketDataRequestReject],
+        )
+        self._fix_client.register_reconnect_handler(self._resubscribe)
         self._instrument_provider = instrument_provider
+        self._instrument_provider.register_load_handler(self._refresh_quote_contexts)
         self._logger = logger
 
+        # active market data subscriptions, replayed when the FIX session reconnects
+        self._quote_tick_subscriptions: set[InstrumentId] = set()
+
+        # subscriptions made within the window are sent in one MarketDataRequest
+        self._quote_tick_batcher = MarketDataSubscriptionBatcher(
+            send=self._send_market_data_request,
+            window_seconds=subscription_window_seconds,
+            max_batch_size=subscription_batch_size,
+            prefix=QuoteTick.__name__,
+        )
+
+        # SecurityID bytes -> decoding context of each subscribed instrument
+        self._quote_contexts: dict[bytes, QuoteContext] = {}
+        self._feed_monitor = FeedMonitor(
+            clock=clock,
+            logger=logger,
+            stale_threshold_seconds=stale_quote_threshold_seconds,
+            summary_interval_seconds=feed_summary_interval_seconds,
+        )
+        self._quote_conflator = QuoteConflator(
+            publish=self._publish_quote_tick,
+            loop=loop,
+            drop_duplicates=drop_duplicate_quotes,
+            latest_only=conflate_quotes,
+        )
+
+        # order book subscriptions by MarketDepth, 0 for the full book
+        self._subscription_window_seconds = subscription_window_seconds
+        self._subscription_batch_size = subscription_batch_size
+        self._order_book_batchers: dict[int, MarketDataSubscriptionBatcher] = {}
+        self._order_book_subscriptions: dict[InstrumentId, tuple[int, bool]] = {}
+
+        # SecurityID bytes -> L2 book of each instrument with an order book subscription
+        self._order_books: dict[bytes, LmaxOrderBook] = {}
+
+        # market data decoded by a child process, see `MarketDataIngestProcess`
+        self._ingest = ingest
+        self._ingest_poll_interval_seconds = ingest_poll_interval_seconds
+        self._ingest_task: asyncio.Task | None = None
+
     @property
     def xml_client(self) -> LmaxXmlClient:
         return self._xml_client
@@ -103,9 +172,31 @@ class LmaxLiveDataClient(LiveMarketDataClient):
     def logger(self) -> Logger:
         return self._logger
 
+    @property
+    def quote_conflation_stats(self) -> QuoteConflationStats:
+        return self._quote_conflator.stats
+
+    @property
+    def feed_monitor(self) -> FeedMonitor:
+        return self._feed_monitor
+
+    @property
+    def stage_timings(self) -> StageTimings:
+        """
+        Return the stage timings of the FIX session, including the publish stages of
+        this client.
+        """
+        return self._timings
+
     async def _connect(self) -> None:
         await self._xml_client.connect()
-        await self._fix_client.connect()
+        if self._ingest is not None:
+            self._ingest.start()
+            self._ingest_task = self.create_task(
+                self._consume_ingest(self._ingest.ring.reader()),
+            )
+        else:
+            await self._fix_client.connect()
 
         await self._instrument_provider.initialize()
 
@@ -121,58 +212,256 @@ class LmaxLiveDataClient(LiveMarketDataClient):
             f"DataEngine has {len(self._cache.instruments(LMAX_VENUE))} Lmax instruments",
         )
 
+        self._refresh_quote_contexts()
+        self._feed_monitor.start()
+
     async def _disconnect(self) -> None:
-        await self._fix_client.disconnect()
+        self._log.info(f"Quote conflation: {self._quote_conflator.stats}")
+        self._feed_monitor.stop()
+        self._feed_monitor.log_summary()
+        if self._ingest is not None:
+            if self._ingest_task is not None:
+                self._ingest_task.cancel()
+                self._ingest_task = None
+            self._ingest.stop()
+        else:
+            await self._fix_client.disconnect()
         await self._xml_client.disconnect()
 
     async def _subscribe_quote_ticks(self, instrument_id: InstrumentId) -> None:
         self._log.info(f"Subscribing to quote ticks: {instrument_id}")
-        await self._send_market_data_request(
-            cls=QuoteTick,
-            instrument_id=instrument_id,
-            subscribe=True,
-        )
+        instrument = self._instrument_provider.find(instrument_id)
+        if instrument is None:
+            self._log.error(f"Instrument not found: {instrument_id}")
+            return
+
+        self._quote_tick_subscriptions.add(instrument_id)
+        context = self._create_quote_context(instrument)
+        self._quote_contexts[context.security_id] = context
+        await self._quote_tick_batcher.subscribe(instrument)
 
     async def _unsubscribe_quote_ticks(self, instrument_id: InstrumentId) -> None:
         self._log.info(f"Unsubscribing to quote ticks: {instrument_id}")
-        await self._send_market_data_request(
-            cls=QuoteTick,
-            instrument_id=instrument_id,
-            subscribe=False,
-        )
+        self._quote_tick_subscriptions.discard(instrument_id)
+        self._feed_monitor.unregister(instrument_id)
+        instrument = self._instrument_provider.find(instrument_id)
+        if instrument is None:
+            self._log.error(f"Instrument not found: {instrument_id}")
+            return
 
-    async def _send_market_data_request(
+        self._quote_contexts.pop(str(instrument.info["id"]).encode(), None)
+        await self._quote_tick_batcher.unsubscribe(instrument)
+
+    async def _subscribe_order_book_deltas(
         self,
-        cls: DataType,
         instrument_id: InstrumentId,
-        subscribe: bool,
+        book_type: BookType,
+        depth: int | None = None,
+        kwargs: dict | None = None,
+    ) -> None:
+        await self._subscribe_order_book(instrument_id, book_type, depth or 0, depth10=False)
+
+    async def _subscribe_order_book_snapshots(
+        self,
+        instrument_id: InstrumentId,
+        book_type: BookType,
+        depth: int | None = None,
+        kwargs: dict | None = None,
     ) -> None:
+        depth = min(depth or DEPTH10_LEN, DEPTH10_LEN)
+        await self._subscribe_order_book(instrument_id, book_type, depth, depth10=True)
+
+    async def _unsubscribe_order_book_deltas(self, instrument_id: InstrumentId) -> None:
+        await self._unsubscribe_order_book(instrument_id)
+
+    async def _unsubscribe_order_book_snapshots(self, instrument_id: InstrumentId) -> None:
+        await self._unsubscribe_order_book(instrument_id)
+
+    async def _subscribe_order_book(
+        self,
+        instrument_id: InstrumentId,
+        book_type: BookType,
+        depth: int,
+        depth10: bool,
+    ) -> None:
+        self._log.info(f"Subscribing to order book: {instrument_id}, depth {depth or 'full'}")
+        if book_type != BookType.L2_MBP:
+            self._log.error(f"Cannot subscribe to {book_type}, LMAX provides L2_MBP books only")
+            return
+        if self._ingest is not None:
+            self._log.error("Order book subscriptions are not supported by the ingest process")
+            return
         instrument = self._instrument_provider.find(instrument_id)
         if instrument is None:
             self._log.error(f"Instrument not found: {instrument_id}")
             return
 
-        msg = MarketDataRequest()
+        self._order_book_subscriptions[instrument_id] = (depth, depth10)
+        book = LmaxOrderBook(instrument, depth10=depth10)
+        self._order_books[book.security_id] = book
+        await self._order_book_batcher(depth).subscribe(instrument)
 
-        msg.append_pair(262, cls.__name__ + "-" + instrument.id.value)  # MDReqID
+    async def _unsubscribe_order_book(self, instrument_id: InstrumentId) -> None:
+        self._log.info(f"Unsubscribing to order book: {instrument_id}")
+        subscription = self._order_book_subscriptions.pop(instrument_id, None)
+        instrument = self._instrument_provider.find(instrument_id)
+        if subscription is None or instrument is None:
+            return
 
-        if subscribe:
-            # SubscriptionRequestType: Snapshot + Updates (Subscribe)
-            msg.append_pair(263, 1)
+        self._order_books.pop(str(instrument.info["id"]).encode(), None)
+        await self._order_book_batcher(subscription[0]).unsubscribe(instrument)
+
+    def _order_book_batcher(self, depth: int) -> MarketDataSubscriptionBatcher:
+        batcher = self._order_book_batchers.get(depth)
+        if batcher is None:
+            batcher = MarketDataSubscriptionBatcher(
+                send=partial(self._send_market_data_request, depth=depth),
+                window_seconds=self._subscription_window_seconds,
+                max_batch_size=self._subscription_batch_size,
+                prefix=f"OrderBook{depth}",
+            )
+            self._order_book_batchers[depth] = batcher
+        return batcher
+
+    def _refresh_quote_contexts(self) -> None:
+        """
+        Rebuild the quote contexts and order books from the instrument provider after
+        the instruments are reloaded. Subscriptions to instruments which no longer
+        exist are dropped.
+        """
+        contexts = {}
+        for instrument_id in list(self._quote_tick_subscriptions):
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.warning(
+                    f"Instrument {instrument_id} removed, dropping quote tick subscription",
+                )
+                self._quote_tick_subscriptions.discard(instrument_id)
+                self._feed_monitor.unregister(instrument_id)
+                continue
+            context = self._create_quote_context(instrument)
+            contexts[context.security_id] = context
+        self._quote_contexts = contexts
+
+        books = {}
+        for instrument_id, (_, depth10) in list(self._order_book_subscriptions.items()):
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.warning(
+                    f"Instrument {instrument_id} removed, dropping order book subscription",
+                )
+                del self._order_book_subscriptions[instrument_id]
+                continue
+            book = LmaxOrderBook(instrument, depth10=depth10)
+            previous = self._order_books.get(book.security_id)
+            if (
+                previous is not None
+                and previous.instrument_id == book.instrument_id
+                and previous.price_precision == book.price_precision
+                and previous.size_precision == book.size_precision
+            ):
+                book = previous  # unchanged, so its levels are kept
+            books[book.security_id] = book
+        self._order_books = books
+
+    def _quote_context(self, security_id: bytes) -> QuoteContext | None:
+        """
+        Return a new context for a snapshot of a subscribed instrument without one,
+        which includes subscriptions made before the instruments were refreshed. The
+        late snapshots of an unsubscribed instrument get none, and are dropped.
+        """
+        instrument = self._instrument_provider.find_with_security_id(int(security_id))
+        if instrument is None:
+            self._log.error(f"Instrument not found for SecurityID {security_id.decode()}")
+            return None
+        if instrument.id not in self._quote_tick_subscriptions:
+            return None
+        context = self._create_quote_context(instrument)
+        self._quote_contexts[security_id] = context
+        return context
+
+    def _create_quote_context(self, instrument: Instrument) -> QuoteContext:
+        self._feed_monitor.register(instrument)
+        return QuoteContext(instrument)
+
+    async def _resubscribe(self) -> None:
+        """
+        Replay every active quote tick subscription in batched MarketDataRequests.
+        """
+        instruments = []
+        for instrument_id in self._quote_tick_subscriptions:
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.error(f"Instrument not found: {instrument_id}")
+                continue
+            instruments.append(instrument)
+
+        if instruments:
+            self._log.info(f"Resubscribing to quote ticks: {len(instruments)} instruments")
+            await self._quote_tick_batcher.send_batches(instruments, subscribe=True)
+
+        # books are emitted in full again after the gap
+        by_depth: dict[int, list] = {}
+        for instrument_id, (depth, _) in self._order_book_subscriptions.items():
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._log.error(f"Instrument not found: {instrument_id}")
+                continue
+            by_depth.setdefault(depth, []).append(instrument)
+        for book in self._order_books.values():
+            book.reset()
+        for depth, instruments in by_depth.items():
+            self._log.info(f"Resubscribing to order books: {len(instruments)} instruments")
+            await self._order_book_batcher(depth).send_batches(instruments, subscribe=True)
+
+    async def _resend_individually(
+        self,
+        batcher: MarketDataSubscriptionBatcher,
+        instrument_ids: list[InstrumentId],
+    ) -> None:
+        """
+        Resubscribe the instruments of a rejected group one request each, so a single
+        invalid instrument does not drop the whole group.
+        """
+        for instrument_id in instrument_ids:
+            instrument = self._instrument_provider.find(instrument_id)
+            if instrument is None:
+                self._drop_subscription(instrument_id, batcher is not self._quote_tick_batcher)
+                continue
+            await batcher.send([instrument], subscribe=True)
+
+    def _drop_subscription(self, instrument_id: InstrumentId, order_book: bool) -> None:
+        if order_book:
+            self._order_book_subscriptions.pop(instrument_id, None)
+            contexts = self._order_books
         else:
-            # SubscriptionRequestType: Disable previous Snapshot + Updates Request (Unsubscribe)
-            msg.append_pair(263, 2)
-
-        msg.append_pair(264, 1)  # MarketDepth: 1 = Top of Book
-
-        msg.append_pair(267, 2)  # NoMDEntryTypes
-        msg.append_pair(269, 0)  # MDEntryType: Bid
-        msg.append_pair(269, 1)  # MDEntryType: Ask
+            self._quote_tick_subscriptions.discard(instrument_id)
+            self._feed_monitor.unregister(instrument_id)
+            contexts = self._quote_contexts
+        for security_id, context in list(contexts.items()):
+            if context.instrument_id == instrument_id:
+                del contexts[security_id]
 
-        msg.append_pair(146, 1)  # NoRelatedSym
-        msg.append_pair(48, instrument.info["id"])  # SecurityID
-        msg.append_pair(22, 8)  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
+    async def _send_market_data_request(
+        self,
+        request_id: str,
+        security_ids: list[int],
+        subscribe: bool,
+        depth: int = 1,
+    ) -> None:
+        if self._ingest is not None:
+            if subscribe:
+                self._ingest.subscribe(security_ids)
+            else:
+                self._ingest.unsubscribe(security_ids)
+            return
 
+        msg = create_market_data_request(
+            request_id=request_id,
+            security_ids=security_ids,
+            subscribe=subscribe,
+            depth=depth,
+        )
         await self._fix_client.send_message(msg)
 
     async def _subscribe_instrument(self, instrument_id: InstrumentId) -> None:
@@ -184,51 +473,118 @@ class LmaxLiveDataClient(LiveMarketDataClient):
         for instrument in self._instrument_provider.list_all():
             self._handle_data(instrument)
 
-    async def handle_message(self, msg: FixMessage) -> None:
-        self._log.info(f"Handling: {type(msg).__name__}({msg})")
-        if type(msg) is MarketDataSnapshotFullRefresh:
-            self._handle_market_data_update(msg)
-        elif type(msg) is MarketDataRequestReject:
-            self._handle_market_data_reject(msg)
-
     def _handle_market_data_reject(self, msg: MarketDataRequestReject) -> None:
+        request_id = msg.get(262).decode()  # MDReqID
         reason = msg.get(58).decode()  # Text
-        self._log.error(f"Market data subscription request rejected: {reason}")
-
-    def _handle_market_data_update(self, msg: MarketDataSnapshotFullRefresh) -> None:
-        if int(msg.get(268)) == 0:
-            self._log.warning(
-                "Market Closed. The exchange sent a empty MarketDataSnapshotFullRefresh message",
-            )
+        for batcher in (self._quote_tick_batcher, *self._order_book_batchers.values()):
+            instrument_ids = batcher.pop_request(request_id)
+            if instrument_ids is not None:
+                break
+        else:
+            self._log.error(f"Market data subscription request rejected: {reason}")
             return
 
-        instrument = self._instrument_provider.find_with_security_id(int(msg.get(48)))  # SecurityID
-        self._log.info(f"Handling quote tick update: {instrument.id}")
-
-        # Parse ts_event
-        date = msg.get(272).decode()  # MDEntryDate
-        time = msg.get(273).decode()  # MDEntryTime
-
-        # Parse prices
-        bid_price = float(msg.get(270, nth=1))  # MDEntryPx
-        ask_price = float(msg.get(270, nth=2))  # MDEntryPx
-
-        # Parse sizes
-        bid_size = float(msg.get(271, nth=1))  # MDEntrySize
-        ask_size = float(msg.get(271, nth=2))  # MDEntrySize
-
-        # instrument_id = InstrumentId.from_str() # MDReqID
-        quote_tick = QuoteTick(
-            instrument_id=instrument.id,
-            bid_price=Price(bid_price, instrument.price_precision),
-            bid_size=Quantity(bid_size, instrument.size_precision),
-            ask_price=Price(ask_price, instrument.price_precision),
-            ask_size=Quantity(ask_size, instrument.size_precision),
-            ts_event=parse_lmax_timestamp_ns(date + "-" + time),
-            ts_init=self._clock.timestamp_ns(),
+        self._log.error(
+            f"Market data subscription request {request_id} rejected "
+            f"for {len(instrument_ids)} instruments: {reason}",
         )
+        if len(instrument_ids) > 1:
+            self.create_task(self._resend_individually(batcher, instrument_ids))
+            return
+
+        for instrument_id in instrument_ids:
+            self._drop_subscription(instrument_id, batcher is not self._quote_tick_batcher)
+
+    def _handle_market_data_update(
+        self,
+        msg: MarketDataSnapshotFullRefreshView | MarketDataSnapshotFullRefresh,
+    ) -> None:
+        request_id = msg.get(262)  # MDReqID
+        if request_id is not None and request_id.startswith(b"OrderBook"):
+            self._handle_order_book_update(msg)
+            return
 
-        self._handle_data(quote_tick)
+        entry_count = int(msg.get(268))  # NoMDEntries
+        if entry_count < 2:
+            if entry_count == 0:
+                self._log.warning(
+                    "Market Closed. "
+                    "The exchange sent a empty MarketDataSnapshotFullRefresh message",
+                )
+            return  # one side of the book is empty, so there is no quote
+
+        security_id = msg.get(48)  # SecurityID
+        context = self._quote_contexts.get(security_id) or self._quote_context(security_id)
+        if context is None:
+            return
+
+        ts_init = self._clock.timestamp_ns()
+        self._feed_monitor.on_snapshot(context.instrument_id, ts_init)
+        self._quote_conflator.handle_snapshot(context, msg, ts_init=ts_init)
+
+    def _publish_quote_tick(self, quote_tick: QuoteTick) -> None:
+        self._feed_monitor.on_quote(quote_tick.instrument_id, quote_tick.ts_event, quote_tick.ts_init)
+        if not self._timings.enabled:
+            self._handle_data(quote_tick)
+        elif self._ingest is not None:
+            # decoded by the ingest process, so there is no read time to measure from
+            start = time.perf_counter_ns()
+            self._handle_data(quote_tick)
+            self._timings.record_since(self._publish_stage, start)
+        else:
+            self._publish_timed(quote_tick)
+
+    def _publish_timed(self, data) -> None:
+        timings = self._timings
+        start = time.perf_counter_ns()
+        self._handle_data(data)
+        end = time.perf_counter_ns()
+        timings.record(self._publish_stage, end - start)
+        timings.record(self._read_to_publish_stage, end - timings.origin_ns)
+
+    def _handle_order_book_update(
+        self,
+        msg: MarketDataSnapshotFullRefreshView | MarketDataSnapshotFullRefresh,
+    ) -> None:
+        book = self._order_books.get(msg.get(48))  # SecurityID
+        if book is None:
+            return  # unsubscribed
+
+        data = book.apply(msg, ts_init=self._clock.timestamp_ns())
+        if data is None:
+            return
+        if self._timings.enabled:
+            self._publish_timed(data)
+        else:
+            self._handle_data(data)
+
+    async def _consume_ingest(self, reader: MarketDataRingReader) -> None:
+        while True:
+            records = reader.read_batch()
+            if not records:
+                await asyncio.sleep(self._ingest_poll_interval_seconds)
+                continue
+            self._handle_market_data_records(records)
+            await asyncio.sleep(0)
+
+    def _handle_market_data_records(self, records: list[tuple]) -> None:
+        """
+        Handle (security_id, bid_price, bid_size, ask_price, ask_size, ts_event)
+        records with raw fixed-point prices and sizes, see `MarketDataRingBuffer`.
+
+        The records are decoded by the quote context of their instrument and pass
+        through the quote conflator, as the snapshots of the FIX session do.
+
+        """
+        ts_init = self._clock.timestamp_ns()
+        contexts = self._quote_contexts
+        for record in records:
+            security_id = b"%d" % record[0]
+            context = contexts.get(security_id) or self._quote_context(security_id)
+            if context is None:
+                continue
+            self._feed_monitor.on_snapshot(context.instrument_id, ts_init)
+            self._quote_conflator.handle_record(context, record, ts_init=ts_init)
 
     async def _request_instrument(self, instrument_id: InstrumentId, correlation_id: UUID4) -> None:
         pass
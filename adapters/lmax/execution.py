@@ -1,6 +1,7 @@
 import asyncio
 import itertools
 import secrets
+import time
 
 import pandas as pd
 from simplefix import FixMessage
@@ -36,11 +37,10 @@ from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import Money
-from nautilus_trader.model.objects import Price
-from nautilus_trader.model.objects import Quantity
 from nautilus_trader.common.component import MessageBus
 from pytower.adapters.lmax import LMAX_VENUE
 from pytower.adapters.lmax.common import EvictingDict
+from pytower.adapters.lmax.common import StageTimings
 from pytower.adapters.lmax.fix.client import LmaxFixClient
 from pytower.adapters.lmax.fix.enums import ExecType
 from pytower.adapters.lmax.fix.enums import parse_lmax_exec_type
@@ -58,10 +58,10 @@ from pytower.adapters.lmax.fix.messages import TradeCaptureReportRequest
 from pytower.adapters.lmax.fix.messages import TradeCaptureReportRequestAck
 from pytower.adapters.lmax.fix.parsing import format_lmax_timestamp
 from pytower.adapters.lmax.fix.parsing import parse_lmax_timestamp_ns
+from pytower.adapters.lmax.fix.parsing import parse_price
+from pytower.adapters.lmax.fix.parsing import parse_quantity
 from pytower.adapters.lmax.providers import LmaxInstrumentProvider
-from pytower.adapters.lmax.xml.client import LmaxOrder
 from pytower.adapters.lmax.xml.client import LmaxXmlClient
-from pytower.adapters.lmax.xml.types import LmaxOrder
 
 
 class LmaxLiveExecutionClient(LiveExecutionClient):
@@ -98,9 +98,81 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
         self._reports = EvictingDict(max_size=100_000)
         self._request_id_lock = asyncio.Lock()
         self._report_timeout_seconds = report_timeout_seconds
-        self._fix_client.register_handler(self.handle_message)
+        self._fix_client.register_handler(
+            self.handle_message,
+            message_types=[
+                ExecutionReport,
+                OrderCancelReject,
+                TradeCaptureReportRequestAck,
+                TradeCaptureReport,
+            ],
+        )
         self._logger = logger
 
+        # stages added to the stage timings of the FIX session
+        self._timings = fix_client.stage_timings
+        self._order_command_stage = self._timings.add_stage("order_command")
+        self._execution_report_stage = self._timings.add_stage("execution_report")
+        self._read_to_event_stage = self._timings.add_stage("read_to_order_event")
+
+        # Order entry messages are pre-encoded, only the variable fields are filled on send
+        # TransactTime: required but ignored by LMAX. Can't be an empty string. YYYYMMDD-HH:MM:SS
+        self._limit_order_template = fix_client.create_template(
+            NewOrderSingle,
+            [
+                (11, None),  # ClOrdID
+                (48, None),  # SecurityID
+                (22, 8),  # SecurityIDSource: Must contain the value '8'
+                (54, None),  # Side
+                (60, "19700101-00:00:00"),  # TransactTime
+                (38, None),  # OrderQty
+                (18, "H"),  # ExecInst=H (do not cancel on disconnect)
+                (40, 2),  # OrdType: 2 = LIMIT
+                (44, None),  # Price
+                (59, 1),  # TimeInForce: GTC
+            ],
+        )
+        self._market_order_template = fix_client.create_template(
+            NewOrderSingle,
+            [
+                (11, None),  # ClOrdID
+                (48, None),  # SecurityID
+                (22, 8),  # SecurityIDSource: Must contain the value '8'
+                (54, None),  # Side
+                (60, "19700101-00:00:00"),  # TransactTime
+                (38, None),  # OrderQty
+                (18, "H"),  # ExecInst=H (do not cancel on disconnect)
+                (40, 1),  # OrdType: 1 = MARKET
+                (59, 4),  # TimeInForce: FOK
+            ],
+        )
+        self._cancel_order_template = fix_client.create_template(
+            OrderCancelRequest,
+            [
+                (11, None),  # ClOrdID
+                (41, None),  # OrigClOrdID
+                (48, None),  # SecurityID
+                (22, 8),  # SecurityIDSource: Must contain the value '8'
+                (60, "19700101-00:00:00"),  # TransactTime
+            ],
+        )
+        self._modify_order_template = fix_client.create_template(
+            OrderCancelReplaceRequest,
+            [
+                (11, None),  # ClOrdID
+                (41, None),  # OrigClOrdID
+                (48, None),  # SecurityID
+                (22, 8),  # SecurityIDSource: Must contain the value '8'
+                (60, "19700101-00:00:00"),  # TransactTime
+                (18, "H"),  # ExecInst=H (do not cancel on disconnect)
+                (54, None),  # Side
+                (38, None),  # OrderQty
+                (44, None),  # Price
+                (40, 2),  # OrdType: 2 = LIMIT
+                (59, 1),  # TimeInForce: GTC
+            ],
+        )
+
     @property
     def xml_client(self):
         return self._xml_client
@@ -109,6 +181,14 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
     def fix_client(self):
         return self._fix_client
 
+    @property
+    def stage_timings(self) -> StageTimings:
+        """
+        Return the stage timings of the FIX session, including the order stages of
+        this client.
+        """
+        return self._timings
+
     @property
     def instrument_provider(self):
         return self._instrument_provider
@@ -149,7 +229,10 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
         self._log.info(f"Handling message {type(msg).__name__}")
         if type(msg) is ExecutionReport:
             if msg.request_id is None:
-                await self._handle_execution_report(msg)
+                if self._timings.enabled:
+                    await self._handle_execution_report_timed(msg)
+                else:
+                    await self._handle_execution_report(msg)
 
         elif type(msg) is OrderCancelReject:
             await self._handle_order_cancel_reject(msg)
@@ -226,6 +309,14 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
     #         self._log.error(f"Order not found for client_order_id: {client_order_id}")
     #         return
 
+    async def _handle_execution_report_timed(self, msg: ExecutionReport) -> None:
+        timings = self._timings
+        start = time.perf_counter_ns()
+        await self._handle_execution_report(msg)
+        end = time.perf_counter_ns()
+        timings.record(self._execution_report_stage, end - start)
+        timings.record(self._read_to_event_stage, end - timings.origin_ns)
+
     async def _handle_execution_report(self, msg: ExecutionReport) -> None:
         """
         This method only handles ExecutionReport messages without a request_id.
@@ -257,7 +348,7 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             instrument_id=instrument.id,
             client_order_id=client_order_id,  # ClOrdID
             venue_order_id=VenueOrderId(msg.get(37).decode()),  # OrderID
-            ts_event=parse_lmax_timestamp_ns(msg.get(60).decode()),  # TransactTime
+            ts_event=parse_lmax_timestamp_ns(msg.get(60)),  # TransactTime
         )
 
     async def _handle_order_updated(self, msg: ExecutionReport) -> None:
@@ -270,10 +361,10 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             instrument_id=instrument.id,
             client_order_id=client_order_id,
             venue_order_id=VenueOrderId(msg.get(37).decode()),  # OrderID,
-            quantity=Quantity(float(msg.get(38)), instrument.size_precision),  # OrderQty
-            price=Price(float(msg.get(44)), instrument.price_precision),  # Price
+            quantity=parse_quantity(msg.get(38), instrument.size_precision),  # OrderQty
+            price=parse_price(msg.get(44), instrument.price_precision),  # Price
             trigger_price=None,
-            ts_event=parse_lmax_timestamp_ns(msg.get(60).decode()),  # TransactTime
+            ts_event=parse_lmax_timestamp_ns(msg.get(60)),  # TransactTime
             venue_order_id_modified=True,
         )
         self._pending.pop(msg.get(11).decode())  # ClOrdId
@@ -302,12 +393,12 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             trade_id=TradeId(msg.get(527).decode()),  # SecondaryExecId
             order_side=parse_lmax_order_side(int(msg.get(54))),  # OrdStatus
             order_type=parse_lmax_order_type(int(msg.get(40))),  #  OrdType
-            last_qty=Quantity(float(msg.get(32)), instrument.size_precision),  # LastQty
-            last_px=Price(float(msg.get(31)), instrument.price_precision),  # LastPx
+            last_qty=parse_quantity(msg.get(32), instrument.size_precision),  # LastQty
+            last_px=parse_price(msg.get(31), instrument.price_precision),  # LastPx
             quote_currency=instrument.quote_currency,
             commission=Money(0, instrument.base_currency),  # missing from LMAX FIX
             liquidity_side=LiquiditySide.TAKER,
-            ts_event=parse_lmax_timestamp_ns(msg.get(60).decode()),  # TransactTime
+            ts_event=parse_lmax_timestamp_ns(msg.get(60)),  # TransactTime
         )
 
     async def _handle_order_rejected(self, msg: ExecutionReport) -> None:
@@ -323,7 +414,7 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             instrument_id=instrument.id,
             client_order_id=client_order_id,
             reason=reason,
-            ts_event=parse_lmax_timestamp_ns(msg.get(60).decode()),  # TransactTime
+            ts_event=parse_lmax_timestamp_ns(msg.get(60)),  # TransactTime
         )
 
     async def _handle_order_canceled(self, msg: ExecutionReport) -> None:
@@ -339,11 +430,12 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             instrument_id=instrument.id,
             client_order_id=client_order_id,
             venue_order_id=VenueOrderId(msg.get(37).decode()),  # OrderID,
-            ts_event=parse_lmax_timestamp_ns(msg.get(60).decode()),  # TransactTime
+            ts_event=parse_lmax_timestamp_ns(msg.get(60)),  # TransactTime
         )
         self._pending.pop(msg.get(11).decode())  # ClOrdId
 
     async def _submit_order(self, command: SubmitOrder) -> None:
+        received_ns = time.perf_counter_ns() if self._timings.enabled else 0
         security_id = self._instrument_provider.get_security_id(command.instrument_id)
         if security_id is None:
             self._log.error(f"Instrument not found for lmax_id: {command.instrument_id}")
@@ -364,40 +456,29 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
 
         self._log.info(f"Submitting order: {order}")
 
-        msg = NewOrderSingle()
-
-        msg.append_pair(11, order.client_order_id.value)  # ClOrdID
-
-        msg.append_pair(48, security_id)  # SecurityID
-        msg.append_pair(22, 8)  # SecurityIDSource: Must contain the value '8'
-
-        msg.append_pair(54, int(order.side))  # Side
-
-        # TransactTime: required but ignored by LMAX. Can't be an empty string. YYYYMMDD-HH:MM:SS
-        msg.append_pair(60, "19700101-00:00:00")
-
-        msg.append_pair(38, str(order.quantity))  # OrderQty
-
-        msg.append_pair(18, "H")  # ExecInst=H (do not cancel on disconnect)
-
         if order.order_type == OrderType.MARKET:
-            msg.append_pair(40, 1)  # OrdType: 1 = MARKET
-            msg.append_pair(59, 4)  # TimeInForce: FOK
+            if received_ns != 0:
+                self._timings.record_since(self._order_command_stage, received_ns)
+            await self._fix_client.send_template(
+                self._market_order_template,
+                order.client_order_id.value,  # ClOrdID
+                security_id,  # SecurityID
+                int(order.side),  # Side
+                str(order.quantity),  # OrderQty
+                received_ns=received_ns,
+            )
         elif order.order_type == OrderType.LIMIT:
-            msg.append_pair(40, 2)  # OrdType: 2 = LIMIT
-            msg.append_pair(44, str(order.price))  # Price
-            msg.append_pair(59, 1)  # TimeInForce: GTC
-
-        # assert order.time_in_force == TimeInForce.FOK  # TODO: only FOK for
-
-        # self.generate_order_submitted(
-        #     strategy_id=command.strategy_id,
-        #     instrument_id=command.order.instrument_id,
-        #     client_order_id=command.order.client_order_id,
-        #     ts_event=self._clock.timestamp_ns(),
-        # )
-
-        await self._fix_client.send_message(msg)
+            if received_ns != 0:
+                self._timings.record_since(self._order_command_stage, received_ns)
+            await self._fix_client.send_template(
+                self._limit_order_template,
+                order.client_order_id.value,  # ClOrdID
+                security_id,  # SecurityID
+                int(order.side),  # Side
+                str(order.quantity),  # OrderQty
+                str(order.price),  # Price
+                received_ns=received_ns,
+            )
 
     async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
         self._log.info(f"Cancelling all orders: {command}")
@@ -407,39 +488,38 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             self._log.error(f"Instrument not found for lmax_id: {command.instrument_id}")
             return
 
-        orders: list[LmaxOrder] = await self._xml_client.request_orders(
-            security_id=security_id,
-            side=command.order_side,
-            open_only=True,
-        )
-
         # orders = self._cache.orders_open(instrument_id=command.instrument_id)
         # for order in orders:
         #     print(order)
 
-        if len(orders) == 0:
+        # send each cancel as soon as its order is parsed, not after the whole list
+        tasks = []
+        async for order in self._xml_client.iter_orders(
+            security_id=security_id,
+            side=command.order_side,
+            open_only=True,
+        ):
+            cancel = CancelOrder(
+                trader_id=command.trader_id,
+                strategy_id=command.strategy_id,
+                instrument_id=command.instrument_id,
+                client_order_id=order.client_order_id,
+                venue_order_id=order.venue_order_id,
+                command_id=UUID4(),
+                ts_init=self._clock.timestamp_ns(),
+            )
+            tasks.append(self._loop.create_task(self._cancel_order(cancel)))
+
+        if len(tasks) == 0:
             self._log.info(
                 f"Nothing to cancel, no open orders for instrument {command.instrument_id}",
             )
             return
 
-        tasks = [
-            self._cancel_order(
-                CancelOrder(
-                    trader_id=command.trader_id,
-                    strategy_id=command.strategy_id,
-                    instrument_id=command.instrument_id,
-                    client_order_id=order.client_order_id,
-                    venue_order_id=order.venue_order_id,
-                    command_id=UUID4(),
-                    ts_init=self._clock.timestamp_ns(),
-                ),
-            )
-            for order in orders
-        ]
         return await asyncio.gather(*tasks)
 
     async def _cancel_order(self, command: CancelOrder) -> None:
+        received_ns = time.perf_counter_ns() if self._timings.enabled else 0
         self._log.info(f"Cancelling: {command}")
 
         security_id = self._instrument_provider.get_security_id(command.instrument_id)
@@ -447,28 +527,22 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             self._log.error(f"Instrument not found for lmax_id: {command.instrument_id}")
             return
 
-        msg = OrderCancelRequest()
-
         request_id = await self._generate_request_id()
 
-        msg.append_pair(11, request_id)  # ClOrdID:
-
-        msg.append_pair(41, command.client_order_id.value)  # OrigClOrdID
-
-        msg.append_pair(48, security_id)  # SecurityID
-        msg.append_pair(22, 8)  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
-
-        # TransactTime: required but ignored by LMAX. Can't be an empty string. YYYYMMDD-HH:MM:SS
-        msg.append_pair(60, "19700101-00:00:00")  # TransactTime
-
-        self._cache.order(command.client_order_id)
-        # assert order is not None
-
         self._pending[request_id] = self._cache.order(command.client_order_id)
 
-        await self._fix_client.send_message(msg)
+        if received_ns != 0:
+            self._timings.record_since(self._order_command_stage, received_ns)
+        await self._fix_client.send_template(
+            self._cancel_order_template,
+            request_id,  # ClOrdID
+            command.client_order_id.value,  # OrigClOrdID
+            security_id,  # SecurityID
+            received_ns=received_ns,
+        )
 
     async def _modify_order(self, command: ModifyOrder) -> None:
+        received_ns = time.perf_counter_ns() if self._timings.enabled else 0
         self._log.info(f"Modifying: {command}")
         security_id = self._instrument_provider.get_security_id(command.instrument_id)
         if security_id is None:
@@ -484,40 +558,25 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
             self._log.error(f"unsupported order type: {order.type}")
             return
 
-        msg = OrderCancelReplaceRequest()
-
         request_id = await self._generate_request_id()
 
-        msg.append_pair(11, request_id)  # ClOrdID
-
-        msg.append_pair(41, command.client_order_id.value)  # OrigClOrdID
-
-        msg.append_pair(48, security_id)  # SecurityID
-        msg.append_pair(22, 8)  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
-
-        # TransactTime: required but ignored by LMAX. Can't be an empty string. YYYYMMDD-HH:MM:SS
-        msg.append_pair(60, "19700101-00:00:00")  # TransactTime
-
-        # msg.append_pair(60, format_lmax_timestamp(self._utc_now()))  # TransactTime
-        msg.append_pair(18, "H")  # ExecInst=H (do not cancel on disconnect)
-
-        msg.append_pair(54, int(order.side))  # OrdSide
-
         quantity = command.quantity if command.quantity is not None else order.quantity
-        msg.append_pair(38, str(quantity))  # OrderQty
-
         price = command.price if command.price is not None else order.price
-        msg.append_pair(44, str(price))  # Price
-
-        msg.append_pair(40, 2)  # OrdType: Limit
-        msg.append_pair(59, 1)  # TimeInForce: GTC
-
-        order = self._cache.order(command.client_order_id)
-        # assert order is not None
 
         self._pending[request_id] = order
 
-        await self._fix_client.send_message(msg)
+        if received_ns != 0:
+            self._timings.record_since(self._order_command_stage, received_ns)
+        await self._fix_client.send_template(
+            self._modify_order_template,
+            request_id,  # ClOrdID
+            command.client_order_id.value,  # OrigClOrdID
+            security_id,  # SecurityID
+            int(order.side),  # Side
+            str(quantity),  # OrderQty
+            str(price),  # Price
+            received_ns=received_ns,
+        )
 
     async def _generate_request_id(self) -> str:
         r"""
@@ -565,31 +624,32 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
         #         )
         #     )
         # security_id = self._instrument_provider.get_security_id(instrument_id=instrument_id)
-        orders: list[LmaxOrder] = await self._xml_client.request_orders(
+        # request the status of each order as soon as it is parsed
+        tasks = []
+        async for order in self._xml_client.iter_orders(
             # security_id=security_id,
             start=start,
             end=end,
             open_only=open_only,
-        )
-
-        if len(orders) == 0:
-            return []
-
-        tasks = []
-        for order in orders:
+        ):
             instrument = self._instrument_provider.find_with_security_id(order.instrumentId)
             if instrument is None:
                 self._log.error(f"Instrument not found for instrument_id: {instrument_id}")
                 continue
 
             tasks.append(
-                self._generate_order_status_report(
-                    instrument_id=instrument.id,
-                    client_order_id=order.client_order_id,
-                    side=order.side,
+                self._loop.create_task(
+                    self._generate_order_status_report(
+                        instrument_id=instrument.id,
+                        client_order_id=order.client_order_id,
+                        side=order.side,
+                    ),
                 ),
             )
 
+        if len(tasks) == 0:
+            return []
+
         reports = await asyncio.gather(*tasks)
         reports = [report for report in reports if report is not None]
         return sorted(reports, key=lambda x: x.ts_accepted)
@@ -680,7 +740,7 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
         end: pd.Timestamp | None = None,
     ) -> list[PositionStatusReport]:
         reports = []
-        for position in await self._xml_client.request_positions(open_only=True):
+        async for position in self._xml_client.iter_positions(open_only=True):
             instrument = self._instrument_provider.find_with_security_id(position.instrumentId)
             assert instrument is not None
             self._log.info(str(position))
@@ -1125,7 +1185,7 @@ class LmaxLiveExecutionClient(LiveExecutionClient):
 # instrument = self._instrument_provider.find_with_lmax_id(int(msg.get(48)))  # SecurityID
 # assert instrument is not None  # TODO: handle this case
 
-# # ts_event = parse_lmax_timestamp_ns(msg.get(60).decode())  # TransactTime
+# # ts_event = parse_lmax_timestamp_ns(msg.get(60))  # TransactTime
 # # venue_order_id = VenueOrderId(msg.get(37).decode())  # OrderID
 
 # # if exec_type == ExecType.REPLACE or exec_type == ExecType.CANCELED:
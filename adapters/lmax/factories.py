@@ -13,6 +13,7 @@ from pytower.adapters.lmax.config import LmaxExecClientConfig
 from pytower.adapters.lmax.data import LmaxLiveDataClient
 from pytower.adapters.lmax.execution import LmaxLiveExecutionClient
 from pytower.adapters.lmax.fix.client import LmaxFixClient
+from pytower.adapters.lmax.fix.ingest import MarketDataIngestProcess
 from pytower.adapters.lmax.providers import LmaxInstrumentProvider
 from pytower.adapters.lmax.xml.client import LmaxXmlClient
 
@@ -37,6 +38,18 @@ def get_cached_lmax_fix_client(
     clock: LiveClock,
     heartbeat_frequency_seconds: int = 30,
     logon_timeout_seconds: int = 10,
+    read_buffer_size: int = 65536,
+    max_messages_per_second: float | None = None,
+    write_high_water: int = 65536,
+    session_store_path: str | None = None,
+    reconnect: bool = True,
+    reconnect_initial_delay_seconds: float = 0.5,
+    reconnect_max_delay_seconds: float = 30.0,
+    test_request_interval_seconds: float | None = 30.0,
+    io_thread: bool = False,
+    journal_path: str | None = None,
+    log_messages: bool = False,
+    stage_timings: bool = False,
 ) -> LmaxFixClient:
     return LmaxFixClient(
         hostname=hostname,
@@ -48,6 +61,18 @@ def get_cached_lmax_fix_client(
         clock=clock,
         heartbeat_frequency_seconds=heartbeat_frequency_seconds,
         logon_timeout_seconds=logon_timeout_seconds,
+        read_buffer_size=read_buffer_size,
+        max_messages_per_second=max_messages_per_second,
+        write_high_water=write_high_water,
+        session_store_path=session_store_path,
+        reconnect=reconnect,
+        reconnect_initial_delay_seconds=reconnect_initial_delay_seconds,
+        reconnect_max_delay_seconds=reconnect_max_delay_seconds,
+        test_request_interval_seconds=test_request_interval_seconds,
+        io_thread=io_thread,
+        journal_path=journal_path,
+        log_messages=log_messages,
+        stage_timings=stage_timings,
     )
 
 
@@ -60,6 +85,12 @@ def get_cached_lmax_xml_client(
     cache: Cache,
     logger: Logger,
     loop: asyncio.AbstractEventLoop,
+    heartbeat_interval_seconds: float | None = 300.0,
+    max_concurrent_requests: int = 6,
+    query_concurrency: int = 2,
+    historic_concurrency: int = 1,
+    download_concurrency: int = 2,
+    historic_timeout_seconds: float = 60.0,
 ) -> LmaxXmlClient:
     return LmaxXmlClient(
         hostname=hostname,
@@ -69,6 +100,12 @@ def get_cached_lmax_xml_client(
         cache=cache,
         logger=logger,
         loop=loop,
+        heartbeat_interval_seconds=heartbeat_interval_seconds,
+        max_concurrent_requests=max_concurrent_requests,
+        query_concurrency=query_concurrency,
+        historic_concurrency=historic_concurrency,
+        download_concurrency=download_concurrency,
+        historic_timeout_seconds=historic_timeout_seconds,
     )
 
 
@@ -95,6 +132,12 @@ class LmaxLiveDataClientFactory(LiveDataClientFactory):
             cache=cache,
             logger=logger,
             loop=loop,
+            heartbeat_interval_seconds=config.xml_client.heartbeat_interval_seconds,
+            max_concurrent_requests=config.xml_client.max_concurrent_requests,
+            query_concurrency=config.xml_client.query_concurrency,
+            historic_concurrency=config.xml_client.historic_concurrency,
+            download_concurrency=config.xml_client.download_concurrency,
+            historic_timeout_seconds=config.xml_client.historic_timeout_seconds,
         )
 
         # Get instrument provider singleton
@@ -117,8 +160,30 @@ class LmaxLiveDataClientFactory(LiveDataClientFactory):
             clock=clock,
             heartbeat_frequency_seconds=config.fix_client.heartbeat_frequency_seconds,
             logon_timeout_seconds=config.fix_client.logon_timeout_seconds,
+            read_buffer_size=config.fix_client.read_buffer_size,
+            max_messages_per_second=config.fix_client.max_messages_per_second,
+            write_high_water=config.fix_client.write_high_water,
+            # the session of the ingest process owns the store, this client never connects
+            session_store_path=(
+                None if config.ingest_process else config.fix_client.session_store_path
+            ),
+            reconnect=config.fix_client.reconnect,
+            reconnect_initial_delay_seconds=config.fix_client.reconnect_initial_delay_seconds,
+            reconnect_max_delay_seconds=config.fix_client.reconnect_max_delay_seconds,
+            test_request_interval_seconds=config.fix_client.test_request_interval_seconds,
+            io_thread=config.fix_client.io_thread,
+            journal_path=config.fix_client.journal_path,
+            log_messages=config.fix_client.log_messages,
+            stage_timings=config.fix_client.stage_timings,
         )
 
+        ingest = None
+        if config.ingest_process:
+            ingest = MarketDataIngestProcess(
+                config=config.fix_client,
+                capacity=config.ingest_capacity,
+            )
+
         # Create client
         return LmaxLiveDataClient(
             fix_client=fix_client,
@@ -129,6 +194,13 @@ class LmaxLiveDataClientFactory(LiveDataClientFactory):
             logger=logger,
             loop=loop,
             clock=clock,
+            ingest=ingest,
+            subscription_window_seconds=config.subscription_window_seconds,
+            subscription_batch_size=config.subscription_batch_size,
+            drop_duplicate_quotes=config.drop_duplicate_quotes,
+            conflate_quotes=config.conflate_quotes,
+            stale_quote_threshold_seconds=config.stale_quote_threshold_seconds,
+            feed_summary_interval_seconds=config.feed_summary_interval_seconds,
         )
 
 
@@ -151,6 +223,12 @@ class LmaxLiveExecClientFactory(LiveExecClientFactory):
             cache=cache,
             logger=logger,
             loop=loop,
+            heartbeat_interval_seconds=config.xml_client.heartbeat_interval_seconds,
+            max_concurrent_requests=config.xml_client.max_concurrent_requests,
+            query_concurrency=config.xml_client.query_concurrency,
+            historic_concurrency=config.xml_client.historic_concurrency,
+            download_concurrency=config.xml_client.download_concurrency,
+            historic_timeout_seconds=config.xml_client.historic_timeout_seconds,
         )
 
         # Get instrument provider singleton
@@ -173,6 +251,18 @@ class LmaxLiveExecClientFactory(LiveExecClientFactory):
             clock=clock,
             heartbeat_frequency_seconds=config.fix_client.heartbeat_frequency_seconds,
             logon_timeout_seconds=config.fix_client.logon_timeout_seconds,
+            read_buffer_size=config.fix_client.read_buffer_size,
+            max_messages_per_second=config.fix_client.max_messages_per_second,
+            write_high_water=config.fix_client.write_high_water,
+            session_store_path=config.fix_client.session_store_path,
+            reconnect=config.fix_client.reconnect,
+            reconnect_initial_delay_seconds=config.fix_client.reconnect_initial_delay_seconds,
+            reconnect_max_delay_seconds=config.fix_client.reconnect_max_delay_seconds,
+            test_request_interval_seconds=config.fix_client.test_request_interval_seconds,
+            io_thread=config.fix_client.io_thread,
+            journal_path=config.fix_client.journal_path,
+            log_messages=config.fix_client.log_messages,
+            stage_timings=config.fix_client.stage_timings,
         )
 
         return LmaxLiveExecutionClient(
@@ -0,0 +1,216 @@
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import OrderBookDepth10
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from pytower.adapters.lmax.fix.parsing import parse_raw
+from pytower.adapters.lmax.fix.timestamps import parse_utc_date_time_ns
+
+
+DEPTH10_LEN = 10
+
+
+def read_levels(msg) -> tuple[dict[bytes, bytes], dict[bytes, bytes]]:
+    """
+    Return the bid and offer levels of a MarketDataSnapshotFullRefresh as
+    MDEntryPx -> MDEntrySize bytes, in book order.
+    """
+    bids: dict[bytes, bytes] = {}
+    asks: dict[bytes, bytes] = {}
+    get = msg.get
+    for nth in range(1, int(get(268) or 0) + 1):  # NoMDEntries
+        levels = bids if get(269, nth) == b"0" else asks  # MDEntryType: Bid
+        levels[get(270, nth)] = get(271, nth)  # MDEntryPx, MDEntrySize
+    return bids, asks
+
+
+def diff_levels(
+    previous: dict[bytes, bytes],
+    current: dict[bytes, bytes],
+) -> list[tuple[BookAction, bytes, bytes]]:
+    """
+    Return the (action, price, size) changes from the previous to the current levels
+    of one side, compared by their bytes.
+    """
+    changes = []
+    for price, size in current.items():
+        previous_size = previous.get(price)
+        if previous_size is None:
+            changes.append((BookAction.ADD, price, size))
+        elif previous_size != size:
+            changes.append((BookAction.UPDATE, price, size))
+    for price, size in previous.items():
+        if price not in current:
+            changes.append((BookAction.DELETE, price, size))
+    return changes
+
+
+class LmaxOrderBook:
+    """
+    Maintains the L2 price levels of an instrument from MarketDataSnapshotFullRefresh
+    messages and emits only the levels which changed.
+
+    Each side is kept as its MDEntryPx -> MDEntrySize bytes from the last snapshot.
+    A new snapshot is compared to it by those bytes, so prices and sizes are only
+    parsed, and book orders only built, for the levels which changed. With `depth10`
+    the top of the book is emitted as an `OrderBookDepth10` which reuses the book
+    orders of unchanged levels, otherwise the changes are emitted as
+    `OrderBookDeltas`, starting with a clear of the book.
+
+    The deltas of the first snapshot, and every `OrderBookDepth10`, are flagged with
+    `F_SNAPSHOT`, and the last delta of each `OrderBookDeltas` with `F_LAST`, so a
+    DataEngine buffering deltas flushes the batch.
+
+    """
+
+    __slots__ = (
+        "instrument_id",
+        "security_id",
+        "price_precision",
+        "size_precision",
+        "depth10",
+        "sequence",
+        "_bids",
+        "_asks",
+        "_bid_orders",
+        "_ask_orders",
+        "_null_order",
+        "_is_initialized",
+    )
+
+    def __init__(self, instrument: Instrument, depth10: bool = False):
+        self.instrument_id = instrument.id
+        self.security_id: bytes = str(instrument.info["id"]).encode()
+        self.price_precision: int = instrument.price_precision
+        self.size_precision: int = instrument.size_precision
+        self.depth10 = depth10
+        self.sequence = 0
+        self._null_order = BookOrder(
+            side=OrderSide.NO_ORDER_SIDE,
+            price=Price.from_raw(0, self.price_precision),
+            size=Quantity.from_raw(0, self.size_precision),
+            order_id=0,
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget the levels, so the next snapshot is emitted in full.
+        """
+        self._bids: dict[bytes, bytes] = {}
+        self._asks: dict[bytes, bytes] = {}
+        self._bid_orders: dict[bytes, BookOrder] = {}
+        self._ask_orders: dict[bytes, BookOrder] = {}
+        self._is_initialized = False
+
+    @property
+    def bids(self) -> dict[bytes, bytes]:
+        return self._bids
+
+    @property
+    def asks(self) -> dict[bytes, bytes]:
+        return self._asks
+
+    def apply(self, msg, ts_init: int) -> OrderBookDeltas | OrderBookDepth10 | None:
+        """
+        Apply a snapshot and return the changes, or ``None`` if nothing changed.
+        """
+        bids, asks = read_levels(msg)
+        bid_changes = diff_levels(self._bids, bids)
+        ask_changes = diff_levels(self._asks, asks)
+        is_initialized = self._is_initialized
+        self._bids = bids
+        self._asks = asks
+        self._is_initialized = True
+        if is_initialized and not bid_changes and not ask_changes:
+            return None
+
+        self.sequence += 1
+        date = msg.get(272)  # MDEntryDate, only present on the first entry
+        ts_event = parse_utc_date_time_ns(date, msg.get(273)) if date is not None else ts_init
+
+        if self.depth10:
+            self._update_orders(self._bid_orders, bid_changes, OrderSide.BUY)
+            self._update_orders(self._ask_orders, ask_changes, OrderSide.SELL)
+            return self._depth10(ts_event, ts_init)
+
+        flags = 0 if is_initialized else RecordFlag.F_SNAPSHOT
+        remaining = len(bid_changes) + len(ask_changes)
+        deltas = []
+        if not is_initialized:
+            deltas.append(
+                OrderBookDelta(
+                    instrument_id=self.instrument_id,
+                    action=BookAction.CLEAR,
+                    order=None,
+                    flags=flags if remaining else flags | RecordFlag.F_LAST,
+                    sequence=self.sequence,
+                    ts_event=ts_event,
+                    ts_init=ts_init,
+                ),
+            )
+        for changes, side in ((bid_changes, OrderSide.BUY), (ask_changes, OrderSide.SELL)):
+            for action, price, size in changes:
+                remaining -= 1
+                deltas.append(
+                    OrderBookDelta(
+                        instrument_id=self.instrument_id,
+                        action=action,
+                        order=self._book_order(
+                            side,
+                            price,
+                            size if action != BookAction.DELETE else b"0",
+                        ),
+                        flags=flags if remaining else flags | RecordFlag.F_LAST,
+                        sequence=self.sequence,
+                        ts_event=ts_event,
+                        ts_init=ts_init,
+                    ),
+                )
+        return OrderBookDeltas(instrument_id=self.instrument_id, deltas=deltas)
+
+    def _book_order(self, side: OrderSide, price: bytes, size: bytes) -> BookOrder:
+        price_precision = self.price_precision
+        size_precision = self.size_precision
+        return BookOrder(
+            side=side,
+            price=Price.from_raw(parse_raw(price, price_precision), price_precision),
+            size=Quantity.from_raw(parse_raw(size, size_precision), size_precision),
+            order_id=0,
+        )
+
+    def _update_orders(
+        self,
+        orders: dict[bytes, BookOrder],
+        changes: list[tuple[BookAction, bytes, bytes]],
+        side: OrderSide,
+    ) -> None:
+        for action, price, size in changes:
+            if action == BookAction.DELETE:
+                orders.pop(price, None)
+            else:
+                orders[price] = self._book_order(side, price, size)
+
+    def _depth10(self, ts_event: int, ts_init: int) -> OrderBookDepth10:
+        bids = [self._bid_orders[price] for price in list(self._bids)[:DEPTH10_LEN]]
+        asks = [self._ask_orders[price] for price in list(self._asks)[:DEPTH10_LEN]]
+        bid_counts = [1] * len(bids) + [0] * (DEPTH10_LEN - len(bids))
+        ask_counts = [1] * len(asks) + [0] * (DEPTH10_LEN - len(asks))
+        bids += [self._null_order] * (DEPTH10_LEN - len(bids))
+        asks += [self._null_order] * (DEPTH10_LEN - len(asks))
+        return OrderBookDepth10(
+            instrument_id=self.instrument_id,
+            bids=bids,
+            asks=asks,
+            bid_counts=bid_counts,
+            ask_counts=ask_counts,
+            flags=RecordFlag.F_SNAPSHOT | RecordFlag.F_LAST,
+            sequence=self.sequence,
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
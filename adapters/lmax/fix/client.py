@@ -1,5 +1,7 @@
 import asyncio
+import heapq
 import ssl
+import time
 from collections import deque
 from collections.abc import Callable
 
@@ -9,13 +11,46 @@ from simplefix import FixParser
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import LoggerAdapter
-from nautilus_trader.core.datetime import unix_nanos_to_dt
+from pytower.adapters.lmax.common import LatencyHistogram
+from pytower.adapters.lmax.common import RateLimiter
+from pytower.adapters.lmax.common import StageTimings
+from pytower.adapters.lmax.fix.correlation import CorrelationRegistry
+from pytower.adapters.lmax.fix.decoder import MarketDataSnapshotFullRefreshView
+from pytower.adapters.lmax.fix.decoder import peek_message_type
+from pytower.adapters.lmax.fix.encoder import FixTemplate
+from pytower.adapters.lmax.fix.framing import FixFramer
+from pytower.adapters.lmax.fix.framing import SOH
+from pytower.adapters.lmax.fix.heartbeat import FixHeartbeatEngine
+from pytower.adapters.lmax.fix.iothread import FixIoThread
+from pytower.adapters.lmax.fix.journal import INBOUND
+from pytower.adapters.lmax.fix.journal import OUTBOUND
+from pytower.adapters.lmax.fix.journal import FixJournal
 from pytower.adapters.lmax.fix.messages import Heartbeat
 from pytower.adapters.lmax.fix.messages import Logon
 from pytower.adapters.lmax.fix.messages import Logout
 from pytower.adapters.lmax.fix.messages import Reject
+from pytower.adapters.lmax.fix.messages import ResendRequest
+from pytower.adapters.lmax.fix.messages import SequenceReset
 from pytower.adapters.lmax.fix.messages import TestRequest
 from pytower.adapters.lmax.fix.messages import downcast_message
+from pytower.adapters.lmax.fix.messages import get_message_type
+from pytower.adapters.lmax.fix.messages import raw_to_message
+from pytower.adapters.lmax.fix.routing import FixRouter
+from pytower.adapters.lmax.fix.routing import RouteStats
+from pytower.adapters.lmax.fix.store import FixSessionStore
+from pytower.adapters.lmax.fix.supervisor import FixConnectionSupervisor
+from pytower.adapters.lmax.fix.supervisor import RecoveryStats
+from pytower.adapters.lmax.fix.timestamps import SendingTimeFormatter
+
+
+_LOGON = get_message_type(Logon)
+_SEQUENCE_RESET = get_message_type(SequenceReset)
+
+# session level messages are never resent, they are replaced by a SequenceReset-GapFill
+_SESSION_MESSAGE_TYPES = {
+    get_message_type(cls)
+    for cls in (Heartbeat, TestRequest, ResendRequest, Reject, SequenceReset, Logout, Logon)
+}
 
 
 class LmaxFixClient:
@@ -30,23 +65,100 @@ class LmaxFixClient:
         clock: LiveClock,
         heartbeat_frequency_seconds: int = 30,
         logon_timeout_seconds: int = 10,
+        read_buffer_size: int = 65536,
+        max_messages_per_second: float | None = None,
+        write_high_water: int = 65536,
+        session_store_path: str | None = None,
+        reconnect: bool = True,
+        reconnect_initial_delay_seconds: float = 0.5,
+        reconnect_max_delay_seconds: float = 30.0,
+        test_request_interval_seconds: float | None = 30.0,
+        io_thread: bool = False,
+        journal_path: str | None = None,
+        log_messages: bool = False,
+        stage_timings: bool = False,
     ):
         self._logger = logger
         self._loop = loop
-        self._handlers = set()
+        self._router = FixRouter()
         self._host = hostname
         self._username = username
         self._password = password
         self._target_comp_id = target_comp_id
         self._heartbeat_frequency_seconds = heartbeat_frequency_seconds
         self._logon_timeout_seconds = logon_timeout_seconds
-        self._message_sequence_number = 1
+        self._read_buffer_size = read_buffer_size
+        self._io_thread = io_thread
+        self._io: FixIoThread | None = None
+        self._write_high_water = write_high_water
+        self._rate_limiter = (
+            RateLimiter(max_messages_per_second) if max_messages_per_second is not None else None
+        )
+        # (template, payload, perf counter time the message was received or 0)
+        self._outbound: deque[tuple[FixTemplate | None, tuple | FixMessage | bytes, int]] = deque()
+        self._outbound_ready = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._sender_task: asyncio.Task | None = None
+        self._store = FixSessionStore(
+            path=session_store_path,
+            session_id=f"{username}-{target_comp_id}",
+        )
+        self._message_sequence_number = self._store.next_outbound_sequence_number
+        # opened on connect, so a client which is never connected maps no segment
+        self._journal_path = journal_path
+        self._journal: FixJournal | None = None
+        self._log_messages = log_messages
+        self._timings = StageTimings(enabled=stage_timings)
+        self._frame_stage = self._timings.add_stage("frame")
+        self._decode_stage = self._timings.add_stage("decode")
+        self._dispatch_stage = self._timings.add_stage("dispatch")
+        self._read_to_handled_stage = self._timings.add_stage("read_to_handled")
+        self._outbound_stage = self._timings.add_stage("enqueue_to_write")
+        self._inbound_gap: tuple[int, int] | None = None
+        self._is_logging_out = False  # after a session error, until the next connect
+        self._sending_time = SendingTimeFormatter()
         self._clock = clock
         self.is_logged_on = asyncio.Event()
         self.is_connected = False
+        self.is_disconnected = asyncio.Event()
+        self.last_received_ns = 0
+        self.last_sent_ns = 0
+        self._listen_task: asyncio.Task | None = None
+        self._reconnect_handlers: list[Callable] = []
         self.processed_count = 0
         self._event_history: deque[FixMessage] = deque(maxlen=200)
+        self._correlations = CorrelationRegistry()
+        self._count_waiters: list[tuple[int, int, asyncio.Future]] = []
         self._log = LoggerAdapter(type(self).__name__ + self._target_comp_id, logger)
+        self._session_handlers: dict[bytes, Callable | None] = {
+            get_message_type(Logon): self._handle_logon,
+            get_message_type(TestRequest): self._handle_test_request,
+            get_message_type(Logout): self._handle_logout,
+            get_message_type(Reject): self._handle_reject,
+            get_message_type(ResendRequest): self._handle_resend_request,
+            get_message_type(Heartbeat): self._handle_heartbeat,
+        }
+        self._heartbeats = FixHeartbeatEngine(
+            fix_client=self,
+            clock=clock,
+            logger=logger,
+            heartbeat_interval_seconds=heartbeat_frequency_seconds,
+            test_request_interval_seconds=test_request_interval_seconds,
+        )
+        self._supervisor = (
+            FixConnectionSupervisor(
+                fix_client=self,
+                clock=clock,
+                logger=logger,
+                # the server sends a Heartbeat every interval while idle
+                heartbeat_timeout_seconds=heartbeat_frequency_seconds * 2,
+                initial_delay_seconds=reconnect_initial_delay_seconds,
+                max_delay_seconds=reconnect_max_delay_seconds,
+            )
+            if reconnect
+            else None
+        )
 
     @property
     def username(self) -> str:
@@ -64,6 +176,37 @@ class LmaxFixClient:
     def clock(self) -> LiveClock:
         return self._clock
 
+    @property
+    def stage_timings(self) -> StageTimings:
+        """
+        Return the hot path stage timings of the session, which the live clients add
+        their own stages to. Set `enabled` to switch them on or off.
+        """
+        return self._timings
+
+    @property
+    def log_messages(self) -> bool:
+        """
+        Return whether every message is logged at DEBUG, see `FixJournal` for an
+        audit trail which does not format every message.
+        """
+        return self._log_messages
+
+    @property
+    def recovery_stats(self) -> RecoveryStats | None:
+        """
+        Return the reconnect count and time-to-recover timings, ``None`` if reconnects
+        are disabled.
+        """
+        return self._supervisor.stats if self._supervisor is not None else None
+
+    @property
+    def latency_histogram(self) -> LatencyHistogram:
+        """
+        Return the rolling TestRequest round-trip times of the session.
+        """
+        return self._heartbeats.histogram
+
     async def connect(self) -> None:
         if self.is_connected:
             self._log.info("Already connected")
@@ -79,10 +222,34 @@ class LmaxFixClient:
 
         self._log.info("Opening connection")
 
-        self._reader, self._writer = await asyncio.open_connection(self._host, 443, ssl=ssl_context)
+        if self._io_thread:
+            # socket, TLS and framing run on a dedicated thread, see `FixIoThread`
+            self._io = FixIoThread(
+                read_buffer_size=self._read_buffer_size,
+                write_high_water=self._write_high_water,
+            )
+            await self._io.connect(self._host, 443, ssl_context)
+            self._writer = self._io
+        else:
+            self._reader, self._writer = await asyncio.open_connection(
+                self._host,
+                443,
+                ssl=ssl_context,
+            )
+            self._writer.transport.set_write_buffer_limits(high=self._write_high_water)
+
+        self.is_disconnected.clear()
+        self._is_logging_out = False
+        self.last_received_ns = self._clock.timestamp_ns()
+        self._open_journal()
 
         self._log.info("Starting recv loop")
-        self._loop.create_task(self.listen())
+        self._listen_task = self._loop.create_task(self.listen())
+
+        # messages queued while the session was down are sent after the Logon
+        self._log.info("Starting send loop")
+        self._writable.set()
+        self._sender_task = self._loop.create_task(self._send_loop())
 
         # Logon
         # task = asyncio.wait_for(self.is_logged_on.wait(), timeout=self._logon_timeout_seconds)
@@ -96,105 +263,374 @@ class LmaxFixClient:
 
         self.is_connected = True
 
+        self._heartbeats.start()
+        if self._supervisor is not None:
+            self._supervisor.start()
+
+    async def reconnect(self) -> None:
+        """
+        Re-open the connection, log on again and run the reconnect handlers.
+        """
+        self._close()
+        self.is_connected = False
+        await self.connect()
+        await asyncio.wait_for(self.is_logged_on.wait(), timeout=self._logon_timeout_seconds)
+
+        for handler in self._reconnect_handlers:
+            await handler()
+
+    def register_reconnect_handler(self, handler: Callable) -> None:
+        """
+        Register a coroutine function called after every reconnect, once logged on.
+
+        Used to replay the state held by the server for the session, such as market
+        data subscriptions.
+
+        """
+        self._reconnect_handlers.append(handler)
+
     # async def wait_for_logon(self) -> None:
     #     self._log.info("Waiting for logon...")
     async def wait_for_events(self, count: int) -> None:
         target = self.processed_count + count
         self._log.info(f"Waiting for processed_count: {target}")
-        while True:
-            await asyncio.sleep(0)
-            if self.processed_count >= target:
-                break
+        if self.processed_count < target:
+            future = asyncio.get_running_loop().create_future()
+            entry = (target, id(future), future)
+            heapq.heappush(self._count_waiters, entry)
+            try:
+                await future
+            finally:
+                # a waiter which timed out or was cancelled is never resolved
+                if entry in self._count_waiters:
+                    self._count_waiters.remove(entry)
+                    heapq.heapify(self._count_waiters)
         self._log.info("Events received")
-        await asyncio.sleep(0)
 
     async def wait_for_event(
         self,
         cls: type,
-        tags: dict[str, str] | None = None,
+        tags: dict[int, str] | None = None,
         timeout_seconds=2,
     ) -> FixMessage:
         self._log.info(f"Waiting msg type {cls.__name__}: tags: {tags}")
+
+        # the response may already have been handled before the caller started waiting
+        msg = self._find_event(cls=cls, tags=tags)
+        if msg is not None:
+            return msg
+
+        future = self._correlations.register(cls=cls, tags=tags)
         try:
-            return await asyncio.wait_for(
-                self._wait_for_event(cls=cls, tags=tags),
-                timeout=timeout_seconds,
-            )
+            return await asyncio.wait_for(future, timeout=timeout_seconds)
         except asyncio.TimeoutError as e:
             self._log.error(
                 f"Timeout occurred while waiting for event {cls.__name__} with tags {tags}",
             )
             raise e  # re-raise
-
-    async def _wait_for_event(self, cls: type, tags: dict[str, str] | None = None) -> FixMessage:
-        while True:
-            await asyncio.sleep(0)
-            for msg in self._event_history:
-                if type(msg) is cls and (
-                    tags is None
-                    or all(
-                        msg.get(key) is not None and msg.get(key).decode() == value
-                        for key, value in tags.items()
-                    )
-                ):
-                    # await asyncio.sleep(0)
-                    return msg
-            # await asyncio.sleep(0)
+        finally:
+            self._correlations.discard(future)
+
+    def _find_event(self, cls: type, tags: dict[int, str] | None = None) -> FixMessage | None:
+        for msg in self._event_history:
+            if type(msg) is cls and (
+                tags is None
+                or all(
+                    msg.get(key) is not None and msg.get(key).decode() == value
+                    for key, value in tags.items()
+                )
+            ):
+                return msg
+        return None
 
     async def disconnect(self) -> None:
-        self._writer.close()
+        if self._supervisor is not None:
+            self._supervisor.stop()
+        self._close()
+        if self._outbound:
+            self._log.warning(f"Dropping {len(self._outbound)} unsent messages on disconnect")
+            self._outbound.clear()
+        self._store.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
         await self._writer.wait_closed()
 
+    def _open_journal(self) -> None:
+        if self._journal_path is not None and self._journal is None:
+            self._journal = FixJournal(
+                path=self._journal_path,
+                session_id=f"{self._username}-{self._target_comp_id}",
+            )
+
+    def _close(self) -> None:
+        self.is_logged_on.clear()  # a reconnect waits for the Logon of the new connection
+        self._heartbeats.stop()
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            self._sender_task = None
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        self._writer.close()
+
     async def listen(self):
-        # try:
+        framer = self._io.framer if self._io is not None else FixFramer()
         parser = FixParser(
             allow_empty_values=True,  # LMAX sends empty TargetCompID
-            # allow_missing_begin_string=True,
-            # strip_fields_before_begin_string=False,
         )
         while True:
-            # 2048 / 8
-            # TODO: high byte counts are dropping messages
-            raw = await self._reader.read(24)
-
-            parser.append_buffer(raw)
-
-            msg: FixMessage = parser.get_message()
-            if msg is not None:
-                await self._handle_message(downcast_message(msg))
+            frames = await self._read_frames(framer)
+            if frames is None:
+                self._log.warning("Connection closed by the server")
+                self.is_connected = False
+                self.is_logged_on.clear()
+                self.is_disconnected.set()
+                return
+
+            self.last_received_ns = self._clock.timestamp_ns()
+            if self._journal is not None:
+                self._journal.write_frames(self.last_received_ns, INBOUND, frames)
+
+            # dispatch every complete frame in the read, in order
+            if self._timings.enabled:
+                await self._handle_frames_timed(frames, parser)
+            else:
+                for frame in frames:
+                    if peek_message_type(frame) == b"W":
+                        # market data hot path: lazily decoded view over the frame
+                        await self._handle_message(MarketDataSnapshotFullRefreshView(frame))
+                        continue
+                    parser.append_buffer(frame)
+                    msg: FixMessage = parser.get_message()
+                    if msg is not None:
+                        await self._handle_message(downcast_message(msg))
+
+            if framer.discarded_count > 0:
+                self._log.error(f"Discarded {framer.discarded_count} malformed frames")
+                framer.discarded_count = 0
 
             await asyncio.sleep(0)
 
-        # except Exception as e:
-        #     self._log.info(f"Error occurred while receiving message: {e}")
-        # self._log.info(f"Handling raw: {raw.decode()})")
-        # msg = raw_to_message(raw)
+    async def _handle_frames_timed(self, frames: list[bytes], parser: FixParser) -> None:
+        """
+        Dispatch the frames as the listen loop does, recording the stage timings.
+        """
+        timings = self._timings
+        for frame in frames:
+            start = time.perf_counter_ns()
+            if peek_message_type(frame) == b"W":
+                msg = MarketDataSnapshotFullRefreshView(frame)
+            else:
+                parser.append_buffer(frame)
+                msg = parser.get_message()
+                if msg is None:
+                    continue
+                msg = downcast_message(msg)
+            decoded = time.perf_counter_ns()
+            timings.record(self._decode_stage, decoded - start)
+
+            await self._handle_message(msg)
+            end = time.perf_counter_ns()
+            timings.record(self._dispatch_stage, end - decoded)
+            timings.record(self._read_to_handled_stage, end - timings.origin_ns)
+
+    async def _read_frames(self, framer: FixFramer) -> list[bytes] | None:
+        """
+        Return the complete frames of the next read, or ``None`` once disconnected.
+        """
+        if self._io is not None:
+            frames = await self._io.read_frames()
+            self._timings.origin_ns = time.perf_counter_ns()
+            return frames
 
-    async def _handle_message(self, msg: FixMessage) -> None:
-        self._log.info(f"Handling message: {type(msg).__name__}({msg})")
+        try:
+            raw = await self._reader.read(self._read_buffer_size)
+        except OSError as e:  # includes ConnectionError and ssl.SSLError
+            self._log.error(f"Connection error: {e!r}")
+            return None
+        if not raw:
+            return None
+        start = self._timings.origin_ns = time.perf_counter_ns()
+        frames = framer.feed(raw)
+        if self._timings.enabled:
+            self._timings.record_since(self._frame_stage, start)
+        return frames
 
-        if type(msg) is Logon:
-            await self._handle_logon(msg)
-            return
-        elif type(msg) is TestRequest:
-            await self._handle_test_request(msg)
-            return
-        elif type(msg) is Logout:
-            await self._handle_logout(msg)
+    async def _handle_message(self, msg: FixMessage) -> None:
+        if self._is_logging_out:
+            return  # the rest of the read is not processed after a session error
+        if self._log_messages:
+            self._log.debug(f"Handling message: {type(msg).__name__}({msg})")
+
+        message_type = msg.message_type
+        if message_type == _SEQUENCE_RESET:
+            self._handle_sequence_reset(msg)
             return
-        elif type(msg) is Reject:
-            await self._handle_reject(msg)
+        elif message_type == _LOGON and msg.get(141) == b"Y":  # ResetSeqNumFlag
+            self._inbound_gap = None
+            self._store.set_next_inbound_sequence_number(int(msg.get(34)) + 1)  # MsgSeqNum
+        elif not self._check_sequence_number(msg):
             return
-        elif type(msg) is Heartbeat:
+
+        # session level messages are handled by the client only
+        if message_type in self._session_handlers:
+            handler = self._session_handlers[message_type]
+            if handler is not None:
+                await handler(msg)
             return
 
-        for handler in self._handlers:
-            await handler(msg)
+        await self._router.dispatch(msg)
 
         self.processed_count += 1
         # self._log.debug(f"Processed count: {self.processed_count}")
         self._event_history.appendleft(msg)
 
+        self._correlations.resolve(msg)
+        count_waiters = self._count_waiters
+        while count_waiters and count_waiters[0][0] <= self.processed_count:
+            future = heapq.heappop(count_waiters)[2]
+            if not future.done():
+                future.set_result(None)
+
+    def _check_sequence_number(self, msg: FixMessage) -> bool:
+        """
+        Track the inbound MsgSeqNum and request a resend when a gap is detected.
+
+        Returns False for a possible duplicate which has already been processed, and
+        for a MsgSeqNum lower than expected without PossDupFlag, after which the
+        session is logged out and closed.
+
+        """
+        value = msg.get(34)  # MsgSeqNum
+        if value is None:
+            return True
+
+        sequence_number = int(value)
+        expected = self._store.next_inbound_sequence_number
+        if sequence_number == expected:
+            self._store.set_next_inbound_sequence_number(expected + 1)
+            return True
+
+        if sequence_number > expected:
+            self._log.warning(
+                f"Inbound sequence gap detected, expected {expected} received {sequence_number}",
+            )
+            self._store.set_next_inbound_sequence_number(sequence_number + 1)
+            self._request_resend(expected, sequence_number - 1)
+            return True
+
+        gap = self._inbound_gap
+        if msg.get(43) == b"Y":  # PossDupFlag
+            if gap is None or not gap[0] <= sequence_number <= gap[1]:
+                return False  # already processed
+            if sequence_number == gap[1]:
+                self._log.info("Inbound sequence gap filled")
+                self._inbound_gap = None
+            return True
+
+        text = f"MsgSeqNum too low, expecting {expected} but received {sequence_number}"
+        self._log.error(text)
+        self._logout_and_close(text)
+        return False
+
+    def _logout_and_close(self, text: str) -> None:
+        """
+        Send a Logout with the text ahead of any queued message, then close the
+        connection, after a session error the session cannot recover from.
+        """
+        self._is_logging_out = True
+        msg = Logout()
+        msg.append_pair(58, text)  # Text
+        frame = self._encode(None, msg)
+        try:
+            self._writer.write(frame)
+        except Exception as e:
+            self._log.error(f"Failed to write Logout: {e!r}")
+        else:
+            self.last_sent_ns = self._clock.timestamp_ns()
+            if self._journal is not None:
+                self._journal.write_frames(self.last_sent_ns, OUTBOUND, [frame])
+        self._close()
+        self.is_connected = False
+        self.is_disconnected.set()
+
+    def _request_resend(self, begin: int, end: int) -> None:
+        gap = self._inbound_gap
+        if gap is not None:
+            begin = min(begin, gap[0])
+        self._inbound_gap = (begin, end)
+
+        msg = ResendRequest()
+        msg.append_pair(7, begin)  # BeginSeqNo
+        msg.append_pair(16, end)  # EndSeqNo
+        self._enqueue_nowait(None, msg)
+
+    def _handle_sequence_reset(self, msg: SequenceReset) -> None:
+        new_sequence_number = int(msg.get(36))  # NewSeqNo
+        self._log.info(f"SequenceReset received, NewSeqNo {new_sequence_number}")
+        if new_sequence_number > self._store.next_inbound_sequence_number:
+            self._store.set_next_inbound_sequence_number(new_sequence_number)
+        gap = self._inbound_gap
+        if gap is not None and new_sequence_number > gap[1]:
+            self._log.info("Inbound sequence gap filled")
+            self._inbound_gap = None
+
+    async def _handle_resend_request(self, msg: ResendRequest) -> None:
+        """
+        Answer a ResendRequest from the store.
+
+        Application messages are resent with PossDupFlag=Y, session level messages and
+        messages missing from the store are skipped with a SequenceReset-GapFill.
+
+        """
+        begin = int(msg.get(7))  # BeginSeqNo
+        end = int(msg.get(16))  # EndSeqNo
+        self._log.warning(f"ResendRequest received, BeginSeqNo {begin} EndSeqNo {end}")
+
+        frames = self._store.get_outbound(begin, end)
+        gap_fill_start = None
+        for sequence_number, raw in frames:
+            if raw is None or peek_message_type(raw) in _SESSION_MESSAGE_TYPES:
+                if gap_fill_start is None:
+                    gap_fill_start = sequence_number
+                continue
+            if gap_fill_start is not None:
+                self._enqueue_nowait(None, self._encode_gap_fill(gap_fill_start, sequence_number))
+                gap_fill_start = None
+            self._enqueue_nowait(None, self._encode_possible_duplicate(raw))
+
+        if gap_fill_start is not None:
+            new_sequence_number = frames[-1][0] + 1
+            self._enqueue_nowait(None, self._encode_gap_fill(gap_fill_start, new_sequence_number))
+
+    def _encode_gap_fill(self, sequence_number: int, new_sequence_number: int) -> bytes:
+        msg = SequenceReset()
+        msg.append_pair(8, "FIX.4.4")  # BeginString
+        msg.append_pair(35, msg.message_type)  # MsgType
+        msg.append_pair(49, self._username)  # SenderCompID
+        msg.append_pair(56, self._target_comp_id)  # TargetCompID
+        msg.append_pair(34, sequence_number)  # MsgSeqNum
+        msg.append_pair(43, "Y")  # PossDupFlag
+        msg.append_pair(52, self._sending_time.format(self._clock.timestamp_ns()))  # SendingTime
+        msg.append_pair(123, "Y")  # GapFillFlag
+        msg.append_pair(36, new_sequence_number)  # NewSeqNo
+        return msg.encode()
+
+    def _encode_possible_duplicate(self, raw: bytes) -> bytes:
+        msg = FixMessage()
+        for tag, value in raw_to_message(raw):
+            tag = int(tag)
+            if tag == 9 or tag == 10:  # BodyLength, CheckSum
+                continue
+            if tag == 52:  # SendingTime
+                msg.append_pair(43, "Y")  # PossDupFlag
+                msg.append_pair(52, self._sending_time.format(self._clock.timestamp_ns()))
+                msg.append_pair(122, value)  # OrigSendingTime
+            else:
+                msg.append_pair(tag, value)
+        return msg.encode()
+
     async def _handle_reject(self, msg: Reject) -> None:
         """
         45      RefSeqNum       MsgSeqNum of rejected message   Y       SeqNum 371
@@ -218,39 +654,182 @@ class LmaxFixClient:
         self.is_logged_on.clear()
 
     async def _handle_test_request(self, msg: TestRequest) -> None:
-        return
-        msg = Heartbeat()
-        request_id = msg.get(112)  # TestReqID
-        msg.append_pair(112, request_id)  # TestReqID
-        await self.send_message(msg)
+        heartbeat = Heartbeat()
+        heartbeat.append_pair(112, msg.get(112))  # TestReqID
+        await self.send_message(heartbeat)
+
+    async def _handle_heartbeat(self, msg: Heartbeat) -> None:
+        self._heartbeats.handle_heartbeat(msg)
 
-    async def send_message(self, msg: FixMessage) -> None:
+    async def send_message(self, msg: FixMessage, received_ns: int = 0) -> None:
         """
-        Send a message to the server.
+        Queue a message to be sent to the server.
+
+        The header, including the MsgSeqNum, is added when the message is dequeued by
+        the send loop. `received_ns` is the `time.perf_counter_ns` at which the
+        command which sends the message was received, for the stage timings.
+
         """
-        msg.append_pair(8, "FIX.4.4", header=True)  # BeginString
-        msg.append_pair(35, msg.message_type, header=True)  # MsgType
-        msg.append_pair(49, self._username, header=True)  # SenderCompID
-        msg.append_pair(56, self._target_comp_id, header=True)  # SenderCompID
-        msg.append_pair(34, self._message_sequence_number, header=True)  # MsgSeqNum
+        await self._enqueue(None, msg, received_ns)
 
-        now = unix_nanos_to_dt(self._clock.timestamp_ns())
-        msg.append_pair(52, now.strftime("%Y%m%d-%H:%M:%S.%f"), header=True)  # SendingTime
+    def create_template(
+        self,
+        message_cls: type[FixMessage],
+        fields: list[tuple[int, object | None]],
+    ) -> FixTemplate:
+        """
+        Create a pre-encoded message for this session, see `FixTemplate`.
+        """
+        return FixTemplate(
+            message_cls=message_cls,
+            fields=fields,
+            sender_comp_id=self._username,
+            target_comp_id=self._target_comp_id,
+        )
+
+    async def send_template(self, template: FixTemplate, *values, received_ns: int = 0) -> None:
+        """
+        Queue a pre-encoded message to be sent with the values filled into its slots.
+        """
+        await self._enqueue(template, values, received_ns)
 
-        self._log.info(f"Sending message: {type(msg).__name__}({msg})")
-        self._writer.write(msg.encode())
+    async def _enqueue(
+        self,
+        template: FixTemplate | None,
+        payload: tuple | FixMessage | bytes,
+        received_ns: int = 0,
+    ) -> None:
+        self._enqueue_nowait(template, payload, received_ns)
 
-        await self._writer.drain()
+        # backpressure, only while the transport is above its high-water mark
+        if not self._writable.is_set():
+            await self._writable.wait()
 
+    def _enqueue_nowait(
+        self,
+        template: FixTemplate | None,
+        payload: tuple | FixMessage | bytes,
+        received_ns: int = 0,
+        first: bool = False,
+    ) -> None:
+        if received_ns == 0 and self._timings.enabled:
+            received_ns = time.perf_counter_ns()
+        if first:
+            self._outbound.appendleft((template, payload, received_ns))
+        else:
+            self._outbound.append((template, payload, received_ns))
+        self._outbound_ready.set()
+
+    def _encode(self, template: FixTemplate | None, payload: tuple | FixMessage | bytes) -> bytes:
+        if type(payload) is bytes:
+            # resent frame which keeps its original MsgSeqNum
+            if self._log_messages:
+                self._log.debug(f"Sending message: {payload.replace(SOH, b'|').decode()}")
+            return payload
+
+        sequence_number = self._message_sequence_number
+        sending_time = self._sending_time.format(self._clock.timestamp_ns())
+
+        if template is None:
+            msg = payload
+            msg.append_pair(8, "FIX.4.4", header=True)  # BeginString
+            msg.append_pair(35, msg.message_type, header=True)  # MsgType
+            msg.append_pair(49, self._username, header=True)  # SenderCompID
+            msg.append_pair(56, self._target_comp_id, header=True)  # TargetCompID
+            msg.append_pair(34, sequence_number, header=True)  # MsgSeqNum
+            msg.append_pair(52, sending_time, header=True)  # SendingTime
+            if self._log_messages:
+                self._log.debug(f"Sending message: {type(msg).__name__}({msg})")
+            raw = msg.encode()
+        else:
+            raw = template.encode(sequence_number, sending_time, *payload)
+            if self._log_messages:
+                self._log.debug(
+                    f"Sending message: {template.name}({raw.replace(SOH, b'|').decode()})",
+                )
+
+        self._store.add_outbound(sequence_number, raw)
         self._message_sequence_number += 1
+        return raw
 
-        await asyncio.sleep(0.002)
+    async def _send_loop(self) -> None:
+        """
+        Write every queued message to the transport in a single write per loop tick.
+
+        Sequence numbers are assigned as messages are dequeued, so the wire order
+        always matches the MsgSeqNum order.
 
-    def register_handler(self, handler: Callable) -> None:
         """
-        Register the handler for the FIX messages.
+        outbound = self._outbound
+        while True:
+            if not outbound:
+                self._outbound_ready.clear()
+                await self._outbound_ready.wait()
+                continue
+
+            count = len(outbound)
+            if self._rate_limiter is not None:
+                count = self._rate_limiter.acquire(count)
+                if count == 0:
+                    await asyncio.sleep(self._rate_limiter.delay())
+                    continue
+
+            entries = [outbound.popleft() for _ in range(count)]
+            frames = []
+            for template, payload, _ in entries:
+                try:
+                    frames.append(self._encode(template, payload))
+                except Exception as e:
+                    # drop only the bad message, its MsgSeqNum is not used
+                    self._log.error(f"Dropping message which failed to encode: {e!r}")
+            if not frames:
+                continue
+            try:
+                self._writer.write(b"".join(frames))
+            except Exception as e:
+                # the frames are in the session store, so can be resent once reconnected
+                self._log.error(f"Failed to write {len(frames)} messages: {e!r}")
+                continue
+            self.last_sent_ns = self._clock.timestamp_ns()
+            if self._timings.enabled:
+                written = time.perf_counter_ns()
+                for _, _, received_ns in entries:
+                    if received_ns != 0:
+                        self._timings.record(self._outbound_stage, written - received_ns)
+            if self._journal is not None:
+                self._journal.write_frames(self.last_sent_ns, OUTBOUND, frames)
+
+            if self._get_write_buffer_size() > self._write_high_water:
+                self._writable.clear()
+                await self._writer.drain()
+                self._writable.set()
+
+    def _get_write_buffer_size(self) -> int:
+        if self._io is not None:
+            return self._io.get_write_buffer_size()
+        return self._writer.transport.get_write_buffer_size()
+
+    def register_handler(
+        self,
+        handler: Callable,
+        message_types: list[type[FixMessage]] | None = None,
+    ) -> None:
+        """
+        Register the handler for the FIX messages of the given types, or all
+        application messages if ``None``.
+
+        The handler may be a coroutine function or a plain function, plain functions
+        are called directly on dispatch.
+
         """
-        self._handlers.add(handler)
+        self._router.register(handler, message_types)
+
+    @property
+    def route_stats(self) -> dict[tuple[str, str], RouteStats]:
+        """
+        Return the dispatch count and timings keyed by (MsgType, handler name).
+        """
+        return self._router.stats
 
     # @property
     # def is_logged_on(self) -> bool:
@@ -263,9 +842,22 @@ class LmaxFixClient:
         msg.append_pair(108, self._heartbeat_frequency_seconds)  # HeartBtInt
         msg.append_pair(553, self._username)
         msg.append_pair(554, self._password)
-        msg.append_pair(141, "Y")  # ResetSeqNumFlag
 
-        await self.send_message(msg)
+        # resume the stored session, unless there is nothing to resume from
+        reset = not self._store.is_persistent or self._store.is_empty
+        if reset:
+            self._store.reset()
+            self._message_sequence_number = 1
+            self._inbound_gap = None
+        else:
+            self._log.info(
+                f"Resuming session at MsgSeqNum {self._message_sequence_number}, "
+                f"expecting {self._store.next_inbound_sequence_number}",
+            )
+        msg.append_pair(141, "Y" if reset else "N")  # ResetSeqNumFlag
+
+        # ahead of any message queued while the session was down
+        self._enqueue_nowait(None, msg, first=True)
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import asyncio
+
+from simplefix import FixMessage
+
+from pytower.adapters.lmax.fix.messages import get_message_type
+
+
+# Tags which identify the request a response belongs to, in order of precedence
+_CORRELATION_TAGS = (
+    790,  # OrdStatusReqID
+    568,  # TradeRequestID
+    11,  # ClOrdID
+)
+
+
+class CorrelationRegistry:
+    """
+    Provides futures resolved by the first inbound message matching a request.
+
+    A waiter is registered for a message type and a set of expected tag values. When
+    a correlation tag (OrdStatusReqID, TradeRequestID or ClOrdID) is expected, the
+    waiter is keyed by the message type, tag and value, so resolving it only takes a
+    dictionary lookup per correlation tag of the inbound message. Waiters without a
+    correlation tag are checked against every inbound message of their type.
+
+    Messages are matched by MsgType, so typed messages and decoded views of the same
+    type resolve the same waiters.
+
+    """
+
+    def __init__(self):
+        self._waiters: dict[tuple, list[tuple[dict[int, bytes], asyncio.Future]]] = {}
+        self._keys: dict[asyncio.Future, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def register(self, cls: type[FixMessage], tags: dict | None = None) -> asyncio.Future:
+        """
+        Return a future resolved with the first message of the type matching the tags.
+        """
+        expected = {int(tag): str(value).encode() for tag, value in (tags or {}).items()}
+
+        key = (get_message_type(cls), None, None)
+        for tag in _CORRELATION_TAGS:
+            value = expected.pop(tag, None)
+            if value is not None:
+                key = (key[0], tag, value)
+                break
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, []).append((expected, future))
+        self._keys[future] = key
+        return future
+
+    def discard(self, future: asyncio.Future) -> None:
+        """
+        Remove the waiter for the future, if still registered.
+        """
+        key = self._keys.pop(future, None)
+        if key is None:
+            return
+        waiters = [waiter for waiter in self._waiters[key] if waiter[1] is not future]
+        if waiters:
+            self._waiters[key] = waiters
+        else:
+            del self._waiters[key]
+
+    def resolve(self, msg: FixMessage) -> int:
+        """
+        Resolve every waiter matching the message and return the number resolved.
+        """
+        if not self._waiters:
+            return 0
+
+        message_type = msg.get(35)  # MsgType
+        resolved = self._resolve(msg, (message_type, None, None))
+        for tag in _CORRELATION_TAGS:
+            value = msg.get(tag)
+            if value is not None:
+                resolved += self._resolve(msg, (message_type, tag, value))
+        return resolved
+
+    def _resolve(self, msg: FixMessage, key: tuple) -> int:
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return 0
+
+        resolved = 0
+        remaining = []
+        for expected, future in waiters:
+            if future.done():
+                self._keys.pop(future, None)
+            elif all(msg.get(tag) == value for tag, value in expected.items()):
+                future.set_result(msg)
+                self._keys.pop(future, None)
+                resolved += 1
+            else:
+                remaining.append((expected, future))
+
+        if remaining:
+            self._waiters[key] = remaining
+        else:
+            del self._waiters[key]
+        return resolved
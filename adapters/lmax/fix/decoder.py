@@ -0,0 +1,281 @@
+from simplefix import FixMessage
+
+from pytower.adapters.lmax.fix.messages import ExecutionReport
+from pytower.adapters.lmax.fix.messages import TradeCaptureReport
+from pytower.adapters.lmax.fix.messages import raw_to_message
+
+
+# Tags indexed by FixFrame. Pairs with any other tag are skipped during the scan.
+# None has more than three digits, so longer tags are skipped without parsing.
+_INDEXED_TAGS = frozenset(
+    (
+        1,  # Account
+        6,  # AvgPx
+        7,  # BeginSeqNo
+        11,  # ClOrdID
+        14,  # CumQty
+        16,  # EndSeqNo
+        17,  # ExecID
+        22,  # SecurityIDSource
+        31,  # LastPx
+        32,  # LastQty
+        34,  # MsgSeqNum
+        35,  # MsgType
+        36,  # NewSeqNo
+        37,  # OrderID
+        38,  # OrderQty
+        39,  # OrdStatus
+        40,  # OrdType
+        41,  # OrigClOrdID
+        43,  # PossDupFlag
+        44,  # Price
+        45,  # RefSeqNum
+        48,  # SecurityID
+        49,  # SenderCompID
+        52,  # SendingTime
+        54,  # Side
+        56,  # TargetCompID
+        58,  # Text
+        59,  # TimeInForce
+        60,  # TransactTime
+        99,  # StopPx
+        102,  # CxlRejReason
+        103,  # OrdRejReason
+        108,  # HeartBtInt
+        112,  # TestReqID
+        123,  # GapFillFlag
+        141,  # ResetSeqNumFlag
+        150,  # ExecType
+        151,  # LeavesQty
+        262,  # MDReqID
+        268,  # NoMDEntries
+        269,  # MDEntryType
+        270,  # MDEntryPx
+        271,  # MDEntrySize
+        272,  # MDEntryDate
+        273,  # MDEntryTime
+        281,  # MDReqRejReason
+        371,  # RefTagID
+        372,  # RefMsgType
+        373,  # SessionRejectReason
+        434,  # CxlRejResponseTo
+        527,  # SecondaryExecID
+        568,  # TradeRequestID
+        748,  # TotNumTradeReports
+        749,  # TradeRequestResult
+        750,  # TradeRequestStatus
+        789,  # NextExpectedMsgSeqNum
+        790,  # OrdStatusReqID
+        912,  # LastRptRequested
+    ),
+)
+
+# The value of each byte as a digit of a tag. Any other byte, and a leading zero,
+# makes the parsed tag negative so it is never indexed.
+_DIGITS = [-1000] * 256
+_DIGITS[48:58] = range(10)
+_LEADING_DIGITS = _DIGITS.copy()
+_LEADING_DIGITS[48] = -1000
+
+
+def peek_message_type(raw: bytes) -> bytes | None:
+    """
+    Return the MsgType (tag 35) of a raw frame without indexing it.
+
+    The MsgType is always the third field of a valid frame.
+
+    """
+    start = raw.find(b"\x0135=")
+    if start == -1:
+        return None
+    start += 4
+    return raw[start : raw.find(b"\x01", start)]
+
+
+class FixFrame:
+    """
+    Provides a read-only view over a single raw FIX frame.
+
+    The frame is scanned once on construction and the value offsets of the indexed
+    tags are recorded. Values are only sliced out of the frame when accessed, so no
+    (tag, value) pairs are materialized. Repeating fields keep every occurrence, in
+    order, so repeating group entries can be read by position without rescanning.
+
+    The `get` method is compatible with `simplefix.FixMessage.get`.
+
+    """
+
+    __slots__ = ("_raw", "_offsets", "message_type")
+
+    def __init__(self, raw: bytes):
+        self._raw = raw
+        self.message_type: bytes | None = None
+
+        # tag -> [start0, end0, start1, end1, ...]
+        offsets: dict[int, list[int]] = {}
+        find = raw.find
+        indexed = _INDEXED_TAGS
+        leading = _LEADING_DIGITS
+        digits = _DIGITS
+        size = len(raw)
+        pos = 0
+        while pos < size:
+            eq = find(b"=", pos)
+            if eq == -1:
+                break
+            end = find(b"\x01", eq)
+            if end == -1:
+                end = size
+            # parse the tag in place rather than slicing it out of the frame
+            width = eq - pos
+            if width == 2:
+                tag = leading[raw[pos]] * 10 + digits[raw[pos + 1]]
+            elif width == 3:
+                tag = leading[raw[pos]] * 100 + digits[raw[pos + 1]] * 10 + digits[raw[pos + 2]]
+            elif width == 1:
+                tag = leading[raw[pos]]
+            else:
+                tag = -1
+            if tag in indexed:
+                entry = offsets.get(tag)
+                if entry is None:
+                    offsets[tag] = [eq + 1, end]
+                else:
+                    entry.append(eq + 1)
+                    entry.append(end)
+            pos = end + 1
+
+        self._offsets = offsets
+
+        entry = offsets.get(35)  # MsgType
+        if entry is not None:
+            self.message_type = raw[entry[0] : entry[1]]
+
+    @property
+    def raw(self) -> bytes:
+        return self._raw
+
+    def get(self, tag: int, nth: int = 1) -> bytes | None:
+        """
+        Return the nth value for the tag, or ``None`` if not present.
+        """
+        entry = self._offsets.get(tag)
+        if entry is None:
+            return None
+        i = (nth - 1) << 1
+        if i >= len(entry):
+            return None
+        return self._raw[entry[i] : entry[i + 1]]
+
+    def get_int(self, tag: int, nth: int = 1) -> int | None:
+        value = self.get(tag, nth)
+        return int(value) if value is not None else None
+
+    def get_str(self, tag: int, nth: int = 1) -> str | None:
+        value = self.get(tag, nth)
+        return value.decode() if value is not None else None
+
+    def count(self, tag: int) -> int:
+        """
+        Return the number of occurrences of the tag.
+        """
+        entry = self._offsets.get(tag)
+        return len(entry) >> 1 if entry is not None else 0
+
+    def to_message(self) -> FixMessage:
+        """
+        Return the frame parsed into a typed `FixMessage`.
+        """
+        return raw_to_message(self._raw)
+
+    def __str__(self) -> str:
+        return self._raw.replace(b"\x01", b"|").decode()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self})"
+
+
+class ExecutionReportView(FixFrame):
+    __slots__ = ()
+
+    @property
+    def request_id(self) -> str | None:
+        return self.get_str(790)  # OrdStatusReqID
+
+    @property
+    def security_id(self) -> int:
+        return int(self.get(48))  # SecurityID
+
+    @property
+    def client_order_id(self) -> str:
+        return self.get_str(11)  # ClOrdID
+
+    # Decodes fields using `get` only, so the `FixMessage` implementation applies as-is
+    to_nautilus = ExecutionReport.to_nautilus
+
+
+class TradeCaptureReportView(FixFrame):
+    __slots__ = ()
+
+    @property
+    def request_id(self) -> str | None:
+        return self.get_str(568)  # TradeRequestID
+
+    @property
+    def security_id(self) -> int:
+        return int(self.get(48))  # SecurityID
+
+    to_nautilus = TradeCaptureReport.to_nautilus
+
+
+class MarketDataSnapshotFullRefreshView(FixFrame):
+    """
+    Provides a read-only view over a MarketDataSnapshotFullRefresh frame.
+
+    Entries of the NoMDEntries (268) repeating group are addressed by their
+    zero-based position in the group.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def security_id(self) -> int:
+        return int(self.get(48))  # SecurityID
+
+    @property
+    def entry_count(self) -> int:
+        return self.count(269)  # MDEntryType
+
+    def _entry(self, tag: int, index: int) -> bytes | None:
+        entry = self._offsets.get(tag)
+        if entry is None:
+            return None
+        i = index << 1
+        if i >= len(entry):
+            return None
+        return self._raw[entry[i] : entry[i + 1]]
+
+    def entry_type(self, index: int) -> bytes | None:
+        return self._entry(269, index)  # MDEntryType
+
+    def entry_price(self, index: int) -> bytes | None:
+        return self._entry(270, index)  # MDEntryPx
+
+    def entry_size(self, index: int) -> bytes | None:
+        return self._entry(271, index)  # MDEntrySize
+
+
+_VIEW_TYPE_MAP = {
+    b"8": ExecutionReportView,
+    b"W": MarketDataSnapshotFullRefreshView,
+    b"AE": TradeCaptureReportView,
+}
+
+
+def decode_frame(raw: bytes) -> FixFrame:
+    """
+    Return a typed read-only view over the raw frame.
+    """
+    cls = _VIEW_TYPE_MAP.get(peek_message_type(raw), FixFrame)
+    return cls(raw)
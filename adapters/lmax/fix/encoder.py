@@ -0,0 +1,117 @@
+from simplefix import FixMessage
+
+from pytower.adapters.lmax.fix.framing import SOH
+
+
+_BEGIN_STRING = b"8=FIX.4.4" + SOH
+
+
+def _to_bytes(value) -> bytes:
+    if type(value) is bytes:
+        return value
+    return str(value).encode()
+
+
+class FixTemplate:
+    """
+    Provides a pre-encoded outbound FIX message.
+
+    The standard header and every constant body field are encoded once, on
+    construction, along with their length and byte sum. Encoding a message splices
+    the variable values into a reusable buffer between the constant chunks, and the
+    BodyLength and CheckSum are derived from the precomputed totals plus the values.
+
+    Fields are given in wire order as (tag, value) pairs. A value of ``None`` marks a
+    slot, which is filled from the values passed to `encode`, in order.
+
+    """
+
+    def __init__(
+        self,
+        message_cls: type[FixMessage],
+        fields: list[tuple[int, object | None]],
+        sender_comp_id: str,
+        target_comp_id: str,
+    ):
+        self._message_cls = message_cls
+        self._fields = tuple(fields)
+        self.message_type: bytes = _to_bytes(message_cls().message_type)
+
+        # MsgSeqNum and SendingTime are the first two slots of every message
+        chunks = [
+            b"35=%s\x0149=%s\x0156=%s\x0134="
+            % (self.message_type, sender_comp_id.encode(), target_comp_id.encode()),
+            b"\x0152=",
+        ]
+        current = bytearray(SOH)
+        for tag, value in self._fields:
+            current += b"%d=" % tag
+            if value is None:
+                chunks.append(bytes(current))
+                current = bytearray(SOH)
+            else:
+                current += _to_bytes(value) + SOH
+        chunks.append(bytes(current))
+
+        self._chunks = tuple(chunks)
+        self._slot_count = len(chunks) - 3  # excludes MsgSeqNum and SendingTime
+        self._static_length = sum(len(chunk) for chunk in chunks)
+        self._static_sum = sum(sum(chunk) for chunk in chunks) + sum(_BEGIN_STRING)
+        self._buf = bytearray()
+
+    @property
+    def name(self) -> str:
+        return self._message_cls.__name__
+
+    @property
+    def slot_count(self) -> int:
+        return self._slot_count
+
+    def encode(self, sequence_number: int, sending_time: bytes, *values) -> bytes:
+        """
+        Return the encoded message with the values filled into the slots, in order.
+        """
+        if len(values) != self._slot_count:
+            raise ValueError(
+                f"{self.name} template has {self._slot_count} slots, {len(values)} values given",
+            )
+
+        values = (b"%d" % sequence_number, sending_time, *map(_to_bytes, values))
+
+        body_length = self._static_length
+        checksum = self._static_sum
+        for value in values:
+            body_length += len(value)
+            checksum += sum(value)
+
+        length_field = b"9=%d\x01" % body_length
+        checksum += sum(length_field)
+
+        buf = self._buf
+        buf.clear()
+        buf += _BEGIN_STRING
+        buf += length_field
+        chunks = self._chunks
+        for i, value in enumerate(values):
+            buf += chunks[i]
+            buf += value
+        buf += chunks[-1]
+        buf += b"10=%03d\x01" % (checksum & 0xFF)
+
+        # the transport may hold a reference to the written data, never hand out the buffer
+        return bytes(buf)
+
+    def to_message(self, *values) -> FixMessage:
+        """
+        Return a typed `FixMessage` holding the body fields with the values filled in.
+        """
+        if len(values) != self._slot_count:
+            raise ValueError(
+                f"{self.name} template has {self._slot_count} slots, {len(values)} values given",
+            )
+
+        msg = self._message_cls()
+        values = iter(values)
+        for tag, value in self._fields:
+            msg.append_pair(tag, next(values) if value is None else value)
+        return msg
@@ -0,0 +1,81 @@
+SOH = b"\x01"
+
+_BEGIN_STRING = b"8=FIX"
+_BODY_LENGTH = b"\x019="
+_CHECKSUM = b"10="
+_CHECKSUM_FIELD_LENGTH = 7  # 10=XXX<SOH>
+
+
+class FixFramer:
+    """
+    Splits a raw FIX byte stream into complete messages.
+
+    Frames are located using the BodyLength (tag 9) value, so every complete frame
+    in the buffer is extracted in a single pass. Bytes belonging to an incomplete
+    frame are retained until the next call to `feed`.
+
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self.discarded_count = 0
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buf)
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """
+        Append data read from the socket and return the complete frames, in order.
+        """
+        buf = self._buf
+        buf += data
+        size = len(buf)
+
+        frames = []
+        start = 0
+        while start < size:
+            begin = buf.find(_BEGIN_STRING, start)
+            if begin == -1:
+                # keep a tail which may hold the start of the next BeginString
+                start = max(start, size - len(_BEGIN_STRING) + 1)
+                break
+
+            length_start = buf.find(_BODY_LENGTH, begin)
+            if length_start == -1:
+                start = begin
+                break
+
+            length_end = buf.find(SOH, length_start + 3)
+            if length_end == -1:
+                start = begin
+                break
+
+            try:
+                body_length = int(buf[length_start + 3 : length_end])
+            except ValueError:
+                # corrupt header, resync on the next BeginString
+                self.discarded_count += 1
+                start = begin + 1
+                continue
+
+            end = length_end + 1 + body_length + _CHECKSUM_FIELD_LENGTH
+            if end > size:
+                start = begin
+                break
+
+            checksum_start = end - _CHECKSUM_FIELD_LENGTH
+            if buf[checksum_start : checksum_start + 3] != _CHECKSUM or buf[end - 1] != 1:
+                # BodyLength does not match the frame, resync on the next BeginString
+                self.discarded_count += 1
+                start = begin + 1
+                continue
+
+            frames.append(bytes(buf[begin:end]))
+            start = end
+
+        del buf[:start]
+        return frames
+
+    def clear(self) -> None:
+        self._buf.clear()
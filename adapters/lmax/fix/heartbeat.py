@@ -0,0 +1,133 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from simplefix import FixMessage
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import LoggerAdapter
+from pytower.adapters.lmax.common import EvictingDict
+from pytower.adapters.lmax.common import LatencyHistogram
+from pytower.adapters.lmax.fix.messages import Heartbeat
+from pytower.adapters.lmax.fix.messages import TestRequest
+
+
+if TYPE_CHECKING:
+    from pytower.adapters.lmax.fix.client import LmaxFixClient
+
+
+_TEST_REQUEST_ID_PREFIX = "RTT-"
+
+
+class FixHeartbeatEngine:
+    """
+    Keeps a FIX session alive and measures the round-trip time to the gateway.
+
+    A Heartbeat is only sent when nothing has been sent for the heartbeat interval.
+    When nothing has been received for 1.2 times the interval a TestRequest is sent,
+    which gives the server a chance to respond before the connection is considered
+    down. TestRequests are also sent every `test_request_interval_seconds`, and the
+    time until the Heartbeat with the matching TestReqID is recorded in a rolling
+    latency histogram.
+
+    """
+
+    def __init__(
+        self,
+        fix_client: "LmaxFixClient",
+        clock: LiveClock,
+        logger: Logger,
+        heartbeat_interval_seconds: float,
+        test_request_interval_seconds: float | None = None,
+        histogram_size: int = 1024,
+    ):
+        self._fix_client = fix_client
+        self._clock = clock
+        self._interval_ns = int(heartbeat_interval_seconds * 1_000_000_000)
+        self._receive_timeout_ns = int(self._interval_ns * 1.2)
+        self._test_request_interval_ns = (
+            int(test_request_interval_seconds * 1_000_000_000)
+            if test_request_interval_seconds is not None
+            else None
+        )
+        self._tick_seconds = min(1.0, heartbeat_interval_seconds / 10)
+        self._next_test_request_ns = 0
+        self._test_request_count = 0
+        self._last_test_request_ns = 0
+        self._pending: EvictingDict = EvictingDict(max_size=64)  # TestReqID -> sent_ns
+        self._histogram = LatencyHistogram(size=histogram_size)
+        self._task: asyncio.Task | None = None
+        self._log = LoggerAdapter(type(self).__name__, logger)
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        return self._histogram
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._pending.clear()
+        if self._test_request_interval_ns is not None:
+            self._next_test_request_ns = self._clock.timestamp_ns()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self._tick_seconds)
+
+    async def check(self) -> None:
+        """
+        Send whichever Heartbeat or TestRequest is due.
+        """
+        fix_client = self._fix_client
+        now = self._clock.timestamp_ns()
+
+        if now - fix_client.last_sent_ns >= self._interval_ns:
+            await fix_client.send_message(Heartbeat())
+
+        if self._test_request_interval_ns is not None and now >= self._next_test_request_ns:
+            self._next_test_request_ns = now + self._test_request_interval_ns
+            await self.send_test_request()
+        elif (
+            now - fix_client.last_received_ns >= self._receive_timeout_ns
+            and not self._is_probe_outstanding(now)
+        ):
+            self._log.warning("No messages received within the heartbeat interval")
+            await self.send_test_request()
+
+    def _is_probe_outstanding(self, now: int) -> bool:
+        # a TestRequest which went unanswered for the timeout does not stop another
+        if not self._pending:
+            return False
+        return now - self._last_test_request_ns < self._receive_timeout_ns
+
+    async def send_test_request(self) -> str:
+        """
+        Send a TestRequest and return its TestReqID.
+        """
+        self._test_request_count += 1
+        request_id = f"{_TEST_REQUEST_ID_PREFIX}{self._test_request_count}"
+        msg = TestRequest()
+        msg.append_pair(112, request_id)  # TestReqID
+        self._last_test_request_ns = self._clock.timestamp_ns()
+        self._pending[request_id.encode()] = self._last_test_request_ns
+        await self._fix_client.send_message(msg)
+        return request_id
+
+    def handle_heartbeat(self, msg: FixMessage) -> None:
+        """
+        Record the round-trip time if the Heartbeat answers one of our TestRequests.
+        """
+        request_id = msg.get(112)  # TestReqID
+        if request_id is None:
+            return
+        sent_ns = self._pending.pop(request_id, None)
+        if sent_ns is None:
+            return
+        self._histogram.add(self._clock.timestamp_ns() - sent_ns)
@@ -0,0 +1,370 @@
+"""
+Runs the market data FIX session in a child process, which decodes snapshots into
+fixed-width records in a shared memory ring buffer read by the data client.
+"""
+
+import asyncio
+import multiprocessing
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+import msgspec
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from pytower.adapters.lmax.config import LmaxFixClientConfig
+from pytower.adapters.lmax.fix.client import LmaxFixClient
+from pytower.adapters.lmax.fix.decoder import MarketDataSnapshotFullRefreshView
+from pytower.adapters.lmax.fix.messages import MarketDataSnapshotFullRefresh
+from pytower.adapters.lmax.fix.messages import create_market_data_request
+from pytower.adapters.lmax.fix.parsing import RECORD_PRECISION
+from pytower.adapters.lmax.fix.parsing import parse_fixed
+from pytower.adapters.lmax.fix.subscriptions import SendMarketDataRequest
+from pytower.adapters.lmax.fix.timestamps import parse_utc_date_time_ns
+
+
+# next write sequence, capacity, padded to a cache line
+_HEADER = struct.Struct("<QQ48x")
+
+# SecurityID, bid price, bid size, ask price, ask size, ts_event
+RECORD = struct.Struct("<qqqqqq")
+
+class MarketDataRingBuffer:
+    """
+    Provides a single producer ring buffer of fixed-width market data records in
+    shared memory.
+
+    The producer writes a record into its slot then publishes it by advancing the
+    write sequence in the header. Readers keep their own read sequence, so any
+    number of readers, in any process, can consume the same buffer. The slot of the
+    next record may be being written, so a reader holds at most `capacity - 1`
+    records, and one which falls further behind skips the overwritten records and
+    counts them as dropped.
+
+    """
+
+    def __init__(self, name: str | None = None, capacity: int = 65536, create: bool = True):
+        if create:
+            self._shm = SharedMemory(
+                name=name,
+                create=True,
+                size=_HEADER.size + capacity * RECORD.size,
+            )
+            _HEADER.pack_into(self._shm.buf, 0, 0, capacity)
+        else:
+            self._shm = SharedMemory(name=name)
+            capacity = _HEADER.unpack_from(self._shm.buf, 0)[1]
+        self._capacity = capacity
+        self._records = self._shm.buf[_HEADER.size :]
+        self._sequence = _HEADER.unpack_from(self._shm.buf, 0)[0]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def write_sequence(self) -> int:
+        return _HEADER.unpack_from(self._shm.buf, 0)[0]
+
+    def write(
+        self,
+        security_id: int,
+        bid_price: int,
+        bid_size: int,
+        ask_price: int,
+        ask_size: int,
+        ts_event: int,
+    ) -> None:
+        sequence = self._sequence
+        RECORD.pack_into(
+            self._records,
+            (sequence % self._capacity) * RECORD.size,
+            security_id,
+            bid_price,
+            bid_size,
+            ask_price,
+            ask_size,
+            ts_event,
+        )
+        self._sequence = sequence + 1
+        struct.pack_into("<Q", self._shm.buf, 0, self._sequence)
+
+    def reader(self, from_start: bool = False) -> "MarketDataRingReader":
+        """
+        Return a reader starting at the next record written, or the oldest record
+        which is not being overwritten if `from_start`.
+        """
+        sequence = self.write_sequence
+        if from_start:
+            sequence = max(0, sequence + 1 - self._capacity)
+        return MarketDataRingReader(self, sequence)
+
+    def _read(self, start: int, end: int) -> list[tuple]:
+        capacity = self._capacity
+        first = start % capacity
+        last = first + (end - start)
+        records = self._records
+        if last <= capacity:
+            data = bytes(records[first * RECORD.size : last * RECORD.size])
+        else:
+            data = bytes(records[first * RECORD.size :]) + bytes(
+                records[: (last - capacity) * RECORD.size],
+            )
+        return list(RECORD.iter_unpack(data))
+
+    def close(self) -> None:
+        self._records.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+class MarketDataRingReader:
+    """
+    Reads the records of a `MarketDataRingBuffer` in batches.
+    """
+
+    def __init__(self, ring: MarketDataRingBuffer, sequence: int):
+        self._ring = ring
+        self._sequence = sequence
+        self.dropped_count = 0
+
+    def read_batch(self, max_count: int = 4096) -> list[tuple]:
+        """
+        Return up to `max_count` records as (security_id, bid_price, bid_size,
+        ask_price, ask_size, ts_event) tuples, oldest first.
+        """
+        ring = self._ring
+        end = ring.write_sequence
+        start = self._sequence
+        # the slot of the record at end - capacity is the next to be written
+        if end - start >= ring.capacity:
+            self.dropped_count += end + 1 - ring.capacity - start
+            start = end + 1 - ring.capacity
+        end = min(end, start + max_count)
+        if start == end:
+            return []
+
+        records = ring._read(start, end)
+
+        # records overwritten, or being overwritten, while they were copied are dropped
+        overwritten = ring.write_sequence + 1 - ring.capacity - start
+        if overwritten > 0:
+            self.dropped_count += overwritten
+            records = records[overwritten:]
+
+        self._sequence = end
+        return records
+
+
+class MarketDataRecordWriter:
+    """
+    Decodes MarketDataSnapshotFullRefresh frames into records of the ring buffer.
+    """
+
+    def __init__(self, ring: MarketDataRingBuffer):
+        self._ring = ring
+
+    def handle_snapshot(self, msg: MarketDataSnapshotFullRefreshView) -> None:
+        bid_price = bid_size = ask_price = ask_size = None
+        for index in range(msg.entry_count):
+            entry_type = msg.entry_type(index)
+            if entry_type == b"0":  # Bid
+                bid_price = parse_fixed(msg.entry_price(index), RECORD_PRECISION)
+                bid_size = parse_fixed(msg.entry_size(index), RECORD_PRECISION)
+            elif entry_type == b"1":  # Offer
+                ask_price = parse_fixed(msg.entry_price(index), RECORD_PRECISION)
+                ask_size = parse_fixed(msg.entry_size(index), RECORD_PRECISION)
+
+        if bid_price is None or ask_price is None:
+            return  # market closed, or one side of the book is empty
+
+        self._ring.write(
+            int(msg.get(48)),  # SecurityID
+            bid_price,
+            bid_size,
+            ask_price,
+            ask_size,
+            parse_utc_date_time_ns(msg.get(272), msg.get(273)),  # MDEntryDate, MDEntryTime
+        )
+
+
+class MarketDataIngestSubscriptions:
+    """
+    Tracks the quote subscriptions of the ingest process by the MDReqID of the
+    MarketDataRequest which made them.
+
+    LMAX disables a subscription by the MDReqID of the request which made it, so an
+    unsubscribe is sent with that MDReqID, and the other instruments of the request
+    are then subscribed again in a new request.
+
+    """
+
+    def __init__(self, send: SendMarketDataRequest):
+        self._send = send
+        self._request_count = 0
+
+        # SecurityID -> MDReqID of its subscribe request
+        self._request_ids: dict[int, str] = {}
+
+        # MDReqID -> SecurityIDs of each active subscribe request
+        self._requests: dict[str, set[int]] = {}
+
+    @property
+    def security_ids(self) -> list[int]:
+        return sorted(self._request_ids)
+
+    async def subscribe(self, security_ids: list[int]) -> None:
+        security_ids = [i for i in security_ids if i not in self._request_ids]
+        if security_ids:
+            await self._subscribe(security_ids)
+
+    async def unsubscribe(self, security_ids: list[int]) -> None:
+        by_request: dict[str, list[int]] = {}
+        for security_id in security_ids:
+            request_id = self._request_ids.pop(security_id, None)
+            if request_id is not None:
+                by_request.setdefault(request_id, []).append(security_id)
+
+        for request_id, unsubscribes in by_request.items():
+            remaining = sorted(self._requests.pop(request_id).difference(unsubscribes))
+            await self._send(request_id, unsubscribes, False)
+            if remaining:
+                await self._subscribe(remaining)
+
+    async def resubscribe(self) -> None:
+        """
+        Subscribe every instrument again in one request, after the session reconnects.
+        """
+        if self._request_ids:
+            await self._subscribe(self.security_ids)
+
+    async def _subscribe(self, security_ids: list[int]) -> None:
+        self._request_count += 1
+        request_id = f"QuoteTick-subscribe-{self._request_count}"
+        for security_id in security_ids:
+            previous = self._requests.get(self._request_ids.get(security_id))
+            if previous is not None:
+                previous.discard(security_id)
+                if not previous:
+                    del self._requests[self._request_ids[security_id]]
+            self._request_ids[security_id] = request_id
+        self._requests[request_id] = set(security_ids)
+        await self._send(request_id, security_ids, True)
+
+
+def run_market_data_ingest(
+    config: LmaxFixClientConfig,
+    ring_name: str,
+    commands: multiprocessing.Queue,
+) -> None:
+    """
+    Entry point of the ingest child process.
+    """
+    asyncio.run(_run_market_data_ingest(config, ring_name, commands))
+
+
+async def _run_market_data_ingest(
+    config: LmaxFixClientConfig,
+    ring_name: str,
+    commands: multiprocessing.Queue,
+) -> None:
+    loop = asyncio.get_running_loop()
+    clock = LiveClock()
+    ring = MarketDataRingBuffer(name=ring_name, create=False)
+    fix_client = LmaxFixClient(
+        logger=Logger(clock=clock),
+        loop=loop,
+        clock=clock,
+        **msgspec.structs.asdict(config),
+    )
+    fix_client.register_handler(
+        MarketDataRecordWriter(ring).handle_snapshot,
+        message_types=[MarketDataSnapshotFullRefresh],
+    )
+
+    async def send(request_id: str, security_ids: list[int], subscribe: bool) -> None:
+        await fix_client.send_message(
+            create_market_data_request(
+                request_id=request_id,
+                security_ids=security_ids,
+                subscribe=subscribe,
+            ),
+        )
+
+    subscriptions = MarketDataIngestSubscriptions(send)
+    fix_client.register_reconnect_handler(subscriptions.resubscribe)
+    await fix_client.connect()
+
+    while True:
+        command, security_ids = await loop.run_in_executor(None, commands.get)
+        if command == "stop":
+            break
+        if command == "subscribe":
+            await subscriptions.subscribe(security_ids)
+        else:
+            await subscriptions.unsubscribe(security_ids)
+
+    await fix_client.disconnect()
+    ring.close()
+
+
+class MarketDataIngestProcess:
+    """
+    Runs the market data `LmaxFixClient` in a child process.
+
+    The child decodes every MarketDataSnapshotFullRefresh into a record of a shared
+    memory `MarketDataRingBuffer`. Subscriptions are sent to the child through a
+    command queue, and the child replays them itself when its session reconnects.
+
+    """
+
+    def __init__(self, config: LmaxFixClientConfig, capacity: int = 65536):
+        self._config = config
+        self._capacity = capacity
+        self._context = multiprocessing.get_context("spawn")
+        self._ring: MarketDataRingBuffer | None = None
+        self._commands: multiprocessing.Queue | None = None
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def ring(self) -> MarketDataRingBuffer | None:
+        return self._ring
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        self._ring = MarketDataRingBuffer(capacity=self._capacity)
+        self._commands = self._context.Queue()
+        self._process = self._context.Process(
+            target=run_market_data_ingest,
+            args=(self._config, self._ring.name, self._commands),
+            name="lmax-market-data-ingest",
+            daemon=True,
+        )
+        self._process.start()
+
+    def subscribe(self, security_ids: list[int]) -> None:
+        self._commands.put(("subscribe", security_ids))
+
+    def unsubscribe(self, security_ids: list[int]) -> None:
+        self._commands.put(("unsubscribe", security_ids))
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        if self._process is None:
+            return
+        self._commands.put(("stop", []))
+        self._process.join(timeout_seconds)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+        self._ring.close()
+        self._ring.unlink()
+        self._ring = None
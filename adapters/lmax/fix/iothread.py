@@ -0,0 +1,198 @@
+import asyncio
+import ssl
+import threading
+from collections import deque
+
+from pytower.adapters.lmax.fix.framing import FixFramer
+
+
+class FixIoThread:
+    """
+    Runs a FIX socket, with TLS and framing, on a dedicated thread and event loop.
+
+    Complete frames are handed to the owner's loop in batches: the I/O thread appends
+    each read's frames to a deque and only schedules a wake-up on the owner's loop
+    when one is not already pending, so a burst of reads costs a single
+    ``call_soon_threadsafe``. Outbound data is handed to the I/O thread the same way
+    and coalesced into one transport write per wake-up.
+
+    Each side only appends to its own deque and increments its own counters, so no
+    locks are taken on either path.
+
+    """
+
+    def __init__(self, read_buffer_size: int = 65536, write_high_water: int = 65536):
+        self._read_buffer_size = read_buffer_size
+        self._write_high_water = write_high_water
+        self.framer = FixFramer()
+
+        self._owner_loop: asyncio.AbstractEventLoop | None = None
+        self._io_loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task | None = None
+
+        # I/O thread -> owner, a batch of frames per read, None on EOF
+        self._inbound: deque[list[bytes] | None] = deque()
+        self._inbound_ready: asyncio.Event | None = None
+        self._wakeup_scheduled = False
+
+        # owner -> I/O thread
+        self._outbound: deque[bytes] = deque()
+        self._flush_scheduled = False
+        self._written = 0  # incremented by the owner only
+        self._flushed = 0  # incremented by the I/O thread only
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    async def connect(self, host: str, port: int, ssl_context: ssl.SSLContext | None) -> None:
+        """
+        Start the I/O thread and open the connection on its loop.
+        """
+        self._owner_loop = asyncio.get_running_loop()
+        self._inbound_ready = asyncio.Event()
+        self._inbound.clear()
+        self._outbound.clear()
+        self._written = self._flushed = 0
+        self.framer.clear()
+
+        self._io_loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_io_loop,
+            name=f"{type(self).__name__}-{host}",
+            daemon=True,
+        )
+        self._thread.start()
+
+        try:
+            await self._run_in_io_loop(self._open(host, port, ssl_context))
+        except BaseException:
+            self.close()
+            await self.wait_closed()
+            raise
+
+    def _run_io_loop(self) -> None:
+        try:
+            self._io_loop.run_forever()
+        finally:
+            self._io_loop.close()
+
+    async def _open(self, host: str, port: int, ssl_context: ssl.SSLContext | None) -> None:
+        self._reader, self._writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self._writer.transport.set_write_buffer_limits(high=self._write_high_water)
+        self._read_task = self._io_loop.create_task(self._read_loop())
+
+    async def _run_in_io_loop(self, coro):
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._io_loop))
+
+    async def _read_loop(self) -> None:
+        framer = self.framer
+        while True:
+            try:
+                raw = await self._reader.read(self._read_buffer_size)
+            except OSError:
+                raw = b""
+
+            if not raw:
+                self._hand_off(None)
+                return
+
+            frames = framer.feed(raw)
+            if frames:
+                self._hand_off(frames)
+
+    def _hand_off(self, frames: list[bytes] | None) -> None:
+        self._inbound.append(frames)
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            self._owner_loop.call_soon_threadsafe(self._wakeup)
+
+    def _wakeup(self) -> None:
+        self._wakeup_scheduled = False
+        self._inbound_ready.set()
+
+    async def read_frames(self) -> list[bytes] | None:
+        """
+        Return every frame handed off since the last call, or ``None`` on EOF.
+        """
+        inbound = self._inbound
+        while not inbound:
+            self._inbound_ready.clear()
+            await self._inbound_ready.wait()
+
+        batch = []
+        while inbound:
+            frames = inbound[0]
+            if frames is None:
+                if batch:
+                    return batch  # EOF is returned on the next call
+                inbound.popleft()
+                return None
+            batch.extend(inbound.popleft())
+        return batch
+
+    def write(self, data: bytes) -> None:
+        """
+        Hand the data to the I/O thread to be written to the transport.
+        """
+        self._outbound.append(data)
+        self._written += len(data)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._io_loop.call_soon_threadsafe(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        outbound = self._outbound
+        chunks = []
+        while outbound:
+            chunks.append(outbound.popleft())
+        if not chunks:
+            return
+        data = b"".join(chunks)
+        self._writer.write(data)
+        self._flushed += len(data)
+
+    def get_write_buffer_size(self) -> int:
+        """
+        Return the number of bytes handed off or buffered by the transport, not yet
+        written to the socket.
+        """
+        size = self._written - self._flushed
+        if self._writer is not None:
+            size += self._writer.transport.get_write_buffer_size()
+        return size
+
+    async def drain(self) -> None:
+        await self._run_in_io_loop(self._drain())
+
+    async def _drain(self) -> None:
+        self._flush()
+        await self._writer.drain()
+
+    def close(self) -> None:
+        """
+        Close the connection and stop the I/O thread.
+        """
+        if self._io_loop is None or self._io_loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._io_loop)
+
+    async def _shutdown(self) -> None:
+        if self._read_task is not None:
+            self._read_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._io_loop.stop()
+
+    async def wait_closed(self) -> None:
+        if self._thread is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+            self._thread = None
@@ -0,0 +1,258 @@
+"""
+Journals the raw inbound and outbound FIX frames of a session to memory-mapped
+rolling segment files, and decodes them back from the command line::
+
+    python -m pytower.adapters.lmax.fix.journal <folder> [--direction in|out]
+        [--type W] [--tag 48=4001] [--since 20240102-09:00:00] [--limit 100]
+"""
+
+import argparse
+import mmap
+import re
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from pytower.adapters.lmax.fix.decoder import peek_message_type
+from pytower.adapters.lmax.fix.framing import SOH
+from pytower.adapters.lmax.fix.timestamps import format_utc_timestamp
+from pytower.adapters.lmax.fix.timestamps import parse_utc_timestamp_ns
+
+
+INBOUND = 0
+OUTBOUND = 1
+
+# receive or send time in UNIX nanoseconds, direction, frame length
+_RECORD = struct.Struct("<QBI")
+
+_DEFAULT_SEGMENT_SIZE = 64 << 20
+
+
+class JournalRecord:
+    """
+    Represents a single journaled FIX frame.
+    """
+
+    __slots__ = ("ts_ns", "direction", "frame")
+
+    def __init__(self, ts_ns: int, direction: int, frame: bytes):
+        self.ts_ns = ts_ns
+        self.direction = direction
+        self.frame = frame
+
+    @property
+    def message_type(self) -> bytes | None:
+        return peek_message_type(self.frame)
+
+    def get(self, tag: int) -> bytes | None:
+        """
+        Return the value of the first field with the tag, if any.
+        """
+        field = b"\x01%d=" % tag
+        start = self.frame.find(field)
+        if start == -1:
+            return None
+        start += len(field)
+        end = self.frame.find(SOH, start)
+        return self.frame[start:end] if end != -1 else self.frame[start:]
+
+    def __repr__(self) -> str:
+        direction = "in" if self.direction == INBOUND else "out"
+        return f"{type(self).__name__}({self.ts_ns}, {direction}, {self.frame!r})"
+
+
+class FixJournal:
+    """
+    Provides an append-only journal of the raw FIX frames of a session.
+
+    Frames are appended with their receive or send time to the current segment,
+    ``<session>-<n>.journal`` in the folder, which is a memory-mapped file of
+    `segment_size` bytes. An append is a copy into the mapping, the pages are written
+    back to disk by the kernel, so the session loop never blocks on file IO. When a
+    segment is full the next is created, and only the newest `max_segments` are
+    kept. Segments are created exclusively, so journals of the same session in two
+    processes never write to the same segment.
+
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        session_id: str,
+        segment_size: int = _DEFAULT_SEGMENT_SIZE,
+        max_segments: int | None = 16,
+    ):
+        self._folder = Path(path)
+        self._folder.mkdir(parents=True, exist_ok=True)
+        self._session_id = session_id
+        self._segment_size = segment_size
+        self._max_segments = max_segments
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._offset = 0
+
+        segments = segment_paths(self._folder, session_id)
+        self._index = _segment_index(segments[-1]) + 1 if segments else 0
+        self._open_segment(segment_size)
+
+    @property
+    def segment_path(self) -> Path:
+        return self._segment_path(self._index)
+
+    def _segment_path(self, index: int) -> Path:
+        return self._folder / f"{self._session_id}-{index:06d}.journal"
+
+    def _open_segment(self, size: int) -> None:
+        while True:
+            try:
+                self._file = open(self._segment_path(self._index), "x+b")
+                break
+            except FileExistsError:
+                self._index += 1  # taken by another journal of the session
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._offset = 0
+
+        if self._max_segments is not None:
+            for path in segment_paths(self._folder, self._session_id)[: -self._max_segments]:
+                path.unlink(missing_ok=True)
+
+    def _roll(self, min_size: int) -> None:
+        self._close_segment()
+        self._index += 1
+        self._open_segment(max(self._segment_size, min_size))
+
+    def _close_segment(self) -> None:
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self._offset)  # drop the unwritten tail
+        self._file.close()
+
+    def write(self, ts_ns: int, direction: int, frame: bytes) -> None:
+        offset = self._offset
+        end = offset + _RECORD.size + len(frame)
+        if end > len(self._map):
+            self._roll(end - offset)
+            offset = 0
+            end = _RECORD.size + len(frame)
+
+        _RECORD.pack_into(self._map, offset, ts_ns, direction, len(frame))
+        self._map[offset + _RECORD.size : end] = frame
+        self._offset = end
+
+    def write_frames(self, ts_ns: int, direction: int, frames: list[bytes]) -> None:
+        """
+        Append the frames of a single read or write, which share a timestamp.
+        """
+        for frame in frames:
+            self.write(ts_ns, direction, frame)
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._close_segment()
+            self._map = None
+
+
+def _segment_index(path: Path) -> int:
+    return int(path.stem.rsplit("-", 1)[1])
+
+
+def segment_paths(folder: str | Path, session_id: str | None = None) -> list[Path]:
+    """
+    Return the journal segments in the folder, oldest first.
+    """
+    pattern = f"{session_id}-*.journal" if session_id is not None else "*.journal"
+    paths = [path for path in Path(folder).glob(pattern) if re.search(r"-\d+$", path.stem)]
+    return sorted(paths, key=lambda path: (path.stem.rsplit("-", 1)[0], _segment_index(path)))
+
+
+def read_segment(path: str | Path) -> Iterator[JournalRecord]:
+    """
+    Yield the records of a segment, stopping at the end of the written records.
+    """
+    data = Path(path).read_bytes()
+    size = len(data)
+    offset = 0
+    while offset + _RECORD.size <= size:
+        ts_ns, direction, length = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        if ts_ns == 0 or start + length > size:
+            return  # zeroed tail of a segment which was not closed
+        yield JournalRecord(ts_ns, direction, data[start : start + length])
+        offset = start + length
+
+
+def read_journal(
+    path: str | Path,
+    session_id: str | None = None,
+    direction: int | None = None,
+    message_types: set[bytes] | None = None,
+    tags: dict[int, bytes] | None = None,
+    start_ns: int | None = None,
+    end_ns: int | None = None,
+) -> Iterator[JournalRecord]:
+    """
+    Yield the records of a journal file or folder, oldest first, which match every
+    given filter.
+    """
+    path = Path(path)
+    paths = [path] if path.is_file() else segment_paths(path, session_id)
+    for segment in paths:
+        for record in read_segment(segment):
+            if direction is not None and record.direction != direction:
+                continue
+            if start_ns is not None and record.ts_ns < start_ns:
+                continue
+            if end_ns is not None and record.ts_ns >= end_ns:
+                continue
+            if message_types is not None and record.message_type not in message_types:
+                continue
+            if tags is not None and any(record.get(t) != v for t, v in tags.items()):
+                continue
+            yield record
+
+
+def format_record(record: JournalRecord) -> str:
+    timestamp = b"%s.%09d" % (format_utc_timestamp(record.ts_ns), record.ts_ns % 1_000_000_000)
+    arrow = "<" if record.direction == INBOUND else ">"
+    return f"{timestamp.decode()} {arrow} {record.frame.replace(SOH, b'|').decode(errors='replace')}"
+
+
+def _parse_tag(value: str) -> tuple[int, bytes]:
+    tag, _, tag_value = value.partition("=")
+    return int(tag), tag_value.encode()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Decode an LMAX FIX wire journal.")
+    parser.add_argument("path", help="journal folder or segment file")
+    parser.add_argument("--session", help="session id of the segments in the folder")
+    parser.add_argument("--direction", choices=["in", "out"])
+    parser.add_argument("--type", action="append", dest="types", help="MsgType, repeatable")
+    parser.add_argument("--tag", action="append", dest="tags", help="tag=value, repeatable")
+    parser.add_argument("--since", help="FIX UTCTimestamp, inclusive")
+    parser.add_argument("--until", help="FIX UTCTimestamp, exclusive")
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args(argv)
+
+    records = read_journal(
+        args.path,
+        session_id=args.session,
+        direction={"in": INBOUND, "out": OUTBOUND}.get(args.direction),
+        message_types={t.encode() for t in args.types} if args.types else None,
+        tags=dict(_parse_tag(t) for t in args.tags) if args.tags else None,
+        start_ns=parse_utc_timestamp_ns(args.since.encode()) if args.since else None,
+        end_ns=parse_utc_timestamp_ns(args.until.encode()) if args.until else None,
+    )
+    for count, record in enumerate(records):
+        if args.limit is not None and count >= args.limit:
+            break
+        sys.stdout.write(format_record(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
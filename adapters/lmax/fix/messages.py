@@ -16,13 +16,13 @@ from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Money
-from nautilus_trader.model.objects import Price
-from nautilus_trader.model.objects import Quantity
 from pytower.adapters.lmax.fix.enums import parse_lmax_order_side
 from pytower.adapters.lmax.fix.enums import parse_lmax_order_status
 from pytower.adapters.lmax.fix.enums import parse_lmax_order_type
 from pytower.adapters.lmax.fix.enums import parse_lmax_time_in_force
 from pytower.adapters.lmax.fix.parsing import parse_lmax_timestamp_ns
+from pytower.adapters.lmax.fix.parsing import parse_price
+from pytower.adapters.lmax.fix.parsing import parse_quantity
 
 
 def string_to_raw(value: str) -> bytes:
@@ -212,18 +212,18 @@ class ExecutionReport(FixMessage):
             order_type=parse_lmax_order_type(int(self.get(40))),  #  OrdType
             time_in_force=parse_lmax_time_in_force(int(self.get(59))),  # TimeInForce
             order_status=parse_lmax_order_status(int(self.get(39))),  # OrdStatus
-            quantity=Quantity(float(self.get(38)), instrument.size_precision),  # OrderQty
-            filled_qty=Quantity(float(self.get(14)), instrument.size_precision),  # CumQty
+            quantity=parse_quantity(self.get(38), instrument.size_precision),  # OrderQty
+            filled_qty=parse_quantity(self.get(14), instrument.size_precision),  # CumQty
             report_id=UUID4(),
-            ts_accepted=parse_lmax_timestamp_ns(self.get(60).decode()),  # TransactTime
-            ts_last=parse_lmax_timestamp_ns(self.get(60).decode()),  # TransactTime
+            ts_accepted=parse_lmax_timestamp_ns(self.get(60)),  # TransactTime
+            ts_last=parse_lmax_timestamp_ns(self.get(60)),  # TransactTime
             ts_init=dt_to_unix_nanos(pd.Timestamp.utcnow()),
             client_order_id=ClientOrderId(self.get(11).decode()),  # ClOrdID
             avg_px=Decimal(self.get(6).decode()),  # AvgPx
-            price=Price(float(self.get(44)), instrument.price_precision)
+            price=parse_price(self.get(44), instrument.price_precision)
             if self.get(44) is not None
             else None,  # Price
-            trigger_price=Price(float(self.get(99)), instrument.price_precision)
+            trigger_price=parse_price(self.get(99), instrument.price_precision)
             if self.get(99) is not None
             else None,  # StopPx
             cancel_reason=self.get(58).decode() if self.get(58) is not None else None,  # Text
@@ -284,6 +284,42 @@ class MarketDataRequest(FixMessage):
         # self.append_pair(35, "V", header=True)
 
 
+def create_market_data_request(
+    request_id: str,
+    security_ids: list[int],
+    subscribe: bool,
+    depth: int = 1,
+) -> MarketDataRequest:
+    """
+    Return a bid and ask MarketDataRequest for the instruments, with `depth` levels
+    per side or the full book if 0.
+    """
+    msg = MarketDataRequest()
+
+    msg.append_pair(262, request_id)  # MDReqID
+
+    if subscribe:
+        # SubscriptionRequestType: Snapshot + Updates (Subscribe)
+        msg.append_pair(263, 1)
+    else:
+        # SubscriptionRequestType: Disable previous Snapshot + Updates Request (Unsubscribe)
+        msg.append_pair(263, 2)
+
+    msg.append_pair(264, depth)  # MarketDepth: 0 = Full Book, 1 = Top of Book, N levels
+
+    msg.append_pair(267, 2)  # NoMDEntryTypes
+    msg.append_pair(269, 0)  # MDEntryType: Bid
+    msg.append_pair(269, 1)  # MDEntryType: Ask
+
+    msg.append_pair(146, len(security_ids))  # NoRelatedSym
+    for security_id in security_ids:
+        msg.append_pair(48, security_id)  # SecurityID
+        # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
+        msg.append_pair(22, 8)
+
+    return msg
+
+
 class MarketDataSnapshotFullRefresh(FixMessage):
     def __init__(self):
         super().__init__()
@@ -327,11 +363,11 @@ class TradeCaptureReport(FixMessage):
             venue_order_id=VenueOrderId(self.get(37).decode()),  # OrderID
             trade_id=TradeId(self.get(527).decode()),  # SecondaryExecID
             order_side=parse_lmax_order_side(int(self.get(54))),  # Side
-            last_qty=Quantity(float(self.get(32)), instrument.size_precision),  # LastQty
-            last_px=Price(float(self.get(31)), instrument.price_precision),  # LastPx
+            last_qty=parse_quantity(self.get(32), instrument.size_precision),  # LastQty
+            last_px=parse_price(self.get(31), instrument.price_precision),  # LastPx
             liquidity_side=LiquiditySide.TAKER,
             report_id=UUID4(),
-            ts_event=parse_lmax_timestamp_ns(self.get(60).decode()),  #  TransactTime
+            ts_event=parse_lmax_timestamp_ns(self.get(60)),  #  TransactTime
             ts_init=dt_to_unix_nanos(pd.Timestamp.utcnow()),
             client_order_id=ClientOrderId(self.get(11).decode()),  # ClOrdID
             venue_position_id=None,  # LMAX netting position resolution
@@ -372,6 +408,16 @@ _MESSAGE_TYPE_MAP = {
     "AQ": TradeCaptureReportRequestAck,
 }
 
+_MESSAGE_CLASS_MAP = {cls: message_type.encode() for message_type, cls in _MESSAGE_TYPE_MAP.items()}
+
+
+def get_message_type(cls: type[FixMessage]) -> bytes:
+    """
+    Return the MsgType of the typed message class.
+    """
+    return _MESSAGE_CLASS_MAP[cls]
+
+
 _FIELD_MAP = {
     1: "Account",
     6: "AvgPx",
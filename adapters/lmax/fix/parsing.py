@@ -1,10 +1,24 @@
 import pandas as pd
 
-from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.objects import FIXED_PRECISION
+from nautilus_trader.model.objects import FIXED_SCALAR
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from pytower.adapters.lmax.fix.timestamps import format_utc_timestamp
+from pytower.adapters.lmax.fix.timestamps import parse_utc_timestamp_ns
 
 
-def parse_lmax_timestamp_ns(value: str) -> int:
-    return dt_to_unix_nanos(pd.to_datetime(value, format="%Y%m%d-%H:%M:%S.%f"))  # TransactTime
+# raw units per unit of the last decimal place, by precision, for the fixed precision
+# of the Nautilus build (9 decimals, or 16 with high precision)
+_RAW_SCALE = tuple(int(FIXED_SCALAR) // 10**precision for precision in range(FIXED_PRECISION + 1))
+
+# Decimal places of the prices and sizes of the ingest records, see
+# `MarketDataRingBuffer`. Independent of the build, so the values fit an int64.
+RECORD_PRECISION = 9
+
+
+def parse_lmax_timestamp_ns(value: bytes | str) -> int:
+    return parse_utc_timestamp_ns(value)  # TransactTime
 
 
 def format_lmax_timestamp(value: pd.Timestamp) -> str:
@@ -13,7 +27,71 @@ def format_lmax_timestamp(value: pd.Timestamp) -> str:
     only accepted in this format : YYYYMMDD-HH:MM:SS (whole seconds).
     For example 20120321-17:15:03
     """
-    return value.strftime("%Y%m%d-%H:%M:%S")
+    return format_utc_timestamp(value.value).decode()
+
+
+def parse_fixed(value: bytes, precision: int) -> int:
+    """
+    Return the decimal value scaled to an integer with `precision` decimal places,
+    without a float conversion. Extra decimal places are truncated.
+    """
+    integer, _, fraction = value.partition(b".")
+    return int(integer + fraction[:precision].ljust(precision, b"0"))
+
+
+def fixed_to_raw(value: int, fixed_precision: int, precision: int) -> int:
+    """
+    Return a `parse_fixed` value with `fixed_precision` decimal places as the raw
+    fixed-point integer of a `Price` or `Quantity` with `precision` decimal places,
+    rounded as `parse_raw` rounds.
+    """
+    scale = 10 ** (fixed_precision - precision)
+    units, remainder = divmod(abs(value), scale)
+    if remainder * 2 >= scale:
+        units += 1
+    return (-units if value < 0 else units) * _RAW_SCALE[precision]
+
+
+def parse_raw(value: bytes, precision: int) -> int:
+    """
+    Return the decimal value as the raw fixed-point integer of a `Price` or
+    `Quantity` with `precision` decimal places.
+
+    Extra decimal places are rounded half away from zero, as `Price(float(value),
+    precision)` rounds, but without the float conversion.
+
+    """
+    integer, _, fraction = value.partition(b".")
+    units = int(integer + fraction[:precision].ljust(precision, b"0"))
+    if len(fraction) > precision and fraction[precision] >= 53:  # '5'
+        units += -1 if integer[:1] == b"-" else 1
+    return units * _RAW_SCALE[precision]
+
+
+def parse_raw_batch(values: list[bytes], precision: int) -> list[int]:
+    """
+    Return the raw fixed-point integers of the decimal values, such as every
+    MDEntryPx of a snapshot, with `precision` decimal places.
+    """
+    scale = _RAW_SCALE[precision]
+    padding = b"0" * precision
+    raws = []
+    append = raws.append
+    for value in values:
+        integer, _, fraction = value.partition(b".")
+        if len(fraction) > precision:
+            append(parse_raw(value, precision))
+        else:
+            append(int(integer + fraction + padding[len(fraction) :]) * scale)
+    return raws
+
+
+def parse_price(value: bytes, precision: int) -> Price:
+    return Price.from_raw(parse_raw(value, precision), precision)
+
+
+def parse_quantity(value: bytes, precision: int) -> Quantity:
+    return Quantity.from_raw(parse_raw(value, precision), precision)
 
 
 def parse_lmax_reject_reason(value: int) -> str:
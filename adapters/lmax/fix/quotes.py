@@ -0,0 +1,217 @@
+import asyncio
+from collections.abc import Callable
+
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from pytower.adapters.lmax.fix.parsing import RECORD_PRECISION
+from pytower.adapters.lmax.fix.parsing import fixed_to_raw
+from pytower.adapters.lmax.fix.parsing import parse_raw_batch
+from pytower.adapters.lmax.fix.timestamps import parse_utc_date_time_ns
+
+
+class QuoteContext:
+    """
+    Holds everything needed to decode the quote snapshots of a single instrument.
+
+    A context is created when the subscription is sent and is looked up by the
+    SecurityID (tag 48) bytes of each snapshot, so the tick path does not search
+    the instrument provider. The last quote, and the raw prices and sizes it was
+    decoded from, are kept for comparison with the next.
+
+    """
+
+    __slots__ = (
+        "security_id",
+        "instrument_id",
+        "price_precision",
+        "size_precision",
+        "last_quote",
+        "last_values",
+    )
+
+    def __init__(self, instrument: Instrument):
+        self.security_id: bytes = str(instrument.info["id"]).encode()
+        self.instrument_id = instrument.id
+        self.price_precision: int = instrument.price_precision
+        self.size_precision: int = instrument.size_precision
+        self.last_quote: QuoteTick | None = None
+        self.last_values: tuple | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(security_id={self.security_id.decode()}, "
+            f"instrument_id={self.instrument_id})"
+        )
+
+    def decode(self, msg, ts_init: int) -> QuoteTick:
+        """
+        Return the QuoteTick of a MarketDataSnapshotFullRefresh with a bid and an
+        offer entry.
+        """
+        price_precision = self.price_precision
+        size_precision = self.size_precision
+        bid_price, ask_price = parse_raw_batch(
+            [msg.get(270, nth=1), msg.get(270, nth=2)],  # MDEntryPx
+            price_precision,
+        )
+        bid_size, ask_size = parse_raw_batch(
+            [msg.get(271, nth=1), msg.get(271, nth=2)],  # MDEntrySize
+            size_precision,
+        )
+        quote_tick = QuoteTick(
+            instrument_id=self.instrument_id,
+            bid_price=Price.from_raw(bid_price, price_precision),
+            bid_size=Quantity.from_raw(bid_size, size_precision),
+            ask_price=Price.from_raw(ask_price, price_precision),
+            ask_size=Quantity.from_raw(ask_size, size_precision),
+            ts_event=parse_utc_date_time_ns(msg.get(272), msg.get(273)),  # MDEntryDate, MDEntryTime
+            ts_init=ts_init,
+        )
+        self.last_quote = quote_tick
+        return quote_tick
+
+    def decode_record(self, record: tuple, ts_init: int) -> QuoteTick:
+        """
+        Return the QuoteTick of a (security_id, bid_price, bid_size, ask_price,
+        ask_size, ts_event) record of the ingest process, see `MarketDataRingBuffer`.
+        """
+        _, bid_price, bid_size, ask_price, ask_size, ts_event = record
+        price_precision = self.price_precision
+        size_precision = self.size_precision
+        quote_tick = QuoteTick(
+            instrument_id=self.instrument_id,
+            bid_price=Price.from_raw(
+                fixed_to_raw(bid_price, RECORD_PRECISION, price_precision),
+                price_precision,
+            ),
+            bid_size=Quantity.from_raw(
+                fixed_to_raw(bid_size, RECORD_PRECISION, size_precision),
+                size_precision,
+            ),
+            ask_price=Price.from_raw(
+                fixed_to_raw(ask_price, RECORD_PRECISION, price_precision),
+                price_precision,
+            ),
+            ask_size=Quantity.from_raw(
+                fixed_to_raw(ask_size, RECORD_PRECISION, size_precision),
+                size_precision,
+            ),
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
+        self.last_quote = quote_tick
+        return quote_tick
+
+
+class QuoteConflationStats:
+    """
+    Holds the counts of quote snapshots received, published and suppressed.
+    """
+
+    __slots__ = ("received", "published", "duplicates", "merged")
+
+    def __init__(self):
+        self.received = 0
+        self.published = 0
+        self.duplicates = 0
+        self.merged = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(received={self.received}, "
+            f"published={self.published}, "
+            f"duplicates={self.duplicates}, "
+            f"merged={self.merged})"
+        )
+
+
+class QuoteConflator:
+    """
+    Suppresses quote snapshots which do not need to be published.
+
+    With `drop_duplicates`, a snapshot with the same bid and ask prices and sizes as
+    the last one of its instrument is dropped before it is decoded. With
+    `latest_only`, snapshots are held per instrument until the event loop is next
+    idle, and only the newest of each instrument is decoded and published, so a
+    burst read while the loop was busy is coalesced into one quote per instrument.
+    The records of the ingest process are handled the same way by `handle_record`.
+
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[QuoteTick], None],
+        loop: asyncio.AbstractEventLoop,
+        drop_duplicates: bool = True,
+        latest_only: bool = False,
+    ):
+        self._publish = publish
+        self._loop = loop
+        self._drop_duplicates = drop_duplicates
+        self._latest_only = latest_only
+        # SecurityID bytes -> (decode, snapshot or record, ts_init)
+        self._pending: dict[bytes, tuple[Callable, object, int]] = {}
+        self._flush_scheduled = False
+        self._stats = QuoteConflationStats()
+
+    @property
+    def stats(self) -> QuoteConflationStats:
+        return self._stats
+
+    def handle_snapshot(self, context: QuoteContext, msg, ts_init: int) -> None:
+        stats = self._stats
+        stats.received += 1
+
+        if self._drop_duplicates:
+            get = msg.get
+            values = (get(270, 1), get(271, 1), get(270, 2), get(271, 2))  # MDEntryPx, MDEntrySize
+            if values == context.last_values:
+                stats.duplicates += 1
+                return
+            context.last_values = values
+
+        if not self._latest_only:
+            stats.published += 1
+            self._publish(context.decode(msg, ts_init))
+            return
+
+        self._hold(context, context.decode, msg, ts_init)
+
+    def handle_record(self, context: QuoteContext, record: tuple, ts_init: int) -> None:
+        stats = self._stats
+        stats.received += 1
+
+        if self._drop_duplicates:
+            values = record[1:5]  # bid price, bid size, ask price, ask size
+            if values == context.last_values:
+                stats.duplicates += 1
+                return
+            context.last_values = values
+
+        if not self._latest_only:
+            stats.published += 1
+            self._publish(context.decode_record(record, ts_init))
+            return
+
+        self._hold(context, context.decode_record, record, ts_init)
+
+    def _hold(self, context: QuoteContext, decode: Callable, value, ts_init: int) -> None:
+        if context.security_id in self._pending:
+            self._stats.merged += 1
+        self._pending[context.security_id] = (decode, value, ts_init)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """
+        Publish the newest held snapshot of every instrument.
+        """
+        self._flush_scheduled = False
+        pending = self._pending
+        self._pending = {}
+        self._stats.published += len(pending)
+        for decode, value, ts_init in pending.values():
+            self._publish(decode(value, ts_init))
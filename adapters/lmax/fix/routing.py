@@ -0,0 +1,124 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+from simplefix import FixMessage
+
+from pytower.adapters.lmax.fix.messages import get_message_type
+
+
+_ANY_MESSAGE_TYPE = "*"
+
+
+class RouteStats:
+    """
+    Holds the dispatch count and timings of a single route.
+    """
+
+    __slots__ = ("count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(count={self.count}, "
+            f"mean_us={self.mean_ns / 1_000:.1f}, max_us={self.max_ns / 1_000:.1f})"
+        )
+
+
+class _Route:
+    __slots__ = ("handler", "is_async", "stats")
+
+    def __init__(self, handler: Callable, is_async: bool, stats: RouteStats):
+        self.handler = handler
+        self.is_async = is_async
+        self.stats = stats
+
+
+class FixRouter:
+    """
+    Routes inbound messages to the handlers registered for their MsgType.
+
+    Handlers registered without message types receive every message. Synchronous
+    handlers are called directly, so no coroutine is created for them on dispatch.
+    Each (MsgType, handler) route records its dispatch count and timings.
+
+    """
+
+    def __init__(self):
+        self._registrations: list[tuple[Callable, frozenset[bytes] | None]] = []
+        self._stats: dict[tuple[str, str], RouteStats] = {}
+        self._routes: dict[bytes, tuple[_Route, ...]] = {}
+        self._default: tuple[_Route, ...] = ()
+
+    @property
+    def stats(self) -> dict[tuple[str, str], RouteStats]:
+        """
+        Return the route statistics keyed by (MsgType, handler name).
+        """
+        return self._stats
+
+    def register(
+        self,
+        handler: Callable,
+        message_types: list[type[FixMessage]] | None = None,
+    ) -> None:
+        """
+        Register the handler for the message types, or every message if ``None``.
+        """
+        types = None
+        if message_types is not None:
+            types = frozenset(get_message_type(cls) for cls in message_types)
+        self._registrations.append((handler, types))
+        self._build()
+
+    def _build(self) -> None:
+        message_types = set()
+        for _, types in self._registrations:
+            if types is not None:
+                message_types.update(types)
+
+        self._routes = {
+            message_type: self._build_routes(message_type) for message_type in message_types
+        }
+        self._default = self._build_routes(None)
+
+    def _build_routes(self, message_type: bytes | None) -> tuple[_Route, ...]:
+        routes = []
+        for handler, types in self._registrations:
+            if types is None or (message_type is not None and message_type in types):
+                key = (
+                    message_type.decode() if message_type is not None else _ANY_MESSAGE_TYPE,
+                    getattr(handler, "__qualname__", repr(handler)),
+                )
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = RouteStats()
+                routes.append(
+                    _Route(handler, asyncio.iscoroutinefunction(handler), stats),
+                )
+        return tuple(routes)
+
+    async def dispatch(self, msg: FixMessage) -> None:
+        """
+        Dispatch the message to every handler routed for its MsgType, in order.
+        """
+        for route in self._routes.get(msg.message_type, self._default):
+            start = time.perf_counter_ns()
+            if route.is_async:
+                await route.handler(msg)
+            else:
+                route.handler(msg)
+            elapsed = time.perf_counter_ns() - start
+            stats = route.stats
+            stats.count += 1
+            stats.total_ns += elapsed
+            if elapsed > stats.max_ns:
+                stats.max_ns = elapsed
@@ -0,0 +1,165 @@
+import mmap
+import struct
+from pathlib import Path
+
+
+# next outbound MsgSeqNum, next expected inbound MsgSeqNum
+_HEADER = struct.Struct("<QQ")
+
+# MsgSeqNum, frame length
+_RECORD = struct.Struct("<QI")
+
+_INITIAL_SIZE = 1 << 20
+
+
+class FixSessionStore:
+    """
+    Provides an append-only store of the sequence numbers and outbound frames of a
+    single FIX session.
+
+    With a path, the state is kept in two memory-mapped files so a session can be
+    resumed after a restart without resetting the sequence numbers:
+
+    - ``<session>.seqnums`` holds the next outbound and next expected inbound MsgSeqNum
+    - ``<session>.body`` holds every outbound frame, as MsgSeqNum, length and frame
+
+    Without a path the same state is kept in memory for the lifetime of the process.
+
+    """
+
+    def __init__(self, path: str | Path | None, session_id: str):
+        self._index: dict[int, tuple[int, int]] = {}  # MsgSeqNum -> (offset, length)
+        self._offset = 0
+
+        if path is None:
+            self._header_file = None
+            self._body_file = None
+            self._header = bytearray(_HEADER.size)
+            self._body = bytearray()
+            _HEADER.pack_into(self._header, 0, 1, 1)
+            return
+
+        folder = Path(path)
+        folder.mkdir(parents=True, exist_ok=True)
+
+        header_path = folder / f"{session_id}.seqnums"
+        is_new = not header_path.exists() or header_path.stat().st_size < _HEADER.size
+        header_path.touch(exist_ok=True)
+        self._header_file = open(header_path, "r+b")
+        if is_new:
+            self._header_file.truncate(_HEADER.size)
+        self._header = mmap.mmap(self._header_file.fileno(), _HEADER.size)
+        if is_new:
+            _HEADER.pack_into(self._header, 0, 1, 1)
+
+        body_path = folder / f"{session_id}.body"
+        body_path.touch(exist_ok=True)
+        self._body_file = open(body_path, "r+b")
+        size = max(self._body_file.seek(0, 2), _INITIAL_SIZE)
+        self._body_file.truncate(size)
+        self._body = mmap.mmap(self._body_file.fileno(), size)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        body = self._body
+        size = len(body)
+        offset = 0
+        while offset + _RECORD.size <= size:
+            sequence_number, length = _RECORD.unpack_from(body, offset)
+            if sequence_number == 0 or offset + _RECORD.size + length > size:
+                break  # end of the written records
+            self._index[sequence_number] = (offset + _RECORD.size, length)
+            offset += _RECORD.size + length
+        self._offset = offset
+
+    @property
+    def next_outbound_sequence_number(self) -> int:
+        return _HEADER.unpack_from(self._header, 0)[0]
+
+    @property
+    def next_inbound_sequence_number(self) -> int:
+        return _HEADER.unpack_from(self._header, 0)[1]
+
+    @property
+    def is_persistent(self) -> bool:
+        return self._body_file is not None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.next_outbound_sequence_number == 1 and self.next_inbound_sequence_number == 1
+
+    def set_next_inbound_sequence_number(self, sequence_number: int) -> None:
+        struct.pack_into("<Q", self._header, 8, sequence_number)
+
+    def add_outbound(self, sequence_number: int, raw: bytes) -> None:
+        """
+        Append the outbound frame and advance the next outbound MsgSeqNum past it.
+        """
+        end = self._offset + _RECORD.size + len(raw)
+        if end > len(self._body):
+            self._grow(end)
+
+        body = self._body
+        _RECORD.pack_into(body, self._offset, sequence_number, len(raw))
+        start = self._offset + _RECORD.size
+        body[start:end] = raw
+        self._index[sequence_number] = (start, len(raw))
+        self._offset = end
+
+        struct.pack_into("<Q", self._header, 0, sequence_number + 1)
+
+    def get_outbound(self, begin: int, end: int) -> list[tuple[int, bytes | None]]:
+        """
+        Return the outbound frames from `begin` to `end` inclusive, ``None`` for any
+        sequence number not in the store. An `end` of 0 means the last sent message.
+        """
+        last = self.next_outbound_sequence_number - 1
+        if end == 0 or end > last:
+            end = last
+
+        frames = []
+        for sequence_number in range(begin, end + 1):
+            location = self._index.get(sequence_number)
+            if location is None:
+                frames.append((sequence_number, None))
+            else:
+                start, length = location
+                frames.append((sequence_number, bytes(self._body[start : start + length])))
+        return frames
+
+    def reset(self) -> None:
+        """
+        Reset both sequence numbers to 1 and discard the stored frames.
+        """
+        _HEADER.pack_into(self._header, 0, 1, 1)
+        self._index.clear()
+        if self.is_persistent:
+            self._body[: self._offset] = bytes(self._offset)
+        else:
+            self._body.clear()
+        self._offset = 0
+
+    def _grow(self, min_size: int) -> None:
+        if not self.is_persistent:
+            self._body.extend(bytes(min_size - len(self._body)))
+            return
+
+        size = len(self._body)
+        while size < min_size:
+            size *= 2
+        self._body.close()
+        self._body_file.truncate(size)
+        self._body = mmap.mmap(self._body_file.fileno(), size)
+
+    def flush(self) -> None:
+        if self.is_persistent:
+            self._header.flush()
+            self._body.flush()
+
+    def close(self) -> None:
+        if self.is_persistent:
+            self.flush()
+            self._header.close()
+            self._body.close()
+            self._header_file.close()
+            self._body_file.close()
@@ -0,0 +1,174 @@
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments.base import Instrument
+
+
+# (request_id, security_ids, subscribe)
+SendMarketDataRequest = Callable[[str, list[int], bool], Awaitable[None]]
+
+
+class MarketDataSubscriptionBatcher:
+    """
+    Groups the quote tick subscribe and unsubscribe calls made within
+    `window_seconds` into MarketDataRequests of up to `max_batch_size` instruments.
+
+    Each call waits until the request with its instrument has been sent. A subscribe
+    and an unsubscribe of the same instrument within a window cancel out, and
+    repeated calls are sent once. The instruments of every subscribe request are
+    kept by MDReqID so a MarketDataRequestReject can be mapped back to its group.
+
+    LMAX disables a subscription by the MDReqID of the request which made it, so an
+    unsubscribe is sent with the MDReqID of the subscribe of its instrument. The
+    other instruments of that request are then subscribed again in a new request.
+
+    """
+
+    def __init__(
+        self,
+        send: SendMarketDataRequest,
+        window_seconds: float = 0.005,
+        max_batch_size: int = 100,
+        prefix: str = "QuoteTick",
+    ):
+        self._send = send
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._prefix = prefix
+        self._request_count = 0
+
+        # InstrumentId -> (Instrument, subscribe) waiting for the window to close
+        self._pending: dict[InstrumentId, tuple[Instrument, bool]] = {}
+        self._flushed: asyncio.Future | None = None
+
+        # MDReqID -> instruments of each active subscribe request
+        self._requests: dict[str, dict[InstrumentId, Instrument]] = {}
+
+        # InstrumentId -> MDReqID of the subscribe request of the instrument
+        self._request_ids: dict[InstrumentId, str] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def subscribe(self, instrument: Instrument) -> None:
+        await self._enqueue(instrument, subscribe=True)
+
+    async def unsubscribe(self, instrument: Instrument) -> None:
+        await self._enqueue(instrument, subscribe=False)
+
+    async def _enqueue(self, instrument: Instrument, subscribe: bool) -> None:
+        pending = self._pending.get(instrument.id)
+        if pending is not None and pending[1] != subscribe:
+            del self._pending[instrument.id]  # cancels out
+        else:
+            self._pending[instrument.id] = (instrument, subscribe)
+
+        if self._flushed is None:
+            self._flushed = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().create_task(self._flush_after_window(self._flushed))
+        await asyncio.shield(self._flushed)
+
+    async def _flush_after_window(self, flushed: asyncio.Future) -> None:
+        await asyncio.sleep(self._window_seconds)
+        self._flushed = None
+        try:
+            await self.flush()
+        except Exception as e:
+            flushed.set_exception(e)
+            flushed.exception()  # retrieved by the waiters, if any are left
+        else:
+            flushed.set_result(None)
+
+    async def flush(self) -> None:
+        """
+        Send every pending subscribe and unsubscribe now.
+        """
+        pending = self._pending
+        self._pending = {}
+
+        subscribes = [instrument for instrument, subscribe in pending.values() if subscribe]
+        unsubscribes = [instrument for instrument, subscribe in pending.values() if not subscribe]
+        await self.send_batches(subscribes, subscribe=True)
+        await self.send_batches(unsubscribes, subscribe=False)
+
+    async def send_batches(self, instruments: list[Instrument], subscribe: bool) -> None:
+        """
+        Send the instruments in MarketDataRequests of up to `max_batch_size`.
+        """
+        if not subscribe:
+            await self._send_unsubscribes(instruments)
+            return
+
+        size = self._max_batch_size
+        for i in range(0, len(instruments), size):
+            await self.send(instruments[i : i + size], subscribe)
+
+    async def send(self, instruments: list[Instrument], subscribe: bool) -> str:
+        """
+        Send a single MarketDataRequest for the instruments and return its MDReqID.
+        """
+        request_id = self._next_request_id(instruments)
+        if subscribe:
+            for instrument in instruments:
+                self._forget(instrument.id)
+            self._requests[request_id] = {instrument.id: instrument for instrument in instruments}
+            for instrument in instruments:
+                self._request_ids[instrument.id] = request_id
+
+        await self._send(
+            request_id,
+            [instrument.info["id"] for instrument in instruments],
+            subscribe,
+        )
+        return request_id
+
+    def pop_request(self, request_id: str) -> list[InstrumentId] | None:
+        """
+        Return the instruments of the subscribe request with the MDReqID, if known.
+        """
+        instruments = self._requests.pop(request_id, None)
+        if instruments is None:
+            return None
+        for instrument_id in instruments:
+            if self._request_ids.get(instrument_id) == request_id:
+                del self._request_ids[instrument_id]
+        return list(instruments)
+
+    async def _send_unsubscribes(self, instruments: list[Instrument]) -> None:
+        """
+        Disable the subscribe requests of the instruments by their MDReqIDs, and
+        subscribe the other instruments of each request again.
+        """
+        by_request: dict[str, list[Instrument]] = {}
+        for instrument in instruments:
+            request_id = self._request_ids.pop(instrument.id, None)
+            if request_id is None:
+                request_id = self._next_request_id([instrument])  # not subscribed here
+            by_request.setdefault(request_id, []).append(instrument)
+
+        for request_id, unsubscribes in by_request.items():
+            group = self._requests.pop(request_id, {})
+            for instrument in unsubscribes:
+                group.pop(instrument.id, None)
+            remaining = list(group.values())
+            security_ids = [instrument.info["id"] for instrument in unsubscribes]
+            await self._send(request_id, security_ids, False)
+            if remaining:
+                await self.send(remaining, subscribe=True)
+
+    def _next_request_id(self, instruments: list[Instrument]) -> str:
+        if len(instruments) == 1:
+            return f"{self._prefix}-{instruments[0].id.value}"
+        self._request_count += 1
+        return f"{self._prefix}-batch-{self._request_count}"
+
+    def _forget(self, instrument_id: InstrumentId) -> None:
+        request_id = self._request_ids.pop(instrument_id, None)
+        instruments = self._requests.get(request_id)
+        if instruments is not None:
+            instruments.pop(instrument_id, None)
+            if not instruments:
+                del self._requests[request_id]
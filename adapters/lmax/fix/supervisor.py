@@ -0,0 +1,165 @@
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import LoggerAdapter
+
+
+if TYPE_CHECKING:
+    from pytower.adapters.lmax.fix.client import LmaxFixClient
+
+
+class RecoveryStats:
+    """
+    Holds the reconnect count and time-to-recover timings of a FIX session.
+
+    The time to logon is measured from the failure being detected to the Logon
+    response, the time to data from the failure to the first application message
+    handled after the subscriptions are replayed.
+
+    """
+
+    __slots__ = (
+        "count",
+        "failed_attempts",
+        "last_logon_ns",
+        "max_logon_ns",
+        "last_data_ns",
+        "max_data_ns",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.failed_attempts = 0
+        self.last_logon_ns = 0
+        self.max_logon_ns = 0
+        self.last_data_ns = 0
+        self.max_data_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(count={self.count}, "
+            f"failed_attempts={self.failed_attempts}, "
+            f"last_logon_ms={self.last_logon_ns / 1_000_000:.1f}, "
+            f"max_logon_ms={self.max_logon_ns / 1_000_000:.1f}, "
+            f"last_data_ms={self.last_data_ns / 1_000_000:.1f}, "
+            f"max_data_ms={self.max_data_ns / 1_000_000:.1f})"
+        )
+
+
+class FixConnectionSupervisor:
+    """
+    Watches a FIX connection and restores it when it fails.
+
+    The connection is considered down on EOF, on a read error, or when nothing has
+    been received for `heartbeat_timeout_seconds`. Reconnects are attempted with
+    exponential backoff and full jitter, from `initial_delay_seconds` up to
+    `max_delay_seconds`, and the client replays its subscriptions once logged on.
+
+    """
+
+    def __init__(
+        self,
+        fix_client: "LmaxFixClient",
+        clock: LiveClock,
+        logger: Logger,
+        heartbeat_timeout_seconds: float,
+        initial_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 30.0,
+    ):
+        self._fix_client = fix_client
+        self._clock = clock
+        self._heartbeat_timeout_seconds = heartbeat_timeout_seconds
+        self._initial_delay_seconds = initial_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._task: asyncio.Task | None = None
+        self._stats = RecoveryStats()
+        self._log = LoggerAdapter(type(self).__name__, logger)
+
+    @property
+    def stats(self) -> RecoveryStats:
+        return self._stats
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Return the delay before the given reconnect attempt, starting from 0.
+        """
+        ceiling = min(self._max_delay_seconds, self._initial_delay_seconds * (1 << attempt))
+        return random.uniform(0, ceiling)
+
+    async def _run(self) -> None:
+        while True:
+            reason = await self._wait_for_failure()
+            await self._recover(reason)
+
+    async def _wait_for_failure(self) -> str:
+        fix_client = self._fix_client
+        timeout_ns = int(self._heartbeat_timeout_seconds * 1_000_000_000)
+        interval = self._heartbeat_timeout_seconds / 4
+        while not fix_client.is_disconnected.is_set():
+            idle_ns = self._clock.timestamp_ns() - fix_client.last_received_ns
+            if idle_ns > timeout_ns:
+                return f"nothing received for {idle_ns / 1_000_000_000:.1f}s"
+            try:
+                await asyncio.wait_for(fix_client.is_disconnected.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+        return "connection lost"
+
+    async def _recover(self, reason: str) -> None:
+        start_ns = self._clock.timestamp_ns()
+        self._log.warning(f"FIX session down ({reason}), reconnecting")
+
+        attempt = 0
+        while True:
+            delay = self.backoff_delay(attempt)
+            attempt += 1
+            await asyncio.sleep(delay)
+            try:
+                await self._fix_client.reconnect()
+                break
+            except (OSError, asyncio.TimeoutError) as e:
+                self._stats.failed_attempts += 1
+                self._log.warning(f"Reconnect attempt {attempt} failed: {e!r}")
+            except Exception as e:
+                # such as a failing reconnect handler, keep retrying rather than stop
+                self._stats.failed_attempts += 1
+                self._log.error(f"Reconnect attempt {attempt} failed: {e!r}")
+
+        stats = self._stats
+        stats.count += 1
+        stats.last_logon_ns = self._clock.timestamp_ns() - start_ns
+        stats.max_logon_ns = max(stats.max_logon_ns, stats.last_logon_ns)
+        self._log.info(
+            f"FIX session recovered after {attempt} attempts, "
+            f"logged on in {stats.last_logon_ns / 1_000_000:.1f}ms",
+        )
+
+        try:
+            await asyncio.wait_for(
+                self._fix_client.wait_for_events(1),
+                timeout=self._heartbeat_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            self._log.warning("No messages received since the FIX session recovered")
+            return
+
+        stats.last_data_ns = self._clock.timestamp_ns() - start_ns
+        stats.max_data_ns = max(stats.max_data_ns, stats.last_data_ns)
+        self._log.info(f"Messages flowing again {stats.last_data_ns / 1_000_000:.1f}ms after failure")
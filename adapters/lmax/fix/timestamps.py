@@ -0,0 +1,125 @@
+"""
+FIX UTCTimestamp codec.
+
+Timestamps are parsed from ``YYYYMMDD-HH:MM:SS[.fff[fff[fff]]]`` bytes straight to
+UNIX nanoseconds. The midnight of each date is cached, so only the time of day is
+parsed for every timestamp after the first of the day.
+"""
+
+import datetime
+
+
+_NANOS_PER_SECOND = 1_000_000_000
+_SECONDS_PER_DAY = 86_400
+_NANOS_PER_DAY = _SECONDS_PER_DAY * _NANOS_PER_SECOND
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# nanoseconds per unit of a fraction with n digits
+_FRACTION_SCALE = tuple(10 ** (9 - digits) for digits in range(10))
+
+_MAX_CACHED_DATES = 4096
+
+# UTCDateOnly bytes -> UNIX nanoseconds at midnight
+_midnight_ns: dict[bytes, int] = {}
+
+# days since the epoch -> b"YYYYMMDD-"
+_date_prefixes: dict[int, bytes] = {}
+
+
+def _date_to_midnight_ns(date: bytes) -> int:
+    midnight_ns = _midnight_ns.get(date)
+    if midnight_ns is None:
+        if len(date) != 8 or not date.isdigit():
+            raise ValueError(f"Invalid UTCDateOnly: {date!r}")
+        ordinal = datetime.date(int(date[0:4]), int(date[4:6]), int(date[6:8])).toordinal()
+        midnight_ns = (ordinal - _EPOCH_ORDINAL) * _NANOS_PER_DAY
+        if len(_midnight_ns) >= _MAX_CACHED_DATES:
+            _midnight_ns.clear()
+        _midnight_ns[date] = midnight_ns
+    return midnight_ns
+
+
+def _time_of_day_ns(time: bytes) -> int:
+    # HH:MM:SS[.f], 1 to 9 fraction digits
+    size = len(time)
+    if size < 8 or time[2] != 58 or time[5] != 58:  # ':'
+        raise ValueError(f"Invalid UTCTimeOnly: {time!r}")
+
+    hours = int(time[0:2])
+    minutes = int(time[3:5])
+    seconds = int(time[6:8])
+    if hours > 23 or minutes > 59 or seconds > 60:  # 60 is a leap second
+        raise ValueError(f"Invalid UTCTimeOnly: {time!r}")
+
+    nanos = (hours * 3600 + minutes * 60 + seconds) * _NANOS_PER_SECOND
+    if size > 8:
+        digits = size - 9
+        if time[8] != 46 or digits < 1 or digits > 9:  # '.'
+            raise ValueError(f"Invalid UTCTimeOnly: {time!r}")
+        nanos += int(time[9:]) * _FRACTION_SCALE[digits]
+    return nanos
+
+
+def parse_utc_timestamp_ns(value: bytes | str) -> int:
+    """
+    Return the UNIX nanoseconds of a UTCTimestamp, such as TransactTime.
+    """
+    if type(value) is str:
+        value = value.encode()
+    if len(value) < 17 or value[8] != 45:  # '-'
+        raise ValueError(f"Invalid UTCTimestamp: {value!r}")
+    return _date_to_midnight_ns(value[:8]) + _time_of_day_ns(value[9:])
+
+
+def parse_utc_date_time_ns(date: bytes | str, time: bytes | str) -> int:
+    """
+    Return the UNIX nanoseconds of a UTCDateOnly and UTCTimeOnly pair, such as
+    MDEntryDate and MDEntryTime.
+    """
+    if type(date) is str:
+        date = date.encode()
+    if type(time) is str:
+        time = time.encode()
+    return _date_to_midnight_ns(date) + _time_of_day_ns(time)
+
+
+def _date_prefix(days: int) -> bytes:
+    prefix = _date_prefixes.get(days)
+    if prefix is None:
+        date = datetime.date.fromordinal(days + _EPOCH_ORDINAL)
+        prefix = b"%04d%02d%02d-" % (date.year, date.month, date.day)
+        if len(_date_prefixes) >= _MAX_CACHED_DATES:
+            _date_prefixes.clear()
+        _date_prefixes[days] = prefix
+    return prefix
+
+
+def format_utc_timestamp(timestamp_ns: int) -> bytes:
+    """
+    Return the UNIX nanoseconds as a UTCTimestamp in whole seconds.
+    """
+    days, seconds = divmod(timestamp_ns // _NANOS_PER_SECOND, _SECONDS_PER_DAY)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return _date_prefix(days) + b"%02d:%02d:%02d" % (hours, minutes, seconds)
+
+
+class SendingTimeFormatter:
+    """
+    Formats UTC nanosecond timestamps as FIX UTCTimestamps with microsecond precision.
+
+    The date and time prefix is only formatted when the second changes, every other
+    call appends the microseconds to the cached prefix.
+
+    """
+
+    def __init__(self):
+        self._second = -1
+        self._prefix = b""
+
+    def format(self, timestamp_ns: int) -> bytes:
+        second, nanos = divmod(timestamp_ns, _NANOS_PER_SECOND)
+        if second != self._second:
+            self._second = second
+            self._prefix = format_utc_timestamp(timestamp_ns) + b"."
+        return self._prefix + b"%06d" % (nanos // 1_000)
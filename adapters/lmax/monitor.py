@@ -0,0 +1,308 @@
+"""
+Monitors the latency and staleness of the LMAX market data feed per instrument.
+"""
+
+import asyncio
+import datetime
+from zoneinfo import ZoneInfo
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import LoggerAdapter
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments.base import Instrument
+from pytower.adapters.lmax.common import LatencyHistogram
+
+
+_WEEKDAYS = ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY")
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+class TradingHours:
+    """
+    Represents the LMAX trading hours of an instrument.
+
+    The session of each trading day opens `opening_offset` minutes after midnight
+    of that day in the instrument timezone and closes `closing_offset` minutes after
+    it. The opening offset is negative when the session opens the evening before,
+    such as -415 (17:05 the previous day) for currency pairs.
+
+    """
+
+    def __init__(
+        self,
+        opening_offset: int,
+        closing_offset: int,
+        timezone: str,
+        trading_days: list[str],
+    ):
+        self._opening = datetime.timedelta(minutes=opening_offset)
+        self._closing = datetime.timedelta(minutes=closing_offset)
+        self._timezone = ZoneInfo(timezone)
+        self._trading_days = frozenset(_WEEKDAYS.index(day) for day in trading_days)
+
+    @classmethod
+    def from_instrument(cls, instrument: Instrument) -> "TradingHours | None":
+        info = instrument.info or {}
+        if info.get("timezone") is None or info.get("tradingDays") is None:
+            return None
+        return cls(
+            opening_offset=info["openingOffset"],
+            closing_offset=info["closingOffset"],
+            timezone=info["timezone"],
+            trading_days=info["tradingDays"],
+        )
+
+    def is_open(self, timestamp_ns: int) -> bool:
+        now = datetime.datetime.fromtimestamp(timestamp_ns / 1_000_000_000, tz=self._timezone)
+        today = now.date()
+        # a session may open the day before, or close the day after, its trading day
+        for day in (today - _ONE_DAY, today, today + _ONE_DAY):
+            if day.weekday() not in self._trading_days:
+                continue
+            midnight = datetime.datetime.combine(day, datetime.time(), tzinfo=self._timezone)
+            if midnight + self._opening <= now < midnight + self._closing:
+                return True
+        return False
+
+
+class FeedStats:
+    """
+    Represents a snapshot of the feed statistics of an instrument.
+    """
+
+    __slots__ = (
+        "instrument_id",
+        "count",
+        "last_update_ns",
+        "rate_per_second",
+        "latency_p50_ns",
+        "latency_p99_ns",
+        "is_stale",
+    )
+
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        count: int,
+        last_update_ns: int,
+        rate_per_second: float,
+        latency_p50_ns: int | None,
+        latency_p99_ns: int | None,
+        is_stale: bool,
+    ):
+        self.instrument_id = instrument_id
+        self.count = count
+        self.last_update_ns = last_update_ns
+        self.rate_per_second = rate_per_second
+        self.latency_p50_ns = latency_p50_ns
+        self.latency_p99_ns = latency_p99_ns
+        self.is_stale = is_stale
+
+    def __repr__(self) -> str:
+        p50 = f"{self.latency_p50_ns / 1_000_000:.1f}" if self.latency_p50_ns is not None else None
+        p99 = f"{self.latency_p99_ns / 1_000_000:.1f}" if self.latency_p99_ns is not None else None
+        return (
+            f"{type(self).__name__}({self.instrument_id}, count={self.count}, "
+            f"rate={self.rate_per_second:.1f}/s, p50_ms={p50}, p99_ms={p99}, "
+            f"is_stale={self.is_stale})"
+        )
+
+
+class FeedMonitor:
+    """
+    Tracks the update time, update rate and feed latency of every instrument.
+
+    Each instrument is given a slot in parallel per-instrument lists, so recording a
+    quote is a dict lookup, two list writes and a histogram append. The latency is
+    `ts_init - ts_event`, the time from the LMAX MDEntryTime to the quote being
+    decoded, which includes any clock offset between LMAX and this host.
+
+    An instrument is stale when no snapshot has been received for
+    `stale_threshold_seconds` while its market is open, which includes snapshots
+    dropped as duplicates of the last quote. The stale instruments and a summary of the feed are
+    logged every `summary_interval_seconds` once started.
+
+    """
+
+    def __init__(
+        self,
+        clock: LiveClock,
+        logger: Logger,
+        stale_threshold_seconds: float = 10.0,
+        summary_interval_seconds: float = 60.0,
+        histogram_size: int = 256,
+    ):
+        self._clock = clock
+        self._stale_threshold_ns = int(stale_threshold_seconds * 1_000_000_000)
+        self._summary_interval_seconds = summary_interval_seconds
+        self._histogram_size = histogram_size
+        self._task: asyncio.Task | None = None
+        self._log = LoggerAdapter(type(self).__name__, logger)
+
+        self._slots: dict[InstrumentId, int] = {}
+        self._instrument_ids: list[InstrumentId] = []
+        self._trading_hours: list[TradingHours | None] = []
+        self._registered_ns: list[int] = []
+        self._last_update_ns: list[int] = []
+        self._counts: list[int] = []
+        self._histograms: list[LatencyHistogram] = []
+
+        # update rate over the last summary interval
+        self._rate_counts: list[int] = []
+        self._rates: list[float] = []
+        self._rate_start_ns = clock.timestamp_ns()
+
+    def register(self, instrument: Instrument) -> None:
+        """
+        Start monitoring the instrument, if not already monitored.
+        """
+        slot = self._slots.get(instrument.id)
+        if slot is not None:
+            self._trading_hours[slot] = TradingHours.from_instrument(instrument)
+            return
+
+        self._slots[instrument.id] = len(self._instrument_ids)
+        self._instrument_ids.append(instrument.id)
+        self._trading_hours.append(TradingHours.from_instrument(instrument))
+        self._registered_ns.append(self._clock.timestamp_ns())
+        self._last_update_ns.append(0)
+        self._counts.append(0)
+        self._histograms.append(LatencyHistogram(size=self._histogram_size))
+        self._rate_counts.append(0)
+        self._rates.append(0.0)
+
+    def unregister(self, instrument_id: InstrumentId) -> None:
+        """
+        Stop monitoring the instrument, if monitored.
+        """
+        slot = self._slots.pop(instrument_id, None)
+        if slot is None:
+            return
+
+        # move the last slot into the freed one, so the lists stay dense
+        lists = (
+            self._instrument_ids,
+            self._trading_hours,
+            self._registered_ns,
+            self._last_update_ns,
+            self._counts,
+            self._histograms,
+            self._rate_counts,
+            self._rates,
+        )
+        last = len(self._instrument_ids) - 1
+        if slot != last:
+            for values in lists:
+                values[slot] = values[last]
+            self._slots[self._instrument_ids[slot]] = slot
+        for values in lists:
+            values.pop()
+
+    def on_snapshot(self, instrument_id: InstrumentId, ts_init: int) -> None:
+        """
+        Record that a snapshot was received, whether or not a quote is published.
+        """
+        slot = self._slots.get(instrument_id)
+        if slot is not None:
+            self._last_update_ns[slot] = ts_init
+
+    def on_quote(self, instrument_id: InstrumentId, ts_event: int, ts_init: int) -> None:
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            return
+        self._last_update_ns[slot] = ts_init
+        self._counts[slot] += 1
+        self._histograms[slot].add(ts_init - ts_event)
+
+    def histogram(self, instrument_id: InstrumentId) -> LatencyHistogram | None:
+        slot = self._slots.get(instrument_id)
+        return self._histograms[slot] if slot is not None else None
+
+    def is_stale(self, instrument_id: InstrumentId, now_ns: int | None = None) -> bool:
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            return False
+        return self._is_stale(slot, now_ns if now_ns is not None else self._clock.timestamp_ns())
+
+    def _is_stale(self, slot: int, now_ns: int) -> bool:
+        since_ns = self._last_update_ns[slot] or self._registered_ns[slot]
+        if now_ns - since_ns < self._stale_threshold_ns:
+            return False
+        trading_hours = self._trading_hours[slot]
+        return trading_hours is None or trading_hours.is_open(now_ns)
+
+    def stale_instruments(self, now_ns: int | None = None) -> list[InstrumentId]:
+        now_ns = now_ns if now_ns is not None else self._clock.timestamp_ns()
+        return [
+            instrument_id
+            for slot, instrument_id in enumerate(self._instrument_ids)
+            if self._is_stale(slot, now_ns)
+        ]
+
+    def snapshot(self, now_ns: int | None = None) -> list[FeedStats]:
+        """
+        Return the feed statistics of every monitored instrument.
+        """
+        now_ns = now_ns if now_ns is not None else self._clock.timestamp_ns()
+        stats = []
+        for slot, instrument_id in enumerate(self._instrument_ids):
+            histogram = self._histograms[slot]
+            stats.append(
+                FeedStats(
+                    instrument_id=instrument_id,
+                    count=self._counts[slot],
+                    last_update_ns=self._last_update_ns[slot],
+                    rate_per_second=self._rates[slot],
+                    latency_p50_ns=histogram.percentile(50),
+                    latency_p99_ns=histogram.percentile(99),
+                    is_stale=self._is_stale(slot, now_ns),
+                ),
+            )
+        return stats
+
+    def update_rates(self, now_ns: int | None = None) -> None:
+        """
+        Compute the update rate of every instrument since the last call.
+        """
+        now_ns = now_ns if now_ns is not None else self._clock.timestamp_ns()
+        elapsed_seconds = (now_ns - self._rate_start_ns) / 1_000_000_000
+        for slot, count in enumerate(self._counts):
+            if elapsed_seconds > 0:
+                self._rates[slot] = (count - self._rate_counts[slot]) / elapsed_seconds
+            self._rate_counts[slot] = count
+        self._rate_start_ns = now_ns
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._summary_interval_seconds)
+            self.log_summary()
+
+    def log_summary(self) -> None:
+        now_ns = self._clock.timestamp_ns()
+        self.update_rates(now_ns)
+        stats = self.snapshot(now_ns)
+        if not stats:
+            return
+
+        latencies = [s.latency_p99_ns for s in stats if s.latency_p99_ns is not None]
+        p99 = f"{max(latencies) / 1_000_000:.1f}ms" if latencies else "n/a"
+        self._log.info(
+            f"Feed: {len(stats)} instruments, "
+            f"{sum(s.rate_per_second for s in stats):.1f} updates/s, "
+            f"worst p99 latency {p99}",
+        )
+        stale = [str(s.instrument_id) for s in stats if s.is_stale]
+        if stale:
+            self._log.warning(f"Stale during trading hours: {', '.join(stale)}")
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.config.common import InstrumentProviderConfig
@@ -21,6 +23,7 @@ class LmaxInstrumentProvider(InstrumentProvider):
         )
         self._instrument_map = {}  # dict[int, Instrument]
         self._xml_client = xml_client
+        self._load_handlers: list[Callable] = []
 
     @property
     def xml_client(self) -> LmaxXmlClient:
@@ -28,12 +31,35 @@ class LmaxInstrumentProvider(InstrumentProvider):
 
     async def load_all_async(self, filters: dict | None = None) -> None:
         instruments = await self._xml_client.request_instruments(query="")
+
+        # instruments no longer listed are removed, so a refresh drops them
+        listed = {instrument.id for instrument in instruments}
+        for instrument in list(self._instrument_map.values()):
+            if instrument.id not in listed:
+                self._log.info(f"Removing delisted instrument {instrument.id}")
+                del self._instrument_map[instrument.info["id"]]
+                self._instruments.pop(instrument.id, None)
+
         for instrument in instruments:
             self.add(instrument)
         # self._instrument_map =
         # for instrument in self._instrument_map.values():
         # self.add(instrument)
 
+        for handler in self._load_handlers:
+            handler()
+
+    def register_load_handler(self, handler: Callable) -> None:
+        """
+        Register a function called after every `load_all_async`, once the instruments
+        are updated.
+
+        Used to rebuild the state derived from the instruments, such as the quote
+        contexts of the data client.
+
+        """
+        self._load_handlers.append(handler)
+
     def add(self, instrument: Instrument) -> None:
         self._instrument_map[instrument.info["id"]] = instrument
         super().add(instrument)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import socket
 import urllib
-import xml.dom.minidom
-import xml.sax
+from collections.abc import AsyncIterator
+from collections.abc import Callable
 from collections.abc import Generator
 from xml.etree import ElementTree
 
@@ -21,19 +22,24 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.events.account import AccountState
 from nautilus_trader.model.instruments.base import Instrument
+from pytower.adapters.lmax.xml.decoder import INSTRUMENT
+from pytower.adapters.lmax.xml.decoder import decode_objects
+from pytower.adapters.lmax.xml.decoder import order_filter
+from pytower.adapters.lmax.xml.decoder import position_filter
 from pytower.adapters.lmax.xml.enums import LmaxOrderType
-from pytower.adapters.lmax.xml.sax import LMAXSaxHandler
-from pytower.adapters.lmax.xml.types import LmaxAccountState
-from pytower.adapters.lmax.xml.types import LmaxInstrument
+from pytower.adapters.lmax.xml.scheduler import LmaxRequestScheduler
+from pytower.adapters.lmax.xml.session import LmaxUnauthorisedError
+from pytower.adapters.lmax.xml.session import LmaxXmlSession
+from pytower.adapters.lmax.xml.session import is_unauthorised
+from pytower.adapters.lmax.xml.stream import LmaxEventStream
 from pytower.adapters.lmax.xml.types import LmaxOrder
 from pytower.adapters.lmax.xml.types import LmaxPosition
 
 
-class LmaxXmlClient:
-    stream_lock = asyncio.Lock()
+_HAS_NO_MORE_RESULTS = re.compile(r"<hasMoreResults>\s*false\s*</hasMoreResults>")
 
-    _login_lock = asyncio.Lock()
 
+class LmaxXmlClient:
     def __init__(
         self,
         hostname: str,
@@ -43,7 +49,12 @@ class LmaxXmlClient:
         cache: Cache,
         logger: Logger,
         loop: asyncio.AbstractEventLoop,
-        # heartbeat_interval_seconds: int = 60 * 5,
+        heartbeat_interval_seconds: float | None = 300.0,
+        max_concurrent_requests: int = 6,
+        query_concurrency: int = 2,
+        historic_concurrency: int = 1,
+        download_concurrency: int = 2,
+        historic_timeout_seconds: float = 60.0,
     ):
         self._hostname = hostname
         self._headers = {
@@ -63,10 +74,41 @@ class LmaxXmlClient:
         self.is_connected = False
         self._lock = asyncio.Lock()
 
-        # self._heartbeat_interval_seconds = heartbeat_interval_seconds
         self._session_id = None
         self._logger = logger
 
+        # one login shared by every request, see `LmaxXmlSession`
+        self._xml_session = LmaxXmlSession(
+            client=self,
+            logger=logger,
+            heartbeat_interval_seconds=heartbeat_interval_seconds,
+        )
+
+        # one push stream reader shared by every query, see `LmaxEventStream`
+        self._event_stream = LmaxEventStream(client=self, logger=logger)
+
+        # the push stream is long-lived, so it only times out when nothing, not even
+        # the heartbeat event of the session, has been read for 3 heartbeat intervals
+        self._stream_timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_read=(
+                heartbeat_interval_seconds * 3 if heartbeat_interval_seconds is not None else None
+            ),
+        )
+
+        # a concurrency budget per channel of requests, see `LmaxRequestScheduler`
+        self._historic_timeout_seconds = historic_timeout_seconds
+        self._scheduler = LmaxRequestScheduler(
+            limits={
+                "orders": query_concurrency,
+                "positions": query_concurrency,
+                "account": query_concurrency,
+                "historic": historic_concurrency,
+                "download": download_concurrency,
+            },
+            max_concurrent=max_concurrent_requests,
+        )
+
     @property
     def hostname(self) -> str:
         return self._hostname
@@ -79,6 +121,25 @@ class LmaxXmlClient:
     def logger(self) -> str | None:
         return self._logger
 
+    @property
+    def xml_session(self) -> LmaxXmlSession:
+        return self._xml_session
+
+    @property
+    def event_stream(self) -> LmaxEventStream:
+        return self._event_stream
+
+    @property
+    def scheduler(self) -> LmaxRequestScheduler:
+        return self._scheduler
+
+    @property
+    def historic_timeout_seconds(self) -> float:
+        """
+        Return the time to wait for the urls of a historic market data request.
+        """
+        return self._historic_timeout_seconds
+
     async def connect(self) -> None:
         self._log.debug("Connecting...")
 
@@ -101,8 +162,10 @@ class LmaxXmlClient:
 
     async def disconnect(self) -> None:
         """
-        Disconnect the HTTP client session.
+        Log out and disconnect the HTTP client session.
         """
+        await self._event_stream.stop()
+        await self._xml_session.close()
         self._log.debug(f"Closing session: {self._session}...")
         await self._session.close()
         self._log.debug("Session closed.")
@@ -121,52 +184,85 @@ class LmaxXmlClient:
         workingState of ACCEPTED with a matchedQuantity of 0 InstructionID =
         client_order_id orderId = venue_order_id Does not returned completed orders.
         """
-        xml_data = await self._get_stream(subscribe="order", target_element="orders")
-
-        root = ElementTree.fromstring(xml_data)
-        orders = [LmaxOrder.from_xml(elem) for elem in root.findall(".//order")]
-
-        if open_only is True:
-            orders = [order for order in orders if float(order.matchedQuantity) == 0.0]
-
-        filtered = [
+        orders = [
             order
-            for order in orders
-            if (security_id is None or security_id == order.security_id)
-            and (side is None or side == order.side)
-            and (start is None or order.timestamp >= start)
-            and (end is None or order.timestamp <= end)
-            and (order_types is None or order.orderType in order_types)
+            async for order in self.iter_orders(
+                security_id=security_id,
+                start=start,
+                end=end,
+                side=side,
+                order_types=order_types,
+                open_only=open_only,
+            )
         ]
-        return sorted(filtered, key=lambda x: x.timestamp)
+        return sorted(orders, key=lambda x: x.timestamp)
 
-    async def request_positions(
+    async def iter_orders(
         self,
         security_id: int | None = None,
-        side: PositionSide = None,
-        # open_only=True,
-    ) -> str:
-        xml_data = await self._get_stream(subscribe="position", target_element="positions")
-        root = ElementTree.fromstring(xml_data)
+        start: pd.Timestamp = None,
+        end: pd.Timestamp = None,
+        side: OrderSide = None,
+        order_types: list[LmaxOrderType] | None = None,
+        open_only: bool = False,
+    ) -> AsyncIterator[LmaxOrder]:
+        """
+        Yield the working orders matching the filters in the order LMAX sends them,
+        each as soon as its element is parsed.
 
-        positions = [LmaxPosition.from_xml(elem) for elem in root.findall(".//position")]
+        The filters are applied to the fields of each element, so an order which
+        does not match is never built.
 
-        # if open_only is True:
-        #     positions = [position for position in positions if float(position.openQuantity) > 0.0]
+        """
+        accept = order_filter(
+            security_id=security_id,
+            start=start,
+            end=end,
+            side=side,
+            order_types=order_types,
+            open_only=open_only,
+        )
+        async for order in self._iter_objects("order", "orders", accept, channel="orders"):
+            yield order
 
-        filtered = [
+    async def request_positions(
+        self,
+        security_id: int | None = None,
+        side: PositionSide = None,
+        open_only: bool = False,
+    ) -> list[LmaxPosition]:
+        return [
             position
-            for position in positions
-            if (security_id is None or security_id == position.security_id)
-            and (side is None or side == position.side)
+            async for position in self.iter_positions(
+                security_id=security_id,
+                side=side,
+                open_only=open_only,
+            )
         ]
 
-        return filtered
+    async def iter_positions(
+        self,
+        security_id: int | None = None,
+        side: PositionSide = None,
+        open_only: bool = False,
+    ) -> AsyncIterator[LmaxPosition]:
+        """
+        Yield the positions matching the filters, each as soon as its element is
+        parsed.
+        """
+        accept = position_filter(security_id=security_id, side=side, open_only=open_only)
+        async for position in self._iter_objects(
+            "position",
+            "positions",
+            accept,
+            channel="positions",
+        ):
+            yield position
 
     async def request_account_state(self) -> AccountState:
-        xml_data = await self._get_stream(subscribe="account", target_element="accountState")
-        root = ElementTree.fromstring(xml_data)
-        return LmaxAccountState.from_xml(root).to_nautilus()
+        async with self._scheduler.slot("account"):
+            states = await self._get_stream(subscribe="account", target_element="accountState")
+        return states[0].to_nautilus()
 
     async def request_instruments(self, query: str) -> list[Instrument]:
         """
@@ -187,44 +283,36 @@ class LmaxXmlClient:
 
         instruments = []
         pages = []
-        async with self.stream_lock:
+        async with self._scheduler.slot("instruments"):
             while True:
                 url = f"/secure/instrument/searchCurrentInstruments?q={query}&offset={offset}"
 
-                await self.login()
-
-                xml_data = await self.post_xml(url)
+                xml_data = await self.request(url)
 
-                pages.append(xml_data)
+                page = decode_objects(xml_data, INSTRUMENT)
+                pages.append(page)
 
-                root = ElementTree.fromstring(xml_data)
-                if root.find("body").findtext("hasMoreResults") == "false":
+                if _HAS_NO_MORE_RESULTS.search(xml_data) is not None:
                     break
 
-                elems = list(root.findall(".//instrument"))
-                if len(elems) == 0:
+                if len(page) == 0:
                     break
 
-                offset = elems[-1].findtext("id")
+                offset = page[-1].id
 
-        for xml_data in pages:
+        for page in pages:
             # TODO: handle no instruments found
-            root = ElementTree.fromstring(xml_data)
-            for elem in root.findall(".//instrument"):
+            for instrument in page:
                 # filter instruments with unrecognized currencies
                 # filter contract instruments
-                base = elem.findtext("contractUnitOfMeasure")
-                quote = elem.findtext("currency")
-                if Currency.from_internal_map(base) is None:
+                if Currency.from_internal_map(instrument.contractUnitOfMeasure) is None:
                     continue
-                elif Currency.from_internal_map(quote) is None:
+                elif Currency.from_internal_map(instrument.currency) is None:
                     continue
-                elif elem.find("aggressiveCommissionPerContract") is not None:
+                elif instrument.aggressiveCommissionPerContract is not None:
                     continue
 
-                instruments.append(
-                    LmaxInstrument.from_xml(elem).to_nautilus(),
-                )
+                instruments.append(instrument.to_nautilus())
 
         return instruments
 
@@ -241,9 +329,8 @@ class LmaxXmlClient:
         """
 
         url = "/public/security/login"
-        async with self._login_lock:
-            # await asyncio.sleep(0.05)  # Wait for 50 milliseconds before making the login request
-            resp = await self.post(url, data=body)
+        # logins of the client are serialised by the `LmaxXmlSession`
+        resp = await self.post(url, data=body)
         session_id = resp.cookies.get("JSESSIONID")
 
         if session_id is None:
@@ -269,9 +356,34 @@ class LmaxXmlClient:
             # TODO: handle failure
             pass
 
-    async def subscribe(self, value: str) -> ClientResponse:
+    async def subscribe(self, value: str) -> str:
         data = f"<req><body><subscription><type>{value}</type></subscription></body></req>"
-        return await self.post(url="/secure/subscribe", data=data)
+        return await self.request(url="/secure/subscribe", data=data)
+
+    async def ensure_subscribed(self, value: str) -> None:
+        """
+        Subscribe to the stream type, unless already subscribed in this session.
+        """
+        if self._xml_session.is_logged_in and self._xml_session.is_subscribed(value):
+            return
+        await self.subscribe(value)
+        self._xml_session.add_subscription(value)
+
+    async def request(self, url: str, data: str | None = None) -> str:
+        """
+        Post to a secure endpoint in the shared session and return the response.
+
+        If the session has expired the client logs in again and retries once.
+
+        """
+        for _ in range(2):
+            await self._xml_session.ensure_logged_in()
+            resp = await self.post(url=url, data=data)
+            xml_data = await resp.text()
+            if resp.status != 403 and not is_unauthorised(xml_data):
+                return xml_data
+            self._xml_session.invalidate()
+        raise LmaxUnauthorisedError(f"{url} UNAUTHORISED after logging in again")
 
     async def post_xml(self, url: str) -> str:
         resp = await self.post(url=url)
@@ -287,37 +399,71 @@ class LmaxXmlClient:
             await resp.text()
             return resp
 
-    async def parse_stream(self, target_element: str) -> str:
-        parser = xml.sax.make_parser()
-        handler = LMAXSaxHandler(target_element=target_element)
-        parser.setContentHandler(handler)
-
-        async for chunk in self._iter_stream():
-            if chunk is None:
-                raise ValueError("No data returned from the server")
-            parser.feed(chunk)
-
-            if handler.get_result() is None:
-                await asyncio.sleep(0)
-                continue
+    async def parse_stream(self, target_element: str) -> str | list:
+        """
+        Return the next target element pushed on the shared stream.
+        """
+        return await self._event_stream.wait_for(target_element)
 
-            return handler.get_result()
+    async def _get_stream(self, subscribe: str, target_element: str) -> list:
+        """
+        Subscribe in the shared session and return the objects of the target element
+        pushed on the stream, the current state of the subscribed type.
+        """
+        try:
+            return await self._subscribe_and_wait(subscribe, target_element)
+        except LmaxUnauthorisedError:
+            # the stream was refused and the session marked as expired, log in again
+            return await self._subscribe_and_wait(subscribe, target_element)
 
-    async def _get_stream(self, subscribe: str, target_element: str) -> str:
-        async with self.stream_lock:
-            await self.logout()
-            await self.login()
+    async def _iter_objects(
+        self,
+        subscribe: str,
+        target_element: str,
+        accept: Callable[[dict], bool] | None,
+        channel: str,
+    ) -> AsyncIterator:
+        """
+        Subscribe in the shared session and yield the accepted objects of the target
+        element pushed on the stream, as each is decoded, holding a slot of the
+        channel until the last.
+        """
+        async with self._scheduler.slot(channel):
+            for attempt in range(2):
+                queue = self._event_stream.stream_objects(target_element, accept)
+                is_started = False
+                try:
+                    await self.subscribe(subscribe)
+                    while (item := await queue.get()) is not None:
+                        if isinstance(item, BaseException):
+                            raise item
+                        is_started = True
+                        yield item
+                    return
+                except LmaxUnauthorisedError:
+                    # the stream was refused before any object, log in again and retry once
+                    if is_started or attempt == 1:
+                        raise
+                finally:
+                    self._event_stream.cancel_objects(target_element, queue)
+
+    async def _subscribe_and_wait(self, subscribe: str, target_element: str) -> list:
+        # expect the event before subscribing, which pushes it
+        future = self._event_stream.expect(target_element)
+        try:
             await self.subscribe(subscribe)
-            xml_data = await self.parse_stream(target_element=target_element)
-            await self.logout()
-            return xml_data
+            return await future
+        finally:
+            future.cancel()
 
     async def _iter_stream(self) -> Generator[bytes, None, None]:
         async with self._session.request(
             method="POST",
             url="/push/stream",
+            timeout=self._stream_timeout,
         ) as resp:
-            # TODO: handle 403 Forbidden
+            if resp.status == 403:
+                raise LmaxUnauthorisedError("/push/stream forbidden, the session has expired")
             async for chunk in resp.content.iter_any():
                 yield chunk
 
@@ -0,0 +1,243 @@
+"""
+Decodes the objects of the XML API directly from SAX events, without building an
+element tree or an XML string first.
+"""
+
+import xml.sax
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pandas as pd
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PositionSide
+from pytower.adapters.lmax.xml.enums import LmaxOrderType
+from pytower.adapters.lmax.xml.types import LmaxAccountState
+from pytower.adapters.lmax.xml.types import LmaxInstrument
+from pytower.adapters.lmax.xml.types import LmaxOrder
+from pytower.adapters.lmax.xml.types import LmaxPosition
+
+
+class LmaxObjectSpec:
+    """
+    Describes how the objects of an element are decoded.
+
+    The text of every element without children inside a `target` element is kept
+    by name. The elements named in `lists` are appended to the list of their key
+    instead, and each element named in `records` is kept as a dict of the text of
+    its children in the list of its key. The fields are passed to `build` when the
+    target element closes.
+
+    """
+
+    __slots__ = ("target", "build", "lists", "records")
+
+    def __init__(
+        self,
+        target: str,
+        build: Callable[[dict], object],
+        lists: dict[str, str] | None = None,
+        records: dict[str, str] | None = None,
+    ):
+        self.target = target
+        self.build = build
+        self.lists = lists or {}
+        self.records = records or {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.target})"
+
+
+ORDER = LmaxObjectSpec("order", LmaxOrder.from_fields)
+
+POSITION = LmaxObjectSpec("position", LmaxPosition.from_fields)
+
+ACCOUNT_STATE = LmaxObjectSpec(
+    "accountState",
+    LmaxAccountState.from_fields,
+    records={"wallet": "wallets"},
+)
+
+INSTRUMENT = LmaxObjectSpec(
+    "instrument",
+    LmaxInstrument.from_fields,
+    lists={"tradingDay": "tradingDays"},
+)
+
+
+class LmaxObjectHandler(xml.sax.ContentHandler):
+    """
+    Builds an object of the spec for every target element and passes it to
+    `on_object` as the element closes.
+
+    The text of an element is collected as a list of its chunks and joined once
+    when the element closes. With `accept`, the fields of each target element are
+    passed to it first, and the object is only built if it returns True.
+
+    """
+
+    def __init__(
+        self,
+        spec: LmaxObjectSpec,
+        on_object: Callable[[object], None],
+        accept: Callable[[dict], bool] | None = None,
+    ):
+        self._spec = spec
+        self._on_object = on_object
+        self._accept = accept
+        self._fields: dict | None = None  # of the object being decoded
+        self._record: dict | None = None
+        self._leaf: str | None = None  # the element the text is collected for
+        self._text: list[str] = []
+
+    def startElement(self, name, attrs):
+        if self._fields is None:
+            if name == self._spec.target:
+                self._fields = {}
+            return
+        if name in self._spec.records:
+            self._record = {}
+        self._leaf = name
+        self._text = []
+
+    def endElement(self, name):
+        fields = self._fields
+        if fields is None:
+            return
+        spec = self._spec
+        if name in spec.records:
+            fields.setdefault(spec.records[name], []).append(self._record)
+            self._record = None
+        elif name == self._leaf:
+            value = "".join(self._text)
+            key = spec.lists.get(name)
+            if key is not None:
+                fields.setdefault(key, []).append(value)
+            elif self._record is not None:
+                self._record[name] = value
+            else:
+                fields[name] = value
+        elif name == spec.target:
+            self._fields = None
+            if self._accept is None or self._accept(fields):
+                self._on_object(spec.build(fields))
+        self._leaf = None
+
+    def characters(self, content):
+        if self._leaf is not None:
+            self._text.append(content)
+
+
+class LmaxObjectDecoder:
+    """
+    Incrementally decodes the objects of a document which is fed in chunks.
+    """
+
+    def __init__(self, spec: LmaxObjectSpec, accept: Callable[[dict], bool] | None = None):
+        self._objects: list = []
+        self._parser = xml.sax.make_parser()
+        self._parser.setContentHandler(LmaxObjectHandler(spec, self._objects.append, accept))
+
+    def feed(self, data: str | bytes) -> list:
+        """
+        Feed the next chunk and return the objects which it completed.
+        """
+        self._parser.feed(data)
+        objects = self._objects[:]
+        self._objects.clear()
+        return objects
+
+
+def decode_objects(
+    xml_data: str | bytes,
+    spec: LmaxObjectSpec,
+    accept: Callable[[dict], bool] | None = None,
+) -> list:
+    """
+    Return the objects of the spec in the document, in document order.
+    """
+    objects: list = []
+    xml.sax.parseString(xml_data, LmaxObjectHandler(spec, objects.append, accept))
+    return objects
+
+
+def iter_objects(
+    chunks: Iterable[str | bytes],
+    spec: LmaxObjectSpec,
+    accept: Callable[[dict], bool] | None = None,
+) -> Iterator:
+    """
+    Yield the objects of the spec in a document read in chunks, as each closes.
+    """
+    decoder = LmaxObjectDecoder(spec, accept)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+
+def order_filter(
+    security_id: int | None = None,
+    start: pd.Timestamp | None = None,
+    end: pd.Timestamp | None = None,
+    side: OrderSide | None = None,
+    order_types: list[LmaxOrderType] | None = None,
+    open_only: bool = False,
+) -> Callable[[dict], bool] | None:
+    """
+    Return a predicate of the fields of an ``<order>`` which is True for the orders
+    matching every given filter, or ``None`` if there are no filters.
+
+    Only the fields of the filters are parsed, and the cheapest are compared first.
+
+    """
+    instrument_id = str(security_id) if security_id is not None else None
+    type_names = {order_type.name for order_type in order_types} if order_types is not None else None
+    filters = (instrument_id, start, end, side, type_names)
+    if all(value is None for value in filters) and not open_only:
+        return None
+
+    def accept(fields: dict) -> bool:
+        if instrument_id is not None and fields["instrumentId"] != instrument_id:
+            return False
+        if type_names is not None and fields["orderType"] not in type_names:
+            return False
+        if side is not None and (Decimal(fields["quantity"]) > 0) != (side == OrderSide.BUY):
+            return False
+        if open_only and float(fields["matchedQuantity"]) != 0.0:
+            return False
+        if start is not None or end is not None:
+            timestamp = pd.Timestamp(fields["timestamp"], tz="UTC")
+            if start is not None and timestamp < start:
+                return False
+            if end is not None and timestamp > end:
+                return False
+        return True
+
+    return accept
+
+
+def position_filter(
+    security_id: int | None = None,
+    side: PositionSide | None = None,
+    open_only: bool = False,
+) -> Callable[[dict], bool] | None:
+    """
+    Return a predicate of the fields of a ``<position>`` which is True for the
+    positions matching every given filter, or ``None`` if there are no filters.
+    """
+    instrument_id = str(security_id) if security_id is not None else None
+    if instrument_id is None and side is None and not open_only:
+        return None
+
+    def accept(fields: dict) -> bool:
+        if instrument_id is not None and fields["instrumentId"] != instrument_id:
+            return False
+        if side is None and not open_only:
+            return True
+        open_quantity = Decimal(fields["openQuantity"])
+        if open_only and open_quantity == 0:
+            return False
+        return side is None or (open_quantity > 0) == (side == PositionSide.LONG)
+
+    return accept
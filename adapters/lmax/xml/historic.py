@@ -1,4 +1,6 @@
+import asyncio
 import gzip
+import itertools
 from collections.abc import Callable
 from copy import copy
 from io import BytesIO
@@ -14,9 +16,14 @@ from nautilus_trader.core.datetime import nanos_to_millis
 from pytower.adapters.lmax.xml.client import LmaxXmlClient
 from pytower.adapters.lmax.xml.enums import LmaxAggregateOption
 from pytower.adapters.lmax.xml.enums import LmaxAggregateResolution
+from pytower.adapters.lmax.xml.session import LmaxInstructionRejectedError
 from pytower.adapters.lmax.xml.util import unpretty_xml
 
 
+# the instructionId of each historic request, matched to its historicMarketData event
+_instruction_ids = itertools.count(1)
+
+
 class DataFrameBuffer:
     def __init__(self, limit: int, start: pd.Timestamp = None):
         self._buf = pd.DataFrame()
@@ -64,20 +71,21 @@ class LmaxDataGenerator:
         stop: pd.Timestamp,
         processor: Callable | None = None,
     ) -> pd.DataFrame:
+        # each url request and download takes a slot of the scheduler of the client,
+        # so a long backfill is interleaved with the other requests of the client
         total = pd.DataFrame()
-        async with self._xml_client.stream_lock:
-            async for df in self:
-                if processor is not None:
-                    df = processor(df)
+        async for df in self:
+            if processor is not None:
+                df = processor(df)
 
-                total = pd.concat([df, total])
+            total = pd.concat([df, total])
 
-                self._log.debug(f"Read items: {len(df)}, Total items: {len(total)}...")
+            self._log.debug(f"Read items: {len(df)}, Total items: {len(total)}...")
 
-                if stop is not None and total.index[0] <= stop:
-                    return total[total.index >= stop].iloc[-limit:]
-                if len(total) >= limit:
-                    return total.iloc[-limit:]
+            if stop is not None and total.index[0] <= stop:
+                return total[total.index >= stop].iloc[-limit:]
+            if len(total) >= limit:
+                return total.iloc[-limit:]
 
     async def __aiter__(self):
         async for csv_data in self._iterate_csv_data():
@@ -125,17 +133,39 @@ class LmaxDataGenerator:
             )
             start = end - pd.Timedelta(days=1)
 
-    async def _fetch_urls(self, body: str) -> list[str]:
-        await self._xml_client.logout()
-        await self._xml_client.login()
-        await self._xml_client.subscribe("historicMarketData")
-        url = "/secure/read/marketData/requestHistoricMarketData"
-
-        await self._xml_client.post(url=url, data=body)
-        # returns: <res><header><status>OK</status></header><body/></res>
-
-        # will stall if urls have already been sent
-        xml_data = await self._xml_client.parse_stream(target_element="historicMarketData")
+    async def _fetch_urls(self, body: str, instruction_id: int) -> list[str]:
+        async with self._xml_client.scheduler.slot("historic"):
+            await self._xml_client.ensure_subscribed("historicMarketData")
+            url = "/secure/read/marketData/requestHistoricMarketData"
+
+            # expect the urls, or the rejection of the request, before requesting
+            # them, so they can not be missed
+            key = str(instruction_id)
+            event_stream = self._xml_client.event_stream
+            future = event_stream.expect("historicMarketData", instruction_id=key)
+            rejected = event_stream.expect("instructionRejected", instruction_id=key)
+            try:
+                await self._xml_client.request(url=url, data=body)
+                # returns: <res><header><status>OK</status></header><body/></res>
+                done, _ = await asyncio.wait(
+                    (future, rejected),
+                    timeout=self._xml_client.historic_timeout_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    raise asyncio.TimeoutError(
+                        f"No historicMarketData for instruction {key} "
+                        f"after {self._xml_client.historic_timeout_seconds}s",
+                    )
+                if future not in done:
+                    reason = ElementTree.fromstring(rejected.result()).findtext("reason")
+                    raise LmaxInstructionRejectedError(
+                        f"Historic market data instruction {key} rejected: {reason}",
+                    )
+                xml_data = future.result()
+            finally:
+                future.cancel()
+                rejected.cancel()
 
         root = ElementTree.fromstring(xml_data)
         if root.find("noMatchingData") is not None:
@@ -147,18 +177,20 @@ class LmaxDataGenerator:
 
     async def _read_url(self, url: str) -> str:
         """
-        NOTE: The JSESSIONID cookie needs to be the same as when the urls were requested
+        NOTE: The JSESSIONID cookie needs to be the same as when the urls were requested,
+        which holds as the session is shared
         """
         url = "/marketdata/" + url.split("/marketdata/")[1]
         assert self._xml_client.is_connected
-        await self._xml_client.login()
         # resp = await self.get(url=url)
-        async with self._xml_client._session.request(
-            method="GET",
-            url=url,
-        ) as resp:
-            with gzip.GzipFile(fileobj=BytesIO(await resp.read()), mode="rb") as f:
-                return f.read().decode()
+        async with self._xml_client.scheduler.slot("download"):
+            async with self._xml_client._session.request(
+                method="GET",
+                url=url,
+            ) as resp:
+                data = await resp.read()
+        with gzip.GzipFile(fileobj=BytesIO(data), mode="rb") as f:
+            return f.read().decode()
 
 
 class LmaxBarDataGenerator(LmaxDataGenerator):
@@ -185,11 +217,12 @@ class LmaxBarDataGenerator(LmaxDataGenerator):
 
         start_ms = nanos_to_millis(dt_to_unix_nanos(start))
         end_ms = nanos_to_millis(dt_to_unix_nanos(end))
+        instruction_id = next(_instruction_ids)
 
         body = f"""
             <req>
                 <body>
-                    <instructionId>1</instructionId>
+                    <instructionId>{instruction_id}</instructionId>
                     <orderBookId>{self._security_id}</orderBookId>
                     <from>{start_ms}</from>
                     <to>{end_ms}</to>
@@ -206,7 +239,7 @@ class LmaxBarDataGenerator(LmaxDataGenerator):
         """
         body = unpretty_xml(body)
 
-        urls = await self._fetch_urls(body=body)
+        urls = await self._fetch_urls(body=body, instruction_id=instruction_id)
 
         return urls
 
@@ -288,11 +321,12 @@ class LmaxQuoteTickDataGenerator(LmaxDataGenerator):
 
         start_ms = nanos_to_millis(dt_to_unix_nanos(start))
         end_ms = nanos_to_millis(dt_to_unix_nanos(end))
+        instruction_id = next(_instruction_ids)
 
         body = f"""
             <req>
                 <body>
-                    <instructionId>1</instructionId>
+                    <instructionId>{instruction_id}</instructionId>
                     <orderBookId>{self._security_id}</orderBookId>
                     <from>{start_ms}</from>
                     <to>{end_ms}</to>
@@ -309,7 +343,7 @@ class LmaxQuoteTickDataGenerator(LmaxDataGenerator):
             """
         body = unpretty_xml(body)
 
-        urls = await self._fetch_urls(body=body)
+        urls = await self._fetch_urls(body=body, instruction_id=instruction_id)
 
         return urls
 
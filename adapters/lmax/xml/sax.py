@@ -23,7 +23,7 @@ class LMAXSaxHandlerDebug(xml.sax.ContentHandler):
 
 class LMAXSaxHandler(xml.sax.ContentHandler):
     def __init__(self, target_element: str | None = None):
-        self._value = ""
+        self._value: list[str] = []
         self._target_element = target_element
         self._data: list[str] = []
         self._result = None
@@ -47,8 +47,7 @@ class LMAXSaxHandler(xml.sax.ContentHandler):
         self._end = f"</{name}>"
 
         if self._is_capturing:
-            if self._value != "":
-                self._data.append(self._value)
+            self._data.extend(self._value)
             self._data.append(self._end)
 
         # self.debug()
@@ -58,18 +57,18 @@ class LMAXSaxHandler(xml.sax.ContentHandler):
             self._data = []
             self._is_capturing = False
 
-        self._value = ""
+        self._value = []
 
     def characters(self, c):
-        self._value += c
+        self._value.append(c)
 
     def ignorableWhitespace(self):
         pass
 
     def debug(self):
         print(self._start)
-        if self._value != "":
-            print(self._value)
+        if self._value:
+            print("".join(self._value))
         print(self._end)
 
 
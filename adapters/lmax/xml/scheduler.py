@@ -0,0 +1,115 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+# the channels of the requests of a client and their default concurrency
+DEFAULT_CHANNEL_LIMITS = {
+    "orders": 2,
+    "positions": 2,
+    "account": 2,
+    "instruments": 1,
+    "historic": 1,  # historic market data url requests
+    "download": 2,  # historic market data file downloads
+}
+
+
+class LmaxRequestScheduler:
+    """
+    Schedules the requests of a client on channels, each with its own concurrency
+    budget, within a total budget of `max_concurrent` requests.
+
+    A request waits for a slot of its channel with `slot`. While the total budget is
+    free every channel runs up to its limit. When it is used up, a freed slot is
+    granted to the channels with waiting requests in turn, each to its oldest
+    request, rather than in the order the requests were made. A historic backfill
+    queueing a download after each file therefore only gets every other slot while
+    a reconciliation query is waiting, and never more than its own limit.
+
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        max_concurrent: int | None = None,
+    ):
+        self._limits = {**DEFAULT_CHANNEL_LIMITS, **(limits or {})}
+        self._max_concurrent = max_concurrent or sum(self._limits.values())
+        self._active = dict.fromkeys(self._limits, 0)
+        self._waiting: dict[str, deque[asyncio.Future]] = {
+            channel: deque() for channel in self._limits
+        }
+        self._turns = deque(self._limits)  # the next channel to be granted a slot first
+        self._total_active = 0
+
+    @property
+    def channels(self) -> list[str]:
+        return list(self._limits)
+
+    def limit(self, channel: str) -> int:
+        return self._limits[channel]
+
+    def active(self, channel: str) -> int:
+        return self._active[channel]
+
+    def waiting(self, channel: str) -> int:
+        return sum(not future.done() for future in self._waiting[channel])
+
+    @asynccontextmanager
+    async def slot(self, channel: str) -> AsyncIterator[None]:
+        """
+        Hold a slot of the channel for the requests of the block.
+        """
+        await self.acquire(channel)
+        try:
+            yield
+        finally:
+            self.release(channel)
+
+    async def acquire(self, channel: str) -> None:
+        waiting = self._waiting[channel]
+        if not waiting and self._is_free(channel):
+            self._grant(channel)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        waiting.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(channel)  # granted as the waiter was cancelled
+            elif future in waiting:
+                waiting.remove(future)
+            raise
+
+    def release(self, channel: str) -> None:
+        self._active[channel] -= 1
+        self._total_active -= 1
+        self._dispatch()
+
+    def _is_free(self, channel: str) -> bool:
+        return (
+            self._total_active < self._max_concurrent
+            and self._active[channel] < self._limits[channel]
+        )
+
+    def _grant(self, channel: str) -> None:
+        self._active[channel] += 1
+        self._total_active += 1
+
+    def _dispatch(self) -> None:
+        while self._total_active < self._max_concurrent:
+            for _ in range(len(self._turns)):
+                channel = self._turns[0]
+                self._turns.rotate(-1)
+                waiting = self._waiting[channel]
+                while waiting and waiting[0].done():
+                    waiting.popleft()  # cancelled
+                if waiting and self._active[channel] < self._limits[channel]:
+                    self._grant(channel)
+                    waiting.popleft().set_result(None)
+                    break
+            else:
+                return  # no channel with waiting requests is free
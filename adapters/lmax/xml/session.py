@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import LoggerAdapter
+
+
+if TYPE_CHECKING:
+    from pytower.adapters.lmax.xml.client import LmaxXmlClient
+
+
+class LmaxUnauthorisedError(Exception):
+    """
+    Raised when a request is still UNAUTHORISED after logging in again.
+    """
+
+
+class LmaxInstructionRejectedError(Exception):
+    """
+    Raised when an ``instructionRejected`` event is pushed for a request.
+    """
+
+
+def is_unauthorised(xml_data: str) -> bool:
+    """
+    Return whether the response is the UNAUTHORISED warning of an expired session.
+
+    <res><header><status>WARN</status><warnings><warning><fieldName/>
+    <message>UNAUTHORISED</message></warning></warnings></header><body/>
+    <auth>UNAUTHORISED</auth></res>
+
+    """
+    return ">UNAUTHORISED<" in xml_data
+
+
+class LmaxXmlSession:
+    """
+    Keeps a single logged in XML API session shared by every request of a client.
+
+    The session logs in on the first request and is kept alive by posting to
+    ``/secure/read/heartbeat`` every `heartbeat_interval_seconds`. It only logs in
+    again after a response is UNAUTHORISED, and requests made while a login is in
+    flight wait for that login. The stream subscriptions of the session are
+    remembered, so a type is subscribed once per login.
+
+    """
+
+    def __init__(
+        self,
+        client: LmaxXmlClient,
+        logger: Logger,
+        heartbeat_interval_seconds: float | None = 300.0,
+    ):
+        self._client = client
+        self._heartbeat_interval_seconds = heartbeat_interval_seconds
+        self._log = LoggerAdapter(type(self).__name__, logger)
+        self._lock = asyncio.Lock()
+        self._subscriptions: set[str] = set()
+        self._heartbeat_task: asyncio.Task | None = None
+        self._heartbeat_count = 0
+        self.is_logged_in = False
+        self.login_count = 0
+
+    async def ensure_logged_in(self) -> None:
+        if self.is_logged_in:
+            return
+        async with self._lock:
+            if self.is_logged_in:
+                return  # logged in by the request which held the lock
+            await self._client.login()
+            self.is_logged_in = True
+            self.login_count += 1
+            self._subscriptions.clear()
+            self._log.debug(f"Logged in, login count {self.login_count}")
+            self._start_heartbeat()
+
+    def invalidate(self) -> None:
+        """
+        Mark the session as expired, so the next request logs in again.
+        """
+        if self.is_logged_in:
+            self._log.warning("Session UNAUTHORISED, logging in again on the next request")
+        self.is_logged_in = False
+        self._subscriptions.clear()
+
+    def is_subscribed(self, value: str) -> bool:
+        return value in self._subscriptions
+
+    def add_subscription(self, value: str) -> None:
+        self._subscriptions.add(value)
+
+    def _start_heartbeat(self) -> None:
+        if self._heartbeat_interval_seconds is None:
+            return
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            return
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self) -> None:
+        while self.is_logged_in:
+            await asyncio.sleep(self._heartbeat_interval_seconds)
+            if not self.is_logged_in:
+                return
+            await self.heartbeat()
+
+    async def heartbeat(self) -> bool:
+        """
+        Post a heartbeat to keep the session alive, return False if it has expired.
+        """
+        self._heartbeat_count += 1
+        data = f"<req><body><token>token-{self._heartbeat_count}</token></body></req>"
+        try:
+            resp = await self._client.post(url="/secure/read/heartbeat", data=data)
+            xml_data = await resp.text()
+        except Exception as e:
+            self._log.error(f"Heartbeat failed: {e!r}")
+            return False
+        if resp.status == 403 or is_unauthorised(xml_data):
+            self.invalidate()
+            return False
+        return True
+
+    async def close(self) -> None:
+        """
+        Stop the heartbeats and log out, if logged in.
+        """
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self.is_logged_in:
+            self.is_logged_in = False
+            self._subscriptions.clear()
+            await self._client.logout()
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import asyncio
+import xml.sax
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.component import LoggerAdapter
+from pytower.adapters.lmax.xml.decoder import ACCOUNT_STATE
+from pytower.adapters.lmax.xml.decoder import ORDER
+from pytower.adapters.lmax.xml.decoder import POSITION
+from pytower.adapters.lmax.xml.decoder import LmaxObjectHandler
+from pytower.adapters.lmax.xml.decoder import LmaxObjectSpec
+from pytower.adapters.lmax.xml.session import LmaxUnauthorisedError
+
+
+if TYPE_CHECKING:
+    from pytower.adapters.lmax.xml.client import LmaxXmlClient
+
+
+# the events of the push stream, as handled by the EventStreamHandler of the .Net API
+EVENT_NAMES = frozenset(
+    {
+        "orders",
+        "positions",
+        "accountState",
+        "historicMarketData",
+        "heartbeat",
+        "instructionRejected",
+        "order",
+        "position",
+        "orderBookStatus",
+        "ob2",
+    },
+)
+
+# the events which are decoded to a list of objects, rather than an XML string
+EVENT_DECODERS = {
+    "orders": ORDER,
+    "order": ORDER,
+    "positions": POSITION,
+    "position": POSITION,
+    "accountState": ACCOUNT_STATE,
+}
+
+
+class LmaxEventRouter(xml.sax.ContentHandler):
+    """
+    Splits the push stream into its events and passes each to `on_event` as
+    ``(name, instruction_id, value)``.
+
+    An event is the outermost element with a name in `names`, wherever it is in the
+    stream, so the ``<events><header/><body>`` wrapper of each batch is skipped. The
+    instruction id is the text of an ``instructionId`` child of the event, if any.
+    The value of an event with a spec in `decoders` is the list of objects decoded
+    from its SAX events by the handler of `make_handler`, otherwise it is the XML
+    string of the event.
+
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[str, str | None, str | list], None],
+        names: frozenset[str] = EVENT_NAMES,
+        decoders: dict[str, LmaxObjectSpec] | None = None,
+        make_handler: Callable[[str, LmaxObjectSpec, list], LmaxObjectHandler] | None = None,
+    ):
+        self._on_event = on_event
+        self._names = names
+        self._decoders = decoders or {}
+        self._make_handler = make_handler
+        self._handler: LmaxObjectHandler | None = None
+        self._objects: list = []
+        self._event: str | None = None
+        self._depth = 0
+        self._data: list[str] = []
+        self._key: str | None = None
+        self._key_data: list[str] | None = None
+
+    def startElement(self, name, attrs):
+        if self._event is None:
+            if name not in self._names:
+                return
+            self._event = name
+            self._key = None
+            spec = self._decoders.get(name)
+            if spec is not None:
+                self._objects = []
+                if self._make_handler is not None:
+                    self._handler = self._make_handler(name, spec, self._objects)
+                else:
+                    self._handler = LmaxObjectHandler(spec, self._objects.append)
+        self._depth += 1
+        if self._depth == 2 and name == "instructionId":
+            self._key_data = []
+        if self._handler is not None:
+            self._handler.startElement(name, attrs)
+        else:
+            self._data.append(f"<{name}>")
+
+    def endElement(self, name):
+        if self._event is None:
+            return
+        if self._handler is not None:
+            self._handler.endElement(name)
+        else:
+            self._data.append(f"</{name}>")
+        if self._key_data is not None and self._depth == 2:
+            self._key = "".join(self._key_data)
+            self._key_data = None
+        self._depth -= 1
+        if self._depth == 0:
+            event = self._event
+            value = self._objects if self._handler is not None else "".join(self._data)
+            self._event = None
+            self._handler = None
+            self._data = []
+            self._on_event(event, self._key, value)
+
+    def characters(self, content):
+        if self._event is None:
+            return
+        if self._handler is not None:
+            self._handler.characters(content)
+        else:
+            self._data.append(escape(content))
+        if self._key_data is not None:
+            self._key_data.append(content)
+
+
+def make_stream_parser(handler: xml.sax.ContentHandler) -> xml.sax.xmlreader.IncrementalParser:
+    """
+    Return an incremental parser for a push stream response.
+
+    A response is a sequence of ``<events>`` documents, which a single XML parser
+    only accepts inside a root element, so the parser is fed an opening
+    ``<stream>`` first.
+
+    """
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.feed("<stream>")
+    return parser
+
+
+class LmaxEventStream:
+    """
+    Reads the ``/push/stream`` of a session with a single long-lived reader and
+    routes each event to its handlers and waiters.
+
+    Every query of the session shares the stream instead of opening one of its own.
+    A query registers a waiter with `expect` before sending the request which makes
+    LMAX push the event, so the event can not be read before anyone waits for it.
+    A waiter with an instruction id is only given the event with the same id, such
+    as the ``historicMarketData`` of its request, others are given the next event
+    of the name. Handlers are called with every event of the name. The orders,
+    positions and account state are given as lists of their objects, decoded while
+    the stream is parsed, other events as XML strings.
+
+    The objects of the next event of a name can also be streamed to a queue with
+    `stream_objects`, each put as soon as its element closes. The fields of each
+    element are tested against the `accept` predicate of every queue first, and the
+    object is only built if a queue, waiter or handler wants it.
+
+    The reader runs while there are handlers, waiters or queues, and opens the
+    stream again after `reconnect_delay_seconds` when a response ends or times out,
+    keeping the waiters and queues. If the stream is refused the session is marked
+    as expired and the waiters and queues are failed, so each query can log in again
+    and retry.
+
+    """
+
+    def __init__(
+        self,
+        client: LmaxXmlClient,
+        logger: Logger,
+        reconnect_delay_seconds: float = 1.0,
+    ):
+        self._client = client
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._log = LoggerAdapter(type(self).__name__, logger)
+        self._handlers: dict[str, list[Callable[[str | list], None]]] = {}
+        self._waiters: dict[str, list[tuple[str | None, asyncio.Future]]] = {}
+        self._object_queues: dict[str, list[tuple[Callable | None, asyncio.Queue]]] = {}
+        self._open_queues: list[asyncio.Queue] = []  # of the event being decoded
+        self._task: asyncio.Task | None = None
+        self.event_count = 0
+        self.stream_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_handler(self, name: str, handler: Callable[[str | list], None]) -> None:
+        self._handlers.setdefault(name, []).append(handler)
+        self._start()
+
+    def remove_handler(self, name: str, handler: Callable[[str | list], None]) -> None:
+        handlers = self._handlers.get(name)
+        if handlers is not None and handler in handlers:
+            handlers.remove(handler)
+
+    def expect(self, name: str, instruction_id: str | None = None) -> asyncio.Future:
+        """
+        Return a future of the next event of the name, and instruction id if given.
+
+        Cancel the future if the event is no longer wanted.
+
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(name, []).append((instruction_id, future))
+        self._start()
+        return future
+
+    async def wait_for(self, name: str, instruction_id: str | None = None) -> str | list:
+        future = self.expect(name, instruction_id)
+        try:
+            return await future
+        finally:
+            future.cancel()
+
+    def stream_objects(
+        self,
+        name: str,
+        accept: Callable[[dict], bool] | None = None,
+    ) -> asyncio.Queue:
+        """
+        Return a queue of the accepted objects of the next event of the name, which
+        is ended by ``None``, or an exception if the stream failed.
+
+        Cancel the queue with `cancel_objects` if the objects are no longer wanted.
+
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._object_queues.setdefault(name, []).append((accept, queue))
+        self._start()
+        return queue
+
+    def cancel_objects(self, name: str, queue: asyncio.Queue) -> None:
+        queues = self._object_queues.get(name)
+        if queues is not None:
+            self._object_queues[name] = [item for item in queues if item[1] is not queue]
+        if queue in self._open_queues:
+            self._open_queues.remove(queue)
+
+    def _has_waiters(self, name: str) -> bool:
+        return any(not future.done() for _, future in self._waiters.get(name, ()))
+
+    def _has_subscribers(self) -> bool:
+        if any(self._handlers.values()) or any(self._object_queues.values()):
+            return True
+        return any(self._has_waiters(name) for name in self._waiters)
+
+    def _make_handler(self, name: str, spec: LmaxObjectSpec, objects: list) -> LmaxObjectHandler:
+        queues = self._object_queues.pop(name, None)
+        if not queues:
+            return LmaxObjectHandler(spec, objects.append)
+
+        self._open_queues = [queue for _, queue in queues]
+        build_all = bool(self._handlers.get(name)) or self._has_waiters(name)
+        matched: list[asyncio.Queue] = []
+
+        def accept(fields: dict) -> bool:
+            matched.clear()
+            for predicate, queue in queues:
+                if predicate is None or predicate(fields):
+                    matched.append(queue)
+            return build_all or len(matched) > 0
+
+        def on_object(obj) -> None:
+            objects.append(obj)
+            for queue in matched:
+                queue.put_nowait(obj)
+
+        return LmaxObjectHandler(spec, on_object, accept)
+
+    def _start(self) -> None:
+        if not self.is_running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for waiters in self._waiters.values():
+            for _, future in waiters:
+                future.cancel()
+        self._waiters.clear()
+        self._fail_queues(asyncio.CancelledError())
+
+    async def _run(self) -> None:
+        while self._has_subscribers():
+            try:
+                await self._read()
+            except asyncio.CancelledError:
+                raise
+            except LmaxUnauthorisedError as e:
+                self._client.xml_session.invalidate()
+                self._fail_waiters(e)
+            except asyncio.TimeoutError:
+                # idle, open the stream again as when a response ends
+                self._log.warning("Push stream timed out, opening it again")
+            except Exception as e:
+                self._log.error(f"Push stream failed: {e!r}")
+                self._fail_waiters(e)
+
+            if self._has_subscribers():
+                await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _read(self) -> None:
+        await self._client.xml_session.ensure_logged_in()
+        parser = make_stream_parser(LmaxEventRouter(
+                self._on_event,
+                decoders=EVENT_DECODERS,
+                make_handler=self._make_handler,
+            ),
+        )
+        self.stream_count += 1
+        async for chunk in self._client._iter_stream():
+            if chunk is None:
+                raise ValueError("No data returned from the server")
+            parser.feed(chunk)
+
+    def _on_event(self, name: str, instruction_id: str | None, value: str | list) -> None:
+        self.event_count += 1
+
+        for queue in self._open_queues:
+            queue.put_nowait(None)
+        self._open_queues = []
+
+        waiters = self._waiters.get(name)
+        if waiters:
+            remaining = []
+            for key, future in waiters:
+                if future.done():
+                    continue
+                if key is None or key == instruction_id:
+                    future.set_result(value)
+                else:
+                    remaining.append((key, future))
+            self._waiters[name] = remaining
+
+        for handler in self._handlers.get(name, ()):
+            try:
+                handler(value)
+            except Exception as e:
+                self._log.error(f"Error handling {name} event: {e!r}")
+
+    def _fail_waiters(self, error: Exception) -> None:
+        for waiters in self._waiters.values():
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+        self._waiters.clear()
+        self._fail_queues(error)
+
+    def _fail_queues(self, error: BaseException) -> None:
+        for queue in self._open_queues:
+            queue.put_nowait(error)
+        for queues in self._object_queues.values():
+            for _, queue in queues:
+                queue.put_nowait(error)
+        self._open_queues = []
+        self._object_queues.clear()
@@ -33,6 +33,25 @@ from pytower.adapters.lmax.xml.enums import LmaxOrderType
 from pytower.adapters.lmax.xml.enums import LmaxTimeInForce
 
 
+def _leaf_fields(elem: Element, nested: tuple[str, ...] = ()) -> dict[str, str]:
+    """
+    Return the text of the child elements without children by name, including the
+    children of the `nested` elements.
+    """
+    fields = {}
+    for child in elem:
+        if child.tag in nested:
+            fields.update(_leaf_fields(child))
+        elif len(child) == 0:
+            fields[child.tag] = child.text or ""
+    return fields
+
+
+def _optional_decimal(fields: dict[str, str], name: str) -> Decimal | None:
+    value = fields.get(name)
+    return Decimal(value) if value else None
+
+
 @dataclass
 class LmaxOrder:
     timeInForce: LmaxTimeInForce
@@ -74,42 +93,39 @@ class LmaxOrder:
         return OrderSide.BUY if self.quantity > 0 else OrderSide.SELL
 
     def __repr__(self):
-        return f"LmaxOrder({self.client_order_Id}, {self.side}, {self.security_id}, {abs(self.quantity)})"
+        return f"LmaxOrder({self.client_order_id}, {self.side}, {self.security_id}, {abs(self.quantity)})"
 
     @classmethod
     def from_xml(cls, elem: Element) -> LmaxOrder:
+        return cls.from_fields(_leaf_fields(elem))
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> LmaxOrder:
+        """
+        Return the order of the text of its child elements by name.
+        """
         return cls(
-            timeInForce=LmaxTimeInForce[elem.findtext("timeInForce")],
-            instructionId=elem.findtext("instructionId"),
-            originalInstrumentId=elem.findtext("originalInstrumentId"),
-            orderId=elem.findtext("orderId"),
-            accountId=int(elem.findtext("accountId")),
-            instrumentId=int(elem.findtext("instrumentId")),
-            quantity=Decimal(elem.findtext("quantity")),
-            matchedQuantity=Decimal(elem.findtext("matchedQuantity")),
-            matchedCost=Decimal(elem.findtext("matchedCost")),
-            cancelledQuantity=Decimal(elem.findtext("cancelledQuantity")),
-            timestamp=pd.to_datetime(
-                elem.findtext("timestamp"),
-                format="%Y-%m-%dT%H:%M:%S",
-                utc=True,
-            ),
-            orderType=LmaxOrderType[elem.findtext("orderType")],
-            openQuantity=Decimal(elem.findtext("openQuantity")),
-            openCost=Decimal(elem.findtext("openCost")),
-            cumulativeCost=Decimal(elem.findtext("cumulativeCost")),
-            commission=Decimal(elem.findtext("commission")),
-            workingState=elem.findtext("workingState"),
-            stopReferencePrice=Decimal(elem.findtext("stopReferencePrice"))
-            if elem.get("stopReferencePrice") is not None
-            else None,
-            stopLossOffset=Decimal(elem.findtext("stopLossOffset"))
-            if elem.get("stopLossOffset") is not None
-            else None,
-            stopProfitOffset=Decimal(elem.findtext("stopProfitOffset"))
-            if elem.get("stopProfitOffset") is not None
-            else None,
-            price=Decimal(elem.findtext("price")) if elem.get("price") is not None else None,
+            timeInForce=LmaxTimeInForce[fields["timeInForce"]],
+            instructionId=fields["instructionId"],
+            originalInstrumentId=fields.get("originalInstrumentId"),
+            orderId=fields["orderId"],
+            accountId=int(fields["accountId"]),
+            instrumentId=int(fields["instrumentId"]),
+            quantity=Decimal(fields["quantity"]),
+            matchedQuantity=Decimal(fields["matchedQuantity"]),
+            matchedCost=Decimal(fields["matchedCost"]),
+            cancelledQuantity=Decimal(fields["cancelledQuantity"]),
+            timestamp=pd.Timestamp(fields["timestamp"], tz="UTC"),  # 2023-08-15T17:13:02
+            orderType=LmaxOrderType[fields["orderType"]],
+            openQuantity=Decimal(fields["openQuantity"]),
+            openCost=Decimal(fields["openCost"]),
+            cumulativeCost=Decimal(fields["cumulativeCost"]),
+            commission=Decimal(fields["commission"]),
+            workingState=fields["workingState"],
+            stopReferencePrice=_optional_decimal(fields, "stopReferencePrice"),
+            stopLossOffset=_optional_decimal(fields, "stopLossOffset"),
+            stopProfitOffset=_optional_decimal(fields, "stopProfitOffset"),
+            price=_optional_decimal(fields, "price"),
         )
 
 
@@ -134,15 +150,19 @@ class LmaxPosition:
 
     @classmethod
     def from_xml(cls, elem: Element) -> LmaxPosition:
+        return cls.from_fields(_leaf_fields(elem))
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> LmaxPosition:
         return cls(
-            accountId=int(elem.findtext("accountId")),
-            instrumentId=int(elem.findtext("instrumentId")),
-            valuation=Decimal(elem.findtext("valuation")),
-            shortUnfilledCost=Decimal(elem.findtext("shortUnfilledCost")),
-            longUnfilledCost=Decimal(elem.findtext("longUnfilledCost")),
-            openQuantity=Decimal(elem.findtext("openQuantity")),
-            cumulativeCost=Decimal(elem.findtext("cumulativeCost")),
-            openCost=Decimal(elem.findtext("openCost")),
+            accountId=int(fields["accountId"]),
+            instrumentId=int(fields["instrumentId"]),
+            valuation=Decimal(fields["valuation"]),
+            shortUnfilledCost=Decimal(fields["shortUnfilledCost"]),
+            longUnfilledCost=Decimal(fields["longUnfilledCost"]),
+            openQuantity=Decimal(fields["openQuantity"]),
+            cumulativeCost=Decimal(fields["cumulativeCost"]),
+            openCost=Decimal(fields["openCost"]),
         )
 
     def to_nautilus_report(self, instrument: Instrument) -> PositionStatusReport:
@@ -206,59 +226,55 @@ class LmaxInstrument:
 
     @classmethod
     def from_xml(cls, elem: Element) -> LmaxInstrument:
+        fields = _leaf_fields(elem, nested=("tradingHours",))
+        fields["tradingDays"] = [day.text for day in elem.find("tradingDays")]
+        return cls.from_fields(fields)
+
+    @classmethod
+    def from_fields(cls, fields: dict) -> LmaxInstrument:
+        """
+        Return the instrument of the text of its child elements by name, with the
+        ``tradingHours`` children inlined and ``tradingDays`` as a list.
+        """
         return cls(
-            id=int(elem.findtext("id")),
-            name=elem.findtext("name"),
-            startTime=pd.to_datetime(elem.findtext("startTime"), format="%Y-%m-%dT%H:%M:%S"),
-            openingOffset=int(elem.find("tradingHours").findtext("openingOffset")),
-            closingOffset=int(elem.find("tradingHours").findtext("closingOffset")),
-            timezone=elem.find("tradingHours").findtext("timezone"),
-            margin=Decimal(elem.findtext("margin")),
-            currency=elem.findtext("currency"),
-            unitPrice=Decimal(elem.findtext("unitPrice")),
-            minimumOrderQuantity=Decimal(elem.findtext("minimumOrderQuantity")),
-            orderQuantityIncrement=Decimal(elem.findtext("orderQuantityIncrement")),
-            minimumPrice=Decimal(elem.findtext("minimumPrice")),
-            maximumPrice=Decimal(elem.findtext("maximumPrice")),
-            trustedSpread=Decimal(elem.findtext("trustedSpread")),
-            priceIncrement=Decimal(elem.findtext("priceIncrement")),
-            stopBuffer=int(elem.findtext("stopBuffer")),
-            assetClass=LmaxAssetClass[elem.findtext("assetClass")],
-            symbol=elem.findtext("symbol"),
-            maximumPositionThreshold=Decimal(elem.findtext("maximumPositionThreshold")),
-            minimumCommission=Decimal(elem.findtext("minimumCommission")),
-            tradingDays=[elem.text for elem in elem.find("tradingDays")],
-            retailVolatilityBandPercentage=int(elem.findtext("retailVolatilityBandPercentage")),
-            contractUnitOfMeasure=elem.findtext("contractUnitOfMeasure"),
-            contractSize=Decimal(elem.findtext("contractSize")),
-            aggressiveCommissionRate=Decimal(elem.findtext("aggressiveCommissionRate"))
-            if elem.findtext("aggressiveCommissionRate") is not None
-            else None,
-            passiveCommissionRate=Decimal(elem.findtext("passiveCommissionRate"))
-            if elem.findtext("passiveCommissionRate") is not None
-            else None,
-            aggressiveCommissionPerContract=Decimal(
-                elem.findtext("aggressiveCommissionPerContract"),
-            )
-            if elem.findtext("aggressiveCommissionPerContract") is not None
-            else None,
-            passiveCommissionPerContract=Decimal(elem.findtext("passiveCommissionPerContract"))
-            if elem.findtext("passiveCommissionPerContract") is not None
-            else None,
-            # longSwapPoints=Decimal(elem.findtext("longSwapPoints"))
-            #     if elem.findtext("longSwapPoints") is not None else None,
-            # shortSwapPoints=Decimal(elem.findtext("shortSwapPoints"))
-            #     if elem.findtext("shortSwapPoints") is not None else None,
-            # swapPointValue=Decimal(elem.findtext("swapPointValue"))
-            #     if elem.findtext("swapPointValue") is not None else None,
-            # fundingPremiumPercentage=Decimal(elem.findtext("fundingPremiumPercentage"))
-            #     if elem.findtext("fundingPremiumPercentage") is not None else None,
-            # fundingReductionPercentage=Decimal(elem.findtext("fundingReductionPercentage"))
-            #     if elem.findtext("fundingReductionPercentage") is not None else None,
-            # fundingBaseRate=Decimal(elem.findtext("fundingBaseRate"))
-            #     if elem.findtext("fundingBaseRate") is not None else None,
-            # dailyInterestRateBasis=Decimal(elem.findtext("dailyInterestRateBasis"))
-            #     if elem.findtext("dailyInterestRateBasis") is not None else None,
+            id=int(fields["id"]),
+            name=fields["name"],
+            startTime=pd.Timestamp(fields["startTime"]),  # 2010-07-09T13:09:00
+            openingOffset=int(fields["openingOffset"]),
+            closingOffset=int(fields["closingOffset"]),
+            timezone=fields["timezone"],
+            margin=Decimal(fields["margin"]),
+            currency=fields["currency"],
+            unitPrice=Decimal(fields["unitPrice"]),
+            minimumOrderQuantity=Decimal(fields["minimumOrderQuantity"]),
+            orderQuantityIncrement=Decimal(fields["orderQuantityIncrement"]),
+            minimumPrice=Decimal(fields["minimumPrice"]),
+            maximumPrice=Decimal(fields["maximumPrice"]),
+            trustedSpread=Decimal(fields["trustedSpread"]),
+            priceIncrement=Decimal(fields["priceIncrement"]),
+            stopBuffer=int(fields["stopBuffer"]),
+            assetClass=LmaxAssetClass[fields["assetClass"]],
+            symbol=fields["symbol"],
+            maximumPositionThreshold=Decimal(fields["maximumPositionThreshold"]),
+            minimumCommission=Decimal(fields["minimumCommission"]),
+            tradingDays=fields["tradingDays"],
+            retailVolatilityBandPercentage=int(fields["retailVolatilityBandPercentage"]),
+            contractUnitOfMeasure=fields["contractUnitOfMeasure"],
+            contractSize=Decimal(fields["contractSize"]),
+            aggressiveCommissionRate=_optional_decimal(fields, "aggressiveCommissionRate"),
+            passiveCommissionRate=_optional_decimal(fields, "passiveCommissionRate"),
+            aggressiveCommissionPerContract=_optional_decimal(
+                fields,
+                "aggressiveCommissionPerContract",
+            ),
+            passiveCommissionPerContract=_optional_decimal(fields, "passiveCommissionPerContract"),
+            # longSwapPoints=_optional_decimal(fields, "longSwapPoints"),
+            # shortSwapPoints=_optional_decimal(fields, "shortSwapPoints"),
+            # swapPointValue=_optional_decimal(fields, "swapPointValue"),
+            # fundingPremiumPercentage=_optional_decimal(fields, "fundingPremiumPercentage"),
+            # fundingReductionPercentage=_optional_decimal(fields, "fundingReductionPercentage"),
+            # fundingBaseRate=_optional_decimal(fields, "fundingBaseRate"),
+            # dailyInterestRateBasis=_optional_decimal(fields, "dailyInterestRateBasis"),
         )
 
     def to_nautilus(self) -> Instrument:
@@ -342,11 +358,15 @@ class LmaxWallet:
 
     @classmethod
     def from_xml(cls, elem: Element) -> LmaxWallet:
+        return cls.from_fields(_leaf_fields(elem))
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, str]) -> LmaxWallet:
         return cls(
-            currency=elem.findtext("currency"),
-            balance=Decimal(elem.findtext("balance")),
-            cash=Decimal(elem.findtext("cash")),
-            availableToWithdraw=Decimal(elem.findtext("availableToWithdraw")),
+            currency=fields["currency"],
+            balance=Decimal(fields["balance"]),
+            cash=Decimal(fields["cash"]),
+            availableToWithdraw=Decimal(fields["availableToWithdraw"]),
         )
 
 
@@ -367,19 +387,29 @@ class LmaxAccountState:
 
     @classmethod
     def from_xml(cls, elem: Element) -> LmaxAccountState:
+        fields = _leaf_fields(elem)
+        fields["wallets"] = [_leaf_fields(wallet) for wallet in elem.iter("wallet")]
+        return cls.from_fields(fields)
+
+    @classmethod
+    def from_fields(cls, fields: dict) -> LmaxAccountState:
+        """
+        Return the account state of the text of its child elements by name, with
+        ``wallets`` as a list of the fields of each wallet.
+        """
         return cls(
-            accountId=int(elem.findtext("accountId")),
-            balance=Decimal(elem.findtext("balance")),
-            cash=Decimal(elem.findtext("cash")),
-            credit=Decimal(elem.findtext("credit")),
-            totalCollateralizedCredit=Decimal(elem.findtext("totalCollateralizedCredit")),
-            usedCollateralizedCredit=Decimal(elem.findtext("usedCollateralizedCredit")),
-            availableFunds=Decimal(elem.findtext("availableFunds")),
-            availableToWithdraw=Decimal(elem.findtext("availableToWithdraw")),
-            unrealisedProfitAndLoss=Decimal(elem.findtext("unrealisedProfitAndLoss")),
-            margin=Decimal(elem.findtext("margin")),
-            wallets=[LmaxWallet.from_xml(elem) for elem in elem.findall(".//wallet")],
-            active=bool(elem.findtext("margin")),
+            accountId=int(fields["accountId"]),
+            balance=Decimal(fields["balance"]),
+            cash=Decimal(fields["cash"]),
+            credit=Decimal(fields["credit"]),
+            totalCollateralizedCredit=Decimal(fields["totalCollateralizedCredit"]),
+            usedCollateralizedCredit=Decimal(fields["usedCollateralizedCredit"]),
+            availableFunds=Decimal(fields["availableFunds"]),
+            availableToWithdraw=Decimal(fields["availableToWithdraw"]),
+            unrealisedProfitAndLoss=Decimal(fields["unrealisedProfitAndLoss"]),
+            margin=Decimal(fields["margin"]),
+            wallets=[LmaxWallet.from_fields(wallet) for wallet in fields.get("wallets", ())],
+            active=bool(fields.get("margin")),
         )
 
     def to_nautilus_account_balance(self) -> AccountBalance:
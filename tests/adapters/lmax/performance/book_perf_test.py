@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.fix.book import LmaxOrderBook
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.messages import string_to_raw
+
+
+def _snapshot(best_bid_size: str):
+    entries = [f"269=0|270={29384 - i}.5|271={best_bid_size if i == 0 else '1'}" for i in range(20)]
+    entries[0] += "|272=20230731|273=11:04:39.440"
+    entries += [f"269=1|270={29389 + i}.5|271=1" for i in range(20)]
+    return decode_frame(
+        string_to_raw(
+            "8=FIX.4.4|35=W|49=LMXBDM|56=ghill2|34=2|52=20230731-11:04:40.161|"
+            "262=OrderBook0-XBT/USD.LMAX|48=100934|22=8|268=40|" + "|".join(entries),
+        ),
+    )
+
+
+def _book(depth10: bool) -> LmaxOrderBook:
+    instrument = Mock(
+        id=InstrumentId.from_str("XBT/USD.LMAX"),
+        info={"id": 100934},
+        price_precision=1,
+        size_precision=2,
+    )
+    book = LmaxOrderBook(instrument, depth10=depth10)
+    book.apply(_snapshot("1"), ts_init=0)
+    return book
+
+
+class TestOrderBookPerformance:
+    def test_apply_one_changed_level(self, benchmark):
+        book = _book(depth10=False)
+        snapshots = [_snapshot("2"), _snapshot("3")]
+        benchmark(lambda: [book.apply(snapshot, ts_init=0) for snapshot in snapshots])
+
+    def test_apply_one_changed_level_depth10(self, benchmark):
+        book = _book(depth10=True)
+        snapshots = [_snapshot("2"), _snapshot("3")]
+        benchmark(lambda: [book.apply(snapshot, ts_init=0) for snapshot in snapshots])
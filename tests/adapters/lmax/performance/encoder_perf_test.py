@@ -0,0 +1,64 @@
+from pytower.adapters.lmax.fix.encoder import FixTemplate
+from pytower.adapters.lmax.fix.messages import NewOrderSingle
+from pytower.adapters.lmax.fix.timestamps import SendingTimeFormatter
+
+
+_TIMESTAMP_NS = 1694774929193456789
+
+
+class TestFixEncoderPerformance:
+    def test_encode_new_order_single_simplefix(self, benchmark):
+        def encode():
+            msg = NewOrderSingle()
+            msg.append_pair(8, "FIX.4.4", header=True)  # BeginString
+            msg.append_pair(35, msg.message_type, header=True)  # MsgType
+            msg.append_pair(49, "ghill2", header=True)  # SenderCompID
+            msg.append_pair(56, "LMXBD", header=True)  # TargetCompID
+            msg.append_pair(34, 12, header=True)  # MsgSeqNum
+            msg.append_pair(52, "20230915-10:48:49.193456", header=True)  # SendingTime
+            msg.append_pair(11, "a90dd4d7-c530-4add-8")  # ClOrdID
+            msg.append_pair(48, 100934)  # SecurityID
+            msg.append_pair(22, 8)  # SecurityIDSource
+            msg.append_pair(54, 1)  # Side
+            msg.append_pair(60, "19700101-00:00:00")  # TransactTime
+            msg.append_pair(38, "0.01")  # OrderQty
+            msg.append_pair(18, "H")  # ExecInst
+            msg.append_pair(40, 2)  # OrdType
+            msg.append_pair(44, "1.23")  # Price
+            msg.append_pair(59, 1)  # TimeInForce
+            return msg.encode()
+
+        benchmark(encode)
+
+    def test_encode_new_order_single_template(self, benchmark):
+        template = FixTemplate(
+            NewOrderSingle,
+            [
+                (11, None),  # ClOrdID
+                (48, None),  # SecurityID
+                (22, 8),  # SecurityIDSource
+                (54, None),  # Side
+                (60, "19700101-00:00:00"),  # TransactTime
+                (38, None),  # OrderQty
+                (18, "H"),  # ExecInst
+                (40, 2),  # OrdType
+                (44, None),  # Price
+                (59, 1),  # TimeInForce
+            ],
+            sender_comp_id="ghill2",
+            target_comp_id="LMXBD",
+        )
+        formatter = SendingTimeFormatter()
+
+        def encode():
+            return template.encode(
+                12,
+                formatter.format(_TIMESTAMP_NS),
+                "a90dd4d7-c530-4add-8",
+                100934,
+                1,
+                "0.01",
+                "1.23",
+            )
+
+        benchmark(encode)
@@ -0,0 +1,83 @@
+import asyncio
+
+from pytower.adapters.lmax.fix.framing import FixFramer
+from pytower.adapters.lmax.fix.iothread import FixIoThread
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+_FRAME_COUNT = 20_000
+
+
+def _market_data_frame() -> bytes:
+    with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+        return string_to_raw(f.readline().strip())
+
+
+async def _serve(frame: bytes) -> tuple[asyncio.AbstractServer, int]:
+    async def handler(reader, writer):
+        for _ in range(_FRAME_COUNT // 100):
+            writer.write(frame * 100)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _handle(frame: bytes) -> None:
+    # stands in for decoding and the strategy callbacks run for every frame
+    frame.split(b"\x01")
+
+
+async def _consume_single_loop(frame: bytes) -> int:
+    server, port = await _serve(frame)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    framer = FixFramer()
+    count = 0
+    while True:
+        raw = await reader.read(65536)
+        if not raw:
+            break
+        for frame in framer.feed(raw):
+            _handle(frame)
+            count += 1
+    writer.close()
+    server.close()
+    return count
+
+
+async def _consume_io_thread(frame: bytes) -> int:
+    server, port = await _serve(frame)
+    io = FixIoThread()
+    await io.connect("127.0.0.1", port, None)
+    count = 0
+    while True:
+        frames = await io.read_frames()
+        if frames is None:
+            break
+        for frame in frames:
+            _handle(frame)
+            count += 1
+    io.close()
+    await io.wait_closed()
+    server.close()
+    return count
+
+
+class TestFixIoThreadPerformance:
+    def test_consume_market_data_single_loop(self, benchmark):
+        frame = _market_data_frame()
+        count = benchmark.pedantic(
+            lambda: asyncio.run(_consume_single_loop(frame)),
+            rounds=5,
+        )
+        assert count == _FRAME_COUNT
+
+    def test_consume_market_data_io_thread(self, benchmark):
+        frame = _market_data_frame()
+        count = benchmark.pedantic(
+            lambda: asyncio.run(_consume_io_thread(frame)),
+            rounds=5,
+        )
+        assert count == _FRAME_COUNT
@@ -0,0 +1,14 @@
+from nautilus_trader.model.objects import Price
+from pytower.adapters.lmax.fix.parsing import parse_price
+from pytower.adapters.lmax.fix.parsing import parse_raw_batch
+
+
+class TestParsingPerformance:
+    def test_price_from_float(self, benchmark):
+        benchmark(lambda: Price(float(b"1.09312"), 5))
+
+    def test_parse_price(self, benchmark):
+        benchmark(parse_price, b"1.09312", 5)
+
+    def test_parse_raw_batch_snapshot(self, benchmark):
+        benchmark(parse_raw_batch, [b"1.09312", b"1.09318"], 5)
@@ -0,0 +1,47 @@
+import asyncio
+from unittest.mock import Mock
+
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.common import RateLimiter
+from pytower.adapters.lmax.fix.messages import create_market_data_request
+from pytower.adapters.lmax.fix.subscriptions import MarketDataSubscriptionBatcher
+
+
+# roughly the LMAX universe of currency pairs, indices and commodities
+_INSTRUMENT_COUNT = 150
+
+
+def _instruments() -> list[Mock]:
+    return [
+        Mock(id=InstrumentId.from_str(f"SYM{i}/USD.LMAX"), info={"id": 100_000 + i})
+        for i in range(_INSTRUMENT_COUNT)
+    ]
+
+
+def _rate_limited_send():
+    # stands in for LmaxFixClient.send_message at the default 500 messages per second
+    rate_limiter = RateLimiter(rate=500, burst=1)
+
+    async def send(request_id: str, security_ids: list[int], subscribe: bool) -> None:
+        create_market_data_request(request_id, security_ids, subscribe)
+        while not rate_limiter.acquire(1):
+            await asyncio.sleep(rate_limiter.delay())
+
+    return send
+
+
+async def _subscribe_all(max_batch_size: int) -> None:
+    batcher = MarketDataSubscriptionBatcher(
+        send=_rate_limited_send(),
+        window_seconds=0.005,
+        max_batch_size=max_batch_size,
+    )
+    await asyncio.gather(*(batcher.subscribe(instrument) for instrument in _instruments()))
+
+
+class TestSubscriptionPerformance:
+    def test_subscribe_universe_one_request_per_instrument(self, benchmark):
+        benchmark.pedantic(lambda: asyncio.run(_subscribe_all(max_batch_size=1)), rounds=5)
+
+    def test_subscribe_universe_batched(self, benchmark):
+        benchmark.pedantic(lambda: asyncio.run(_subscribe_all(max_batch_size=100)), rounds=5)
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from pytower.adapters.lmax.fix.timestamps import parse_utc_date_time_ns
+from pytower.adapters.lmax.fix.timestamps import parse_utc_timestamp_ns
+
+
+class TestFixTimestampsPerformance:
+    def test_parse_transact_time_pandas(self, benchmark):
+        benchmark(
+            lambda: pd.to_datetime("20230915-10:48:49.193456", format="%Y%m%d-%H:%M:%S.%f").value,
+        )
+
+    def test_parse_transact_time(self, benchmark):
+        benchmark(parse_utc_timestamp_ns, b"20230915-10:48:49.193456")
+
+    def test_parse_md_entry_date_time(self, benchmark):
+        benchmark(parse_utc_date_time_ns, b"20230731", b"11:04:39.440")
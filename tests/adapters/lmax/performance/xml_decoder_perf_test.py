@@ -0,0 +1,51 @@
+import xml.sax
+from xml.etree import ElementTree
+
+import pytest
+
+from pytower.adapters.lmax.xml.decoder import ACCOUNT_STATE
+from pytower.adapters.lmax.xml.decoder import INSTRUMENT
+from pytower.adapters.lmax.xml.decoder import ORDER
+from pytower.adapters.lmax.xml.decoder import POSITION
+from pytower.adapters.lmax.xml.decoder import decode_objects
+from pytower.adapters.lmax.xml.sax import LMAXSaxHandler
+from pytower.adapters.lmax.xml.types import LmaxAccountState
+from pytower.adapters.lmax.xml.types import LmaxInstrument
+from pytower.adapters.lmax.xml.types import LmaxOrder
+from pytower.adapters.lmax.xml.types import LmaxPosition
+from pytower.adapters.lmax.xml.util import unpretty_xml
+from pytower.tests.adapters.lmax import XML_RESPONSES
+
+
+_FIXTURES = [
+    ("orders.xml", ORDER, "orders", LmaxOrder),
+    ("positions.xml", POSITION, "positions", LmaxPosition),
+    ("account_state.xml", ACCOUNT_STATE, "accountState", LmaxAccountState),
+    ("instruments.xml", INSTRUMENT, "instruments", LmaxInstrument),
+]
+
+
+def _read(name: str) -> str:
+    with open(XML_RESPONSES / name) as f:
+        return unpretty_xml(f.read())
+
+
+def _sax_element_tree(xml_data: str, target_element: str, cls: type) -> list:
+    # the previous path: capture the element as a pretty printed string, then parse it again
+    handler = LMAXSaxHandler(target_element=target_element)
+    xml.sax.parseString(xml_data, handler)
+    root = ElementTree.fromstring(handler.get_result())
+    tag = target_element if target_element == "accountState" else target_element[:-1]
+    return [cls.from_xml(elem) for elem in root.iter(tag)]
+
+
+class TestXmlDecoderPerformance:
+    @pytest.mark.parametrize(("name", "spec", "target_element", "cls"), _FIXTURES)
+    def test_decode_objects(self, benchmark, name, spec, target_element, cls):
+        xml_data = _read(name)
+        benchmark(decode_objects, xml_data, spec)
+
+    @pytest.mark.parametrize(("name", "spec", "target_element", "cls"), _FIXTURES)
+    def test_sax_minidom_element_tree(self, benchmark, name, spec, target_element, cls):
+        xml_data = _read(name)
+        benchmark(_sax_element_tree, xml_data, target_element, cls)
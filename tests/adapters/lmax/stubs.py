@@ -1,5 +1,6 @@
 import asyncio
 from decimal import Decimal
+from unittest.mock import AsyncMock
 from xml.etree import ElementTree
 
 from dotenv import dotenv_values
@@ -69,6 +70,40 @@ class LMAXStubs:
             loop=loop if loop is not None else asyncio.get_event_loop(),
         )
 
+    @staticmethod
+    def offline_xml_client(loop: asyncio.AbstractEventLoop | None = None) -> LmaxXmlClient:
+        """
+        Return an XML client which logs in and out without a request, and sends no
+        heartbeats, for tests which mock its requests and push stream.
+        """
+        xml_client = LmaxXmlClient(
+            hostname="https://web-order.london-demo.lmax.com",
+            username="username",
+            password="password",
+            clock=TestComponentStubs.clock(),
+            cache=TestComponentStubs.cache(),
+            logger=TestComponentStubs.logger(),
+            loop=loop if loop is not None else asyncio.get_event_loop(),
+            heartbeat_interval_seconds=None,
+        )
+        xml_client.login = AsyncMock(return_value=True)
+        xml_client.logout = AsyncMock(return_value=True)
+        return xml_client
+
+    @staticmethod
+    def fix_client(loop: asyncio.AbstractEventLoop | None = None, **kwargs) -> LmaxFixClient:
+        clock = TestComponentStubs.clock()
+        return LmaxFixClient(
+            hostname="fix-order.london-demo.lmax.com",
+            username="username",
+            password="password",
+            target_comp_id="LMXBD",
+            logger=Logger(clock=clock, level_stdout=LogLevel.DEBUG),
+            loop=loop if loop is not None else asyncio.get_event_loop(),
+            clock=clock,
+            **kwargs,
+        )
+
     @classmethod
     def instrument_provider(cls, loop: asyncio.AbstractEventLoop | None = None):
         clock = TestComponentStubs.clock()
@@ -0,0 +1,166 @@
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import OrderBookDepth10
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.fix.book import LmaxOrderBook
+from pytower.adapters.lmax.fix.book import diff_levels
+from pytower.adapters.lmax.fix.book import read_levels
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.messages import string_to_raw
+
+
+def _snapshot(bids: list[tuple[str, str]], asks: list[tuple[str, str]]):
+    entries = []
+    for entry_type, levels in (("0", bids), ("1", asks)):
+        for price, size in levels:
+            entries.append(f"269={entry_type}|270={price}|271={size}")
+            if len(entries) == 1:
+                entries[0] += "|272=20230731|273=11:04:39.440"
+    return decode_frame(
+        string_to_raw(
+            "8=FIX.4.4|35=W|49=LMXBDM|56=ghill2|34=2|52=20230731-11:04:40.161|"
+            f"262=OrderBook5-XBT/USD.LMAX|48=100934|22=8|268={len(entries)}|"
+            + "|".join(entries),
+        ),
+    )
+
+
+_BIDS = [("29384.72", "4.97"), ("29384.5", "1"), ("29383", "10.5")]
+_ASKS = [("29389", "4.95"), ("29390.1", "2")]
+
+
+@pytest.fixture()
+def instrument():
+    return Mock(
+        id=InstrumentId.from_str("XBT/USD.LMAX"),
+        info={"id": 100934},
+        price_precision=2,
+        size_precision=2,
+    )
+
+
+class TestReadLevels:
+    def test_read_levels_returns_sides_in_book_order(self):
+        # Arrange, Act
+        bids, asks = read_levels(_snapshot(_BIDS, _ASKS))
+
+        # Assert
+        assert list(bids.items()) == [(p.encode(), s.encode()) for p, s in _BIDS]
+        assert list(asks.items()) == [(p.encode(), s.encode()) for p, s in _ASKS]
+
+    def test_read_levels_of_empty_snapshot(self):
+        assert read_levels(_snapshot([], [])) == ({}, {})
+
+
+class TestDiffLevels:
+    def test_diff_levels(self):
+        # Arrange
+        previous = {b"1.1": b"1", b"1.2": b"2", b"1.3": b"3"}
+        current = {b"1.1": b"1", b"1.2": b"5", b"1.4": b"4"}
+
+        # Act
+        changes = diff_levels(previous, current)
+
+        # Assert
+        assert changes == [
+            (BookAction.UPDATE, b"1.2", b"5"),
+            (BookAction.ADD, b"1.4", b"4"),
+            (BookAction.DELETE, b"1.3", b"3"),
+        ]
+
+    def test_diff_levels_of_unchanged_side_is_empty(self):
+        levels = {b"1.1": b"1", b"1.2": b"2"}
+        assert diff_levels(levels, dict(levels)) == []
+
+
+class TestLmaxOrderBook:
+    def test_first_snapshot_clears_and_adds_every_level(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument)
+
+        # Act
+        deltas = book.apply(_snapshot(_BIDS, _ASKS), ts_init=1)
+
+        # Assert
+        assert isinstance(deltas, OrderBookDeltas)
+        assert [delta.action for delta in deltas.deltas] == [BookAction.CLEAR] + [
+            BookAction.ADD,
+        ] * 5
+        assert deltas.deltas[1].order.price.as_double() == 29384.72
+        assert deltas.deltas[0].ts_event == 1690801479440000000
+        assert [delta.flags for delta in deltas.deltas] == [RecordFlag.F_SNAPSHOT] * 5 + [
+            RecordFlag.F_SNAPSHOT | RecordFlag.F_LAST,
+        ]
+
+    def test_first_empty_snapshot_clears_the_book(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument)
+
+        # Act
+        deltas = book.apply(_snapshot([], []), ts_init=1)
+
+        # Assert
+        assert [delta.action for delta in deltas.deltas] == [BookAction.CLEAR]
+        assert deltas.deltas[0].flags == RecordFlag.F_SNAPSHOT | RecordFlag.F_LAST
+
+    def test_unchanged_snapshot_emits_nothing(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument)
+        book.apply(_snapshot(_BIDS, _ASKS), ts_init=1)
+
+        # Act
+        deltas = book.apply(_snapshot(_BIDS, _ASKS), ts_init=2)
+
+        # Assert
+        assert deltas is None
+
+    def test_snapshot_emits_changed_levels_only(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument)
+        book.apply(_snapshot(_BIDS, _ASKS), ts_init=1)
+        bids = [("29384.72", "3"), ("29384.5", "1")]
+
+        # Act
+        deltas = book.apply(_snapshot(bids, _ASKS), ts_init=2)
+
+        # Assert
+        assert [(delta.action, delta.order.price.as_double()) for delta in deltas.deltas] == [
+            (BookAction.UPDATE, 29384.72),
+            (BookAction.DELETE, 29383.0),
+        ]
+        assert deltas.deltas[0].order.size.as_double() == 3.0
+        assert [delta.flags for delta in deltas.deltas] == [0, RecordFlag.F_LAST]
+
+    def test_reset_emits_next_snapshot_in_full(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument)
+        book.apply(_snapshot(_BIDS, _ASKS), ts_init=1)
+
+        # Act
+        book.reset()
+        deltas = book.apply(_snapshot(_BIDS, _ASKS), ts_init=2)
+
+        # Assert
+        assert len(deltas.deltas) == 6
+
+    def test_depth10_pads_levels_and_reuses_unchanged_orders(self, instrument):
+        # Arrange
+        book = LmaxOrderBook(instrument, depth10=True)
+        first = book.apply(_snapshot(_BIDS, _ASKS), ts_init=1)
+        asks = [("29389", "1"), ("29390.1", "2")]
+
+        # Act
+        second = book.apply(_snapshot(_BIDS, asks), ts_init=2)
+
+        # Assert
+        assert isinstance(second, OrderBookDepth10)
+        assert len(second.bids) == 10
+        assert second.bid_counts == [1, 1, 1] + [0] * 7
+        assert second.asks[0].size.as_double() == 1.0
+        assert second.bids[0] == first.bids[0]
+        assert second.flags == RecordFlag.F_SNAPSHOT | RecordFlag.F_LAST
@@ -0,0 +1,530 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+from simplefix import FixParser
+
+from pytower.adapters.lmax.fix.framing import FixFramer
+from pytower.adapters.lmax.fix.journal import OUTBOUND
+from pytower.adapters.lmax.fix.journal import read_journal
+from pytower.adapters.lmax.fix.messages import ExecutionReport
+from pytower.adapters.lmax.fix.messages import Heartbeat
+from pytower.adapters.lmax.fix.messages import Logon
+from pytower.adapters.lmax.fix.messages import Logout
+from pytower.adapters.lmax.fix.messages import NewOrderSingle
+from pytower.adapters.lmax.fix.messages import ResendRequest
+from pytower.adapters.lmax.fix.messages import SequenceReset
+from pytower.adapters.lmax.fix.messages import TestRequest
+from pytower.adapters.lmax.fix.messages import get_message_type
+from pytower.adapters.lmax.fix.messages import raw_to_message
+from pytower.adapters.lmax.fix.messages import string_to_message
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+from pytower.tests.adapters.lmax.stubs import LMAXStubs
+
+
+def _mock_writer(buffer_size: int = 0) -> Mock:
+    writer = Mock()
+    writer.transport.get_write_buffer_size.return_value = buffer_size
+    return writer
+
+
+def _written_messages(writer: Mock) -> list:
+    framer = FixFramer()
+    return [
+        raw_to_message(frame)
+        for call in writer.write.call_args_list
+        for frame in framer.feed(call[0][0])
+    ]
+
+
+class TestFixClientSender:
+    @pytest.mark.asyncio
+    async def test_send_loop_coalesces_queued_messages_into_one_write(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_message(Heartbeat())
+        await fix_client.send_message(Heartbeat())
+        await fix_client.send_message(Logout())
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        assert fix_client._writer.write.call_count == 1
+        messages = _written_messages(fix_client._writer)
+        assert [msg.get(35) for msg in messages] == [b"0", b"0", b"5"]
+        assert [msg.get(34) for msg in messages] == [b"1", b"2", b"3"]
+
+    @pytest.mark.asyncio
+    async def test_send_loop_assigns_sequence_numbers_across_templates_and_messages(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        template = fix_client.create_template(Heartbeat, [(112, None)])  # TestReqID
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_template(template, "request1")
+        await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+        await fix_client.send_template(template, "request2")
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        assert fix_client._writer.write.call_count == 2
+        messages = _written_messages(fix_client._writer)
+        assert [msg.get(34) for msg in messages] == [b"1", b"2", b"3"]
+        assert messages[0].get(112) == b"request1"
+        assert messages[2].get(112) == b"request2"
+
+    @pytest.mark.asyncio
+    async def test_send_loop_drops_a_message_which_fails_to_encode(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        template = fix_client.create_template(NewOrderSingle, [(11, None)])
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_template(template)  # missing the value of its slot
+        await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+        await fix_client.send_message(Logout())
+        await asyncio.sleep(0)
+
+        # Assert
+        assert not task.done()
+        task.cancel()
+        messages = _written_messages(fix_client._writer)
+        assert [msg.get(35) for msg in messages] == [b"0", b"5"]
+        assert [msg.get(34) for msg in messages] == [b"1", b"2"]
+
+    @pytest.mark.asyncio
+    async def test_send_loop_drains_above_high_water_mark(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(write_high_water=10)
+        fix_client._writer = _mock_writer(buffer_size=11)
+        drained = asyncio.Event()
+
+        async def drain():
+            await drained.wait()
+
+        fix_client._writer.drain = drain
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+        blocked = asyncio.create_task(fix_client.send_message(Heartbeat()))
+        await asyncio.sleep(0)
+
+        # Assert
+        assert not blocked.done()
+        drained.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert blocked.done()
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_send_loop_rate_limited(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(max_messages_per_second=2)
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        for _ in range(3):
+            await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+
+        # Assert
+        assert len(_written_messages(fix_client._writer)) == 2
+        await asyncio.sleep(0.6)
+        assert len(_written_messages(fix_client._writer)) == 3
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_send_loop_journals_written_frames(self, tmp_path):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(journal_path=str(tmp_path))
+        fix_client._writer = _mock_writer()
+        fix_client._open_journal()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_message(Heartbeat())
+        await fix_client.send_message(Logout())
+        await asyncio.sleep(0)
+        task.cancel()
+        fix_client._journal.close()
+
+        # Assert
+        records = list(read_journal(tmp_path))
+        assert [r.direction for r in records] == [OUTBOUND, OUTBOUND]
+        assert [r.message_type for r in records] == [b"0", b"5"]
+        assert b"".join(r.frame for r in records) == fix_client._writer.write.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_journal_is_only_opened_on_connect(self, tmp_path):
+        # Arrange, Act
+        fix_client = LMAXStubs.fix_client(journal_path=str(tmp_path))
+
+        # Assert
+        assert fix_client._journal is None
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_send_loop_records_enqueue_to_write_when_timings_enabled(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(stage_timings=True)
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_message(Heartbeat())
+        await fix_client.send_message(Heartbeat(), received_ns=time.perf_counter_ns())
+        await asyncio.sleep(0)
+        task.cancel()
+
+        # Assert
+        assert fix_client.stage_timings.summary()["enqueue_to_write"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_loop_records_nothing_when_timings_disabled(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+        task.cancel()
+
+        # Assert
+        assert fix_client.stage_timings.summary() == {}
+
+
+class TestFixClientWaits:
+    @pytest.mark.asyncio
+    async def test_wait_for_event_resolved_by_handled_message(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        with open(FIX_RESPONSES / "order_status_request_unknown_order.txt") as f:
+            msg = string_to_message(f.readline())
+
+        # Act
+        task = asyncio.create_task(
+            fix_client.wait_for_event(
+                cls=ExecutionReport,
+                tags={150: "I", 790: "630eed65972e3e5e"},
+            ),
+        )
+        await asyncio.sleep(0)
+        await fix_client._handle_message(msg)
+
+        # Assert
+        assert await task is msg
+        assert len(fix_client._correlations) == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_returns_already_handled_message(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        with open(FIX_RESPONSES / "order_status_request_unknown_order.txt") as f:
+            msg = string_to_message(f.readline())
+        await fix_client._handle_message(msg)
+
+        # Act
+        result = await fix_client.wait_for_event(
+            cls=ExecutionReport,
+            tags={150: "I", 790: "630eed65972e3e5e"},
+        )
+
+        # Assert
+        assert result is msg
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_timeout_removes_waiter(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            await fix_client.wait_for_event(
+                cls=ExecutionReport,
+                tags={790: "630eed65972e3e5e"},
+                timeout_seconds=0.01,
+            )
+
+        # Assert
+        assert len(fix_client._correlations) == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_events(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        with open(FIX_RESPONSES / "limit_order_accepted.txt") as f:
+            line = f.readline()
+        msg1 = string_to_message(line)
+        msg2 = string_to_message(line.replace("|34=3|", "|34=4|"))  # MsgSeqNum
+
+        # Act
+        task = asyncio.create_task(fix_client.wait_for_events(2))
+        await asyncio.sleep(0)
+        await fix_client._handle_message(msg1)
+        await asyncio.sleep(0)
+        done_after_one = task.done()
+        await fix_client._handle_message(msg2)
+        await task
+
+        # Assert
+        assert not done_after_one
+        assert fix_client.processed_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_events_timeout_removes_waiter(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(fix_client.wait_for_events(1), timeout=0.01)
+
+        # Assert
+        assert fix_client._count_waiters == []
+
+
+def _inbound(cls, sequence_number: int, *pairs) -> object:
+    msg = cls()
+    msg.append_pair(35, get_message_type(cls))  # MsgType
+    msg.append_pair(34, sequence_number)  # MsgSeqNum
+    for tag, value in pairs:
+        msg.append_pair(tag, value)
+    return msg
+
+
+class TestFixClientStageTimings:
+    @pytest.mark.asyncio
+    async def test_handled_frames_record_decode_and_dispatch(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(stage_timings=True)
+        msg = _inbound(Heartbeat, 1)
+        msg.append_pair(8, "FIX.4.4", header=True)  # BeginString
+        fix_client.stage_timings.origin_ns = time.perf_counter_ns()
+
+        # Act
+        await fix_client._handle_frames_timed(
+            [msg.encode()],
+            FixParser(allow_empty_values=True),
+        )
+
+        # Assert
+        summary = fix_client.stage_timings.summary()
+        assert summary["decode"].count == 1
+        assert summary["dispatch"].count == 1
+        assert summary["read_to_handled"].count == 1
+        assert summary["read_to_handled"].max_ns >= summary["dispatch"].max_ns
+
+
+class TestFixClientSession:
+    @pytest.mark.asyncio
+    async def test_logon_resets_sequence_numbers_without_a_store(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.logon()
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        msg = _written_messages(fix_client._writer)[0]
+        assert msg.get(141) == b"Y"
+        assert msg.get(34) == b"1"
+
+    @pytest.mark.asyncio
+    async def test_logon_resumes_stored_session(self, tmp_path):
+        # Arrange
+        fix_client = LMAXStubs.fix_client(session_store_path=str(tmp_path))
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+        await fix_client.logon()
+        await fix_client.send_message(Heartbeat())
+        await asyncio.sleep(0)
+        task.cancel()
+        fix_client._store.close()
+
+        fix_client = LMAXStubs.fix_client(session_store_path=str(tmp_path))
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client.logon()
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        msg = _written_messages(fix_client._writer)[0]
+        assert msg.get(141) == b"N"
+        assert msg.get(34) == b"3"
+
+    @pytest.mark.asyncio
+    async def test_logon_is_sent_before_messages_queued_while_down(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        await fix_client.send_message(NewOrderSingle())
+
+        # Act
+        await fix_client.logon()
+        task = asyncio.create_task(fix_client._send_loop())
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        messages = _written_messages(fix_client._writer)
+        assert [msg.get(35) for msg in messages] == [b"A", b"D"]
+        assert [msg.get(34) for msg in messages] == [b"1", b"2"]
+
+    @pytest.mark.asyncio
+    async def test_close_clears_logged_on(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        fix_client.is_logged_on.set()
+
+        # Act
+        fix_client._close()
+
+        # Assert
+        assert not fix_client.is_logged_on.is_set()
+
+    @pytest.mark.asyncio
+    async def test_test_request_answered_with_matching_heartbeat(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client._handle_message(_inbound(TestRequest, 1, (112, "request1")))
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        msg = _written_messages(fix_client._writer)[0]
+        assert type(msg) is Heartbeat
+        assert msg.get(112) == b"request1"  # TestReqID
+
+    @pytest.mark.asyncio
+    async def test_inbound_gap_sends_resend_request(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        await fix_client._handle_message(_inbound(Logon, 1, (141, "Y")))
+        task = asyncio.create_task(fix_client._send_loop())
+
+        # Act
+        await fix_client._handle_message(_inbound(Heartbeat, 5))
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        msg = _written_messages(fix_client._writer)[0]
+        assert type(msg) is ResendRequest
+        assert msg.get(7) == b"2"  # BeginSeqNo
+        assert msg.get(16) == b"4"  # EndSeqNo
+        assert fix_client._store.next_inbound_sequence_number == 6
+
+    @pytest.mark.asyncio
+    async def test_possible_duplicates_are_only_processed_inside_the_gap(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        await fix_client._handle_message(_inbound(Logon, 1, (141, "Y")))
+        await fix_client._handle_message(_inbound(ExecutionReport, 2))
+        await fix_client._handle_message(_inbound(ExecutionReport, 4))
+
+        # Act
+        await fix_client._handle_message(_inbound(ExecutionReport, 2, (43, "Y")))
+        await fix_client._handle_message(_inbound(ExecutionReport, 3, (43, "Y")))
+
+        # Assert
+        assert fix_client.processed_count == 3
+        assert fix_client._inbound_gap is None
+
+    @pytest.mark.asyncio
+    async def test_sequence_number_too_low_logs_out_and_closes(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        await fix_client._handle_message(_inbound(Logon, 1, (141, "Y")))
+        await fix_client._handle_message(_inbound(ExecutionReport, 2))
+
+        # Act
+        await fix_client._handle_message(_inbound(ExecutionReport, 2))
+        await fix_client._handle_message(_inbound(ExecutionReport, 3))
+
+        # Assert
+        assert fix_client.processed_count == 1
+        msg = _written_messages(fix_client._writer)[0]
+        assert type(msg) is Logout
+        assert msg.get(58) == b"MsgSeqNum too low, expecting 3 but received 2"  # Text
+        assert fix_client._writer.close.called
+        assert fix_client.is_disconnected.is_set()
+
+    @pytest.mark.asyncio
+    async def test_sequence_reset_gap_fill_advances_inbound_sequence_number(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        await fix_client._handle_message(_inbound(Logon, 1, (141, "Y")))
+        await fix_client._handle_message(_inbound(Heartbeat, 5))
+
+        # Act
+        await fix_client._handle_message(_inbound(SequenceReset, 2, (43, "Y"), (123, "Y"), (36, 7)))
+
+        # Assert
+        assert fix_client._inbound_gap is None
+        assert fix_client._store.next_inbound_sequence_number == 7
+
+    @pytest.mark.asyncio
+    async def test_resend_request_is_answered_from_the_store(self):
+        # Arrange
+        fix_client = LMAXStubs.fix_client()
+        fix_client._writer = _mock_writer()
+        order = fix_client.create_template(NewOrderSingle, [(11, None)])  # ClOrdID
+        task = asyncio.create_task(fix_client._send_loop())
+        await fix_client.logon()
+        await fix_client.send_template(order, "order1")
+        await fix_client.send_message(Heartbeat())
+        await fix_client.send_template(order, "order2")
+        await asyncio.sleep(0)
+        fix_client._writer.write.reset_mock()
+
+        # Act
+        await fix_client._handle_message(_inbound(ResendRequest, 1, (7, 1), (16, 0)))
+        await asyncio.sleep(0)
+
+        # Assert
+        task.cancel()
+        messages = _written_messages(fix_client._writer)
+        assert [type(msg) for msg in messages] == [
+            SequenceReset,
+            NewOrderSingle,
+            SequenceReset,
+            NewOrderSingle,
+        ]
+        assert [msg.get(34) for msg in messages] == [b"1", b"2", b"3", b"4"]
+        assert [msg.get(36) for msg in (messages[0], messages[2])] == [b"2", b"4"]
+        assert all(msg.get(43) == b"Y" for msg in messages)
+        assert messages[1].get(11) == b"order1"
+        assert messages[1].get(122) is not None  # OrigSendingTime
+        assert fix_client._message_sequence_number == 5
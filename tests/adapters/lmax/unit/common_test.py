@@ -0,0 +1,60 @@
+from pytower.adapters.lmax.common import StageTimings
+
+
+class TestStageTimings:
+    def test_add_stage_returns_the_same_index_for_a_name(self):
+        # Arrange
+        timings = StageTimings(size=8)
+
+        # Act
+        decode = timings.add_stage("decode")
+        publish = timings.add_stage("publish")
+
+        # Assert
+        assert (decode, publish) == (0, 1)
+        assert timings.add_stage("decode") == decode
+
+    def test_summary_percentiles(self):
+        # Arrange
+        timings = StageTimings(size=100, enabled=True)
+        stage = timings.add_stage("decode")
+        timings.add_stage("publish")
+
+        # Act
+        for elapsed_ns in range(100, 0, -1):
+            timings.record(stage, elapsed_ns * 1_000)
+
+        # Assert
+        summary = timings.summary()
+        assert list(summary) == ["decode"]  # stages without samples are left out
+        assert summary["decode"].count == 100
+        assert summary["decode"].p50_ns == 51_000
+        assert summary["decode"].p90_ns == 91_000
+        assert summary["decode"].p99_ns == 100_000
+        assert summary["decode"].max_ns == 100_000
+
+    def test_summary_covers_the_most_recent_window(self):
+        # Arrange
+        timings = StageTimings(size=4)
+        stage = timings.add_stage("decode")
+
+        # Act
+        for elapsed_ns in (1_000_000, 1, 2, 3, 4):
+            timings.record(stage, elapsed_ns)
+
+        # Assert
+        summary = timings.summary()["decode"]
+        assert summary.count == 5
+        assert summary.max_ns == 4
+
+    def test_reset(self):
+        # Arrange
+        timings = StageTimings(size=4)
+        stage = timings.add_stage("decode")
+        timings.record(stage, 1)
+
+        # Act
+        timings.reset()
+
+        # Assert
+        assert timings.summary() == {}
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from pytower.adapters.lmax.fix.correlation import CorrelationRegistry
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.messages import ExecutionReport
+from pytower.adapters.lmax.fix.messages import MarketDataSnapshotFullRefresh
+from pytower.adapters.lmax.fix.messages import TradeCaptureReport
+from pytower.adapters.lmax.fix.messages import TradeCaptureReportRequestAck
+from pytower.adapters.lmax.fix.messages import string_to_message
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _read_message(filename: str, line: int = 0):
+    with open(FIX_RESPONSES / filename) as f:
+        return string_to_message(f.readlines()[line])
+
+
+class TestCorrelationRegistry:
+    @pytest.mark.asyncio
+    async def test_resolve_by_request_id(self):
+        # Arrange
+        registry = CorrelationRegistry()
+        msg = _read_message("order_status_request_unknown_order.txt")
+        request_id = msg.get(790).decode()  # OrdStatusReqID
+        future1 = registry.register(ExecutionReport, tags={150: "I", 790: request_id})
+        future2 = registry.register(ExecutionReport, tags={150: "I", 790: "other"})
+
+        # Act
+        resolved = registry.resolve(msg)
+
+        # Assert
+        assert resolved == 1
+        assert future1.result() is msg
+        assert not future2.done()
+        assert len(registry) == 1
+
+    @pytest.mark.asyncio
+    async def test_resolve_checks_remaining_tags(self):
+        # Arrange
+        registry = CorrelationRegistry()
+        ack = _read_message("trade_report1.txt", line=0)
+        report1 = _read_message("trade_report1.txt", line=1)
+        report2 = _read_message("trade_report1.txt", line=2)
+        ack_future = registry.register(
+            TradeCaptureReportRequestAck,
+            tags={568: "mock_request_id1"},
+        )
+        last_future = registry.register(
+            TradeCaptureReport,
+            tags={912: "Y", 568: "mock_request_id1"},
+        )
+
+        # Act
+        registry.resolve(ack)
+        registry.resolve(report1)
+        assert not last_future.done()
+        registry.resolve(report2)
+
+        # Assert
+        assert ack_future.result() is ack
+        assert last_future.result() is report2
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_resolve_without_correlation_tag(self):
+        # Arrange
+        registry = CorrelationRegistry()
+        future = registry.register(ExecutionReport, tags={39: "2"})  # OrdStatus: filled
+        accepted = _read_message("limit_order_accepted.txt")
+        filled = _read_message("limit_order_filled_buy.txt")
+
+        # Act
+        registry.resolve(accepted)
+        registry.resolve(filled)
+
+        # Assert
+        assert future.result() is filled
+
+    @pytest.mark.asyncio
+    async def test_resolve_view_by_message_type(self):
+        # Arrange
+        registry = CorrelationRegistry()
+        future = registry.register(MarketDataSnapshotFullRefresh)
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            view = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        registry.resolve(view)
+
+        # Assert
+        assert future.result() is view
+
+    @pytest.mark.asyncio
+    async def test_discard_removes_waiter(self):
+        # Arrange
+        registry = CorrelationRegistry()
+        future = registry.register(ExecutionReport, tags={11: "C-001"})
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(future, timeout=0.01)
+        registry.discard(future)
+
+        # Assert
+        assert len(registry) == 0
+        assert registry.resolve(_read_message("limit_order_filled_buy.txt")) == 0
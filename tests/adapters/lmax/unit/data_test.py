@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -8,8 +9,11 @@ import pytest
 from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.fix.decoder import decode_frame
 from pytower.adapters.lmax.fix.messages import string_to_message
+from pytower.adapters.lmax.fix.messages import string_to_raw
 from pytower.tests.adapters.lmax import FIX_RESPONSES
 from pytower.tests.adapters.lmax.mocks import LmaxMocks
 
@@ -24,17 +28,75 @@ class TestLMAXLiveDataClient:
     async def test_handle_market_data_snapshot_full_refresh(self, data_client):
         # Arrange
         data_client._handle_data = Mock()
+        data_client._quote_tick_subscriptions.add(InstrumentId.from_str("XBT/USD.LMAX"))
 
         with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
             msg: ExecutionReport = string_to_message(f.readline())
 
         # Act
-        await data_client.handle_message(msg)
+        data_client._handle_market_data_update(msg)
 
         # Assert
         quote_tick = data_client._handle_data.call_args[0][0]
         assert str(quote_tick) == "XBT/USD.LMAX,29384.72,29389.00,4.97,4.95,1690801479440000000"
 
+    @pytest.mark.asyncio
+    async def test_handle_market_data_snapshot_full_refresh_view(self, data_client):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client._quote_tick_subscriptions.add(InstrumentId.from_str("XBT/USD.LMAX"))
+
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        data_client._handle_market_data_update(msg)
+
+        # Assert
+        quote_tick = data_client._handle_data.call_args[0][0]
+        assert str(quote_tick) == "XBT/USD.LMAX,29384.72,29389.00,4.97,4.95,1690801479440000000"
+
+    def test_handle_market_data_records(self, data_client):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client._quote_tick_subscriptions.add(InstrumentId.from_str("XBT/USD.LMAX"))
+        record = (
+            100934,  # SecurityID
+            29384_720_000_000,
+            4_970_000_000,
+            29389_000_000_000,
+            4_950_000_000,
+            1690801479440000000,
+        )
+
+        # Act
+        data_client._handle_market_data_records([record])
+
+        # Assert
+        quote_tick = data_client._handle_data.call_args[0][0]
+        assert str(quote_tick) == "XBT/USD.LMAX,29384.72,29389.00,4.97,4.95,1690801479440000000"
+
+    def test_handle_market_data_records_drops_duplicates(self, data_client):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client._quote_tick_subscriptions.add(InstrumentId.from_str("XBT/USD.LMAX"))
+        record = (
+            100934,  # SecurityID
+            29384_720_000_000,
+            4_970_000_000,
+            29389_000_000_000,
+            4_950_000_000,
+            1690801479440000000,
+        )
+
+        # Act
+        data_client._handle_market_data_records([record, record])
+
+        # Assert
+        assert data_client._handle_data.call_count == 1
+        assert data_client.quote_conflation_stats.duplicates == 1
+        assert b"100934" in data_client._quote_contexts
+
     @pytest.mark.asyncio
     async def test_handle_market_data_snapshot_full_refresh_with_no_data(self, data_client):
         # Arrange
@@ -44,7 +106,7 @@ class TestLMAXLiveDataClient:
             msg: ExecutionReport = string_to_message(f.readline())
 
         # Act
-        await data_client.handle_message(msg)
+        data_client._handle_market_data_update(msg)
 
         # Assert
         assert data_client._handle_data.call_count == 0
@@ -107,15 +169,286 @@ class TestLMAXLiveDataClient:
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
         assert len(msg.pairs) == 9
 
+    @pytest.mark.asyncio
+    async def test_resubscribe_replays_active_subscriptions_in_one_request(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        await data_client._subscribe_quote_ticks(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+        )
+        data_client.fix_client.send_message.reset_mock()
+
+        # Act
+        await data_client._resubscribe()
+
+        # Assert
+        assert data_client.fix_client.send_message.call_count == 1
+        msg = data_client.fix_client.send_message.call_args[0][0]
+        assert msg.get(263) == b"1"  # SubscriptionRequestType: Snapshot + Updates (Subscribe)
+        assert msg.get(146) == b"1"  # NoRelatedSym
+        assert msg.get(48) == b"100934"  # SecurityID
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_skips_unsubscribed_instruments(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        instrument_id = InstrumentId.from_str("XBT/USD.LMAX")
+        await data_client._subscribe_quote_ticks(instrument_id=instrument_id)
+        await data_client._unsubscribe_quote_ticks(instrument_id=instrument_id)
+        data_client.fix_client.send_message.reset_mock()
+
+        # Act
+        await data_client._resubscribe()
+
+        # Assert
+        assert data_client.fix_client.send_message.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_quote_ticks_creates_quote_context(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+
+        # Act
+        await data_client._subscribe_quote_ticks(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+        )
+
+        # Assert
+        context = data_client._quote_contexts[b"100934"]
+        assert context.instrument_id == InstrumentId.from_str("XBT/USD.LMAX")
+        assert context.price_precision == 2
+        assert context.size_precision == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_market_data_snapshot_full_refresh_keeps_last_quote(self, data_client):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client.fix_client.send_message = AsyncMock()
+        await data_client._subscribe_quote_ticks(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+        )
+
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        data_client._handle_market_data_update(msg)
+
+        # Assert
+        quote_tick = data_client._handle_data.call_args[0][0]
+        assert data_client._quote_contexts[b"100934"].last_quote is quote_tick
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_quote_ticks_removes_quote_context(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        instrument_id = InstrumentId.from_str("XBT/USD.LMAX")
+        await data_client._subscribe_quote_ticks(instrument_id=instrument_id)
+
+        # Act
+        await data_client._unsubscribe_quote_ticks(instrument_id=instrument_id)
+
+        # Assert
+        assert b"100934" not in data_client._quote_contexts
+        assert data_client.feed_monitor.snapshot() == []
+
+    @pytest.mark.asyncio
+    async def test_handle_market_data_snapshot_full_refresh_after_unsubscribe(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        data_client._handle_data = Mock()
+        instrument_id = InstrumentId.from_str("XBT/USD.LMAX")
+        await data_client._subscribe_quote_ticks(instrument_id=instrument_id)
+        await data_client._unsubscribe_quote_ticks(instrument_id=instrument_id)
+
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        data_client._handle_market_data_update(msg)
+
+        # Assert
+        assert data_client._handle_data.call_count == 0
+        assert b"100934" not in data_client._quote_contexts
+
+    @pytest.mark.asyncio
+    async def test_refresh_quote_contexts_drops_removed_instruments(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        await data_client._subscribe_quote_ticks(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+        )
+        data_client.instrument_provider.find = Mock(return_value=None)
+
+        # Act
+        data_client._refresh_quote_contexts()
+
+        # Assert
+        assert data_client._quote_contexts == {}
+        assert data_client._quote_tick_subscriptions == set()
+
+    @pytest.mark.asyncio
+    async def test_reloading_instruments_refreshes_quote_contexts(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        instrument_id = InstrumentId.from_str("XBT/USD.LMAX")
+        await data_client._subscribe_quote_ticks(instrument_id=instrument_id)
+        data_client.instrument_provider.xml_client.request_instruments = AsyncMock(
+            return_value=[],
+        )
+
+        # Act
+        await data_client.instrument_provider.load_all_async()
+
+        # Assert
+        assert data_client._quote_contexts == {}
+        assert data_client._quote_tick_subscriptions == set()
+
+    @pytest.mark.asyncio
+    async def test_handle_market_data_snapshot_full_refresh_for_unknown_instrument(
+        self,
+        data_client,
+    ):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client.instrument_provider.find_with_security_id = Mock(return_value=None)
+
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        data_client._handle_market_data_update(msg)
+
+        # Assert
+        assert data_client._handle_data.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_subscribe_quote_ticks_within_window_sends_one_request(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+
+        # Act
+        await asyncio.gather(
+            data_client._subscribe_quote_ticks(InstrumentId.from_str("XBT/USD.LMAX")),
+            data_client._subscribe_quote_ticks(InstrumentId.from_str("EUR/USD.LMAX")),
+        )
+
+        # Assert
+        assert data_client.fix_client.send_message.call_count == 1
+        msg = data_client.fix_client.send_message.call_args[0][0]
+        assert msg.get(146) == b"2"  # NoRelatedSym
+
+    @pytest.mark.asyncio
+    async def test_handle_reject_drops_rejected_subscription(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        instrument_id = InstrumentId.from_str("EUR/USD.LMAX")
+        await data_client._subscribe_quote_ticks(instrument_id=instrument_id)
+
+        with open(FIX_RESPONSES / "market_data_request_reject.txt") as f:
+            msg = string_to_message(f.readline())  # MDReqID QuoteTick-EUR/USD.LMAX
+
+        # Act
+        data_client._handle_market_data_reject(msg)
+
+        # Assert
+        assert instrument_id not in data_client._quote_tick_subscriptions
+
+    @pytest.mark.asyncio
+    async def test_handle_reject_of_group_resends_instruments_individually(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+        instrument_ids = [
+            InstrumentId.from_str("XBT/USD.LMAX"),
+            InstrumentId.from_str("EUR/USD.LMAX"),
+        ]
+        await asyncio.gather(
+            *(data_client._subscribe_quote_ticks(instrument_id) for instrument_id in instrument_ids),
+        )
+        request_id = data_client.fix_client.send_message.call_args[0][0].get(262)  # MDReqID
+        data_client.fix_client.send_message.reset_mock()
+
+        with open(FIX_RESPONSES / "market_data_request_reject.txt") as f:
+            msg = string_to_message(f.readline())
+        msg.pairs = [(tag, request_id if tag == b"262" else value) for tag, value in msg.pairs]
+
+        # Act
+        data_client._handle_market_data_reject(msg)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert data_client.fix_client.send_message.call_count == 2
+        for call in data_client.fix_client.send_message.call_args_list:
+            assert call[0][0].get(146) == b"1"  # NoRelatedSym
+
+    @pytest.mark.asyncio
+    async def test_subscribe_order_book_deltas_sends_depth_request(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+
+        # Act
+        await data_client._subscribe_order_book_deltas(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+            book_type=BookType.L2_MBP,
+            depth=5,
+        )
+
+        # Assert
+        msg = data_client.fix_client.send_message.call_args[0][0]
+        assert msg.get(262) == b"OrderBook5-XBT/USD.LMAX"  # MDReqID
+        assert msg.get(264) == b"5"  # MarketDepth
+        assert msg.get(48) == b"100934"  # SecurityID
+
+    @pytest.mark.asyncio
+    async def test_subscribe_order_book_deltas_without_depth_requests_full_book(self, data_client):
+        # Arrange
+        data_client.fix_client.send_message = AsyncMock()
+
+        # Act
+        await data_client._subscribe_order_book_deltas(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+            book_type=BookType.L2_MBP,
+        )
+
+        # Assert
+        msg = data_client.fix_client.send_message.call_args[0][0]
+        assert msg.get(264) == b"0"  # MarketDepth: Full Book
+
+    @pytest.mark.asyncio
+    async def test_handle_order_book_snapshot_emits_deltas(self, data_client):
+        # Arrange
+        data_client._handle_data = Mock()
+        data_client.fix_client.send_message = AsyncMock()
+        await data_client._subscribe_order_book_deltas(
+            instrument_id=InstrumentId.from_str("XBT/USD.LMAX"),
+            book_type=BookType.L2_MBP,
+            depth=5,
+        )
+
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            line = f.readline().strip().replace("262=BTC/USD.LMAX", "262=OrderBook5-XBT/USD.LMAX")
+            msg = decode_frame(string_to_raw(line))
+
+        # Act
+        data_client._handle_market_data_update(msg)
+        data_client._handle_market_data_update(msg)
+
+        # Assert
+        assert data_client._handle_data.call_count == 1  # unchanged book is not emitted
+        deltas = data_client._handle_data.call_args[0][0]
+        assert len(deltas.deltas) == 3  # clear, bid, ask
+
     @pytest.mark.asyncio
     async def test_handle_reject(self, data_client):
         with open(FIX_RESPONSES / "market_data_request_reject.txt") as f:
             msg: ExecutionReport = string_to_message(f.readline())
-        data_client._handle_market_data_reject = Mock()
 
         # Act
-        await data_client.handle_message(msg)
-        assert data_client._handle_market_data_reject.call_count == 1
+        await data_client.fix_client._router.dispatch(msg)
+
+        # Assert
+        stats = data_client.fix_client.route_stats
+        assert stats[("Y", "LmaxLiveDataClient._handle_market_data_reject")].count == 1
 
     @pytest.mark.asyncio
     async def test_request_second_bars_with_limit_only(self, data_client):
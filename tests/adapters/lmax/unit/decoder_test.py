@@ -0,0 +1,107 @@
+from simplefix import FixMessage
+
+from pytower.adapters.lmax.fix.decoder import ExecutionReportView
+from pytower.adapters.lmax.fix.decoder import FixFrame
+from pytower.adapters.lmax.fix.decoder import MarketDataSnapshotFullRefreshView
+from pytower.adapters.lmax.fix.decoder import TradeCaptureReportView
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.decoder import peek_message_type
+from pytower.adapters.lmax.fix.messages import ExecutionReport
+from pytower.adapters.lmax.fix.messages import raw_to_message
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _read_raw(filename: str, line: int = 0) -> bytes:
+    with open(FIX_RESPONSES / filename) as f:
+        return string_to_raw(f.readlines()[line].strip())
+
+
+class TestFixDecoder:
+    def test_peek_message_type(self):
+        # Arrange
+        raw = _read_raw("market_data_snapshot_full_refresh.txt")
+
+        # Act, Assert
+        assert peek_message_type(raw) == b"W"
+        assert peek_message_type(b"garbage") is None
+
+    def test_decode_frame_returns_typed_view(self):
+        # Arrange, Act
+        view1 = decode_frame(_read_raw("market_data_snapshot_full_refresh.txt"))
+        view2 = decode_frame(_read_raw("limit_order_filled_buy.txt"))
+        view3 = decode_frame(_read_raw("trade_report1.txt", line=1))
+        view4 = decode_frame(_read_raw("logon.txt"))
+
+        # Assert
+        assert type(view1) is MarketDataSnapshotFullRefreshView
+        assert type(view2) is ExecutionReportView
+        assert type(view3) is TradeCaptureReportView
+        assert type(view4) is FixFrame
+        assert view4.message_type == b"A"
+
+    def test_get_matches_simplefix(self):
+        # Arrange
+        raw = _read_raw("limit_order_filled_buy.txt")
+        msg: FixMessage = raw_to_message(raw)
+
+        # Act
+        view = decode_frame(raw)
+
+        # Assert
+        for tag in (1, 6, 11, 14, 31, 32, 37, 38, 39, 40, 44, 48, 54, 59, 60, 150, 527):
+            assert view.get(tag) == msg.get(tag)
+        assert view.get(58) is None
+        assert view.get(48, nth=2) is None
+
+    def test_only_well_formed_indexed_tags_are_indexed(self):
+        # Arrange
+        raw = b"8=FIX.4.4\x0135=0\x01035=1\x013a=2\x011044=3\x01912=4\x0144=5\x0110=000\x01"
+
+        # Act
+        view = FixFrame(raw)
+
+        # Assert
+        assert view.message_type == b"0"
+        assert view.count(35) == 1
+        assert view.get(44) == b"5"
+        assert view.get(912) == b"4"
+        assert view.get(10) is None
+
+    def test_market_data_entries_by_position(self):
+        # Arrange
+        view = decode_frame(_read_raw("market_data_snapshot_full_refresh.txt"))
+
+        # Act, Assert
+        assert view.security_id == 100934
+        assert view.entry_count == 2
+        assert view.entry_type(0) == b"0"
+        assert view.entry_price(0) == b"29384.72"
+        assert view.entry_size(0) == b"4.97"
+        assert view.entry_type(1) == b"1"
+        assert view.entry_price(1) == b"29389"
+        assert view.entry_size(1) == b"4.95"
+        assert view.entry_price(2) is None
+        assert view.get(270, nth=2) == b"29389"
+        assert view.get(272) == b"20230731"
+        assert view.get(273) == b"11:04:39.440"
+
+    def test_market_data_no_entries(self):
+        # Arrange
+        view = decode_frame(_read_raw("market_data_snapshot_full_refresh_no_data.txt"))
+
+        # Act, Assert
+        assert view.get_int(268) == 0
+        assert view.entry_count == 0
+        assert view.entry_price(0) is None
+
+    def test_to_message(self):
+        # Arrange
+        view = decode_frame(_read_raw("limit_order_filled_buy.txt"))
+
+        # Act
+        msg = view.to_message()
+
+        # Assert
+        assert type(msg) is ExecutionReport
+        assert msg.get(37) == view.get(37)
@@ -0,0 +1,108 @@
+import pytest
+
+from pytower.adapters.lmax.fix.encoder import FixTemplate
+from pytower.adapters.lmax.fix.messages import NewOrderSingle
+from pytower.adapters.lmax.fix.messages import OrderCancelRequest
+from pytower.adapters.lmax.fix.messages import raw_to_message
+
+
+def _limit_order_template() -> FixTemplate:
+    return FixTemplate(
+        NewOrderSingle,
+        [
+            (11, None),  # ClOrdID
+            (48, None),  # SecurityID
+            (22, 8),  # SecurityIDSource
+            (54, None),  # Side
+            (60, "19700101-00:00:00"),  # TransactTime
+            (38, None),  # OrderQty
+            (18, "H"),  # ExecInst
+            (40, 2),  # OrdType
+            (44, None),  # Price
+            (59, 1),  # TimeInForce
+        ],
+        sender_comp_id="ghill2",
+        target_comp_id="LMXBD",
+    )
+
+
+class TestFixTemplate:
+    def test_encode_matches_simplefix(self):
+        # Arrange
+        template = _limit_order_template()
+
+        msg = NewOrderSingle()
+        msg.append_pair(8, "FIX.4.4", header=True)
+        msg.append_pair(35, msg.message_type, header=True)
+        msg.append_pair(49, "ghill2", header=True)
+        msg.append_pair(56, "LMXBD", header=True)
+        msg.append_pair(34, 12, header=True)
+        msg.append_pair(52, "20230915-10:48:49.193000", header=True)
+        msg.append_pair(11, "a90dd4d7-c530-4add-8")
+        msg.append_pair(48, 100934)
+        msg.append_pair(22, 8)
+        msg.append_pair(54, 1)
+        msg.append_pair(60, "19700101-00:00:00")
+        msg.append_pair(38, "0.01")
+        msg.append_pair(18, "H")
+        msg.append_pair(40, 2)
+        msg.append_pair(44, "1.23")
+        msg.append_pair(59, 1)
+
+        # Act
+        raw = template.encode(
+            12,
+            b"20230915-10:48:49.193000",
+            "a90dd4d7-c530-4add-8",
+            100934,
+            1,
+            "0.01",
+            "1.23",
+        )
+
+        # Assert
+        assert raw == msg.encode()
+
+    def test_encode_reuses_buffer_between_messages(self):
+        # Arrange
+        template = _limit_order_template()
+
+        # Act
+        raw1 = template.encode(1, b"20230915-10:48:49.193000", "a", 100934, 1, "0.01", "1.23")
+        raw2 = template.encode(2, b"20230915-10:48:49.194000", "bb", 4001, 2, "10", "1.12345")
+
+        # Assert
+        msg1 = raw_to_message(raw1)
+        msg2 = raw_to_message(raw2)
+        assert msg1.get(11) == b"a"
+        assert msg2.get(11) == b"bb"
+        assert msg2.get(34) == b"2"
+        assert msg2.get(44) == b"1.12345"
+
+    def test_encode_wrong_value_count_raises(self):
+        # Arrange
+        template = _limit_order_template()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            template.encode(1, b"20230915-10:48:49.193000", "a", 100934)
+
+    def test_to_message(self):
+        # Arrange
+        template = FixTemplate(
+            OrderCancelRequest,
+            [(11, None), (41, None), (48, None), (22, 8), (60, "19700101-00:00:00")],
+            sender_comp_id="ghill2",
+            target_comp_id="LMXBD",
+        )
+
+        # Act
+        msg = template.to_message("request_id1", "a90dd4d7-c530-4add-8", 100934)
+
+        # Assert
+        assert type(msg) is OrderCancelRequest
+        assert msg.get(11) == b"request_id1"
+        assert msg.get(41) == b"a90dd4d7-c530-4add-8"
+        assert msg.get(48) == b"100934"
+        assert msg.get(22) == b"8"
+        assert len(msg.pairs) == 5
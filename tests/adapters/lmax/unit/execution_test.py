@@ -47,7 +47,7 @@ class TestExecutionClient:
         `LIMIT` order.
         """
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client.generate_order_submitted = Mock()
 
         order = LimitOrder(
@@ -76,9 +76,10 @@ class TestExecutionClient:
         await exec_client._submit_order(command=submit_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is NewOrderSingle
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
@@ -112,7 +113,7 @@ class TestExecutionClient:
         `LIMIT` order.
         """
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client.generate_order_submitted = Mock()
         order = LimitOrder(
             trader_id=TestIdStubs.trader_id(),
@@ -140,9 +141,10 @@ class TestExecutionClient:
         await exec_client._submit_order(command=submit_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is NewOrderSingle
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
@@ -172,10 +174,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_submit_market_order_sell(self, exec_client):
         # Arrange
-        fix_client = exec_client.fix_client
-        fix_client.send_message = AsyncMock()
-
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client.generate_order_submitted = Mock()
 
         order = MarketOrder(
@@ -203,9 +202,10 @@ class TestExecutionClient:
         await exec_client._submit_order(command=submit_order)
 
         # Assert
-        msg = fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is NewOrderSingle
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
@@ -234,10 +234,7 @@ class TestExecutionClient:
 
     @pytest.mark.asyncio
     async def test_submit_market_order_buy(self, exec_client):
-        fix_client = exec_client.fix_client
-        fix_client.send_message = AsyncMock()
-
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client.generate_order_submitted = Mock()
 
         order = MarketOrder(
@@ -265,9 +262,10 @@ class TestExecutionClient:
         await exec_client._submit_order(command=submit_order)
 
         # Assert
-        msg = fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is NewOrderSingle
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
@@ -297,7 +295,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_cancel_limit_order(self, exec_client):
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 
         order = LimitOrder(
@@ -326,9 +324,10 @@ class TestExecutionClient:
         await exec_client._cancel_order(command=cancel_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is OrderCancelRequest
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(22) == b"8"  # SecurityIDSource: Must contain the value '8' (Exchange Symbol)
@@ -431,7 +430,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_modify_limit_order_buy(self, exec_client):
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 
         order = LimitOrder(
@@ -465,9 +464,10 @@ class TestExecutionClient:
         await exec_client._modify_order(command=modify_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is OrderCancelReplaceRequest
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(11) == b"request_id1"  # ClOrdId
@@ -485,7 +485,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_modify_limit_order_sell(self, exec_client):
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 
         order = LimitOrder(
@@ -519,9 +519,10 @@ class TestExecutionClient:
         await exec_client._modify_order(command=modify_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is OrderCancelReplaceRequest
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(11) == b"request_id1"  # ClOrdId
@@ -539,7 +540,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_modify_limit_order_quantity_none_uses_order_quantity(self, exec_client):
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 
         order = LimitOrder(
@@ -573,9 +574,10 @@ class TestExecutionClient:
         await exec_client._modify_order(command=modify_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is OrderCancelReplaceRequest
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(11) == b"request_id1"  # ClOrdId
@@ -593,7 +595,7 @@ class TestExecutionClient:
     @pytest.mark.asyncio
     async def test_modify_limit_order_price_none_uses_order_price(self, exec_client):
         # Arrange
-        exec_client.fix_client.send_message = AsyncMock()
+        exec_client.fix_client.send_template = AsyncMock()
         exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 
         order = LimitOrder(
@@ -627,9 +629,10 @@ class TestExecutionClient:
         await exec_client._modify_order(command=modify_order)
 
         # Assert
-        msg = exec_client.fix_client.send_message.call_args[0][0]
+        template, *values = exec_client.fix_client.send_template.call_args[0]
+        msg = template.to_message(*values)
 
-        exec_client.fix_client.send_message.assert_called_once()
+        exec_client.fix_client.send_template.assert_called_once()
         assert type(msg) is OrderCancelReplaceRequest
         assert msg.get(48) == b"100934"  # SecurityId
         assert msg.get(11) == b"request_id1"  # ClOrdId
@@ -1270,7 +1273,7 @@ class TestExecutionClient:
 
 # exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 # exec_client._utc_now = Mock(return_value=pd.Timestamp("2023-09-16 10:29:44.694348+00:00", tz="UTC"))
-# exec_client.fix_client.send_message = AsyncMock()
+# exec_client.fix_client.send_template = AsyncMock()
 # exec_client._generate_request_id = AsyncMock(return_value="request_id1")
 # exec_client._utc_now = Mock(return_value=pd.Timestamp("2023-09-16 10:29:44.694348+00:00", tz="UTC"))
 # exec_client._generate_request_id = AsyncMock(return_value="request_id1")
@@ -0,0 +1,90 @@
+from pytower.adapters.lmax.fix.framing import FixFramer
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _read_raw(filename: str) -> bytes:
+    with open(FIX_RESPONSES / filename) as f:
+        return string_to_raw(f.readline().strip())
+
+
+class TestFixFramer:
+    def test_feed_single_frame(self):
+        # Arrange
+        framer = FixFramer()
+        raw = _read_raw("market_data_snapshot_full_refresh.txt")
+
+        # Act
+        frames = framer.feed(raw)
+
+        # Assert
+        assert frames == [raw]
+        assert framer.buffered == 0
+
+    def test_feed_extracts_all_frames_in_one_read(self):
+        # Arrange
+        framer = FixFramer()
+        raw1 = _read_raw("market_data_snapshot_full_refresh.txt")
+        raw2 = _read_raw("limit_order_filled_buy.txt")
+        raw3 = _read_raw("logon.txt")
+
+        # Act
+        frames = framer.feed(raw1 + raw2 + raw3)
+
+        # Assert
+        assert frames == [raw1, raw2, raw3]
+        assert framer.buffered == 0
+
+    def test_feed_frame_split_across_reads(self):
+        # Arrange
+        framer = FixFramer()
+        raw1 = _read_raw("market_data_snapshot_full_refresh.txt")
+        raw2 = _read_raw("limit_order_filled_buy.txt")
+        data = raw1 + raw2
+
+        # Act
+        frames = []
+        for i in range(len(data)):
+            frames.extend(framer.feed(data[i : i + 1]))
+
+        # Assert
+        assert frames == [raw1, raw2]
+        assert framer.buffered == 0
+
+    def test_feed_keeps_incomplete_frame(self):
+        # Arrange
+        framer = FixFramer()
+        raw1 = _read_raw("market_data_snapshot_full_refresh.txt")
+        raw2 = _read_raw("limit_order_filled_buy.txt")
+
+        # Act
+        frames1 = framer.feed(raw1 + raw2[:50])
+        frames2 = framer.feed(raw2[50:])
+
+        # Assert
+        assert frames1 == [raw1]
+        assert frames2 == [raw2]
+
+    def test_feed_skips_leading_garbage(self):
+        # Arrange
+        framer = FixFramer()
+        raw = _read_raw("logon.txt")
+
+        # Act
+        frames = framer.feed(b"garbage\x01" + raw)
+
+        # Assert
+        assert frames == [raw]
+
+    def test_feed_resyncs_after_corrupt_body_length(self):
+        # Arrange
+        framer = FixFramer()
+        raw = _read_raw("logon.txt")
+        corrupt = raw.replace(b"\x019=73\x01", b"\x019=70\x01")
+
+        # Act
+        frames = framer.feed(corrupt + raw)
+
+        # Assert
+        assert frames == [raw]
+        assert framer.discarded_count == 1
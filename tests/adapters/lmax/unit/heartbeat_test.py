@@ -0,0 +1,162 @@
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from pytower.adapters.lmax.common import LatencyHistogram
+from pytower.adapters.lmax.fix.heartbeat import FixHeartbeatEngine
+from pytower.adapters.lmax.fix.messages import Heartbeat
+
+
+def _fix_client(clock: LiveClock) -> Mock:
+    fix_client = Mock()
+    fix_client.last_sent_ns = clock.timestamp_ns()
+    fix_client.last_received_ns = clock.timestamp_ns()
+    fix_client.send_message = AsyncMock()
+    return fix_client
+
+
+def _engine(fix_client: Mock, clock: LiveClock, **kwargs) -> FixHeartbeatEngine:
+    return FixHeartbeatEngine(
+        fix_client=fix_client,
+        clock=clock,
+        logger=Logger(clock=clock),
+        heartbeat_interval_seconds=30,
+        **kwargs,
+    )
+
+
+def _sent_types(fix_client: Mock) -> list[str]:
+    return [type(call[0][0]).__name__ for call in fix_client.send_message.call_args_list]
+
+
+class TestFixHeartbeatEngine:
+    @pytest.mark.asyncio
+    async def test_check_sends_nothing_while_active(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        engine = _engine(fix_client, clock)
+
+        # Act
+        await engine.check()
+
+        # Assert
+        assert fix_client.send_message.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_check_sends_heartbeat_when_outbound_idle(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        fix_client.last_sent_ns -= 31_000_000_000
+        engine = _engine(fix_client, clock)
+
+        # Act
+        await engine.check()
+
+        # Assert
+        assert _sent_types(fix_client) == ["Heartbeat"]
+
+    @pytest.mark.asyncio
+    async def test_check_sends_test_request_when_inbound_idle(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        fix_client.last_received_ns -= 37_000_000_000
+        engine = _engine(fix_client, clock)
+
+        # Act
+        await engine.check()
+        await engine.check()
+
+        # Assert
+        assert _sent_types(fix_client) == ["TestRequest"]
+
+    @pytest.mark.asyncio
+    async def test_check_probes_again_after_an_unanswered_test_request(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        fix_client.last_received_ns -= 37_000_000_000
+        engine = _engine(fix_client, clock)
+        await engine.check()
+
+        # Act
+        engine._last_test_request_ns -= 37_000_000_000  # unanswered within the timeout
+        await engine.check()
+
+        # Assert
+        assert _sent_types(fix_client) == ["TestRequest", "TestRequest"]
+
+    @pytest.mark.asyncio
+    async def test_check_sends_scheduled_test_requests(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        engine = _engine(fix_client, clock, test_request_interval_seconds=60)
+
+        # Act
+        await engine.check()
+        await engine.check()
+
+        # Assert
+        assert _sent_types(fix_client) == ["TestRequest"]
+        assert fix_client.send_message.call_args[0][0].get(112) == b"RTT-1"
+
+    @pytest.mark.asyncio
+    async def test_matching_heartbeat_records_round_trip_time(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        engine = _engine(fix_client, clock)
+        request_id = await engine.send_test_request()
+        heartbeat = Heartbeat()
+        heartbeat.append_pair(112, request_id)  # TestReqID
+
+        # Act
+        engine.handle_heartbeat(heartbeat)
+        engine.handle_heartbeat(heartbeat)
+        engine.handle_heartbeat(Heartbeat())
+
+        # Assert
+        assert len(engine.histogram) == 1
+        assert engine.histogram.last_ns >= 0
+
+
+class TestLatencyHistogram:
+    def test_percentiles_over_rolling_window(self):
+        # Arrange
+        histogram = LatencyHistogram(size=100)
+
+        # Act
+        for latency_us in range(1, 201):
+            histogram.add(latency_us * 1_000)
+
+        # Assert
+        assert histogram.count == 200
+        assert len(histogram) == 100
+        assert histogram.percentile(0) == 101_000
+        assert histogram.percentile(50) == 151_000
+        assert histogram.percentile(100) == 200_000
+
+    def test_buckets(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for latency_ns in (500, 1_000, 3_000, 4_000, 1_000_000):
+            histogram.add(latency_ns)
+
+        # Assert
+        assert histogram.buckets() == {1: 2, 4: 2, 1024: 1}
+
+    def test_empty(self):
+        # Arrange, Act
+        histogram = LatencyHistogram()
+
+        # Assert
+        assert histogram.percentile(50) is None
+        assert histogram.last_ns is None
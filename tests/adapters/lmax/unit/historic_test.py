@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+from pytower.adapters.lmax.xml.enums import LmaxAggregateOption
+from pytower.adapters.lmax.xml.enums import LmaxAggregateResolution
+from pytower.adapters.lmax.xml.historic import LmaxBarDataGenerator
+from pytower.adapters.lmax.xml.session import LmaxInstructionRejectedError
+from pytower.adapters.lmax.xml.util import unpretty_xml
+from pytower.tests.adapters.lmax import XML_RESPONSES
+from pytower.tests.adapters.lmax.stubs import LMAXStubs
+
+
+_REJECTED = (
+    "<events><body><instructionRejected><instructionId>1</instructionId>"
+    "<accountId>1</accountId><reason>INVALID_ORDER_BOOK_ID</reason>"
+    "</instructionRejected></body></events>"
+)
+
+
+def _data_gen(*events: str, timeout_seconds: float = 60.0) -> LmaxBarDataGenerator:
+    xml_client = LMAXStubs.offline_xml_client()
+    xml_client._historic_timeout_seconds = timeout_seconds
+    xml_client.ensure_subscribed = AsyncMock()
+    is_requested = asyncio.Event()
+    xml_client.request = AsyncMock(side_effect=lambda **kwargs: is_requested.set())
+
+    async def stream():
+        await is_requested.wait()
+        for xml_data in events:
+            yield xml_data
+        await asyncio.Event().wait()  # the stream stays open
+
+    xml_client._iter_stream = stream
+    return LmaxBarDataGenerator(
+        xml_client=xml_client,
+        security_id=4001,
+        start=pd.Timestamp("2023-01-03 23:00:00", tz="UTC"),
+        option=LmaxAggregateOption.BID,
+        resolution=LmaxAggregateResolution.MINUTE,
+        logger=xml_client.logger,
+    )
+
+
+class TestFetchUrls:
+    @pytest.mark.asyncio
+    async def test_returns_the_urls_of_the_instruction(self):
+        # Arrange
+        with open(XML_RESPONSES / "urls_aggregate.xml") as f:
+            data_gen = _data_gen(unpretty_xml(f.read()))
+
+        # Act
+        urls = await data_gen._fetch_urls(body="<req/>", instruction_id=1)
+
+        # Assert
+        assert len(urls) > 0
+        assert data_gen._xml_client.scheduler.active("historic") == 0
+        await data_gen._xml_client.event_stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_rejected_instruction_raises(self):
+        # Arrange
+        data_gen = _data_gen(_REJECTED)
+
+        # Act, Assert
+        with pytest.raises(LmaxInstructionRejectedError, match="INVALID_ORDER_BOOK_ID"):
+            await data_gen._fetch_urls(body="<req/>", instruction_id=1)
+        assert data_gen._xml_client.scheduler.active("historic") == 0
+        await data_gen._xml_client.event_stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_missing_urls_time_out_and_free_the_slot(self):
+        # Arrange
+        data_gen = _data_gen(timeout_seconds=0.01)
+
+        # Act, Assert
+        with pytest.raises(asyncio.TimeoutError):
+            await data_gen._fetch_urls(body="<req/>", instruction_id=1)
+        assert data_gen._xml_client.scheduler.active("historic") == 0
+        await data_gen._xml_client.event_stream.stop()
@@ -0,0 +1,205 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.ingest import MarketDataIngestSubscriptions
+from pytower.adapters.lmax.fix.ingest import MarketDataRecordWriter
+from pytower.adapters.lmax.fix.ingest import MarketDataRingBuffer
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _record(i: int) -> tuple:
+    return (100934, i, i + 1, i + 2, i + 3, i + 4)
+
+
+@pytest.fixture()
+def ring():
+    ring = MarketDataRingBuffer(capacity=8)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+class TestMarketDataRingBuffer:
+    def test_reader_reads_written_records_in_order(self, ring):
+        # Arrange
+        reader = ring.reader()
+
+        # Act
+        for i in range(5):
+            ring.write(*_record(i))
+        records = reader.read_batch()
+
+        # Assert
+        assert records == [_record(i) for i in range(5)]
+        assert reader.read_batch() == []
+
+    def test_read_batch_wraps_around(self, ring):
+        # Arrange
+        reader = ring.reader()
+        for i in range(6):
+            ring.write(*_record(i))
+        reader.read_batch()
+
+        # Act
+        for i in range(6, 12):
+            ring.write(*_record(i))
+        records = reader.read_batch(max_count=4)
+        records += reader.read_batch()
+
+        # Assert
+        assert records == [_record(i) for i in range(6, 12)]
+        assert reader.dropped_count == 0
+
+    def test_slow_reader_drops_overwritten_records(self, ring):
+        # Arrange
+        reader = ring.reader()
+
+        # Act
+        for i in range(20):
+            ring.write(*_record(i))
+        records = reader.read_batch()
+
+        # Assert
+        assert records == [_record(i) for i in range(13, 20)]
+        assert reader.dropped_count == 13
+
+    def test_record_in_the_slot_being_written_is_dropped(self, ring):
+        # Arrange
+        reader = ring.reader()
+        for i in range(7):
+            ring.write(*_record(i))
+        records = ring._read
+
+        def read_while_writing(start, end):
+            copied = records(start, end)
+            ring.write(*_record(7))  # record 8 may now be written over record 0
+            return copied
+
+        ring._read = read_while_writing
+
+        # Act
+        records_read = reader.read_batch()
+
+        # Assert
+        assert records_read == [_record(i) for i in range(1, 7)]
+        assert reader.dropped_count == 1
+
+    def test_readers_are_independent_and_attach_by_name(self, ring):
+        # Arrange
+        attached = MarketDataRingBuffer(name=ring.name, create=False)
+        first = ring.reader()
+        second = attached.reader()
+
+        # Act
+        ring.write(*_record(1))
+        first_records = first.read_batch()
+        ring.write(*_record(2))
+
+        # Assert
+        assert attached.capacity == 8
+        assert first_records == [_record(1)]
+        assert first.read_batch() == [_record(2)]
+        assert second.read_batch() == [_record(1), _record(2)]
+        attached.close()
+
+
+class TestMarketDataRecordWriter:
+    def test_handle_snapshot_writes_raw_record(self, ring):
+        # Arrange
+        reader = ring.reader()
+        writer = MarketDataRecordWriter(ring)
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        writer.handle_snapshot(msg)
+
+        # Assert
+        assert reader.read_batch() == [
+            (
+                100934,
+                29384_720_000_000,
+                4_970_000_000,
+                29389_000_000_000,
+                4_950_000_000,
+                1690801479440000000,
+            ),
+        ]
+
+    def test_handle_snapshot_skips_empty_snapshot(self, ring):
+        # Arrange
+        reader = ring.reader()
+        writer = MarketDataRecordWriter(ring)
+        with open(FIX_RESPONSES / "market_data_snapshot_full_refresh_no_data.txt") as f:
+            msg = decode_frame(string_to_raw(f.readline().strip()))
+
+        # Act
+        writer.handle_snapshot(msg)
+
+        # Assert
+        assert reader.read_batch() == []
+
+
+    def test_handle_snapshot_skips_one_sided_snapshot(self, ring):
+        # Arrange
+        reader = ring.reader()
+        writer = MarketDataRecordWriter(ring)
+        msg = decode_frame(
+            string_to_raw(
+                "8=FIX.4.4|35=W|49=LMXBDM|56=ghill2|34=2|52=20230731-11:04:40.161|"
+                "262=BTC/USD.LMAX|48=100934|22=8|268=1|"
+                "269=1|270=29389|271=4.95|272=20230731|273=11:04:39.440|10=157",
+            ),
+        )
+
+        # Act
+        writer.handle_snapshot(msg)
+
+        # Assert
+        assert reader.read_batch() == []
+
+class TestMarketDataIngestSubscriptions:
+    @pytest.mark.asyncio
+    async def test_unsubscribe_of_one_instrument_of_request(self):
+        # Arrange
+        send = AsyncMock()
+        subscriptions = MarketDataIngestSubscriptions(send)
+        await subscriptions.subscribe([1, 2, 3])
+
+        # Act
+        await subscriptions.unsubscribe([2])
+        await subscriptions.unsubscribe([3])
+
+        # Assert
+        assert [call.args for call in send.await_args_list] == [
+            ("QuoteTick-subscribe-1", [1, 2, 3], True),
+            ("QuoteTick-subscribe-1", [2], False),
+            ("QuoteTick-subscribe-2", [1, 3], True),
+            ("QuoteTick-subscribe-2", [3], False),
+            ("QuoteTick-subscribe-3", [1], True),
+        ]
+        assert subscriptions.security_ids == [1]
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_moves_every_instrument_to_one_request(self):
+        # Arrange
+        send = AsyncMock()
+        subscriptions = MarketDataIngestSubscriptions(send)
+        await subscriptions.subscribe([1])
+        await subscriptions.subscribe([2, 1])
+        await subscriptions.unsubscribe([4])
+
+        # Act
+        await subscriptions.resubscribe()
+        await subscriptions.unsubscribe([1, 2])
+
+        # Assert
+        assert [call.args for call in send.await_args_list] == [
+            ("QuoteTick-subscribe-1", [1], True),
+            ("QuoteTick-subscribe-2", [2], True),
+            ("QuoteTick-subscribe-3", [1, 2], True),
+            ("QuoteTick-subscribe-3", [1, 2], False),
+        ]
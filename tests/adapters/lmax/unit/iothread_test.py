@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from pytower.adapters.lmax.fix.iothread import FixIoThread
+
+
+_FRAME = b"8=FIX.4.4\x019=5\x0135=0\x0110=000\x01"
+
+
+async def _start_server(handler) -> tuple[asyncio.AbstractServer, int]:
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def _read_until(io: FixIoThread, count: int) -> list[bytes] | None:
+    frames = []
+    while len(frames) < count:
+        batch = await io.read_frames()
+        if batch is None:
+            return None
+        frames.extend(batch)
+    return frames
+
+
+class TestFixIoThread:
+    @pytest.mark.asyncio
+    async def test_read_frames_hands_off_complete_frames(self):
+        # Arrange
+        async def handler(reader, writer):
+            writer.write(_FRAME * 3 + _FRAME[:10])
+            await writer.drain()
+            writer.write(_FRAME[10:])
+            await writer.drain()
+
+        server, port = await _start_server(handler)
+        io = FixIoThread()
+
+        # Act
+        await io.connect("127.0.0.1", port, None)
+        frames = await _read_until(io, 4)
+
+        # Assert
+        assert frames == [_FRAME] * 4
+        assert io.is_running
+        io.close()
+        await io.wait_closed()
+        assert not io.is_running
+        server.close()
+
+    @pytest.mark.asyncio
+    async def test_write_is_sent_from_io_thread(self):
+        # Arrange
+        received = asyncio.get_running_loop().create_future()
+
+        async def handler(reader, writer):
+            received.set_result(await reader.readexactly(len(_FRAME) * 2))
+
+        server, port = await _start_server(handler)
+        io = FixIoThread()
+        await io.connect("127.0.0.1", port, None)
+
+        # Act
+        io.write(_FRAME)
+        io.write(_FRAME)
+        await io.drain()
+
+        # Assert
+        assert await asyncio.wait_for(received, timeout=1) == _FRAME * 2
+        assert io.get_write_buffer_size() == 0
+        io.close()
+        await io.wait_closed()
+        server.close()
+
+    @pytest.mark.asyncio
+    async def test_read_frames_returns_none_on_eof(self):
+        # Arrange
+        async def handler(reader, writer):
+            writer.write(_FRAME)
+            await writer.drain()
+            writer.close()
+
+        server, port = await _start_server(handler)
+        io = FixIoThread()
+        await io.connect("127.0.0.1", port, None)
+
+        # Act
+        frames = await _read_until(io, 1)
+        eof = await io.read_frames()
+
+        # Assert
+        assert frames == [_FRAME]
+        assert eof is None
+        io.close()
+        await io.wait_closed()
+        server.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_stops_thread(self):
+        # Arrange
+        server, port = await _start_server(lambda reader, writer: None)
+        server.close()
+        await server.wait_closed()
+        io = FixIoThread()
+
+        # Act, Assert
+        with pytest.raises(OSError):
+            await io.connect("127.0.0.1", port, None)
+        assert not io.is_running
@@ -0,0 +1,116 @@
+from pytower.adapters.lmax.fix.journal import INBOUND
+from pytower.adapters.lmax.fix.journal import OUTBOUND
+from pytower.adapters.lmax.fix.journal import FixJournal
+from pytower.adapters.lmax.fix.journal import JournalRecord
+from pytower.adapters.lmax.fix.journal import format_record
+from pytower.adapters.lmax.fix.journal import main
+from pytower.adapters.lmax.fix.journal import read_journal
+from pytower.adapters.lmax.fix.journal import segment_paths
+
+
+def _snapshot(security_id: int) -> bytes:
+    return b"8=FIX.4.4\x019=20\x0135=W\x0148=%d\x01268=0\x0110=000\x01" % security_id
+
+
+_HEARTBEAT = b"8=FIX.4.4\x019=5\x0135=0\x0110=000\x01"
+
+
+class TestFixJournal:
+    def test_frames_are_read_back_in_order(self, tmp_path):
+        # Arrange
+        journal = FixJournal(path=tmp_path, session_id="session")
+
+        # Act
+        journal.write_frames(1_000, INBOUND, [_snapshot(4001), _snapshot(4002)])
+        journal.write(2_000, OUTBOUND, _HEARTBEAT)
+        journal.close()
+
+        # Assert
+        records = list(read_journal(tmp_path))
+        assert [(r.ts_ns, r.direction, r.frame) for r in records] == [
+            (1_000, INBOUND, _snapshot(4001)),
+            (1_000, INBOUND, _snapshot(4002)),
+            (2_000, OUTBOUND, _HEARTBEAT),
+        ]
+
+    def test_unclosed_segment_is_read_up_to_the_last_record(self, tmp_path):
+        # Arrange
+        journal = FixJournal(path=tmp_path, session_id="session")
+        journal.write(1_000, INBOUND, _HEARTBEAT)
+
+        # Act
+        journal.flush()
+
+        # Assert
+        assert [r.frame for r in read_journal(tmp_path)] == [_HEARTBEAT]
+
+    def test_full_segment_rolls_and_oldest_segments_are_removed(self, tmp_path):
+        # Arrange
+        journal = FixJournal(path=tmp_path, session_id="session", segment_size=64, max_segments=2)
+
+        # Act
+        for i in range(5):
+            journal.write(1_000 + i, INBOUND, _snapshot(4000 + i))
+        journal.close()
+
+        # Assert
+        paths = segment_paths(tmp_path, "session")
+        assert [path.name for path in paths] == ["session-000003.journal", "session-000004.journal"]
+        assert [r.ts_ns for r in read_journal(tmp_path)] == [1_003, 1_004]
+
+    def test_reopened_journal_starts_a_new_segment(self, tmp_path):
+        # Arrange
+        FixJournal(path=tmp_path, session_id="session").close()
+
+        # Act
+        journal = FixJournal(path=tmp_path, session_id="session")
+
+        # Assert
+        assert journal.segment_path.name == "session-000001.journal"
+
+    def test_read_journal_filters(self, tmp_path):
+        # Arrange
+        journal = FixJournal(path=tmp_path, session_id="session")
+        journal.write(1_000, INBOUND, _snapshot(4001))
+        journal.write(2_000, INBOUND, _snapshot(4002))
+        journal.write(3_000, OUTBOUND, _HEARTBEAT)
+        journal.write(4_000, INBOUND, _snapshot(4001))
+        journal.close()
+
+        # Act
+        records = read_journal(
+            tmp_path,
+            direction=INBOUND,
+            message_types={b"W"},
+            tags={48: b"4001"},
+            start_ns=2_000,
+        )
+
+        # Assert
+        assert [r.ts_ns for r in records] == [4_000]
+
+    def test_format_record(self):
+        # Arrange
+        record = JournalRecord(1_704_186_000_123_456_789, OUTBOUND, _HEARTBEAT)
+
+        # Act
+        line = format_record(record)
+
+        # Assert
+        assert line == "20240102-09:00:00.123456789 > 8=FIX.4.4|9=5|35=0|10=000|"
+
+    def test_main_decodes_filtered_records(self, tmp_path, capsys):
+        # Arrange
+        journal = FixJournal(path=tmp_path, session_id="session")
+        journal.write(1_704_186_000_000_000_000, INBOUND, _snapshot(4001))
+        journal.write(1_704_186_001_000_000_000, OUTBOUND, _HEARTBEAT)
+        journal.close()
+
+        # Act
+        main([str(tmp_path), "--direction", "out", "--since", "20240102-09:00:00"])
+
+        # Assert
+        assert capsys.readouterr().out == (
+            "20240102-09:00:01.000000000 > 8=FIX.4.4|9=5|35=0|10=000|\n"
+        )
+
@@ -0,0 +1,148 @@
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.monitor import FeedMonitor
+from pytower.adapters.lmax.monitor import TradingHours
+
+
+_WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]
+
+
+def _ns(value: str) -> int:
+    return pd.Timestamp(value, tz="UTC").value
+
+
+def _instrument(symbol: str = "EUR/USD", **info) -> Mock:
+    return Mock(id=InstrumentId.from_str(f"{symbol}.LMAX"), info=info)
+
+
+def _eur_usd() -> Mock:
+    # Sunday 17:05 to Friday 17:00 New York
+    return _instrument(
+        openingOffset=-415,
+        closingOffset=1020,
+        timezone="America/New_York",
+        tradingDays=_WEEKDAYS,
+    )
+
+
+@pytest.fixture()
+def monitor():
+    clock = LiveClock()
+    return FeedMonitor(clock=clock, logger=Logger(clock=clock), stale_threshold_seconds=10)
+
+
+class TestTradingHours:
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            ("2023-09-13 12:00", True),  # Wednesday
+            ("2023-09-15 20:59", True),  # Friday 16:59 New York
+            ("2023-09-15 21:00", False),  # Friday 17:00 New York
+            ("2023-09-16 12:00", False),  # Saturday
+            ("2023-09-17 21:04", False),  # Sunday 17:04 New York
+            ("2023-09-17 21:05", True),  # Sunday 17:05 New York
+        ],
+    )
+    def test_is_open(self, timestamp, expected):
+        # Arrange
+        trading_hours = TradingHours.from_instrument(_eur_usd())
+
+        # Act, Assert
+        assert trading_hours.is_open(_ns(timestamp)) is expected
+
+    def test_from_instrument_without_trading_hours(self):
+        assert TradingHours.from_instrument(_instrument()) is None
+
+
+class TestFeedMonitor:
+    def test_on_quote_records_latency(self, monitor):
+        # Arrange
+        instrument = _eur_usd()
+        monitor.register(instrument)
+
+        # Act
+        monitor.on_quote(instrument.id, ts_event=1_000_000, ts_init=3_000_000)
+        monitor.on_quote(instrument.id, ts_event=5_000_000, ts_init=6_000_000)
+
+        # Assert
+        stats = monitor.snapshot()[0]
+        assert stats.count == 2
+        assert stats.last_update_ns == 6_000_000
+        assert monitor.histogram(instrument.id).percentile(0) == 1_000_000
+        assert monitor.histogram(instrument.id).percentile(100) == 2_000_000
+
+    def test_on_quote_for_unregistered_instrument_is_ignored(self, monitor):
+        monitor.on_quote(_eur_usd().id, ts_event=0, ts_init=1)
+        assert monitor.snapshot() == []
+
+    def test_instrument_is_stale_without_updates_during_trading_hours(self, monitor):
+        # Arrange
+        instrument = _eur_usd()
+        monitor.register(instrument)
+        monitor.on_quote(instrument.id, ts_event=0, ts_init=_ns("2023-09-13 12:00"))
+
+        # Act, Assert
+        assert not monitor.is_stale(instrument.id, now_ns=_ns("2023-09-13 12:00:05"))
+        assert monitor.is_stale(instrument.id, now_ns=_ns("2023-09-13 12:00:11"))
+        assert monitor.stale_instruments(now_ns=_ns("2023-09-13 12:00:11")) == [instrument.id]
+
+    def test_instrument_is_not_stale_outside_trading_hours(self, monitor):
+        # Arrange
+        instrument = _eur_usd()
+        monitor.register(instrument)
+        monitor.on_quote(instrument.id, ts_event=0, ts_init=_ns("2023-09-15 20:59"))
+
+        # Act, Assert
+        assert not monitor.is_stale(instrument.id, now_ns=_ns("2023-09-16 12:00"))
+
+    def test_update_rates(self, monitor):
+        # Arrange
+        instrument = _eur_usd()
+        monitor.register(instrument)
+        monitor.update_rates(now_ns=0)
+        for i in range(20):
+            monitor.on_quote(instrument.id, ts_event=i, ts_init=i)
+
+        # Act
+        monitor.update_rates(now_ns=2_000_000_000)
+
+        # Assert
+        assert monitor.snapshot()[0].rate_per_second == 10.0
+
+    def test_unregister_stops_monitoring_and_keeps_other_slots(self, monitor):
+        # Arrange
+        eur_usd = _eur_usd()
+        gbp_usd = _instrument("GBP/USD")
+        monitor.register(eur_usd)
+        monitor.register(gbp_usd)
+        monitor.on_quote(gbp_usd.id, ts_event=1_000_000, ts_init=2_000_000)
+
+        # Act
+        monitor.unregister(eur_usd.id)
+        monitor.unregister(eur_usd.id)
+
+        # Assert
+        assert [stats.instrument_id for stats in monitor.snapshot()] == [gbp_usd.id]
+        assert monitor.snapshot()[0].count == 1
+        assert not monitor.is_stale(eur_usd.id, now_ns=_ns("2023-09-13 12:00:11"))
+        monitor.on_quote(gbp_usd.id, ts_event=3_000_000, ts_init=4_000_000)
+        assert monitor.snapshot()[0].count == 2
+
+    def test_snapshot_without_quote_is_not_stale(self, monitor):
+        # Arrange
+        instrument = _eur_usd()
+        monitor.register(instrument)
+        monitor.on_quote(instrument.id, ts_event=0, ts_init=_ns("2023-09-13 12:00"))
+
+        # Act
+        monitor.on_snapshot(instrument.id, ts_init=_ns("2023-09-13 12:00:08"))
+
+        # Assert
+        assert not monitor.is_stale(instrument.id, now_ns=_ns("2023-09-13 12:00:11"))
+        assert monitor.snapshot()[0].count == 1
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from nautilus_trader.model.objects import FIXED_PRECISION
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from pytower.adapters.lmax.fix.parsing import fixed_to_raw
+from pytower.adapters.lmax.fix.parsing import parse_fixed
+from pytower.adapters.lmax.fix.parsing import parse_price
+from pytower.adapters.lmax.fix.parsing import parse_quantity
+from pytower.adapters.lmax.fix.parsing import parse_raw
+from pytower.adapters.lmax.fix.parsing import parse_raw_batch
+
+
+def _float_raw(value: bytes, precision: int) -> int:
+    # the float path of Price(float(value), precision)
+    return round(float(value) * 10**precision) * 10 ** (FIXED_PRECISION - precision)
+
+
+def _random_decimals(count: int, precision: int, seed: int = 42) -> list[bytes]:
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        integer = rng.randrange(0, 100_000)
+        if precision == 0:
+            values.append(b"%d" % integer)
+            continue
+        fraction = b"%0*d" % (precision, rng.randrange(0, 10**precision))
+        values.append(b"%d.%s" % (integer, fraction.rstrip(b"0") or b"0"))
+    return values
+
+
+class TestParseFixed:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (b"29384.72", 29384_720_000_000),
+            (b"29389", 29389_000_000_000),
+            (b"0.000000001", 1),
+            (b"1.0000000019", 1_000_000_001),
+            (b"-0.5", -500_000_000),
+        ],
+    )
+    def test_parse_fixed(self, value, expected):
+        assert parse_fixed(value, 9) == expected
+
+
+class TestFixedToRaw:
+    @pytest.mark.parametrize(
+        ("value", "precision", "expected"),
+        [
+            (29384_720_000_000, 2, "29384.72"),
+            (1_093_125_000, 5, "1.09313"),  # half rounds away from zero
+            (1_093_124_999, 5, "1.09312"),
+            (-1_093_125_000, 5, "-1.09313"),
+            (1, 9, "0.000000001"),
+        ],
+    )
+    def test_fixed_to_raw(self, value, precision, expected):
+        # Arrange, Act
+        raw = fixed_to_raw(value, 9, precision)
+
+        # Assert
+        assert Price.from_raw(raw, precision) == Price.from_str(expected)
+
+
+class TestParseRaw:
+    @pytest.mark.parametrize(
+        ("value", "precision", "expected"),
+        [
+            (b"1.09312", 5, "1.09312"),
+            (b"1.0931", 5, "1.09310"),
+            (b"29389", 1, "29389.0"),
+            (b"83810.14592", 5, "83810.14592"),
+            (b"0.1", 0, "0"),
+            (b"1.093125", 5, "1.09313"),  # half rounds away from zero
+            (b"1.093124", 5, "1.09312"),
+            (b"-1.093125", 5, "-1.09313"),
+            (b"0.000000001", 9, "0.000000001"),
+        ],
+    )
+    def test_parse_raw(self, value, precision, expected):
+        # Arrange, Act
+        raw = parse_raw(value, precision)
+
+        # Assert
+        assert Price.from_raw(raw, precision) == Price.from_str(expected)
+        assert parse_price(value, precision) == Price.from_str(expected)
+
+    @pytest.mark.parametrize("precision", [0, 1, 2, 3, 5, 9])
+    def test_parse_raw_matches_float_path(self, precision):
+        for value in _random_decimals(5000, precision):
+            assert parse_raw(value, precision) == _float_raw(value, precision), value
+
+    @pytest.mark.parametrize("precision", [0, 2, 5])
+    def test_parse_raw_batch_matches_parse_raw(self, precision):
+        # Arrange
+        values = _random_decimals(1000, precision) + [b"1.0931251", b"-0.0000051", b"7."]
+
+        # Act
+        raws = parse_raw_batch(values, precision)
+
+        # Assert
+        assert raws == [parse_raw(value, precision) for value in values]
+
+    def test_parse_price_matches_float_path(self):
+        for value in _random_decimals(100, 5):
+            assert parse_price(value, 5) == Price(float(value), 5)
+
+    def test_parse_quantity_matches_float_path(self):
+        for value in _random_decimals(100, 2):
+            assert parse_quantity(value, 2) == Quantity(float(value), 2)
@@ -0,0 +1,139 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.adapters.lmax.fix.quotes import QuoteConflator
+from pytower.adapters.lmax.fix.quotes import QuoteContext
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _snapshot(bid_size: str = "4.97"):
+    with open(FIX_RESPONSES / "market_data_snapshot_full_refresh.txt") as f:
+        line = f.readline().strip()
+    return decode_frame(string_to_raw(line.replace("271=4.97", f"271={bid_size}")))
+
+
+# SecurityID, bid price, bid size, ask price, ask size, ts_event
+_RECORD = (100934, 29384_720_000_000, 4_970_000_000, 29389_000_000_000, 4_950_000_000, 1690801479440000000)
+
+
+@pytest.fixture()
+def context():
+    instrument = Mock(
+        id=InstrumentId.from_str("XBT/USD.LMAX"),
+        info={"id": 100934},
+        price_precision=2,
+        size_precision=2,
+    )
+    return QuoteContext(instrument)
+
+
+class TestQuoteContext:
+    def test_decode(self, context):
+        # Arrange, Act
+        quote_tick = context.decode(_snapshot(), ts_init=0)
+
+        # Assert
+        assert str(quote_tick) == "XBT/USD.LMAX,29384.72,29389.00,4.97,4.95,1690801479440000000"
+        assert context.last_quote is quote_tick
+
+    def test_decode_record(self, context):
+        # Arrange, Act
+        quote_tick = context.decode_record(_RECORD, ts_init=0)
+
+        # Assert
+        assert str(quote_tick) == "XBT/USD.LMAX,29384.72,29389.00,4.97,4.95,1690801479440000000"
+        assert context.last_quote is quote_tick
+
+
+class TestQuoteConflator:
+    def test_duplicate_snapshots_are_dropped(self, context):
+        # Arrange
+        publish = Mock()
+        conflator = QuoteConflator(publish=publish, loop=Mock())
+
+        # Act
+        conflator.handle_snapshot(context, _snapshot(), ts_init=0)
+        conflator.handle_snapshot(context, _snapshot(), ts_init=1)
+        conflator.handle_snapshot(context, _snapshot("1"), ts_init=2)
+
+        # Assert
+        assert publish.call_count == 2
+        assert conflator.stats.received == 3
+        assert conflator.stats.duplicates == 1
+        assert conflator.stats.published == 2
+
+    def test_duplicates_are_published_when_not_dropped(self, context):
+        # Arrange
+        publish = Mock()
+        conflator = QuoteConflator(publish=publish, loop=Mock(), drop_duplicates=False)
+
+        # Act
+        conflator.handle_snapshot(context, _snapshot(), ts_init=0)
+        conflator.handle_snapshot(context, _snapshot(), ts_init=1)
+
+        # Assert
+        assert publish.call_count == 2
+        assert conflator.stats.duplicates == 0
+
+    @pytest.mark.asyncio
+    async def test_latest_only_publishes_newest_snapshot_per_instrument(self, context):
+        # Arrange
+        publish = Mock()
+        conflator = QuoteConflator(
+            publish=publish,
+            loop=asyncio.get_running_loop(),
+            latest_only=True,
+        )
+
+        # Act
+        for i, bid_size in enumerate(("1", "2", "3")):
+            conflator.handle_snapshot(context, _snapshot(bid_size), ts_init=i)
+        assert publish.call_count == 0
+        await asyncio.sleep(0)
+
+        # Assert
+        assert publish.call_count == 1
+        assert publish.call_args[0][0].ts_init == 2
+        assert conflator.stats.merged == 2
+        assert conflator.stats.published == 1
+
+    def test_duplicate_records_are_dropped(self, context):
+        # Arrange
+        publish = Mock()
+        conflator = QuoteConflator(publish=publish, loop=Mock())
+        changed = (*_RECORD[:2], 1_000_000_000, *_RECORD[3:])
+
+        # Act
+        conflator.handle_record(context, _RECORD, ts_init=0)
+        conflator.handle_record(context, _RECORD, ts_init=1)
+        conflator.handle_record(context, changed, ts_init=2)
+
+        # Assert
+        assert publish.call_count == 2
+        assert conflator.stats.duplicates == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_only_publishes_newest_record_per_instrument(self, context):
+        # Arrange
+        publish = Mock()
+        conflator = QuoteConflator(
+            publish=publish,
+            loop=asyncio.get_running_loop(),
+            drop_duplicates=False,
+            latest_only=True,
+        )
+
+        # Act
+        conflator.handle_record(context, _RECORD, ts_init=0)
+        conflator.handle_record(context, _RECORD, ts_init=1)
+        await asyncio.sleep(0)
+
+        # Assert
+        assert publish.call_count == 1
+        assert publish.call_args[0][0].ts_init == 1
+        assert conflator.stats.merged == 1
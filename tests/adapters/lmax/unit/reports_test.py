@@ -27,6 +27,14 @@ from pytower.tests.adapters.lmax import FIX_RESPONSES
 from pytower.tests.adapters.lmax.stubs import LMAXStubs
 
 
+def _iter_objects(objects: list):
+    async def iter_objects(*args, **kwargs):
+        for obj in objects:
+            yield obj
+
+    return iter_objects
+
+
 class TestLMAXExecutionReports:
     @pytest.mark.asyncio()
     async def test_generate_request_id(self, exec_client):
@@ -305,7 +313,7 @@ class TestLMAXExecutionReports:
             LMAXStubs.order(instrumentId=100485, instructionId="C-002", quantity=-0.1),
         ]
 
-        exec_client.xml_client.request_orders = AsyncMock(return_value=orders)
+        exec_client.xml_client.iter_orders = _iter_objects(orders)
         exec_client._generate_order_status_report = AsyncMock(return_value=None)
 
         # Act
@@ -335,7 +343,7 @@ class TestLMAXExecutionReports:
             LMAXStubs.order(instrumentId=0, instructionId="C-002", quantity=-0.1),
         ]
 
-        exec_client.xml_client.request_orders = AsyncMock(return_value=orders)
+        exec_client.xml_client.iter_orders = _iter_objects(orders)
         exec_client._generate_order_status_report = AsyncMock(return_value=None)
 
         # Act
@@ -354,7 +362,7 @@ class TestLMAXExecutionReports:
         exec_client,
     ):
         orders: list[LmaxOrder] = []
-        exec_client.xml_client.request_orders = AsyncMock(return_value=orders)
+        exec_client.xml_client.iter_orders = _iter_objects(orders)
 
         # Act
         reports = await exec_client.generate_order_status_reports()
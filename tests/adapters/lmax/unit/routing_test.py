@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from pytower.adapters.lmax.fix.decoder import decode_frame
+from pytower.adapters.lmax.fix.messages import ExecutionReport
+from pytower.adapters.lmax.fix.messages import MarketDataRequestReject
+from pytower.adapters.lmax.fix.messages import MarketDataSnapshotFullRefresh
+from pytower.adapters.lmax.fix.messages import string_to_message
+from pytower.adapters.lmax.fix.messages import string_to_raw
+from pytower.adapters.lmax.fix.routing import FixRouter
+from pytower.tests.adapters.lmax import FIX_RESPONSES
+
+
+def _read_line(filename: str) -> str:
+    with open(FIX_RESPONSES / filename) as f:
+        return f.readline().strip()
+
+
+class TestFixRouter:
+    @pytest.mark.asyncio
+    async def test_dispatch_routes_by_message_type(self):
+        # Arrange
+        router = FixRouter()
+        quote_handler = Mock(__qualname__="quote_handler")
+        exec_handler = AsyncMock(__qualname__="exec_handler")
+        router.register(quote_handler, message_types=[MarketDataSnapshotFullRefresh])
+        router.register(exec_handler, message_types=[ExecutionReport])
+        quote = string_to_message(_read_line("market_data_snapshot_full_refresh.txt"))
+        report = string_to_message(_read_line("limit_order_accepted.txt"))
+
+        # Act
+        await router.dispatch(quote)
+        await router.dispatch(report)
+
+        # Assert
+        quote_handler.assert_called_once_with(quote)
+        exec_handler.assert_awaited_once_with(report)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_view_to_message_type_route(self):
+        # Arrange
+        router = FixRouter()
+        handler = Mock(__qualname__="handler")
+        router.register(handler, message_types=[MarketDataSnapshotFullRefresh])
+        view = decode_frame(string_to_raw(_read_line("market_data_snapshot_full_refresh.txt")))
+
+        # Act
+        await router.dispatch(view)
+
+        # Assert
+        handler.assert_called_once_with(view)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_catch_all_receives_every_message(self):
+        # Arrange
+        router = FixRouter()
+        calls = []
+        router.register(lambda msg: calls.append(("all", msg.message_type)))
+        router.register(
+            lambda msg: calls.append(("reject", msg.message_type)),
+            message_types=[MarketDataRequestReject],
+        )
+        reject = string_to_message(_read_line("market_data_request_reject.txt"))
+        report = string_to_message(_read_line("limit_order_accepted.txt"))
+
+        # Act
+        await router.dispatch(reject)
+        await router.dispatch(report)
+
+        # Assert
+        assert calls == [("all", b"Y"), ("reject", b"Y"), ("all", b"8")]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_records_route_stats(self):
+        # Arrange
+        router = FixRouter()
+        handler = Mock(__qualname__="handler")
+        router.register(handler, message_types=[MarketDataSnapshotFullRefresh])
+        quote = string_to_message(_read_line("market_data_snapshot_full_refresh.txt"))
+
+        # Act
+        await router.dispatch(quote)
+        await router.dispatch(quote)
+
+        # Assert
+        stats = router.stats[("W", "handler")]
+        assert stats.count == 2
+        assert stats.total_ns >= stats.max_ns > 0
@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pytower.adapters.lmax.xml.scheduler import LmaxRequestScheduler
+from pytower.adapters.lmax.xml.util import unpretty_xml
+from pytower.tests.adapters.lmax import XML_RESPONSES
+from pytower.tests.adapters.lmax.stubs import LMAXStubs
+
+
+async def _hold(scheduler: LmaxRequestScheduler, channel: str, order: list, release: asyncio.Event):
+    async with scheduler.slot(channel):
+        order.append(channel)
+        await release.wait()
+
+
+class TestLmaxRequestScheduler:
+    @pytest.mark.asyncio
+    async def test_channel_runs_up_to_its_limit(self):
+        # Arrange
+        scheduler = LmaxRequestScheduler(limits={"download": 2})
+        release = asyncio.Event()
+        order = []
+
+        # Act
+        tasks = [asyncio.create_task(_hold(scheduler, "download", order, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # Assert
+        assert scheduler.active("download") == 2
+        assert scheduler.waiting("download") == 1
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.active("download") == 0
+        assert len(order) == 3
+
+    @pytest.mark.asyncio
+    async def test_channels_have_separate_budgets(self):
+        # Arrange
+        scheduler = LmaxRequestScheduler(limits={"download": 1, "positions": 1})
+        release = asyncio.Event()
+        order = []
+        downloads = [
+            asyncio.create_task(_hold(scheduler, "download", order, release)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # Act
+        async with scheduler.slot("positions"):
+            is_granted = True
+
+        # Assert
+        assert is_granted
+        assert scheduler.active("download") == 1
+        release.set()
+        await asyncio.gather(*downloads)
+
+    @pytest.mark.asyncio
+    async def test_freed_slots_are_granted_to_channels_in_turn(self):
+        # Arrange
+        scheduler = LmaxRequestScheduler(
+            limits={"download": 4, "orders": 4},
+            max_concurrent=1,
+        )
+        release = asyncio.Event()
+        order = []
+        first = asyncio.create_task(_hold(scheduler, "download", order, release))
+        await asyncio.sleep(0)
+        downloads = [
+            asyncio.create_task(_hold(scheduler, "download", order, release)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        queries = [
+            asyncio.create_task(_hold(scheduler, "orders", order, release)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        # Act
+        release.set()
+        await asyncio.gather(first, *downloads, *queries)
+
+        # Assert
+        assert order == ["download", "orders", "download", "orders", "download", "download"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        # Arrange
+        scheduler = LmaxRequestScheduler(limits={"account": 1})
+        release = asyncio.Event()
+        order = []
+        holder = asyncio.create_task(_hold(scheduler, "account", order, release))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(_hold(scheduler, "account", order, release))
+        waiter = asyncio.create_task(_hold(scheduler, "account", order, release))
+        await asyncio.sleep(0)
+
+        # Act
+        cancelled.cancel()
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+        # Assert
+        assert cancelled.cancelled()
+        assert order == ["account", "account"]
+        assert scheduler.active("account") == 0
+
+
+class TestLmaxXmlClientScheduling:
+    @pytest.mark.asyncio
+    async def test_clients_do_not_share_a_budget(self):
+        # Arrange
+        data_client = LMAXStubs.offline_xml_client()
+        exec_client = LMAXStubs.offline_xml_client()
+
+        # Act
+        async with data_client.scheduler.slot("instruments"):
+            async with exec_client.scheduler.slot("instruments"):
+                is_granted = True
+
+        # Assert
+        assert is_granted
+        assert data_client.scheduler is not exec_client.scheduler
+
+    @pytest.mark.asyncio
+    async def test_positions_are_queried_during_a_download(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.subscribe = AsyncMock()
+        with open(XML_RESPONSES / "positions.xml") as f:
+            xml_data = unpretty_xml(f.read())
+
+        async def stream():
+            yield xml_data
+
+        xml_client._iter_stream = stream
+        release = asyncio.Event()
+        downloads = [
+            asyncio.create_task(_hold(xml_client.scheduler, "download", [], release))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+
+        # Act
+        positions = await asyncio.wait_for(xml_client.request_positions(), timeout=1)
+
+        # Assert
+        assert len(positions) == 2
+        release.set()
+        await asyncio.gather(*downloads)
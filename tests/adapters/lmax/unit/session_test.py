@@ -0,0 +1,165 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from pytower.adapters.lmax.xml.client import LmaxXmlClient
+from pytower.adapters.lmax.xml.session import LmaxUnauthorisedError
+from pytower.adapters.lmax.xml.session import LmaxXmlSession
+from pytower.adapters.lmax.xml.session import is_unauthorised
+from pytower.tests.adapters.lmax.stubs import LMAXStubs
+
+
+_OK = "<res><header><status>OK</status></header><body/></res>"
+
+_UNAUTHORISED = (
+    "<res><header><status>WARN</status><warnings><warning><fieldName/>"
+    "<message>UNAUTHORISED</message></warning></warnings></header><body/>"
+    "<auth>UNAUTHORISED</auth></res>"
+)
+
+
+def _response(text: str, status: int = 200) -> Mock:
+    resp = Mock()
+    resp.status = status
+    resp.text = AsyncMock(return_value=text)
+    return resp
+
+
+def _xml_client(*responses: str) -> LmaxXmlClient:
+    xml_client = LMAXStubs.offline_xml_client()
+    xml_client.post = AsyncMock(side_effect=[_response(text) for text in responses])
+    return xml_client
+
+
+class TestIsUnauthorised:
+    def test_unauthorised_response(self):
+        # Arrange, Act, Assert
+        assert is_unauthorised(_UNAUTHORISED)
+        assert not is_unauthorised(_OK)
+
+
+class TestLmaxXmlSession:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_login(self):
+        # Arrange
+        async def login():
+            await asyncio.sleep(0.01)
+
+        client = Mock()
+        client.login = AsyncMock(side_effect=login)
+        session = LmaxXmlSession(client, TestComponentStubs.logger(), None)
+
+        # Act
+        await asyncio.gather(*(session.ensure_logged_in() for _ in range(5)))
+
+        # Assert
+        assert client.login.await_count == 1
+        assert session.is_logged_in
+        assert session.login_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_logs_in_again_and_forgets_subscriptions(self):
+        # Arrange
+        client = Mock()
+        client.login = AsyncMock()
+        session = LmaxXmlSession(client, TestComponentStubs.logger(), None)
+        await session.ensure_logged_in()
+        session.add_subscription("historicMarketData")
+
+        # Act
+        session.invalidate()
+        await session.ensure_logged_in()
+
+        # Assert
+        assert client.login.await_count == 2
+        assert not session.is_subscribed("historicMarketData")
+
+    @pytest.mark.asyncio
+    async def test_unauthorised_heartbeat_invalidates_the_session(self):
+        # Arrange
+        client = Mock()
+        client.login = AsyncMock()
+        client.post = AsyncMock(return_value=_response(_UNAUTHORISED))
+        session = LmaxXmlSession(client, TestComponentStubs.logger(), None)
+        await session.ensure_logged_in()
+
+        # Act
+        alive = await session.heartbeat()
+
+        # Assert
+        assert not alive
+        assert not session.is_logged_in
+        assert client.post.call_args.kwargs["url"] == "/secure/read/heartbeat"
+
+    @pytest.mark.asyncio
+    async def test_close_logs_out_once(self):
+        # Arrange
+        client = Mock()
+        client.login = AsyncMock()
+        client.logout = AsyncMock()
+        session = LmaxXmlSession(client, TestComponentStubs.logger(), None)
+        await session.ensure_logged_in()
+
+        # Act
+        await session.close()
+        await session.close()
+
+        # Assert
+        assert client.logout.await_count == 1
+        assert not session.is_logged_in
+
+
+class TestXmlClientRequest:
+    @pytest.mark.asyncio
+    async def test_requests_reuse_the_session(self):
+        # Arrange
+        xml_client = _xml_client(_OK, _OK, _OK)
+
+        # Act
+        for _ in range(3):
+            await xml_client.request("/secure/subscribe")
+
+        # Assert
+        assert xml_client.login.await_count == 1
+        xml_client.logout.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unauthorised_request_logs_in_again_and_retries(self):
+        # Arrange
+        xml_client = _xml_client(_OK, _UNAUTHORISED, _OK)
+        await xml_client.request("/secure/subscribe")
+
+        # Act
+        xml_data = await xml_client.request("/secure/subscribe")
+
+        # Assert
+        assert xml_data == _OK
+        assert xml_client.login.await_count == 2
+        assert xml_client.post.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_request_raises_when_still_unauthorised(self):
+        # Arrange
+        xml_client = _xml_client(_UNAUTHORISED, _UNAUTHORISED)
+
+        # Act, Assert
+        with pytest.raises(LmaxUnauthorisedError):
+            await xml_client.request("/secure/subscribe")
+
+    @pytest.mark.asyncio
+    async def test_ensure_subscribed_subscribes_once_per_login(self):
+        # Arrange
+        xml_client = _xml_client(_OK, _OK)
+
+        # Act
+        await xml_client.ensure_subscribed("historicMarketData")
+        await xml_client.ensure_subscribed("historicMarketData")
+        xml_client.xml_session.invalidate()
+        await xml_client.ensure_subscribed("historicMarketData")
+
+        # Assert
+        assert xml_client.post.await_count == 2
+        assert xml_client.login.await_count == 2
@@ -0,0 +1,88 @@
+from pytower.adapters.lmax.fix.store import FixSessionStore
+
+
+def _frame(sequence_number: int) -> bytes:
+    return b"8=FIX.4.4\x019=5\x0135=D\x0134=%d\x0110=000\x01" % sequence_number
+
+
+class TestFixSessionStore:
+    def test_new_store_starts_at_one(self, tmp_path):
+        # Arrange, Act
+        store = FixSessionStore(path=tmp_path, session_id="session")
+
+        # Assert
+        assert store.is_persistent
+        assert store.is_empty
+        assert store.next_outbound_sequence_number == 1
+        assert store.next_inbound_sequence_number == 1
+
+    def test_add_outbound_advances_next_outbound_sequence_number(self):
+        # Arrange
+        store = FixSessionStore(path=None, session_id="session")
+
+        # Act
+        store.add_outbound(1, _frame(1))
+        store.add_outbound(2, _frame(2))
+
+        # Assert
+        assert not store.is_persistent
+        assert store.next_outbound_sequence_number == 3
+        assert store.get_outbound(1, 2) == [(1, _frame(1)), (2, _frame(2))]
+
+    def test_state_is_restored_on_reopen(self, tmp_path):
+        # Arrange
+        store = FixSessionStore(path=tmp_path, session_id="session")
+        store.add_outbound(1, _frame(1))
+        store.add_outbound(2, _frame(2))
+        store.set_next_inbound_sequence_number(7)
+        store.close()
+
+        # Act
+        store = FixSessionStore(path=tmp_path, session_id="session")
+
+        # Assert
+        assert not store.is_empty
+        assert store.next_outbound_sequence_number == 3
+        assert store.next_inbound_sequence_number == 7
+        assert store.get_outbound(1, 0) == [(1, _frame(1)), (2, _frame(2))]
+
+    def test_get_outbound_returns_none_for_missing_frames(self):
+        # Arrange
+        store = FixSessionStore(path=None, session_id="session")
+        store.add_outbound(1, _frame(1))
+        store.add_outbound(3, _frame(3))
+
+        # Act
+        frames = store.get_outbound(1, 10)
+
+        # Assert
+        assert frames == [(1, _frame(1)), (2, None), (3, _frame(3))]
+
+    def test_body_grows_past_initial_size(self, tmp_path):
+        # Arrange
+        store = FixSessionStore(path=tmp_path, session_id="session")
+        raw = b"x" * 300_000
+
+        # Act
+        for sequence_number in range(1, 6):
+            store.add_outbound(sequence_number, raw)
+        store.close()
+        store = FixSessionStore(path=tmp_path, session_id="session")
+
+        # Assert
+        assert store.get_outbound(5, 5) == [(5, raw)]
+
+    def test_reset(self, tmp_path):
+        # Arrange
+        store = FixSessionStore(path=tmp_path, session_id="session")
+        store.add_outbound(1, _frame(1))
+        store.set_next_inbound_sequence_number(5)
+
+        # Act
+        store.reset()
+        store.close()
+        store = FixSessionStore(path=tmp_path, session_id="session")
+
+        # Assert
+        assert store.is_empty
+        assert store.get_outbound(1, 1) == []
@@ -0,0 +1,255 @@
+import asyncio
+from unittest.mock import AsyncMock
+from xml.etree import ElementTree
+
+import pytest
+
+from nautilus_trader.model.enums import OrderSide
+from pytower.adapters.lmax.xml.session import LmaxUnauthorisedError
+from pytower.adapters.lmax.xml.stream import LmaxEventRouter
+from pytower.adapters.lmax.xml.stream import make_stream_parser
+from pytower.adapters.lmax.xml.util import unpretty_xml
+from pytower.tests.adapters.lmax import XML_RESPONSES
+from pytower.tests.adapters.lmax.stubs import LMAXStubs
+
+
+def _fixture(name: str) -> str:
+    with open(XML_RESPONSES / name) as f:
+        return unpretty_xml(f.read())
+
+
+def _parse(*chunks: str) -> list[tuple[str, str | None, str]]:
+    events = []
+    parser = make_stream_parser(LmaxEventRouter(lambda *event: events.append(event)))
+    for chunk in chunks:
+        parser.feed(chunk)
+    return events
+
+
+class TestLmaxEventRouter:
+    def test_routes_the_events_of_consecutive_batches(self):
+        # Arrange
+        stream = _fixture("orders.xml") + _fixture("positions.xml") + _fixture("urls_aggregate.xml")
+
+        # Act
+        events = _parse(stream)
+
+        # Assert
+        assert [name for name, _, _ in events] == ["orders", "positions", "historicMarketData"]
+        orders = ElementTree.fromstring(events[0][2])
+        assert len(orders.findall(".//order")) == 14
+        assert events[2][1] == "1"
+
+    def test_events_split_across_chunks(self):
+        # Arrange
+        stream = _fixture("orders.xml") + _fixture("urls_top_of_book.xml")
+        chunks = [stream[i : i + 7] for i in range(0, len(stream), 7)]
+
+        # Act
+        events = _parse(*chunks)
+
+        # Assert
+        assert events == _parse(stream)
+
+    def test_escapes_text(self):
+        # Arrange
+        stream = (
+            "<events><header><seq>1</seq></header><body><instructionRejected>"
+            "<instructionId>7</instructionId><reason>A &amp; B &lt;</reason>"
+            "</instructionRejected><heartbeat><token>token-1</token></heartbeat></body></events>"
+        )
+
+        # Act
+        events = _parse(stream)
+
+        # Assert
+        assert events[0][0] == "instructionRejected"
+        assert events[0][1] == "7"
+        assert ElementTree.fromstring(events[0][2]).findtext("reason") == "A & B <"
+        assert events[1] == ("heartbeat", None, "<heartbeat><token>token-1</token></heartbeat>")
+
+
+class TestLmaxEventStream:
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_stream(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        subscribed = asyncio.Event()
+
+        async def stream():
+            await subscribed.wait()
+            yield _fixture("orders.xml")
+            yield _fixture("positions.xml")
+
+        async def subscribe(value):
+            if value == "position":
+                subscribed.set()
+
+        xml_client._iter_stream = stream
+        xml_client.subscribe = AsyncMock(side_effect=subscribe)
+
+        # Act
+        orders, positions = await asyncio.gather(
+            xml_client.request_orders(),
+            xml_client.request_positions(),
+        )
+
+        # Assert
+        assert len(orders) == 14
+        assert len(positions) == 2
+        assert xml_client.event_stream.stream_count == 1
+
+    @pytest.mark.asyncio
+    async def test_waiter_with_instruction_id_gets_its_event(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        other = _fixture("urls_aggregate.xml").replace(
+            "<instructionId>1</instructionId>",
+            "<instructionId>2</instructionId>",
+        )
+
+        async def stream():
+            yield other
+            yield _fixture("urls_top_of_book.xml")
+
+        xml_client._iter_stream = stream
+
+        # Act
+        xml_data = await xml_client.event_stream.wait_for("historicMarketData", "1")
+
+        # Assert
+        assert "/orderbook/" in xml_data
+
+    @pytest.mark.asyncio
+    async def test_handlers_are_called_with_every_event(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        received = []
+
+        async def stream():
+            for i in range(3):
+                yield f"<events><body><heartbeat><token>token-{i}</token></heartbeat></body></events>"
+            yield _fixture("account_state.xml")
+
+        xml_client._iter_stream = stream
+        xml_client.event_stream.add_handler("heartbeat", received.append)
+
+        # Act
+        await xml_client.event_stream.wait_for("accountState")
+        await xml_client.event_stream.stop()
+
+        # Assert
+        assert len(received) == 3
+        assert not xml_client.event_stream.is_running
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_kept_when_the_stream_ends_or_times_out(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.event_stream._reconnect_delay_seconds = 0
+        responses = [None, "", _fixture("account_state.xml")]
+
+        async def stream():
+            xml_data = responses.pop(0)
+            if xml_data is None:
+                raise asyncio.TimeoutError()
+            yield xml_data
+
+        xml_client._iter_stream = stream
+
+        # Act
+        states = await asyncio.wait_for(xml_client.event_stream.wait_for("accountState"), timeout=1)
+
+        # Assert
+        assert len(states) == 1
+        assert xml_client.event_stream.stream_count == 3
+
+    @pytest.mark.asyncio
+    async def test_refused_stream_logs_in_again_and_retries(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.subscribe = AsyncMock()
+        responses = [None, _fixture("account_state.xml")]
+
+        async def stream():
+            xml_data = responses.pop(0)
+            if xml_data is None:
+                raise LmaxUnauthorisedError("/push/stream forbidden")
+            yield xml_data
+
+        xml_client._iter_stream = stream
+
+        # Act
+        state = await xml_client.request_account_state()
+
+        # Assert
+        assert state.base_currency is not None
+        assert xml_client.subscribe.await_count == 2
+        assert xml_client.xml_session.login_count == 2
+
+
+class TestIterObjects:
+    @pytest.mark.asyncio
+    async def test_first_order_is_yielded_before_the_event_closes(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.subscribe = AsyncMock()
+        xml_data = _fixture("orders.xml")
+        first_close = xml_data.index("</order>") + len("</order>")
+        is_first_read = asyncio.Event()
+
+        async def stream():
+            yield xml_data[:first_close]
+            await is_first_read.wait()
+            yield xml_data[first_close:]
+
+        xml_client._iter_stream = stream
+
+        # Act
+        orders = []
+        async for order in xml_client.iter_orders():
+            orders.append(order)
+            is_first_read.set()
+
+        # Assert
+        assert len(orders) == 14
+
+    @pytest.mark.asyncio
+    async def test_concurrent_iterators_with_different_filters(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.subscribe = AsyncMock()
+
+        async def stream():
+            await asyncio.sleep(0.01)
+            yield _fixture("orders.xml")
+
+        xml_client._iter_stream = stream
+
+        # Act
+        buys, sells = await asyncio.gather(
+            xml_client.request_orders(side=OrderSide.BUY),
+            xml_client.request_orders(side=OrderSide.SELL),
+        )
+
+        # Assert
+        assert len(buys) == 14
+        assert len(sells) == 0
+        assert xml_client.event_stream.stream_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refused_stream_fails_the_iterator_after_retrying(self):
+        # Arrange
+        xml_client = LMAXStubs.offline_xml_client()
+        xml_client.subscribe = AsyncMock()
+
+        async def stream():
+            raise LmaxUnauthorisedError("/push/stream forbidden")
+            yield
+
+        xml_client._iter_stream = stream
+
+        # Act, Assert
+        with pytest.raises(LmaxUnauthorisedError):
+            await xml_client.request_positions(open_only=True)
+        assert xml_client.subscribe.await_count == 2
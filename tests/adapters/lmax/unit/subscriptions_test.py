@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.model.identifiers import InstrumentId
+from pytower.adapters.lmax.fix.subscriptions import MarketDataSubscriptionBatcher
+
+
+def _instrument(security_id: int) -> Mock:
+    return Mock(id=InstrumentId.from_str(f"SYM{security_id}/USD.LMAX"), info={"id": security_id})
+
+
+class TestMarketDataSubscriptionBatcher:
+    @pytest.mark.asyncio
+    async def test_subscribes_within_window_are_sent_in_one_request(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+        instruments = [_instrument(i) for i in range(30)]
+
+        # Act
+        await asyncio.gather(*(batcher.subscribe(instrument) for instrument in instruments))
+
+        # Assert
+        send.assert_awaited_once_with("QuoteTick-batch-1", list(range(30)), True)
+        assert batcher.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_single_subscribe_uses_instrument_request_id(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+
+        # Act
+        await batcher.subscribe(_instrument(100934))
+
+        # Assert
+        send.assert_awaited_once_with("QuoteTick-SYM100934/USD.LMAX", [100934], True)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_at_max_batch_size(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001, max_batch_size=10)
+
+        # Act
+        await asyncio.gather(*(batcher.subscribe(_instrument(i)) for i in range(25)))
+
+        # Assert
+        assert [len(call.args[1]) for call in send.await_args_list] == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_subscribes_and_unsubscribes_are_sent_in_separate_requests(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+
+        # Act
+        await asyncio.gather(
+            batcher.subscribe(_instrument(1)),
+            batcher.subscribe(_instrument(2)),
+            batcher.unsubscribe(_instrument(3)),
+        )
+
+        # Assert
+        assert [call.args[1:] for call in send.await_args_list] == [
+            ([1, 2], True),
+            ([3], False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_and_unsubscribe_within_window_cancel_out(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+        instrument = _instrument(1)
+
+        # Act
+        await asyncio.gather(batcher.subscribe(instrument), batcher.unsubscribe(instrument))
+
+        # Assert
+        assert send.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_uses_request_id_of_subscribe(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+        instrument = _instrument(100934)
+        await batcher.subscribe(instrument)
+
+        # Act
+        await batcher.unsubscribe(instrument)
+
+        # Assert
+        send.assert_awaited_with("QuoteTick-SYM100934/USD.LMAX", [100934], False)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_of_one_instrument_of_batch(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+        instruments = [_instrument(i) for i in range(3)]
+        await asyncio.gather(*(batcher.subscribe(instrument) for instrument in instruments))
+
+        # Act
+        await batcher.unsubscribe(instruments[1])
+        await batcher.unsubscribe(instruments[2])
+
+        # Assert
+        assert [call.args for call in send.await_args_list] == [
+            ("QuoteTick-batch-1", [0, 1, 2], True),
+            ("QuoteTick-batch-1", [1], False),
+            ("QuoteTick-batch-2", [0, 2], True),
+            ("QuoteTick-batch-2", [2], False),
+            ("QuoteTick-SYM0/USD.LMAX", [0], True),
+        ]
+        assert batcher.pop_request("QuoteTick-batch-1") is None
+        assert batcher.pop_request("QuoteTick-SYM0/USD.LMAX") == [instruments[0].id]
+
+    @pytest.mark.asyncio
+    async def test_pop_request_returns_instruments_of_group(self):
+        # Arrange
+        send = AsyncMock()
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+        instruments = [_instrument(i) for i in range(3)]
+        await asyncio.gather(*(batcher.subscribe(instrument) for instrument in instruments))
+
+        # Act
+        instrument_ids = batcher.pop_request("QuoteTick-batch-1")
+
+        # Assert
+        assert instrument_ids == [instrument.id for instrument in instruments]
+        assert batcher.pop_request("QuoteTick-batch-1") is None
+
+    @pytest.mark.asyncio
+    async def test_send_error_is_raised_to_callers(self):
+        # Arrange
+        send = AsyncMock(side_effect=ConnectionResetError)
+        batcher = MarketDataSubscriptionBatcher(send=send, window_seconds=0.001)
+
+        # Act, Assert
+        with pytest.raises(ConnectionResetError):
+            await batcher.subscribe(_instrument(1))
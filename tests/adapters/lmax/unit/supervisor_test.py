@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from pytower.adapters.lmax.fix.supervisor import FixConnectionSupervisor
+
+
+def _fix_client(clock: LiveClock) -> Mock:
+    fix_client = Mock()
+    fix_client.is_disconnected = asyncio.Event()
+    fix_client.last_received_ns = clock.timestamp_ns()
+    fix_client.reconnect = AsyncMock(side_effect=lambda: fix_client.is_disconnected.clear())
+    fix_client.wait_for_events = AsyncMock()
+    return fix_client
+
+
+def _supervisor(fix_client: Mock, clock: LiveClock, **kwargs) -> FixConnectionSupervisor:
+    return FixConnectionSupervisor(
+        fix_client=fix_client,
+        clock=clock,
+        logger=Logger(clock=clock),
+        initial_delay_seconds=0.001,
+        max_delay_seconds=0.01,
+        **kwargs,
+    )
+
+
+async def _wait_for_recovery(supervisor: FixConnectionSupervisor) -> None:
+    for _ in range(100):
+        if supervisor.stats.last_data_ns > 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestFixConnectionSupervisor:
+    def test_backoff_delay_is_capped(self):
+        # Arrange
+        clock = LiveClock()
+        supervisor = _supervisor(_fix_client(clock), clock, heartbeat_timeout_seconds=60)
+
+        # Act
+        delays = [supervisor.backoff_delay(attempt) for attempt in range(10)]
+
+        # Assert
+        assert all(0 <= delay <= 0.01 for delay in delays)
+        assert delays[0] <= 0.001
+
+    @pytest.mark.asyncio
+    async def test_reconnects_on_disconnect_with_retries(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        errors = [ConnectionRefusedError()]
+
+        def reconnect():
+            if errors:
+                raise errors.pop()
+            fix_client.is_disconnected.clear()
+
+        fix_client.reconnect.side_effect = reconnect
+        supervisor = _supervisor(fix_client, clock, heartbeat_timeout_seconds=60)
+        supervisor.start()
+
+        # Act
+        fix_client.is_disconnected.set()
+        await _wait_for_recovery(supervisor)
+        supervisor.stop()
+
+        # Assert
+        assert fix_client.reconnect.call_count == 2
+        assert supervisor.stats.count == 1
+        assert supervisor.stats.failed_attempts == 1
+        assert 0 < supervisor.stats.last_logon_ns <= supervisor.stats.last_data_ns
+
+    @pytest.mark.asyncio
+    async def test_keeps_retrying_after_a_failing_reconnect_handler(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        errors = [ValueError("resubscribe failed")]
+
+        def reconnect():
+            if errors:
+                raise errors.pop()
+            fix_client.is_disconnected.clear()
+
+        fix_client.reconnect.side_effect = reconnect
+        supervisor = _supervisor(fix_client, clock, heartbeat_timeout_seconds=60)
+        supervisor.start()
+
+        # Act
+        fix_client.is_disconnected.set()
+        await _wait_for_recovery(supervisor)
+
+        # Assert
+        assert supervisor.is_running
+        supervisor.stop()
+        assert fix_client.reconnect.call_count == 2
+        assert supervisor.stats.count == 1
+        assert supervisor.stats.failed_attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnects_on_missed_heartbeats(self):
+        # Arrange
+        clock = LiveClock()
+        fix_client = _fix_client(clock)
+        fix_client.last_received_ns -= 10_000_000_000
+        supervisor = _supervisor(fix_client, clock, heartbeat_timeout_seconds=0.04)
+        supervisor.start()
+
+        # Act
+        await _wait_for_recovery(supervisor)
+        supervisor.stop()
+
+        # Assert
+        assert fix_client.reconnect.call_count >= 1
+        assert supervisor.stats.count >= 1
@@ -0,0 +1,120 @@
+import random
+
+import pandas as pd
+import pytest
+
+from pytower.adapters.lmax.fix.timestamps import SendingTimeFormatter
+from pytower.adapters.lmax.fix.timestamps import format_utc_timestamp
+from pytower.adapters.lmax.fix.timestamps import parse_utc_date_time_ns
+from pytower.adapters.lmax.fix.timestamps import parse_utc_timestamp_ns
+
+
+def _pandas_timestamp_ns(value: str) -> int:
+    timestamp_format = "%Y%m%d-%H:%M:%S.%f" if "." in value else "%Y%m%d-%H:%M:%S"
+    return pd.to_datetime(value, format=timestamp_format).value
+
+
+def _random_timestamps(count: int) -> list[str]:
+    rng = random.Random(42)
+    start = pd.Timestamp("1990-01-01").value
+    end = pd.Timestamp("2040-12-31").value
+    values = []
+    for _ in range(count):
+        value = pd.Timestamp(rng.randrange(start, end)).strftime("%Y%m%d-%H:%M:%S")
+        digits = rng.randrange(0, 10)
+        if digits > 0:
+            value += "." + "".join(rng.choice("0123456789") for _ in range(digits))
+        values.append(value)
+    return values
+
+
+class TestParseUtcTimestamp:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("20230731-11:04:39.440", 1690801479440000000),
+            ("20230731-11:04:39", 1690801479000000000),
+            ("20230915-10:48:49.193456", 1694774929193456000),
+            ("20230915-10:48:49.193456789", 1694774929193456789),
+            ("19700101-00:00:00", 0),
+            ("20240229-23:59:59.9", 1709251199900000000),
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert parse_utc_timestamp_ns(value) == expected
+        assert parse_utc_timestamp_ns(value.encode()) == expected
+
+    def test_parse_matches_pandas(self):
+        for value in _random_timestamps(5_000):
+            assert parse_utc_timestamp_ns(value.encode()) == _pandas_timestamp_ns(value), value
+
+    def test_parse_date_time_pair(self):
+        # Arrange, Act
+        result = parse_utc_date_time_ns(b"20230731", b"11:04:39.440")
+
+        # Assert
+        assert result == 1690801479440000000
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "20230731",
+            "20230731 11:04:39",
+            "20230731-11-04-39",
+            "20230731-25:04:39",
+            "20230731-11:04:39.",
+            "20230731-11:04:39.1234567891",
+            "20231331-11:04:39",
+            "2023073a-11:04:39",
+        ],
+    )
+    def test_parse_invalid_raises(self, value):
+        with pytest.raises(ValueError):
+            parse_utc_timestamp_ns(value)
+
+
+class TestFormatUtcTimestamp:
+    def test_format_matches_strftime(self):
+        for value in _random_timestamps(1_000):
+            timestamp = pd.Timestamp(_pandas_timestamp_ns(value))
+            expected = timestamp.strftime("%Y%m%d-%H:%M:%S").encode()
+            assert format_utc_timestamp(timestamp.value) == expected
+
+    def test_round_trip(self):
+        # Arrange
+        timestamp_ns = 1694774929_000000000
+
+        # Act
+        result = parse_utc_timestamp_ns(format_utc_timestamp(timestamp_ns))
+
+        # Assert
+        assert result == timestamp_ns
+
+
+class TestSendingTimeFormatter:
+    def test_format_matches_strftime(self):
+        # Arrange
+        formatter = SendingTimeFormatter()
+        timestamps = [
+            pd.Timestamp("2023-09-15 10:48:49.193456789", tz="UTC"),
+            pd.Timestamp("2023-09-15 10:48:49.999999", tz="UTC"),
+            pd.Timestamp("2023-09-15 10:48:50", tz="UTC"),
+            pd.Timestamp("2024-02-29 23:59:59.000001", tz="UTC"),
+        ]
+
+        # Act, Assert
+        for timestamp in timestamps:
+            expected = timestamp.strftime("%Y%m%d-%H:%M:%S.%f").encode()
+            assert formatter.format(timestamp.value) == expected
+
+    def test_format_matches_pandas_across_seconds(self):
+        # Arrange
+        formatter = SendingTimeFormatter()
+        rng = random.Random(7)
+        timestamp_ns = pd.Timestamp("2023-12-31 23:59:58").value
+
+        # Act, Assert
+        for _ in range(2_000):
+            timestamp_ns += rng.randrange(0, 5_000_000)
+            expected = pd.Timestamp(timestamp_ns).strftime("%Y%m%d-%H:%M:%S.%f").encode()
+            assert formatter.format(timestamp_ns) == expected
@@ -0,0 +1,178 @@
+from decimal import Decimal
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PositionSide
+from pytower.adapters.lmax.xml.decoder import ACCOUNT_STATE
+from pytower.adapters.lmax.xml.decoder import INSTRUMENT
+from pytower.adapters.lmax.xml.decoder import ORDER
+from pytower.adapters.lmax.xml.decoder import POSITION
+from pytower.adapters.lmax.xml.decoder import LmaxObjectDecoder
+from pytower.adapters.lmax.xml.decoder import LmaxObjectSpec
+from pytower.adapters.lmax.xml.decoder import decode_objects
+from pytower.adapters.lmax.xml.decoder import iter_objects
+from pytower.adapters.lmax.xml.decoder import order_filter
+from pytower.adapters.lmax.xml.decoder import position_filter
+from pytower.adapters.lmax.xml.enums import LmaxOrderType
+from pytower.adapters.lmax.xml.types import LmaxAccountState
+from pytower.adapters.lmax.xml.types import LmaxInstrument
+from pytower.adapters.lmax.xml.types import LmaxOrder
+from pytower.adapters.lmax.xml.types import LmaxPosition
+from pytower.tests.adapters.lmax import XML_RESPONSES
+
+
+def _read(name: str) -> str:
+    with open(XML_RESPONSES / name) as f:
+        return f.read()
+
+
+class TestDecodeObjects:
+    def test_orders_match_element_tree(self):
+        # Arrange
+        xml_data = _read("orders.xml")
+        root = ElementTree.fromstring(xml_data)
+
+        # Act
+        orders = decode_objects(xml_data, ORDER)
+
+        # Assert
+        assert len(orders) == 14
+        assert orders == [LmaxOrder.from_xml(elem) for elem in root.iter("order")]
+
+    def test_order_optional_fields(self):
+        # Arrange, Act
+        order = decode_objects(_read("order.xml"), ORDER)[0]
+
+        # Assert
+        assert order.price == Decimal("29203.01")
+        assert order.instructionId == "C-066"
+
+    def test_positions_match_element_tree(self):
+        # Arrange
+        xml_data = _read("positions.xml")
+        root = ElementTree.fromstring(xml_data)
+
+        # Act
+        positions = decode_objects(xml_data, POSITION)
+
+        # Assert
+        assert positions == [LmaxPosition.from_xml(elem) for elem in root.iter("position")]
+
+    def test_account_state_with_wallets(self):
+        # Arrange
+        xml_data = _read("account_state.xml")
+
+        # Act
+        states = decode_objects(xml_data, ACCOUNT_STATE)
+
+        # Assert
+        assert states == [LmaxAccountState.from_xml(ElementTree.fromstring(xml_data))]
+        assert states[0].wallets[0].currency == "GBP"
+
+    def test_instruments_with_trading_hours_and_days(self):
+        # Arrange
+        xml_data = _read("instruments.xml")
+        root = ElementTree.fromstring(xml_data)
+
+        # Act
+        instruments = decode_objects(xml_data, INSTRUMENT)
+
+        # Assert
+        assert len(instruments) == 25
+        assert instruments == [LmaxInstrument.from_xml(elem) for elem in root.iter("instrument")]
+        assert instruments[0].timezone == "America/New_York"
+        assert instruments[0].tradingDays[0] == "MONDAY"
+
+
+class TestLmaxObjectDecoder:
+    def test_feed_returns_objects_as_they_close(self):
+        # Arrange
+        xml_data = _read("orders.xml")
+        decoder = LmaxObjectDecoder(ORDER)
+        first_close = xml_data.index("</order>") + len("</order>")
+
+        # Act
+        first = decoder.feed(xml_data[:first_close])
+        rest = decoder.feed(xml_data[first_close:])
+
+        # Assert
+        assert len(first) == 1
+        assert len(rest) == 13
+
+    def test_iter_objects_over_small_chunks(self):
+        # Arrange
+        xml_data = _read("orders.xml")
+        chunks = [xml_data[i : i + 5] for i in range(0, len(xml_data), 5)]
+
+        # Act
+        orders = list(iter_objects(chunks, ORDER))
+
+        # Assert
+        assert orders == decode_objects(xml_data, ORDER)
+
+
+class TestFilters:
+    def test_no_filters(self):
+        # Arrange, Act, Assert
+        assert order_filter() is None
+        assert position_filter() is None
+
+    def test_rejected_orders_are_not_built(self):
+        # Arrange
+        built = []
+
+        def build(fields):
+            built.append(fields["instructionId"])
+            return LmaxOrder.from_fields(fields)
+
+        spec = LmaxObjectSpec("order", build)
+        accept = order_filter(order_types=[LmaxOrderType.STOP_COMPOUND_MARKET])
+
+        # Act
+        orders = decode_objects(_read("orders.xml"), spec, accept)
+
+        # Assert
+        assert len(orders) == 4
+        assert len(built) == 4
+        assert all(order.orderType == LmaxOrderType.STOP_COMPOUND_MARKET for order in orders)
+
+    def test_order_filter_matches_filtering_objects(self):
+        # Arrange
+        xml_data = _read("orders.xml")
+        orders = decode_objects(xml_data, ORDER)
+        start = pd.Timestamp("2023-09-08T19:59:12", tz="UTC")
+        end = pd.Timestamp("2023-09-12T12:18:20", tz="UTC")
+
+        # Act
+        filtered = decode_objects(
+            xml_data,
+            ORDER,
+            order_filter(security_id=100934, start=start, end=end, side=OrderSide.BUY),
+        )
+
+        # Assert
+        expected = [
+            order
+            for order in orders
+            if order.security_id == 100934
+            and order.side == OrderSide.BUY
+            and start <= order.timestamp <= end
+        ]
+        assert filtered == expected
+        assert len(filtered) == 6
+
+    def test_position_filter(self):
+        # Arrange
+        xml_data = _read("positions.xml")
+
+        # Act
+        longs = decode_objects(xml_data, POSITION, position_filter(side=PositionSide.LONG))
+        shorts = decode_objects(xml_data, POSITION, position_filter(side=PositionSide.SHORT))
+        other = decode_objects(xml_data, POSITION, position_filter(security_id=100932))
+
+        # Assert
+        assert [position.instrumentId for position in longs] == [100934]
+        assert [position.instrumentId for position in shorts] == [100932]
+        assert other == shorts